@@ -0,0 +1,60 @@
+"""
+仪表盘 API
+从内存汇总数据构建仪表盘，不随历史结果数据量增长而变慢
+"""
+from fastapi import APIRouter, Depends
+
+from models import UserInfo, Project, ProjectMember, TestPlan
+from schemas.common_schemas import ResponseModel
+from services.dashboard import dashboard
+from services.executions import registry
+from security import get_current_active_user
+
+Dashboard = APIRouter()
+
+
+@Dashboard.get("", response_model=ResponseModel, summary="获取仪表盘汇总")
+async def get_dashboard(
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """获取平台仪表盘：运行中执行、平台吞吐、延迟趋势、从机利用率与资源数量"""
+    if not dashboard.loaded:
+        await dashboard.load()
+
+    live_executions = registry.all()
+
+    # 非超级管理员只能看到自己项目的运行中执行，平台数量与吞吐仍为全局
+    if not current_user.is_superuser:
+        member_project_ids = await ProjectMember.filter(
+            user_id=current_user.id,
+            is_active=True
+        ).values_list('project_id', flat=True)
+        manager_project_ids = await Project.filter(
+            manager_id=current_user.id,
+            is_deleted=False
+        ).values_list('id', flat=True)
+        accessible_plan_ids = set(await TestPlan.filter(
+            project_id_id__in=list(set(member_project_ids) | set(manager_project_ids))
+        ).values_list('id', flat=True))
+        live_executions = [live for live in live_executions if live.test_plan_id in accessible_plan_ids]
+
+    active = sorted(
+        (live.summary() for live in live_executions),
+        key=lambda item: item["started_at"] or 0,
+        reverse=True
+    )
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": {
+            "counts": {
+                **dashboard.counts,
+                "active_executions": len(registry)
+            },
+            "active_executions": active,
+            "throughput": dashboard.throughput(),
+            "trend": dashboard.trend(),
+            "fleet": dashboard.fleet()
+        }
+    }
@@ -0,0 +1,244 @@
+"""
+测试数据集 API
+提供数据集的上传、查询、删除，以及按从机切分的分片下载
+"""
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, File, UploadFile, Form
+from fastapi.responses import StreamingResponse
+
+from models import Dataset, TestPlanDataset, UserInfo, Project, ProjectMember, TestExecution
+from schemas.common_schemas import ResponseModel
+from services.datasets import (
+    DatasetTooLarge,
+    save_upload,
+    read_header,
+    partition_ranges,
+    iter_file_range,
+    slave_partition
+)
+from services.pagination import count_cache, fetch_page, build_page_data, TOTAL_MODE_PATTERN
+from security import get_current_active_user, check_permissions
+from config import DATASET_MAX_SIZE
+
+Datasets = APIRouter()
+
+
+# 辅助函数
+async def accessible_project_ids(current_user: UserInfo) -> list:
+    """用户参与或管理的项目ID"""
+    member_project_ids = await ProjectMember.filter(
+        user_id=current_user.id,
+        is_active=True
+    ).values_list('project_id', flat=True)
+    manager_project_ids = await Project.filter(
+        manager_id=current_user.id,
+        is_deleted=False
+    ).values_list('id', flat=True)
+    return list(set(member_project_ids) | set(manager_project_ids))
+
+
+async def check_dataset_access(dataset_id: int, current_user: UserInfo) -> Dataset:
+    """
+    检查数据集是否存在以及用户是否有访问其项目的权限
+
+    Raises:
+        HTTPException: 数据集不存在或无权访问
+    """
+    dataset = await Dataset.get_or_none(id=dataset_id, is_deleted=False)
+    if not dataset:
+        raise HTTPException(status_code=404, detail="数据集不存在")
+    if not current_user.is_superuser and dataset.project_id not in await accessible_project_ids(current_user):
+        raise HTTPException(status_code=403, detail="无权访问该数据集")
+    return dataset
+
+
+def dataset_data(dataset: Dataset) -> dict:
+    """数据集响应数据"""
+    return {
+        "id": dataset.id,
+        "name": dataset.name,
+        "description": dataset.description,
+        "project_id": dataset.project_id,
+        "uploaded_by": dataset.uploaded_by_id,
+        "file_size": dataset.file_size,
+        "line_count": dataset.line_count,
+        "has_header": dataset.has_header,
+        "checksum": dataset.checksum,
+        "created_at": dataset.created_at,
+        "updated_at": dataset.updated_at
+    }
+
+
+@Datasets.get("", response_model=ResponseModel, summary="分页获取数据集列表")
+async def list_datasets(
+    page: int = Query(1, ge=1, description="页码"),
+    page_size: int = Query(20, ge=1, le=100, description="每页数量"),
+    name: Optional[str] = Query(None, description="数据集名称筛选"),
+    project_id: Optional[int] = Query(None, description="项目ID筛选"),
+    total_mode: str = Query("exact", alias="total", pattern=TOTAL_MODE_PATTERN, description="总数统计方式: exact/approx/none"),
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """获取数据集列表（分页）"""
+    await check_permissions(["script:read"], current_user)
+
+    filters = {"is_deleted": False}
+    if name:
+        filters["name__icontains"] = name
+    if project_id:
+        filters["project_id"] = project_id
+
+    # 非超级管理员只能看到自己项目的数据集
+    if not current_user.is_superuser:
+        filters["project_id__in"] = await accessible_project_ids(current_user)
+
+    query = Dataset.filter(**filters)
+    total = await count_cache.count(Dataset, filters, query, total_mode)
+    datasets, has_next = await fetch_page(query.order_by('-id'), page, page_size)
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": build_page_data([dataset_data(d) for d in datasets], total, page, page_size, has_next)
+    }
+
+
+@Datasets.post("", response_model=ResponseModel, summary="上传数据集")
+async def create_dataset(
+    name: str = Form(..., min_length=1, max_length=100, description="数据集名称"),
+    project_id: int = Form(..., description="所属项目ID"),
+    description: Optional[str] = Form(None, description="描述"),
+    has_header: bool = Form(True, description="首行是否为表头"),
+    file: UploadFile = File(..., description="数据文件(按行组织，如 CSV)"),
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """上传数据集文件，文件按块写入磁盘，只保存一份"""
+    await check_permissions(["script:create"], current_user)
+
+    project = await Project.get_or_none(id=project_id, is_deleted=False)
+    if not project:
+        raise HTTPException(status_code=400, detail="项目不存在")
+    if not current_user.is_superuser and project.id not in await accessible_project_ids(current_user):
+        raise HTTPException(status_code=403, detail="无权访问该项目")
+
+    try:
+        saved = await save_upload(file, has_header)
+    except DatasetTooLarge:
+        raise HTTPException(status_code=413, detail=f"数据集文件超过大小上限 {DATASET_MAX_SIZE} 字节")
+
+    dataset = await Dataset.create(
+        name=name,
+        description=description,
+        project=project,
+        uploaded_by=current_user,
+        has_header=has_header,
+        **saved
+    )
+
+    return {
+        "code": 200,
+        "message": "数据集上传成功",
+        "data": dataset_data(dataset)
+    }
+
+
+@Datasets.get("/{dataset_id}", response_model=ResponseModel, summary="获取数据集详情")
+async def get_dataset_detail(
+    dataset_id: int,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """获取数据集详情"""
+    await check_permissions(["script:read"], current_user)
+    dataset = await check_dataset_access(dataset_id, current_user)
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": dataset_data(dataset)
+    }
+
+
+@Datasets.delete("/{dataset_id}", response_model=ResponseModel, summary="删除数据集")
+async def delete_dataset(
+    dataset_id: int,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """删除数据集（软删除，已关联的测试计划之后的执行不再下发该数据集）"""
+    await check_permissions(["script:delete"], current_user)
+    dataset = await check_dataset_access(dataset_id, current_user)
+
+    dataset.is_deleted = True
+    await dataset.save()
+
+    return {
+        "code": 200,
+        "message": "数据集删除成功",
+        "data": None
+    }
+
+
+@Datasets.get("/{dataset_id}/partitions", response_model=ResponseModel, summary="预览数据集切分")
+async def preview_dataset_partitions(
+    dataset_id: int,
+    parts: int = Query(..., ge=1, le=1000, description="分片数(从机数)"),
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """按分片数切分数据集，返回各分片的字节区间"""
+    await check_permissions(["script:read"], current_user)
+    dataset = await check_dataset_access(dataset_id, current_user)
+
+    ranges = partition_ranges(dataset.file_path, parts, dataset.has_header)
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": [
+            {"index": index, "start": start, "end": end, "bytes": end - start}
+            for index, (start, end) in enumerate(ranges)
+        ]
+    }
+
+
+@Datasets.get("/{dataset_id}/partition", summary="下载从机的数据集分片")
+async def download_dataset_partition(
+    dataset_id: int,
+    execution_id: str = Query(..., description="执行ID"),
+    slave_id: int = Query(..., description="从机ID"),
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """
+    从机下载自己在本次执行中的数据分片(负载机调用)
+
+    分片方式的数据集只返回该从机的字节区间(附表头)，完整方式的数据集返回整个文件。
+    """
+    await check_permissions(["slave:update"], current_user)
+
+    dataset = await Dataset.get_or_none(id=dataset_id, is_deleted=False)
+    if not dataset:
+        raise HTTPException(status_code=404, detail="数据集不存在")
+    execution = await TestExecution.get_or_none(execution_id=execution_id)
+    if not execution:
+        raise HTTPException(status_code=404, detail="执行记录不存在")
+    link = await TestPlanDataset.get_or_none(test_plan_id=execution.test_plan_id, dataset_id=dataset.id)
+    if not link:
+        raise HTTPException(status_code=400, detail="数据集未关联该执行的测试计划")
+    partition = slave_partition(execution, slave_id)
+    if partition is None:
+        raise HTTPException(status_code=403, detail="从机不属于该执行")
+
+    index, count = partition
+    if link.mode == "full":
+        start, end, header = 0, dataset.file_size, b""
+    else:
+        start, end = partition_ranges(dataset.file_path, count, dataset.has_header)[index]
+        header = read_header(dataset.file_path) if dataset.has_header else b""
+
+    return StreamingResponse(
+        iter_file_range(dataset.file_path, start, end, header),
+        media_type="text/csv",
+        headers={
+            "Content-Length": str(len(header) + end - start),
+            "X-Partition-Index": str(index),
+            "X-Partition-Count": str(count),
+            "X-Dataset-Checksum": dataset.checksum
+        }
+    )
@@ -0,0 +1,603 @@
+"""
+测试执行 API
+提供执行记录查询、采样与日志上报、日志读取与实时跟随、执行停止与结束
+"""
+import asyncio
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
+from tortoise.transactions import in_transaction
+
+from models import TestExecution, TestPlan, UserInfo, Project, ProjectMember, MetricPoint, MonitorTarget
+from schemas.execution_schemas import SampleBatch, ExecutionFinish, ExecutionStop, LogBatch
+from schemas.common_schemas import ResponseModel
+from services.executions import (
+    registry,
+    ingest_samples,
+    finish_execution,
+    stop_execution,
+    compare_executions,
+    FINISHED_STATUSES
+)
+from services.errors import top_errors
+from services.execution_logs import log_store
+from services.execution_queue import execution_queue
+from services.result_store import ColumnarResult
+from services.sla import describe_rule
+from services.pagination import count_cache, fetch_page, build_page_data, TOTAL_MODE_PATTERN
+from security import get_current_active_user, check_permissions, authenticate_token
+from config import LOG_READ_MAX
+from api.test_plan import check_test_plan_access
+
+Executions = APIRouter()
+
+
+# 辅助函数
+async def check_execution_access(execution_id: str, current_user: UserInfo) -> TestExecution:
+    """
+    检查执行记录是否存在以及用户是否有访问其测试计划的权限
+
+    Raises:
+        HTTPException: 执行不存在或无权访问
+    """
+    execution = await TestExecution.get_or_none(execution_id=execution_id)
+    if not execution:
+        raise HTTPException(status_code=404, detail="执行记录不存在")
+    await check_test_plan_access(execution.test_plan_id, current_user)
+    return execution
+
+
+def execution_data(execution: TestExecution) -> dict:
+    """执行记录响应数据，运行中的执行附带实时摘要"""
+    data = {
+        "id": execution.id,
+        "execution_id": execution.execution_id,
+        "test_plan_id": execution.test_plan_id,
+        "triggered_by": execution.triggered_by_id,
+        "trigger": execution.trigger,
+        "priority": execution.priority,
+        "queued_at": execution.queued_at,
+        "status": execution.status,
+        "abort_reason": execution.abort_reason,
+        "slave_ids": execution.slave_ids,
+        "saturation_windows": execution.saturation_windows,
+        "started_at": execution.started_at,
+        "finished_at": execution.finished_at,
+        "total_samples": execution.total_samples,
+        "error_samples": execution.error_samples,
+        "sample_storage": execution.sample_storage,
+        "retention_mode": execution.retention_mode,
+        "compacted_at": execution.compacted_at,
+        "report_ready": execution.report is not None,
+        "is_baseline": execution.is_baseline,
+        "regressed": execution.comparison["regressed"] if execution.comparison else None,
+        "created_at": execution.created_at
+    }
+    live = registry.get(execution.execution_id)
+    if live:
+        data["live"] = live.summary()
+        data["total_samples"] = live.stats.total
+        data["error_samples"] = live.stats.errors
+    return data
+
+
+@Executions.get("", response_model=ResponseModel, summary="分页获取执行记录")
+async def list_executions(
+    page: int = Query(1, ge=1, description="页码"),
+    page_size: int = Query(20, ge=1, le=100, description="每页数量"),
+    test_plan_id: Optional[int] = Query(None, description="测试计划ID筛选"),
+    status: Optional[str] = Query(None, description="状态筛选"),
+    total_mode: str = Query("exact", alias="total", pattern=TOTAL_MODE_PATTERN, description="总数统计方式: exact/approx/none"),
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """获取执行记录列表（按创建时间倒序）"""
+    await check_permissions(["test_plan:read"], current_user)
+
+    filters = {}
+    if test_plan_id:
+        await check_test_plan_access(test_plan_id, current_user)
+        filters["test_plan_id"] = test_plan_id
+    if status:
+        filters["status"] = status
+
+    # 非超级管理员只能看到自己项目的执行记录
+    if not current_user.is_superuser and not test_plan_id:
+        member_project_ids = await ProjectMember.filter(
+            user_id=current_user.id,
+            is_active=True
+        ).values_list('project_id', flat=True)
+        manager_project_ids = await Project.filter(
+            manager_id=current_user.id,
+            is_deleted=False
+        ).values_list('id', flat=True)
+        filters["test_plan__project_id_id__in"] = list(set(member_project_ids) | set(manager_project_ids))
+
+    query = TestExecution.filter(**filters)
+    total = await count_cache.count(TestExecution, filters, query, total_mode)
+    executions, has_next = await fetch_page(query.order_by('-id'), page, page_size)
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": build_page_data([execution_data(e) for e in executions], total, page, page_size, has_next)
+    }
+
+
+@Executions.get("/queue", response_model=ResponseModel, summary="获取执行队列")
+async def get_execution_queue(
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """获取排队中的执行(按派发顺序)，包含队列位置与预计开始时间"""
+    await check_permissions(["test_plan:read"], current_user)
+
+    items = await execution_queue.snapshot()
+
+    # 非超级管理员只能看到自己项目的执行，队列位置仍为全局位置
+    if not current_user.is_superuser:
+        member_project_ids = await ProjectMember.filter(
+            user_id=current_user.id,
+            is_active=True
+        ).values_list('project_id', flat=True)
+        manager_project_ids = await Project.filter(
+            manager_id=current_user.id,
+            is_deleted=False
+        ).values_list('id', flat=True)
+        accessible_plan_ids = set(await TestPlan.filter(
+            project_id_id__in=list(set(member_project_ids) | set(manager_project_ids))
+        ).values_list('id', flat=True))
+        items = [item for item in items if item["test_plan_id"] in accessible_plan_ids]
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": items
+    }
+
+
+@Executions.get("/{execution_id}", response_model=ResponseModel, summary="获取执行详情")
+async def get_execution_detail(
+    execution_id: str,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """获取执行详情，排队中的执行附带队列位置与预计开始时间"""
+    await check_permissions(["test_plan:read"], current_user)
+    execution = await check_execution_access(execution_id, current_user)
+
+    data = execution_data(execution)
+    if execution.status == "queued":
+        data["queue"] = await execution_queue.position(execution.execution_id)
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": data
+    }
+
+
+@Executions.get("/{execution_id}/report", response_model=ResponseModel, summary="获取执行分析报告")
+async def get_execution_report(
+    execution_id: str,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """获取执行结束后生成的分析报告（标签统计、时间序列、错误分布、Apdex、延迟-并发曲线）"""
+    await check_permissions(["test_plan:read"], current_user)
+    execution = await check_execution_access(execution_id, current_user)
+
+    if execution.report is None:
+        raise HTTPException(status_code=409, detail="执行报告尚未生成")
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": execution.report
+    }
+
+
+@Executions.put("/{execution_id}/baseline", response_model=ResponseModel, summary="设为对比基线")
+async def set_execution_baseline(
+    execution_id: str,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """将执行设为其测试计划的对比基线（每个测试计划仅一个基线）"""
+    await check_permissions(["test_plan:update"], current_user)
+    execution = await check_execution_access(execution_id, current_user)
+
+    if execution.report is None:
+        raise HTTPException(status_code=400, detail="执行报告尚未生成，无法设为基线")
+    if execution.sample_storage != "columnar":
+        raise HTTPException(status_code=409, detail="执行原始结果已归档或尚未整理，无法设为基线")
+
+    async with in_transaction():
+        await TestExecution.filter(test_plan_id=execution.test_plan_id, is_baseline=True).update(is_baseline=False)
+        execution.is_baseline = True
+        await execution.save(update_fields=['is_baseline'])
+
+    return {
+        "code": 200,
+        "message": "已设为基线",
+        "data": execution_data(execution)
+    }
+
+
+@Executions.delete("/{execution_id}/baseline", response_model=ResponseModel, summary="取消对比基线")
+async def unset_execution_baseline(
+    execution_id: str,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """取消执行的基线标记"""
+    await check_permissions(["test_plan:update"], current_user)
+    execution = await check_execution_access(execution_id, current_user)
+
+    execution.is_baseline = False
+    await execution.save(update_fields=['is_baseline'])
+
+    return {
+        "code": 200,
+        "message": "已取消基线",
+        "data": execution_data(execution)
+    }
+
+
+@Executions.get("/{execution_id}/compare", response_model=ResponseModel, summary="与基线对比")
+async def compare_execution(
+    execution_id: str,
+    baseline_id: Optional[str] = Query(None, description="基线执行ID，为空时使用测试计划的基线"),
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """逐标签比较执行与基线的延迟分位数(含置信区间)、Mann–Whitney 检验与错误率"""
+    await check_permissions(["test_plan:read"], current_user)
+    execution = await check_execution_access(execution_id, current_user)
+
+    if baseline_id:
+        baseline = await check_execution_access(baseline_id, current_user)
+    else:
+        baseline = await TestExecution.filter(
+            test_plan_id=execution.test_plan_id, is_baseline=True
+        ).exclude(id=execution.id).first()
+        if not baseline:
+            raise HTTPException(status_code=404, detail="测试计划未设置基线")
+
+    # 自动对比的结果直接返回
+    if execution.comparison and execution.comparison.get("baseline_execution_id") == baseline.execution_id:
+        comparison = execution.comparison
+    else:
+        comparison = await compare_executions(baseline, execution)
+    if comparison is None:
+        raise HTTPException(status_code=409, detail="执行报告尚未生成")
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": comparison
+    }
+
+
+@Executions.get("/{execution_id}/query", response_model=ResponseModel, summary="查询执行结果统计")
+async def query_execution_results(
+    execution_id: str,
+    label: Optional[str] = Query(None, description="请求标签，为空时统计全部"),
+    start: Optional[float] = Query(None, ge=0, description="起始时间(相对首个采样的秒数)"),
+    end: Optional[float] = Query(None, ge=0, description="结束时间(相对首个采样的秒数)"),
+    percentiles: str = Query("50,90,95,99", pattern=r"^\d+(\.\d+)?(,\d+(\.\d+)?)*$", description="分位数，逗号分隔"),
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """
+    在列式结果上统计指定标签、时间范围内的样本数、错误率、吞吐与延迟分位数，
+    例如 label=X&start=600&end=1200 即第 10~20 分钟内 X 的分位数
+    """
+    await check_permissions(["test_plan:read"], current_user)
+    execution = await check_execution_access(execution_id, current_user)
+
+    ps = tuple(float(p) for p in percentiles.split(","))
+    if any(p > 100 for p in ps):
+        raise HTTPException(status_code=400, detail="分位数取值范围为 0~100")
+
+    if execution.sample_storage == "archived":
+        raise HTTPException(status_code=409, detail="执行原始结果已归档，只保留报告与分钟汇总")
+    result = ColumnarResult.open(execution.execution_id) if execution.sample_storage == "columnar" else None
+    if result is None:
+        raise HTTPException(status_code=409, detail="执行结果尚未整理完成")
+
+    base = result.meta["start_ts"] or 0
+    start_ts = base + int(start * 1000) if start is not None else None
+    end_ts = base + int(end * 1000) if end is not None else None
+    summary = await asyncio.to_thread(result.summarize, label, start_ts, end_ts, ps)
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": {
+            "label": label,
+            "start": start,
+            "end": end,
+            **summary
+        }
+    }
+
+
+@Executions.get("/{execution_id}/metrics", response_model=ResponseModel, summary="获取执行时序指标")
+async def get_execution_metrics(
+    execution_id: str,
+    source: Optional[str] = Query(None, max_length=50, description="指标来源筛选: execution 或 monitor:<目标ID>"),
+    names: Optional[str] = Query(None, max_length=500, description="指标名称，逗号分隔"),
+    start: Optional[int] = Query(None, ge=0, description="起始时间(秒级时间戳)"),
+    end: Optional[int] = Query(None, ge=0, description="结束时间(秒级时间戳)"),
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """
+    获取执行的秒级时序指标：执行自身的吞吐/延迟/错误(source=execution)
+    与被测系统监控目标的资源指标(source=monitor:<目标ID>)，时间轴一致，可直接叠加展示
+    """
+    await check_permissions(["test_plan:read"], current_user)
+    execution = await check_execution_access(execution_id, current_user)
+
+    filters = {"execution_id": execution.id}
+    if source:
+        filters["source"] = source
+    if names:
+        filters["name__in"] = [name.strip() for name in names.split(",") if name.strip()]
+    if start is not None:
+        filters["ts__gte"] = start
+    if end is not None:
+        filters["ts__lt"] = end
+    points = await MetricPoint.filter(**filters).order_by('ts', 'id').values_list('source', 'name', 'ts', 'value')
+
+    series = {}
+    for point_source, name, ts, value in points:
+        item = series.setdefault(point_source, {}).setdefault(name, {"ts": [], "values": []})
+        item["ts"].append(ts)
+        item["values"].append(value)
+
+    monitor_ids = [int(key.split(":", 1)[1]) for key in series if key.startswith("monitor:")]
+    monitors = await MonitorTarget.filter(id__in=monitor_ids).values('id', 'name', 'host') if monitor_ids else []
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": {
+            "series": series,
+            "monitors": [{**monitor, "source": f"monitor:{monitor['id']}"} for monitor in monitors]
+        }
+    }
+
+
+@Executions.get("/{execution_id}/errors", response_model=ResponseModel, summary="获取执行错误聚合")
+async def get_execution_errors(
+    execution_id: str,
+    limit: int = Query(20, ge=1, le=200, description="返回的错误指纹数"),
+    label: Optional[str] = Query(None, max_length=255, description="请求标签筛选"),
+    examples: bool = Query(False, description="是否返回抽样保留的错误示例"),
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """
+    按出现次数列出执行的错误指纹(状态码 + 异常类型 + 归一化消息)，
+    运行中的执行直接读取实时聚合，已结束的执行读取保存的指纹；
+    各指纹的每秒次数在时序指标中(source=error:<指纹>)
+    """
+    await check_permissions(["test_plan:read"], current_user)
+    execution = await check_execution_access(execution_id, current_user)
+
+    live = registry.get(execution.execution_id)
+    if live is not None:
+        items = live.errors.top(limit, label, examples)
+    else:
+        items = await top_errors(execution.id, limit, label, examples)
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": {
+            "errors": items,
+            "total_errors": execution.error_samples if live is None else live.stats.errors
+        }
+    }
+
+
+@Executions.post("/{execution_id}/samples", response_model=ResponseModel, summary="上报执行采样")
+async def report_samples(
+    execution_id: str,
+    batch: SampleBatch,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """负载机批量上报请求采样，响应中 abort 为 true 时负载机应立即停止压测"""
+    await check_permissions(["slave:update"], current_user)
+
+    live = registry.get(execution_id)
+    if not live:
+        execution = await TestExecution.get_or_none(execution_id=execution_id)
+        if not execution:
+            raise HTTPException(status_code=404, detail="执行记录不存在")
+        raise HTTPException(status_code=409, detail="执行已结束，不再接收采样")
+    if batch.slave_id not in live.slave_ids:
+        raise HTTPException(status_code=403, detail="从机不属于该执行")
+
+    accepted, breached = await ingest_samples(live, batch.slave_id, batch.samples)
+    data = {"accepted": accepted, "abort": False}
+
+    # 违反硬性 SLA 规则：立即终止执行并通知全部负载机，同时在响应中通知上报的负载机停止压测
+    if breached:
+        execution = await TestExecution.get(id=live.id)
+        reason = f"违反 SLA 硬性规则: {describe_rule(breached)}"
+        await stop_execution(execution, "hard", reason)
+        data.update(abort=True, reason=reason)
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": data
+    }
+
+
+@Executions.post("/{execution_id}/finish", response_model=ResponseModel, summary="结束执行")
+async def finish_test_execution(
+    execution_id: str,
+    finish_data: ExecutionFinish,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """结束执行（负载机全部完成或执行失败时调用）"""
+    await check_permissions(["test_plan:execute"], current_user)
+    execution = await check_execution_access(execution_id, current_user)
+
+    if execution.status in FINISHED_STATUSES:
+        raise HTTPException(status_code=400, detail="执行已结束")
+    if execution.status == "queued":
+        raise HTTPException(status_code=400, detail="执行排队中，尚未开始")
+
+    execution = await finish_execution(execution, finish_data.status)
+
+    return {
+        "code": 200,
+        "message": "执行已结束",
+        "data": execution_data(execution)
+    }
+
+
+@Executions.post("/{execution_id}/stop", response_model=ResponseModel, summary="停止执行")
+async def stop_test_execution(
+    execution_id: str,
+    stop_data: ExecutionStop,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """
+    停止运行中的执行，停止指令并发下发到全部负载机；排队中的执行直接取消
+
+    graceful 方式下执行先进入 stopping 状态，等待负载机排空在途请求；
+    对 stopping 状态的执行可再次以 hard 方式立即终止。
+    """
+    await check_permissions(["test_plan:execute"], current_user)
+    execution = await check_execution_access(execution_id, current_user)
+
+    if execution.status in FINISHED_STATUSES:
+        raise HTTPException(status_code=400, detail="执行已结束")
+    if execution.status == "stopping" and stop_data.mode == "graceful":
+        raise HTTPException(status_code=400, detail="执行正在停止")
+
+    reason = stop_data.reason or f"由 {current_user.username} 手动停止"
+    results = await stop_execution(execution, stop_data.mode, reason)
+    if results is None:
+        raise HTTPException(status_code=400, detail="执行已结束")
+
+    return {
+        "code": 200,
+        "message": "执行已停止" if stop_data.mode == "hard" or execution.status == "aborted" else "执行正在停止",
+        "data": {**execution_data(execution), "slaves": results}
+    }
+
+
+@Executions.post("/{execution_id}/logs", response_model=ResponseModel, summary="上报执行日志")
+async def report_logs(
+    execution_id: str,
+    batch: LogBatch,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """负载机批量上报标准输出/错误输出与引擎日志"""
+    await check_permissions(["slave:update"], current_user)
+
+    if not registry.get(execution_id):
+        execution = await TestExecution.get_or_none(execution_id=execution_id)
+        if not execution:
+            raise HTTPException(status_code=404, detail="执行记录不存在")
+        raise HTTPException(status_code=409, detail="执行已结束，不再接收日志")
+
+    log = log_store.open(execution_id)
+    accepted = log.append(batch.slave_id, batch.entries)
+    if log.needs_flush:
+        await log.flush()
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": {"accepted": accepted, "next_offset": log.next_offset}
+    }
+
+
+@Executions.get("/{execution_id}/logs", response_model=ResponseModel, summary="按偏移读取执行日志")
+async def read_logs(
+    execution_id: str,
+    offset: int = Query(0, ge=0, description="起始偏移(行号，从 0 开始)"),
+    limit: int = Query(500, ge=1, le=LOG_READ_MAX, description="读取行数"),
+    tail: Optional[int] = Query(None, ge=1, le=LOG_READ_MAX, description="读取最后若干行，指定时忽略 offset"),
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """按偏移范围读取执行日志，仅解压命中的分段"""
+    await check_permissions(["test_plan:read"], current_user)
+    await check_execution_access(execution_id, current_user)
+
+    log = log_store.get(execution_id)
+    if log:
+        total = log.next_offset
+        if tail:
+            offset, limit = max(total - tail, 0), tail
+        items = await log.read(offset, limit)
+    else:
+        if tail:
+            _, total = await log_store.read_history(execution_id, 0, 0)
+            offset, limit = max(total - tail, 0), tail
+        items, total = await log_store.read_history(execution_id, offset, limit)
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": {
+            "items": items,
+            "offset": offset,
+            "next_offset": offset + len(items),
+            "total": total,
+            "finished": log is None
+        }
+    }
+
+
+@Executions.websocket("/{execution_id}/logs/ws")
+async def follow_logs(
+    websocket: WebSocket,
+    execution_id: str,
+    token: Optional[str] = Query(None, description="访问令牌"),
+    offset: Optional[int] = Query(None, ge=0, description="起始偏移，为空时从最近的环形缓冲开始")
+):
+    """
+    实时跟随执行日志
+
+    浏览器 WebSocket 无法携带请求头，令牌通过查询参数传递。
+    推送消息格式：{"type": "logs", "items": [...], "next_offset": n}，空闲时推送 {"type": "heartbeat"}，
+    执行结束后推送 {"type": "end"} 并关闭连接。
+    """
+    current_user = await authenticate_token(token)
+    if current_user is None:
+        await websocket.close(code=4401, reason="无效的认证凭据")
+        return
+    try:
+        await check_permissions(["test_plan:read"], current_user)
+        await check_execution_access(execution_id, current_user)
+    except HTTPException as e:
+        await websocket.close(code=4000 + e.status_code, reason=str(e.detail))
+        return
+
+    await websocket.accept()
+    try:
+        log = log_store.get(execution_id)
+        if offset is None:
+            offset = max(log.next_offset - LOG_READ_MAX, 0) if log else 0
+
+        # 运行中：先补齐积压，再等待新日志
+        while log and not log.closed:
+            items = await log.read(offset, LOG_READ_MAX)
+            if items:
+                offset += len(items)
+                await websocket.send_json({"type": "logs", "items": items, "next_offset": offset})
+                continue
+            if not await log.wait(offset, timeout=15) and not log.closed:
+                # 空闲时发送心跳，以便及时发现客户端断开
+                await websocket.send_json({"type": "heartbeat", "next_offset": offset})
+
+        # 已结束：从分段文件读完剩余日志
+        while True:
+            items, total = await log_store.read_history(execution_id, offset, LOG_READ_MAX)
+            if not items:
+                break
+            offset += len(items)
+            await websocket.send_json({"type": "logs", "items": items, "next_offset": offset})
+
+        await websocket.send_json({"type": "end", "next_offset": offset})
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
@@ -0,0 +1,222 @@
+"""
+被测系统监控 API
+提供监控目标的 CRUD 操作、代理指标推送与采集测试
+"""
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+import httpx
+
+from models import MonitorTarget, UserInfo, Project, ProjectMember
+from schemas.monitor_schemas import MonitorTargetCreate, MonitorTargetUpdate, MonitorPointBatch
+from schemas.common_schemas import ResponseModel
+from services.monitoring import monitor_collector
+from services.pagination import count_cache, fetch_page, build_page_data, TOTAL_MODE_PATTERN
+from security import get_current_active_user, check_permissions
+from api.projects import check_project_access
+
+Monitors = APIRouter()
+
+
+# 辅助函数
+async def check_monitor_access(target_id: int, current_user: UserInfo) -> MonitorTarget:
+    """
+    检查监控目标是否存在以及用户是否有访问其项目的权限
+
+    Raises:
+        HTTPException: 监控目标不存在或无权访问
+    """
+    target = await MonitorTarget.get_or_none(id=target_id, is_deleted=False)
+    if not target:
+        raise HTTPException(status_code=404, detail="监控目标不存在")
+    await check_project_access(target.project_id, current_user)
+    return target
+
+
+def monitor_data(target: MonitorTarget) -> dict:
+    """监控目标响应数据(不返回采集令牌)"""
+    return {
+        "id": target.id,
+        "name": target.name,
+        "description": target.description,
+        "project_id": target.project_id,
+        "host": target.host,
+        "port": target.port,
+        "method": target.method,
+        "scheme": target.scheme,
+        "metrics_path": target.metrics_path,
+        "interval": target.interval,
+        "extra_metrics": target.extra_metrics,
+        "source": f"monitor:{target.id}",
+        "last_collected_at": target.last_collected_at,
+        "last_error": target.last_error,
+        "is_active": target.is_active,
+        "created_at": target.created_at,
+        "updated_at": target.updated_at
+    }
+
+
+@Monitors.get("", response_model=ResponseModel, summary="分页获取监控目标列表")
+async def list_monitor_targets(
+    page: int = Query(1, ge=1, description="页码"),
+    page_size: int = Query(20, ge=1, le=100, description="每页数量"),
+    name: Optional[str] = Query(None, description="名称筛选"),
+    project_id: Optional[int] = Query(None, description="项目ID筛选"),
+    total_mode: str = Query("exact", alias="total", pattern=TOTAL_MODE_PATTERN, description="总数统计方式: exact/approx/none"),
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """获取监控目标列表（分页）"""
+    await check_permissions(["slave:read"], current_user)
+
+    filters = {"is_deleted": False}
+    if name:
+        filters["name__icontains"] = name
+    if project_id:
+        filters["project_id"] = project_id
+
+    # 非超级管理员只能看到自己项目的监控目标
+    if not current_user.is_superuser:
+        member_project_ids = await ProjectMember.filter(
+            user_id=current_user.id,
+            is_active=True
+        ).values_list('project_id', flat=True)
+        manager_project_ids = await Project.filter(
+            manager_id=current_user.id,
+            is_deleted=False
+        ).values_list('id', flat=True)
+        filters["project_id__in"] = list(set(member_project_ids) | set(manager_project_ids))
+
+    query = MonitorTarget.filter(**filters)
+    total = await count_cache.count(MonitorTarget, filters, query, total_mode)
+    targets, has_next = await fetch_page(query.order_by('-id'), page, page_size)
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": build_page_data([monitor_data(t) for t in targets], total, page, page_size, has_next)
+    }
+
+
+@Monitors.post("", response_model=ResponseModel, summary="创建监控目标")
+async def create_monitor_target(
+    target_data: MonitorTargetCreate,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """创建监控目标，项目内的测试计划执行期间自动采集"""
+    await check_permissions(["slave:create"], current_user)
+    await check_project_access(target_data.project_id, current_user)
+    if target_data.method == "node_exporter" and not target_data.port:
+        raise HTTPException(status_code=400, detail="node_exporter 采集方式需要指定端口")
+
+    target = await MonitorTarget.create(**target_data.model_dump())
+
+    return {
+        "code": 200,
+        "message": "监控目标创建成功",
+        "data": monitor_data(target)
+    }
+
+
+@Monitors.get("/{target_id}", response_model=ResponseModel, summary="获取监控目标详情")
+async def get_monitor_target_detail(
+    target_id: int,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """获取监控目标详情"""
+    await check_permissions(["slave:read"], current_user)
+    target = await check_monitor_access(target_id, current_user)
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": monitor_data(target)
+    }
+
+
+@Monitors.put("/{target_id}", response_model=ResponseModel, summary="更新监控目标")
+async def update_monitor_target(
+    target_id: int,
+    target_data: MonitorTargetUpdate,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """更新监控目标"""
+    await check_permissions(["slave:update"], current_user)
+    target = await check_monitor_access(target_id, current_user)
+
+    update_data = target_data.model_dump(exclude_unset=True)
+    if update_data:
+        target.update_from_dict(update_data)
+        if target.method == "node_exporter" and not target.port:
+            raise HTTPException(status_code=400, detail="node_exporter 采集方式需要指定端口")
+        await target.save()
+
+    return {
+        "code": 200,
+        "message": "监控目标更新成功",
+        "data": monitor_data(target)
+    }
+
+
+@Monitors.delete("/{target_id}", response_model=ResponseModel, summary="删除监控目标")
+async def delete_monitor_target(
+    target_id: int,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """删除监控目标（软删除，已采集的指标保留）"""
+    await check_permissions(["slave:delete"], current_user)
+    target = await check_monitor_access(target_id, current_user)
+
+    target.is_deleted = True
+    await target.save()
+
+    return {
+        "code": 200,
+        "message": "监控目标删除成功",
+        "data": None
+    }
+
+
+@Monitors.post("/{target_id}/scrape", response_model=ResponseModel, summary="测试采集监控目标")
+async def test_scrape_monitor_target(
+    target_id: int,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """立即拉取一次 node_exporter 目标并返回派生指标(不写入时序表)，用于验证配置"""
+    await check_permissions(["slave:read"], current_user)
+    target = await check_monitor_access(target_id, current_user)
+    if target.method != "node_exporter":
+        raise HTTPException(status_code=400, detail="仅 node_exporter 采集方式支持拉取测试")
+
+    try:
+        metrics = await monitor_collector.scrape(target)
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=502, detail=f"采集失败: {str(e) or type(e).__name__}")
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": metrics
+    }
+
+
+@Monitors.post("/{target_id}/points", response_model=ResponseModel, summary="代理推送监控指标")
+async def push_monitor_points(
+    target_id: int,
+    batch: MonitorPointBatch,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """agent 采集方式的监控代理批量推送指标点，写入项目内所有运行中的执行"""
+    await check_permissions(["slave:update"], current_user)
+
+    target = await MonitorTarget.get_or_none(id=target_id, is_deleted=False)
+    if not target:
+        raise HTTPException(status_code=404, detail="监控目标不存在")
+    if target.method != "agent":
+        raise HTTPException(status_code=400, detail="该监控目标不是 agent 采集方式")
+
+    accepted = await monitor_collector.record_push(target, batch.points) if target.is_active else 0
+
+    return {
+        "code": 200,
+        "message": "success",
+        "data": {"accepted": accepted}
+    }
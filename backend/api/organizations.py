@@ -3,8 +3,9 @@
 提供组织的 CRUD 操作、层级结构查询等功能
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from tortoise.exceptions import DoesNotExist
+from tortoise.transactions import in_transaction
 
 from models import Organize, UserInfo, UserOrgRole
 from schemas.organize_schemas import (
@@ -15,6 +16,9 @@ from schemas.organize_schemas import (
     OrganizeTreeResponse
 )
 from schemas.common_schemas import ResponseModel
+from services.pagination import count_cache, fetch_page, build_page_data, TOTAL_MODE_PATTERN
+from services.org_hierarchy import assign_path, move_subtree, count_descendants, is_ancestor
+from services.org_tree import org_tree
 from security import get_current_active_user, check_permissions
 
 Organizations = APIRouter()
@@ -56,30 +60,32 @@ async def list_organizations(
     name: Optional[str] = Query(None, description="组织名称筛选"),
     level: Optional[int] = Query(None, description="层级筛选"),
     parent_id: Optional[int] = Query(None, description="父级组织ID筛选"),
+    total_mode: str = Query("exact", alias="total", pattern=TOTAL_MODE_PATTERN, description="总数统计方式: exact/approx/none"),
     current_user: UserInfo = Depends(get_current_active_user)
 ):
     """获取组织列表（分页）"""
     # 构建查询条件
-    query = Organize.filter(is_deleted=False)
+    filters = {"is_deleted": False}
     
     if name:
-        query = query.filter(name__icontains=name)
+        filters["name__icontains"] = name
     if level is not None:
-        query = query.filter(level=level)
+        filters["level"] = level
     if parent_id is not None:
-        query = query.filter(parent_id=parent_id)
+        filters["parent_id"] = parent_id
     
     # 非超级管理员只能看到自己所属的组织
     if not current_user.is_superuser:
         user_org_roles = await UserOrgRole.filter(user=current_user, is_active=True).values_list('organization_id', flat=True)
-        query = query.filter(id__in=user_org_roles)
+        filters["id__in"] = user_org_roles
     
-    # 计算总数
-    total = await query.count()
+    query = Organize.filter(**filters)
+    
+    # 计算总数（带缓存）
+    total = await count_cache.count(Organize, filters, query, total_mode)
     
     # 分页查询
-    offset = (page - 1) * page_size
-    organizations = await query.offset(offset).limit(page_size).prefetch_related('manager_id')
+    organizations, has_next = await fetch_page(query.prefetch_related('manager_id'), page, page_size)
     
     # 构建响应数据
     items = []
@@ -97,72 +103,26 @@ async def list_organizations(
         }
         items.append(org_data)
     
-    # 计算总页数
-    total_pages = (total + page_size - 1) // page_size
-    
     return {
         "code": 200,
         "message": "success",
-        "data":{
-            "items": items,
-            "total": total,
-            "page": page,
-            "size": page_size,
-            "pages": total_pages,
-            "has_next": page < total_pages,
-            "has_prev": page > 1
-        }
+        "data": build_page_data(items, total, page, page_size, has_next)
     }
 
 
 @Organizations.get("/tree", response_model=ResponseModel, summary="获取组织树")
 async def get_organization_tree(
+    request: Request,
     current_user: UserInfo = Depends(get_current_active_user)
 ):
-    """获取组织树形结构"""
-    # 获取所有未删除的组织
-    if current_user.is_superuser:
-        # 获取组织未删除关联的用户信息，按sort_order排序；prefetch_related访问关联字段
-        organizations = await Organize.filter(is_deleted=False).prefetch_related('manager_id').order_by('sort_order')
-    else:
-        # 非超级管理员只能看到自己所属的组织
-        # values_list只查询特定字段的值，返回一个元组列表[(1,), (2,), (3,)]
-        # lat=True获取单个字段的扁平化列表[1, 2, 3]
-        user_org_roles = await UserOrgRole.filter(user=current_user, is_active=True).values_list('organization_id', flat=True)
-        organizations = await Organize.filter(id__in=user_org_roles, is_deleted=False).prefetch_related('manager_id').order_by('sort_order')
-
-    # 构建组织字典
-    org_dict = {}
-    for org in organizations:
-        org_dict[org.id] = {
-            "id": org.id,
-            "name": org.name,
-            "level": org.level,
-            "parent_id": org.parent_id,
-            "manager": {
-                "id": org.manager_id.id,
-                "username": org.manager_id.username,
-                "real_name": org.manager_id.real_name
-            } if org.manager_id else None,
-            "children": []
-        }
-    # 构建树形结构
-    tree = []
-    for org_id, org_data in org_dict.items():
-
-        # 找到父级组织
-        if org_data["parent_id"] is None:
-            tree.append(org_data)
-        # 找到子级组织
-        elif org_data["parent_id"] in org_dict:
-            # 添加子级组织
-            org_dict[org_data["parent_id"]]["children"].append(org_data)
-    
-    return {
-        "code": 200,
-        "message": "success",
-        "data": tree
-    }
+    """获取组织树形结构（基于缓存快照，支持 If-None-Match）"""
+    # 超级管理员获取完整树，其他用户只能看到自己所属的组织
+    etag, tree = await org_tree.get_tree(current_user)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    body = b'{"code":200,"message":"success","data":' + tree + b'}'
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @Organizations.get("/{organization_id}", response_model=ResponseModel, summary="获取组织详情")
@@ -217,7 +177,7 @@ async def get_organization_detail(
     stats = {
         "total_members": len(members),
         "total_children": len(children),
-        "total_descendants": await count_descendants(organization_id)
+        "total_descendants": await count_descendants(org)
     }
     
     org_data = {
@@ -268,6 +228,7 @@ async def create_organization(
     if await Organize.get_or_none(name=org_data.name):
         raise HTTPException(status_code=400, detail="组织名称已存在")
     # 检查父级组织是否存在，默认只有一个父组织
+    parent = None
     if create_data.get('parent_id'):
         parent = await Organize.get_or_none(id=create_data['parent_id'], is_deleted=False)
         if not parent:
@@ -281,8 +242,10 @@ async def create_organization(
         if not manager:
             raise HTTPException(status_code=400, detail="管理员用户不存在")
     
-    # 创建组织
-    org = await Organize.create(**create_data)
+    # 创建组织并写入层级路径
+    async with in_transaction():
+        org = await Organize.create(**create_data)
+        await assign_path(org, parent)
     
     return {
         "code": 200,
@@ -318,6 +281,7 @@ async def update_organization(
         raise HTTPException(status_code=404, detail="组织不存在")
     
     # 检查父级组织
+    parent = None
     if org_data.parent_id is not None:
         if org_data.parent_id == organization_id:
             raise HTTPException(status_code=400, detail="不能将组织设置为自己的父级")
@@ -326,6 +290,9 @@ async def update_organization(
             parent = await Organize.get_or_none(id=org_data.parent_id, is_deleted=False)
             if not parent:
                 raise HTTPException(status_code=400, detail="父级组织不存在")
+            # 不能移动到自己的后代组织下，否则会形成环
+            if is_ancestor(org, parent):
+                raise HTTPException(status_code=400, detail="不能将组织移动到其子组织下")
     
     # 检查管理员
     if org_data.manager_id is not None:
@@ -343,7 +310,12 @@ async def update_organization(
     if 'manager_id' in update_data and update_data['manager_id'] == 0:
         update_data['manager_id'] = None
     
-    await org.update_from_dict(update_data).save()
+    async with in_transaction():
+        # 父级变更时整棵子树的路径和层级随之调整，层级由父级决定
+        if 'parent_id' in update_data and update_data['parent_id'] != org.parent_id:
+            update_data.pop('level', None)
+            await move_subtree(org, parent)
+        await org.update_from_dict(update_data).save()
     
     # 重新加载以获取最新数据
     await org.refresh_from_db()
@@ -434,14 +406,23 @@ async def get_organization_children(
 @Organizations.get("/{organization_id}/users", response_model=ResponseModel, summary="获取组织下的用户")
 async def get_organization_users(
     organization_id: int,
+    include_descendants: bool = Query(False, description="是否包含所有后代组织的用户"),
     current_user: UserInfo = Depends(get_current_active_user)
 ):
     """获取组织的所有用户"""
     # 检查组织存在性和访问权限
-    await check_organization_access(organization_id, current_user)
+    org = await check_organization_access(organization_id, current_user)
     
-    # 获取组织用户
-    user_org_roles = await UserOrgRole.filter(organization_id=organization_id, is_active=True).prefetch_related('user', 'role')
+    # 获取组织用户，包含后代时按路径前缀一次查询整棵子树
+    if include_descendants:
+        query = UserOrgRole.filter(
+            organization__path__startswith=org.path,
+            organization__is_deleted=False,
+            is_active=True
+        )
+    else:
+        query = UserOrgRole.filter(organization_id=organization_id, is_active=True)
+    user_org_roles = await query.prefetch_related('user', 'role')
     
     users_data = [
         {
@@ -455,6 +436,7 @@ async def get_organization_users(
                 "name": uor.role.name,
                 "description": uor.role.description
             },
+            "organization_id": uor.organization_id,
             "joined_at": uor.joined_at
         }
         for uor in user_org_roles
@@ -465,15 +447,3 @@ async def get_organization_users(
         "message": "success",
         "data": users_data
     }
-
-
-# 辅助函数
-async def count_descendants(organization_id: int) -> int:
-    """递归计算所有后代组织数量"""
-    children = await Organize.filter(parent_id=organization_id, is_deleted=False).values_list('id', flat=True)
-    count = len(children)
-    
-    for child_id in children:
-        count += await count_descendants(child_id)
-    
-    return count
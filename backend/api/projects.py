@@ -5,15 +5,20 @@
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from tortoise.exceptions import DoesNotExist
+from tortoise.transactions import in_transaction
 
-from models import Project, UserInfo, ProjectMember, Script
+from models import Project, UserInfo, ProjectMember, Script, Role
 from schemas.project_schemas import (
     ProjectCreate,
     ProjectUpdate,
     ProjectResponse,
-    ProjectDetailResponse
+    ProjectDetailResponse,
+    ProjectMemberBulkCreate,
+    ProjectMemberBulkRemove
 )
 from schemas.common_schemas import ResponseModel
+from services.bulk import BulkResult
+from services.pagination import count_cache, fetch_page, build_page_data, TOTAL_MODE_PATTERN
 from security import get_current_active_user, check_permissions
 
 Projects = APIRouter()
@@ -62,16 +67,17 @@ async def list_projects(
     page_size: int = Query(20, ge=1, le=100, description="每页数量"),
     name: Optional[str] = Query(None, description="项目名称筛选"),
     status: Optional[str] = Query(None, description="项目状态筛选"),
+    total_mode: str = Query("exact", alias="total", pattern=TOTAL_MODE_PATTERN, description="总数统计方式: exact/approx/none"),
     current_user: UserInfo = Depends(get_current_active_user)
 ):
     """获取项目列表（分页）"""
     # 构建查询条件
-    query = Project.filter(is_deleted=False)
+    filters = {"is_deleted": False}
     
     if name:
-        query = query.filter(name__icontains=name)
+        filters["name__icontains"] = name
     if status:
-        query = query.filter(status=status)
+        filters["status"] = status
     
     # 非超级管理员只能看到自己参与的项目
     if not current_user.is_superuser:
@@ -89,13 +95,15 @@ async def list_projects(
         
         # 合并两个列表
         accessible_project_ids = list(set(member_project_ids) | set(manager_project_ids))
-        query = query.filter(id__in=accessible_project_ids)
+        filters["id__in"] = accessible_project_ids
     
-    # 计算总数
-    total = await query.count()
+    query = Project.filter(**filters)
+    
+    # 计算总数（带缓存）
+    total = await count_cache.count(Project, filters, query, total_mode)
     
     # 分页查询
-    projects = await query.offset((page - 1) * page_size).limit(page_size).prefetch_related('manager_id')
+    projects, has_next = await fetch_page(query.prefetch_related('manager_id'), page, page_size)
     
     # 构建响应数据
     items = []
@@ -114,21 +122,10 @@ async def list_projects(
             "updated_at": project.updated_at
         })
     
-    # 计算总页数
-    total_pages = (total + page_size - 1) // page_size
-    
     return {
         "code": 200,
         "message": "success",
-        "data": {
-            "items": items,
-            "total": total,
-            "page": page,
-            "size": page_size,
-            "pages": total_pages,
-            "has_next": page < total_pages,
-            "has_prev": page > 1
-        }
+        "data": build_page_data(items, total, page, page_size, has_next)
     }
 
 
@@ -333,4 +330,114 @@ async def get_project_members(
         "code": 200,
         "message": "success",
         "data": members_data
-    }
\ No newline at end of file
+    }
+
+
+@Projects.post("/{project_id}/members/bulk", response_model=ResponseModel, summary="批量添加项目成员")
+async def bulk_add_project_members(
+    project_id: int,
+    bulk_data: ProjectMemberBulkCreate,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """批量添加项目成员，已移除的成员会被重新激活，逐条返回处理结果"""
+    # 检查权限
+    await check_permissions(["project:update"], current_user)
+    await check_project_access(project_id, current_user)
+    
+    items = bulk_data.items
+    result = BulkResult(len(items))
+    user_ids = list({item.user_id for item in items})
+    
+    # 一次查询用户、角色和已有成员关系
+    valid_user_ids = set(await UserInfo.filter(
+        id__in=user_ids, is_active=True, is_deleted=False
+    ).values_list('id', flat=True))
+    valid_role_ids = set(await Role.filter(
+        id__in=list({item.role_id for item in items}), is_deleted=False
+    ).values_list('id', flat=True))
+    memberships = {
+        member.user_id: member
+        for member in await ProjectMember.filter(project_id=project_id, user_id__in=user_ids)
+    }
+    
+    new_members = []
+    reactivated = []
+    seen = set()
+    for index, item in enumerate(items):
+        member = memberships.get(item.user_id)
+        if item.user_id not in valid_user_ids:
+            result.fail(index, "用户不存在")
+        elif item.role_id not in valid_role_ids:
+            result.fail(index, "角色不存在")
+        elif item.user_id in seen:
+            result.fail(index, "同批次中用户重复")
+        elif member and member.is_active:
+            result.fail(index, "用户已是项目成员")
+        elif member:
+            member.is_active = True
+            member.role_id = item.role_id
+            reactivated.append(member)
+        else:
+            new_members.append(ProjectMember(project_id=project_id, user_id=item.user_id, role_id=item.role_id))
+        seen.add(item.user_id)
+    
+    # 单个事务中批量写入
+    valid = result.pending()
+    if valid:
+        async with in_transaction():
+            if new_members:
+                await ProjectMember.bulk_create(new_members)
+            if reactivated:
+                await ProjectMember.bulk_update(reactivated, fields=["is_active", "role_id"])
+            created = await ProjectMember.filter(
+                project_id=project_id, user_id__in=[items[index].user_id for index in valid]
+            ).values_list('user_id', 'id')
+        count_cache.invalidate(ProjectMember)
+        
+        id_map = dict(created)
+        for index in valid:
+            result.succeed(index, id_map.get(items[index].user_id))
+    
+    return {
+        "code": 200,
+        "message": "操作成功",
+        "data": result.to_dict()
+    }
+
+
+@Projects.post("/{project_id}/members/bulk-remove", response_model=ResponseModel, summary="批量移除项目成员")
+async def bulk_remove_project_members(
+    project_id: int,
+    bulk_data: ProjectMemberBulkRemove,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """批量移除项目成员（置为未激活），逐条返回处理结果"""
+    # 检查权限
+    await check_permissions(["project:update"], current_user)
+    await check_project_access(project_id, current_user)
+    
+    user_ids = bulk_data.user_ids
+    result = BulkResult(len(user_ids))
+    active = dict(await ProjectMember.filter(
+        project_id=project_id, user_id__in=user_ids, is_active=True
+    ).values_list('user_id', 'id'))
+    seen = set()
+    for index, user_id in enumerate(user_ids):
+        if user_id not in active:
+            result.fail(index, "用户不是项目成员")
+        elif user_id in seen:
+            result.fail(index, "同批次中用户重复")
+        else:
+            seen.add(user_id)
+            result.succeed(index, active[user_id])
+    
+    # 一条 UPDATE 完成移除
+    if active:
+        await ProjectMember.filter(id__in=list(active.values())).update(is_active=False)
+        count_cache.invalidate(ProjectMember)
+    
+    return {
+        "code": 200,
+        "message": "项目成员批量移除完成",
+        "data": result.to_dict()
+    }
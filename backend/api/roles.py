@@ -9,6 +9,7 @@ from tortoise.exceptions import DoesNotExist
 from models import Role, Organize
 from security import get_current_active_user, check_permissions
 from schemas.common_schemas import ResponseModel
+from services.pagination import count_cache, fetch_page, build_page_data, TOTAL_MODE_PATTERN
 from schemas.role_schemas import RoleCreate, RoleUpdate
 
 Roles = APIRouter()
@@ -22,6 +23,7 @@ async def list_roles(
     page_size: int = Query(20, ge=1, le=100, description="每页数量"),
     name: Optional[str] = Query(None, description="角色名称筛选"),
     org_id: Optional[int] = Query(None, description="组织ID筛选"),
+    total_mode: str = Query("exact", alias="total", pattern=TOTAL_MODE_PATTERN, description="总数统计方式: exact/approx/none"),
     current_user = Depends(get_current_active_user)
 ):
     """获取角色列表（分页）"""
@@ -29,18 +31,20 @@ async def list_roles(
     await check_permissions(["role:read"], current_user)
     
     # 构建查询条件
-    query = Role.filter(is_deleted=False)
+    filters = {"is_deleted": False}
     
     if name:
-        query = query.filter(name__icontains=name)
+        filters["name__icontains"] = name
     if org_id is not None:
-        query = query.filter(org_id=org_id)
+        filters["org_id"] = org_id
     
-    # 计算总数
-    total = await query.count()
+    query = Role.filter(**filters)
+    
+    # 计算总数（带缓存）
+    total = await count_cache.count(Role, filters, query, total_mode)
     
     # 分页查询
-    roles = await query.offset((page - 1) * page_size).limit(page_size)
+    roles, has_next = await fetch_page(query, page, page_size)
     
     # 获取所有唯一的组织ID
     org_ids = {role.org_id for role in roles if role.org_id}
@@ -66,21 +70,10 @@ async def list_roles(
         }
         roles_data.append(role_dict)
     
-    # 计算总页数
-    total_pages = (total + page_size - 1) // page_size
-    
     return {
         "code": 200,
         "message": "success",
-        "data": {
-            "items": roles_data,
-            "total": total,
-            "page": page,
-            "size": page_size,
-            "pages": total_pages,
-            "has_next": page < total_pages,
-            "has_prev": page > 1
-        }
+        "data": build_page_data(roles_data, total, page, page_size, has_next)
     }
 
 
@@ -6,6 +6,8 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, File, UploadFile, Form
 from fastapi.responses import FileResponse
 from tortoise.exceptions import DoesNotExist
+from tortoise import timezone
+from tortoise.transactions import in_transaction
 from pathlib import Path
 from datetime import datetime
 import os
@@ -14,9 +16,15 @@ from schemas.script_schemas import (
     ScriptCreate,
     ScriptUpdate,
     ScriptResponse,
-    ScriptDetailResponse
+    ScriptDetailResponse,
+    ScriptBulkCreate,
+    ScriptBulkUpdate
 )
-from schemas.common_schemas import ResponseModel
+from schemas.common_schemas import ResponseModel, BulkDeleteRequest
+from config import SCRIPT_DIR
+from services.bulk import BulkResult
+from services.script_files import script_path
+from services.pagination import count_cache, fetch_page, build_page_data, TOTAL_MODE_PATTERN
 from security import get_current_active_user, check_permissions
 
 Scripts = APIRouter()
@@ -67,18 +75,19 @@ async def list_scripts(
     name: Optional[str] = Query(None, description="脚本名称筛选"),
     project_id: Optional[int] = Query(None, description="项目ID筛选"),
     script_type: Optional[str] = Query(None, description="脚本类型筛选"),
+    total_mode: str = Query("exact", alias="total", pattern=TOTAL_MODE_PATTERN, description="总数统计方式: exact/approx/none"),
     current_user: UserInfo = Depends(get_current_active_user)
 ):
     """获取脚本列表（分页）"""
     # 构建查询条件
-    query = Script.filter(is_deleted=False)
+    filters = {"is_deleted": False}
     
     if name:
-        query = query.filter(name__icontains=name)
+        filters["name__icontains"] = name
     if project_id:
-        query = query.filter(project_id=project_id)
+        filters["project_id"] = project_id
     if script_type:
-        query = query.filter(script_type=script_type)
+        filters["script_type"] = script_type
     
     # 非超级管理员只能看到自己项目的脚本
     if not current_user.is_superuser:
@@ -95,14 +104,15 @@ async def list_scripts(
         ).values_list('id', flat=True)
         
         accessible_project_ids = list(set(member_project_ids) | set(manager_project_ids))
-        query = query.filter(project_id__in=accessible_project_ids)
+        filters["project_id__in"] = accessible_project_ids
     
-    # 计算总数
-    total = await query.count()
+    query = Script.filter(**filters)
+    
+    # 计算总数（带缓存）
+    total = await count_cache.count(Script, filters, query, total_mode)
     
     # 分页查询
-    offset = (page - 1) * page_size
-    scripts = await query.offset(offset).limit(page_size).prefetch_related('author_id', 'project_id')
+    scripts, has_next = await fetch_page(query.prefetch_related('author_id', 'project_id'), page, page_size)
     
     # 构建响应数据
     items = []
@@ -123,21 +133,167 @@ async def list_scripts(
         }
         items.append(script_data)
     
-    # 计算总页数
-    total_pages = (total + page_size - 1) // page_size
-    
     return {
         "code": 200,
         "message": "success",
-        "data": {
-            "items": items,
-            "total": total,
-            "page": page,
-            "size": page_size,
-            "pages": total_pages,
-            "has_next": page < total_pages,
-            "has_prev": page > 1
-        }
+        "data": build_page_data(items, total, page, page_size, has_next)
+    }
+
+
+@Scripts.post("/bulk", response_model=ResponseModel, summary="批量登记脚本元数据")
+async def bulk_create_scripts(
+    bulk_data: ScriptBulkCreate,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """批量登记已存在于脚本目录中的脚本文件，逐条返回处理结果"""
+    # 检查权限
+    await check_permissions(["script:create"], current_user)
+    
+    items = bulk_data.items
+    result = BulkResult(len(items))
+    
+    # 一次查询所有涉及的项目和作者
+    project_ids = set(await Project.filter(
+        id__in=list({item.project_id for item in items}), is_deleted=False
+    ).values_list('id', flat=True))
+    author_ids = set(await UserInfo.filter(
+        id__in=list({item.author_id for item in items if item.author_id}), is_active=True
+    ).values_list('id', flat=True))
+    
+    seen_paths = set()
+    file_sizes = {}
+    for index, item in enumerate(items):
+        path = script_path(item.file_path)
+        if item.project_id not in project_ids:
+            result.fail(index, "项目不存在")
+        elif item.author_id and item.author_id not in author_ids:
+            result.fail(index, "作者不存在")
+        elif item.file_path in seen_paths:
+            result.fail(index, "同批次中脚本文件重复")
+        elif path is None:
+            result.fail(index, "脚本文件必须位于脚本目录中")
+        elif not path.is_file():
+            result.fail(index, "脚本文件不存在")
+        else:
+            file_sizes[index] = path.stat().st_size
+        seen_paths.add(item.file_path)
+    
+    # 单个事务中批量插入
+    valid = result.pending()
+    if valid:
+        async with in_transaction():
+            await Script.bulk_create([
+                Script(
+                    name=items[index].name,
+                    file_path=items[index].file_path,
+                    file_size=file_sizes[index],
+                    script_version=items[index].script_version,
+                    script_type=items[index].script_type,
+                    description=items[index].description,
+                    author_id_id=items[index].author_id or current_user.id,
+                    project_id_id=items[index].project_id
+                )
+                for index in valid
+            ])
+            # 同一文件可能被历史脚本引用，取最新插入的记录
+            created = await Script.filter(
+                file_path__in=[items[index].file_path for index in valid], is_deleted=False
+            ).order_by('id').values_list('file_path', 'id')
+        count_cache.invalidate(Script)
+        
+        id_map = dict(created)
+        for index in valid:
+            result.succeed(index, id_map.get(items[index].file_path))
+    
+    return {
+        "code": 200,
+        "message": "操作成功",
+        "data": result.to_dict()
+    }
+
+
+@Scripts.put("/bulk", response_model=ResponseModel, summary="批量更新脚本")
+async def bulk_update_scripts(
+    bulk_data: ScriptBulkUpdate,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """批量更新脚本元数据，逐条返回处理结果"""
+    # 检查权限
+    await check_permissions(["script:update"], current_user)
+    
+    items = bulk_data.items
+    result = BulkResult(len(items))
+    
+    # 一次加载全部待更新的脚本
+    scripts = await Script.filter(id__in=[item.id for item in items], is_deleted=False)
+    script_map = {script.id: script for script in scripts}
+    
+    changed = {}
+    fields = set()
+    now = timezone.now()
+    for index, item in enumerate(items):
+        script = script_map.get(item.id)
+        if not script:
+            result.fail(index, "脚本不存在")
+            continue
+        if item.id in changed:
+            result.fail(index, "同批次中脚本重复")
+            continue
+        if item.file_path is not None and script_path(item.file_path) is None:
+            result.fail(index, "脚本文件必须位于脚本目录中")
+            continue
+        
+        update_data = item.model_dump(exclude_unset=True, exclude={"id"})
+        script.update_from_dict(update_data)
+        script.updated_at = now
+        changed[item.id] = script
+        fields.update(update_data.keys())
+        result.succeed(index, script.id)
+    
+    # 单个事务中批量更新
+    if changed and fields:
+        async with in_transaction():
+            await Script.bulk_update(list(changed.values()), fields=sorted(fields) + ["updated_at"])
+        count_cache.invalidate(Script)
+    
+    return {
+        "code": 200,
+        "message": "脚本批量更新完成",
+        "data": result.to_dict()
+    }
+
+
+@Scripts.post("/bulk-delete", response_model=ResponseModel, summary="批量删除脚本")
+async def bulk_delete_scripts(
+    bulk_data: BulkDeleteRequest,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """批量删除脚本（软删除），逐条返回处理结果"""
+    # 检查权限
+    await check_permissions(["script:delete"], current_user)
+    
+    ids = bulk_data.ids
+    result = BulkResult(len(ids))
+    existing = set(await Script.filter(id__in=ids, is_deleted=False).values_list('id', flat=True))
+    seen = set()
+    for index, script_id in enumerate(ids):
+        if script_id not in existing:
+            result.fail(index, "脚本不存在")
+        elif script_id in seen:
+            result.fail(index, "同批次中脚本重复")
+        else:
+            seen.add(script_id)
+            result.succeed(index, script_id)
+    
+    # 一条 UPDATE 完成软删除
+    if existing:
+        await Script.filter(id__in=list(existing)).update(is_deleted=True, updated_at=timezone.now())
+        count_cache.invalidate(Script)
+    
+    return {
+        "code": 200,
+        "message": "脚本批量删除完成",
+        "data": result.to_dict()
     }
 
 
@@ -191,9 +347,9 @@ async def download_script(
     # 检查脚本存在性和访问权限
     script = await check_script_access(script_id, current_user)
     
-    # 检查文件是否存在
-    file_path = Path(script.file_path)
-    if not file_path.exists():
+    # 检查文件是否存在，脚本目录之外的历史登记不提供下载
+    file_path = script_path(script.file_path)
+    if file_path is None or not file_path.is_file():
         raise HTTPException(status_code=404, detail="脚本文件不存在")
     
     # 使用脚本名称 + 文件扩展名（去掉时间戳）
@@ -239,7 +395,7 @@ async def create_script(
         author_id = current_user.id
     
     # 创建上传目录
-    upload_dir = Path("uploads/scripts")
+    upload_dir = Path(SCRIPT_DIR)
     upload_dir.mkdir(parents=True, exist_ok=True)
     
     # 生成唯一文件名
@@ -301,6 +457,8 @@ async def update_script(
     script = await Script.get_or_none(id=script_id, is_deleted=False)
     if not script:
         raise HTTPException(status_code=404, detail="脚本不存在")
+    if script_data.file_path is not None and script_path(script_data.file_path) is None:
+        raise HTTPException(status_code=400, detail="脚本文件必须位于脚本目录中")
     
     # 更新脚本
     update_data = script_data.model_dump(exclude_unset=True)
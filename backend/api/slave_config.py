@@ -2,18 +2,30 @@
 负载机配置管理 API
 提供负载机的 CRUD 操作和状态管理
 """
+import time
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from tortoise import timezone
+from tortoise.transactions import in_transaction
 from datetime import datetime
 
 from models import SlaveConfig, UserInfo
 from schemas.slave_schemas import (
     SlaveConfigCreate,
     SlaveConfigUpdate,
-    SlaveConfigResponse
+    SlaveConfigResponse,
+    SlaveConfigBulkCreate,
+    SlaveConfigBulkUpdate,
+    SlaveHeartbeatCreate
 )
-from schemas.common_schemas import ResponseModel
+from schemas.common_schemas import ResponseModel, BulkDeleteRequest
+from services.bulk import BulkResult
+from services.clock_sync import clock_sync
+from services.db_writer import db_writer
+from services.saturation import saturation_guard
+from services.pagination import count_cache, fetch_page, build_page_data, TOTAL_MODE_PATTERN
 from security import get_current_active_user, check_permissions
+from config import SLAVE_HEARTBEAT_INTERVAL
 
 Slaves = APIRouter()
 
@@ -24,23 +36,25 @@ async def list_slaves(
     page_size: int = Query(20, ge=1, le=100, description="每页数量"),
     name: Optional[str] = Query(None, description="负载机名称筛选"),
     status: Optional[str] = Query(None, description="状态筛选"),
+    total_mode: str = Query("exact", alias="total", pattern=TOTAL_MODE_PATTERN, description="总数统计方式: exact/approx/none"),
     current_user: UserInfo = Depends(get_current_active_user)
 ):
     """获取负载机列表（分页）"""
     # 构建查询条件
-    query = SlaveConfig.filter(is_deleted=False)
+    filters = {"is_deleted": False}
     
     if name:
-        query = query.filter(name__icontains=name)
+        filters["name__icontains"] = name
     if status:
-        query = query.filter(status=status)
+        filters["status"] = status
     
-    # 计算总数
-    total = await query.count()
+    query = SlaveConfig.filter(**filters)
+    
+    # 计算总数（带缓存）
+    total = await count_cache.count(SlaveConfig, filters, query, total_mode)
     
     # 分页查询
-    offset = (page - 1) * page_size
-    slaves = await query.offset(offset).limit(page_size)
+    slaves, has_next = await fetch_page(query, page, page_size)
     
     # 构建响应数据
     items = []
@@ -56,6 +70,7 @@ async def list_slaves(
             "memory_usage": slave.memory_usage,
             "disk_usage": slave.disk_usage,
             "last_heartbeat": slave.last_heartbeat,
+            "clock_offset": slave.clock_offset,
             "max_concurrent_tasks": slave.max_concurrent_tasks,
             "current_tasks": slave.current_tasks,
             "is_active": slave.is_active,
@@ -64,21 +79,224 @@ async def list_slaves(
         }
         items.append(slave_data)
     
-    # 计算总页数
-    total_pages = (total + page_size - 1) // page_size
-    
     return {
         "code": 200,
         "message": "success",
-        "data": {
-            "items": items,
-            "total": total,
-            "page": page,
-            "size": page_size,
-            "pages": total_pages,
-            "has_next": page < total_pages,
-            "has_prev": page > 1
+        "data": build_page_data(items, total, page, page_size, has_next)
+    }
+
+
+@Slaves.post("/bulk", response_model=ResponseModel, summary="批量创建负载机配置")
+async def bulk_create_slaves(
+    bulk_data: SlaveConfigBulkCreate,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """批量创建负载机配置，逐条返回处理结果"""
+    # 检查权限
+    await check_permissions(["slave:create"], current_user)
+    
+    items = bulk_data.items
+    result = BulkResult(len(items))
+    
+    # 一次查询已存在的 IP 和端口
+    existing = set(await SlaveConfig.filter(
+        ip_address__in=list({item.ip_address for item in items}),
+        is_deleted=False
+    ).values_list('ip_address', 'port'))
+    
+    # 校验重复（与已有负载机或同批次条目重复）
+    seen = set()
+    for index, item in enumerate(items):
+        key = (item.ip_address, item.port)
+        if key in existing:
+            result.fail(index, "该IP和端口的负载机已存在")
+        elif key in seen:
+            result.fail(index, "同批次中IP和端口重复")
+        seen.add(key)
+    
+    # 单个事务中批量插入
+    valid = result.pending()
+    if valid:
+        async with in_transaction():
+            await SlaveConfig.bulk_create([SlaveConfig(**items[index].model_dump()) for index in valid])
+            created = await SlaveConfig.filter(
+                ip_address__in=list({items[index].ip_address for index in valid}),
+                is_deleted=False
+            ).values_list('ip_address', 'port', 'id')
+        count_cache.invalidate(SlaveConfig)
+        
+        id_map = {(ip_address, port): slave_id for ip_address, port, slave_id in created}
+        for index in valid:
+            result.succeed(index, id_map.get((items[index].ip_address, items[index].port)))
+    
+    return {
+        "code": 200,
+        "message": "操作成功",
+        "data": result.to_dict()
+    }
+
+
+@Slaves.put("/bulk", response_model=ResponseModel, summary="批量更新负载机配置")
+async def bulk_update_slaves(
+    bulk_data: SlaveConfigBulkUpdate,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """批量更新负载机配置，逐条返回处理结果"""
+    # 检查权限
+    await check_permissions(["slave:update"], current_user)
+    
+    items = bulk_data.items
+    result = BulkResult(len(items))
+    
+    # 一次加载全部待更新的负载机
+    slaves = await SlaveConfig.filter(id__in=[item.id for item in items], is_deleted=False)
+    slave_map = {slave.id: slave for slave in slaves}
+    
+    # 一次查询可能冲突的 IP 和端口
+    new_ips = {item.ip_address for item in items if item.ip_address is not None}
+    new_ips |= {slave.ip_address for slave in slaves}
+    occupied = {
+        (ip_address, port): slave_id
+        for ip_address, port, slave_id in await SlaveConfig.filter(
+            ip_address__in=list(new_ips), is_deleted=False
+        ).values_list('ip_address', 'port', 'id')
+    }
+    
+    changed = {}
+    fields = set()
+    for index, item in enumerate(items):
+        slave = slave_map.get(item.id)
+        if not slave:
+            result.fail(index, "负载机不存在")
+            continue
+        if item.id in changed:
+            result.fail(index, "同批次中负载机重复")
+            continue
+        
+        update_data = item.model_dump(exclude_unset=True, exclude={"id"})
+        key = (update_data.get("ip_address", slave.ip_address), update_data.get("port", slave.port))
+        if occupied.get(key, slave.id) != slave.id:
+            result.fail(index, "该IP和端口的负载机已存在")
+            continue
+        
+        occupied.pop((slave.ip_address, slave.port), None)
+        occupied[key] = slave.id
+        slave.update_from_dict(update_data)
+        slave.updated_at = timezone.now()
+        changed[item.id] = slave
+        fields.update(update_data.keys())
+        result.succeed(index, slave.id)
+    
+    # 单个事务中批量更新
+    if changed and fields:
+        async with in_transaction():
+            await SlaveConfig.bulk_update(list(changed.values()), fields=sorted(fields) + ["updated_at"])
+        count_cache.invalidate(SlaveConfig)
+    
+    return {
+        "code": 200,
+        "message": "负载机批量更新完成",
+        "data": result.to_dict()
+    }
+
+
+@Slaves.post("/bulk-delete", response_model=ResponseModel, summary="批量删除负载机配置")
+async def bulk_delete_slaves(
+    bulk_data: BulkDeleteRequest,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """批量删除负载机配置（软删除），逐条返回处理结果"""
+    # 检查权限
+    await check_permissions(["slave:delete"], current_user)
+    
+    ids = bulk_data.ids
+    result = BulkResult(len(ids))
+    existing = set(await SlaveConfig.filter(id__in=ids, is_deleted=False).values_list('id', flat=True))
+    seen = set()
+    for index, slave_id in enumerate(ids):
+        if slave_id not in existing:
+            result.fail(index, "负载机不存在")
+        elif slave_id in seen:
+            result.fail(index, "同批次中负载机重复")
+        else:
+            seen.add(slave_id)
+            result.succeed(index, slave_id)
+    
+    # 一条 UPDATE 完成软删除
+    if existing:
+        await SlaveConfig.filter(id__in=list(existing)).update(is_deleted=True, updated_at=timezone.now())
+        count_cache.invalidate(SlaveConfig)
+    
+    return {
+        "code": 200,
+        "message": "负载机批量删除完成",
+        "data": result.to_dict()
+    }
+
+
+@Slaves.post("/heartbeat", response_model=ResponseModel, summary="负载机心跳上报")
+async def report_heartbeat(
+    heartbeat: SlaveHeartbeatCreate,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """
+    负载机定期上报状态与资源使用率，同时完成时钟交换
+
+    响应中的 clock 为本次交换的服务器时间，负载机记录收到响应的时间后在下一次心跳的 clock_exchange 中回传，
+    服务器据此估计负载机的时钟偏差，之后上报的采样时间戳按偏差换算为服务器时间。
+    """
+    received_ts = int(time.time() * 1000)
+    # 检查权限
+    await check_permissions(["slave:update"], current_user)
+    
+    slave = await SlaveConfig.get_or_none(id=heartbeat.slave_id, is_deleted=False)
+    if not slave:
+        raise HTTPException(status_code=404, detail="负载机不存在")
+    
+    previous_heartbeat = slave.last_heartbeat
+    slave.status = heartbeat.status
+    slave.cpu_usage = heartbeat.cpu_usage
+    slave.memory_usage = heartbeat.memory_usage
+    slave.disk_usage = heartbeat.disk_usage
+    # 当前任务数由执行启动与结束时的预留计数维护，心跳上报的值单独记录，避免覆盖预留导致超额分配
+    slave.reported_tasks = heartbeat.current_tasks
+    slave.last_heartbeat = timezone.now()
+    update_fields = ['status', 'cpu_usage', 'memory_usage', 'disk_usage', 'reported_tasks', 'last_heartbeat', 'updated_at']
+    
+    exchange = heartbeat.clock_exchange
+    if exchange:
+        estimate = clock_sync.add(
+            slave.id,
+            exchange.client_send_ts,
+            exchange.server_receive_ts,
+            exchange.server_send_ts,
+            exchange.client_receive_ts
+        )
+        if estimate:
+            slave.clock_offset, slave.clock_rtt = estimate
+            slave.clock_synced_at = slave.last_heartbeat
+            update_fields += ['clock_offset', 'clock_rtt', 'clock_synced_at']
+    await db_writer.submit(lambda: slave.save(update_fields=update_fields))
+    # 参与执行中的从机：记录资源使用率并标记饱和窗口
+    await saturation_guard.observe(slave, previous_heartbeat)
+    
+    data = {
+        "success": True,
+        "message": "心跳已接收",
+        "next_heartbeat": SLAVE_HEARTBEAT_INTERVAL,
+        "clock_offset": slave.clock_offset
+    }
+    if heartbeat.client_send_ts is not None:
+        data["clock"] = {
+            "client_send_ts": heartbeat.client_send_ts,
+            "server_receive_ts": received_ts,
+            "server_send_ts": int(time.time() * 1000)
         }
+    
+    return {
+        "code": 200,
+        "message": "success",
+        "data": data
     }
 
 
@@ -106,8 +324,12 @@ async def get_slave_detail(
         "memory_usage": slave.memory_usage,
         "disk_usage": slave.disk_usage,
         "last_heartbeat": slave.last_heartbeat,
+        "clock_offset": slave.clock_offset,
+        "clock_rtt": slave.clock_rtt,
+        "clock_synced_at": slave.clock_synced_at,
         "max_concurrent_tasks": slave.max_concurrent_tasks,
         "current_tasks": slave.current_tasks,
+        "reported_tasks": slave.reported_tasks,
         "is_active": slave.is_active,
         "created_at": slave.created_at,
         "updated_at": slave.updated_at
@@ -2,18 +2,44 @@
 测试计划管理 API
 提供测试计划的 CRUD 操作和执行管理
 """
+import asyncio
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from datetime import datetime
-import uuid
+from tortoise.expressions import Case, F, When
+from tortoise.transactions import in_transaction
 
-from models import TestPlan, UserInfo, Project, ProjectMember
+from models import (
+    TestPlan,
+    TestExecution,
+    UserInfo,
+    Project,
+    ProjectMember,
+    Script,
+    SlaveConfig,
+    TestPlanScript,
+    TestPlanSlave,
+    TestPlanDataset,
+    Dataset,
+    SlaRule
+)
 from schemas.test_plan_schemas import (
     TestPlanCreate,
     TestPlanUpdate,
-    TestPlanResponse
+    TestPlanResponse,
+    TestPlanSlaveBulkCreate,
+    TestPlanDatasetCreate,
+    SlaRuleCreate,
+    SlaRuleUpdate
 )
-from schemas.common_schemas import ResponseModel
+from schemas.execution_schemas import ExecutionStop
+from schemas.script_schemas import TestPlanScriptBulkCreate, TestPlanScriptReorder, TestPlanScriptToggle
+from schemas.common_schemas import ResponseModel, BulkDeleteRequest
+from services.bulk import BulkResult
+from services.executions import stop_execution
+from services.execution_queue import execution_queue
+from services.scheduler import scheduler
+from services.pagination import count_cache, fetch_page, build_page_data, TOTAL_MODE_PATTERN
+from services.sla import sla_rule_data
 from security import get_current_active_user, check_permissions
 
 TestPlans = APIRouter()
@@ -57,6 +83,34 @@ async def check_test_plan_access(test_plan_id: int, current_user: UserInfo) -> T
     return test_plan
 
 
+def plan_script_data(link: TestPlanScript) -> dict:
+    """测试计划-脚本关联的响应数据（需预取 script）"""
+    return {
+        "id": link.id,
+        "script_id": link.script.id,
+        "name": link.script.name,
+        "script_type": link.script.script_type,
+        "script_version": link.script.script_version,
+        "execution_order": link.execution_order,
+        "is_enabled": link.is_enabled,
+        "created_at": link.created_at
+    }
+
+
+def plan_slave_data(link: TestPlanSlave) -> dict:
+    """测试计划-从机关联的响应数据（需预取 slave）"""
+    return {
+        "id": link.id,
+        "slave_id": link.slave.id,
+        "name": link.slave.name,
+        "ip_address": link.slave.ip_address,
+        "port": link.slave.port,
+        "status": link.slave.status,
+        "is_active": link.is_active,
+        "assigned_at": link.assigned_at
+    }
+
+
 @TestPlans.get("", response_model=ResponseModel, summary="分页获取测试计划列表")
 async def list_test_plans(
     page: int = Query(1, ge=1, description="页码"),
@@ -64,18 +118,19 @@ async def list_test_plans(
     name: Optional[str] = Query(None, description="测试计划名称筛选"),
     project_id: Optional[int] = Query(None, description="项目ID筛选"),
     status: Optional[str] = Query(None, description="状态筛选"),
+    total_mode: str = Query("exact", alias="total", pattern=TOTAL_MODE_PATTERN, description="总数统计方式: exact/approx/none"),
     current_user: UserInfo = Depends(get_current_active_user)
 ):
     """获取测试计划列表（分页）"""
     # 构建查询条件
-    query = TestPlan.filter(is_deleted=False)
+    filters = {"is_deleted": False}
     
     if name:
-        query = query.filter(name__icontains=name)
+        filters["name__icontains"] = name
     if project_id:
-        query = query.filter(project_id=project_id)
+        filters["project_id"] = project_id
     if status:
-        query = query.filter(status=status)
+        filters["status"] = status
     
     # 非超级管理员只能看到自己项目的测试计划
     if not current_user.is_superuser:
@@ -92,14 +147,15 @@ async def list_test_plans(
         ).values_list('id', flat=True)
         
         accessible_project_ids = list(set(member_project_ids) | set(manager_project_ids))
-        query = query.filter(project_id__in=accessible_project_ids)
+        filters["project_id__in"] = accessible_project_ids
+    
+    query = TestPlan.filter(**filters)
     
-    # 计算总数
-    total = await query.count()
+    # 计算总数（带缓存）
+    total = await count_cache.count(TestPlan, filters, query, total_mode)
     
     # 分页查询
-    offset = (page - 1) * page_size
-    test_plans = await query.offset(offset).limit(page_size).prefetch_related('project_id', 'creator_id')
+    test_plans, has_next = await fetch_page(query.prefetch_related('project_id', 'creator_id'), page, page_size)
     
     # 构建响应数据
     items = []
@@ -114,6 +170,10 @@ async def list_test_plans(
             "priority": plan.priority,
             "scheduled_start": plan.scheduled_start,
             "scheduled_end": plan.scheduled_end,
+            "cron_expression": plan.cron_expression,
+            "retention_mode": plan.retention_mode,
+            "retention_samples": plan.retention_samples,
+            "next_run_at": plan.next_run_at,
             "total_cases": plan.total_cases,
             "passed_cases": plan.passed_cases,
             "failed_cases": plan.failed_cases,
@@ -123,21 +183,10 @@ async def list_test_plans(
         }
         items.append(plan_data)
     
-    # 计算总页数
-    total_pages = (total + page_size - 1) // page_size
-    
     return {
         "code": 200,
         "message": "success",
-        "data": {
-            "items": items,
-            "total": total,
-            "page": page,
-            "size": page_size,
-            "pages": total_pages,
-            "has_next": page < total_pages,
-            "has_prev": page > 1
-        }
+        "data": build_page_data(items, total, page, page_size, has_next)
     }
 
 
@@ -149,7 +198,13 @@ async def get_test_plan_detail(
     """获取测试计划详情"""
     # 检查测试计划存在性和访问权限
     plan = await check_test_plan_access(test_plan_id, current_user)
-    await plan.fetch_related('project_id', 'creator_id')
+    # 关联的脚本和从机随计划一并预取，每层关联只查询一次
+    await plan.fetch_related(
+        'project_id', 'creator_id',
+        'test_plan_scripts__script', 'test_plan_slaves__slave'
+    )
+    scripts = sorted(plan.test_plan_scripts, key=lambda link: (link.execution_order, link.id))
+    slaves = [link for link in plan.test_plan_slaves if link.is_active]
     
     # 计算进度
     progress = 0
@@ -164,6 +219,10 @@ async def get_test_plan_detail(
         "priority": plan.priority,
         "scheduled_start": plan.scheduled_start,
         "scheduled_end": plan.scheduled_end,
+        "cron_expression": plan.cron_expression,
+        "retention_mode": plan.retention_mode,
+        "retention_samples": plan.retention_samples,
+        "next_run_at": plan.next_run_at,
         "actual_start": plan.actual_start,
         "actual_end": plan.actual_end,
         "total_cases": plan.total_cases,
@@ -188,7 +247,9 @@ async def get_test_plan_detail(
             "passed": plan.passed_cases,
             "failed": plan.failed_cases,
             "pending": plan.total_cases - plan.passed_cases - plan.failed_cases
-        }
+        },
+        "scripts": [plan_script_data(link) for link in scripts],
+        "slaves": [plan_slave_data(link) for link in slaves]
     }
     
     return {
@@ -230,8 +291,12 @@ async def create_test_plan(
         status=plan_data.status,
         priority=plan_data.priority,
         scheduled_start=plan_data.scheduled_start,
-        scheduled_end=plan_data.scheduled_end
+        scheduled_end=plan_data.scheduled_end,
+        cron_expression=plan_data.cron_expression,
+        retention_mode=plan_data.retention_mode,
+        retention_samples=plan_data.retention_samples
     )
+    await scheduler.reschedule(plan)
     
     return {
         "code": 200,
@@ -244,6 +309,7 @@ async def create_test_plan(
             "creator_id": creator.id,
             "status": plan.status,
             "priority": plan.priority,
+            "next_run_at": plan.next_run_at,
             "created_at": plan.created_at
         }
     }
@@ -272,6 +338,7 @@ async def update_test_plan(
     update_data = plan_data.model_dump(exclude_unset=True)
     await plan.update_from_dict(update_data).save()
     await plan.refresh_from_db()
+    await scheduler.reschedule(plan)
     
     return {
         "code": 200,
@@ -281,6 +348,7 @@ async def update_test_plan(
             "name": plan.name,
             "status": plan.status,
             "priority": plan.priority,
+            "next_run_at": plan.next_run_at,
             "updated_at": plan.updated_at
         }
     }
@@ -303,6 +371,7 @@ async def delete_test_plan(
     # 软删除
     plan.is_deleted = True
     await plan.save()
+    await scheduler.reschedule(plan)
     
     return {
         "code": 200,
@@ -326,24 +395,546 @@ async def execute_test_plan(
     # 检查测试计划状态
     if plan.status == "completed":
         raise HTTPException(status_code=400, detail="测试计划已完成，无法再次执行")
+    if not await TestPlanSlave.filter(test_plan_id=plan.id, is_active=True).exists():
+        raise HTTPException(status_code=400, detail="测试计划未分配从机，无法执行")
     
-    # 更新测试计划状态
-    plan.status = "active"
-    plan.actual_start = datetime.now()
-    await plan.save()
+    # 执行入队，从机容量满足时立即启动并下发启动指令
+    execution, dispatched = await execution_queue.submit(plan, current_user)
+    await plan.refresh_from_db(fields=['status', 'actual_start'])
+    
+    if execution.status == "queued":
+        return {
+            "code": 200,
+            "message": "从机容量不足，执行已进入队列",
+            "data": {
+                "execution_id": execution.execution_id,
+                "test_plan_id": plan.id,
+                "test_plan_name": plan.name,
+                "status": plan.status,
+                "execution_status": execution.status,
+                "queue": await execution_queue.position(execution.execution_id),
+                "message": "测试计划执行排队中，从机空闲后自动开始"
+            }
+        }
     
-    # 生成执行ID
-    execution_id = str(uuid.uuid4())
+    if execution.status == "failed":
+        raise HTTPException(status_code=502, detail=f"测试计划启动失败: {execution.abort_reason}")
     
     return {
         "code": 200,
         "message": "测试计划已开始执行",
         "data": {
-            "execution_id": execution_id,
+            "execution_id": execution.execution_id,
             "test_plan_id": plan.id,
             "test_plan_name": plan.name,
             "status": plan.status,
+            "execution_status": execution.status,
             "start_time": plan.actual_start,
+            "slaves": dispatched,
             "message": "测试计划执行已启动，请等待执行结果"
         }
     }
+
+
+@TestPlans.post("/{test_plan_id}/stop", response_model=ResponseModel, summary="停止测试计划执行")
+async def stop_test_plan(
+    test_plan_id: int,
+    stop_data: ExecutionStop,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """停止测试计划所有运行中的执行并取消排队中的执行，各执行的停止指令并发下发"""
+    # 检查权限
+    await check_permissions(["test_plan:execute"], current_user)
+    await check_test_plan_access(test_plan_id, current_user)
+    
+    statuses = ("queued", "running", "stopping") if stop_data.mode == "hard" else ("queued", "running")
+    executions = await TestExecution.filter(test_plan_id=test_plan_id, status__in=statuses)
+    if not executions:
+        raise HTTPException(status_code=400, detail="测试计划没有运行中的执行")
+    
+    reason = stop_data.reason or f"由 {current_user.username} 手动停止"
+    results = await asyncio.gather(*[
+        stop_execution(execution, stop_data.mode, reason) for execution in executions
+    ])
+    
+    return {
+        "code": 200,
+        "message": "测试计划执行已停止" if stop_data.mode == "hard" else "测试计划执行正在停止",
+        "data": [
+            {"execution_id": execution.execution_id, "status": execution.status, "slaves": slaves}
+            for execution, slaves in zip(executions, results)
+            if slaves is not None
+        ]
+    }
+
+
+@TestPlans.get("/{test_plan_id}/scripts", response_model=ResponseModel, summary="获取测试计划脚本")
+async def list_test_plan_scripts(
+    test_plan_id: int,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """获取测试计划关联的脚本（按执行顺序）"""
+    await check_test_plan_access(test_plan_id, current_user)
+    
+    links = await TestPlanScript.filter(test_plan_id=test_plan_id).order_by('execution_order', 'id').prefetch_related('script')
+    
+    return {
+        "code": 200,
+        "message": "success",
+        "data": [plan_script_data(link) for link in links]
+    }
+
+
+@TestPlans.put("/{test_plan_id}/scripts/order", response_model=ResponseModel, summary="调整测试计划脚本顺序")
+async def reorder_test_plan_scripts(
+    test_plan_id: int,
+    order_data: TestPlanScriptReorder,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """按给定顺序重排脚本，execution_order 依次为 1..n"""
+    # 检查权限
+    await check_permissions(["test_plan:update"], current_user)
+    await check_test_plan_access(test_plan_id, current_user)
+    
+    script_ids = order_data.script_ids
+    if len(set(script_ids)) != len(script_ids):
+        raise HTTPException(status_code=400, detail="脚本ID重复")
+    
+    attached = set(await TestPlanScript.filter(
+        test_plan_id=test_plan_id, script_id__in=script_ids
+    ).values_list('script_id', flat=True))
+    missing = [script_id for script_id in script_ids if script_id not in attached]
+    if missing:
+        raise HTTPException(status_code=400, detail=f"脚本未关联该测试计划: {missing}")
+    
+    # 一条 UPDATE ... CASE 完成重排
+    await TestPlanScript.filter(test_plan_id=test_plan_id, script_id__in=script_ids).update(
+        execution_order=Case(
+            *[When(script_id=script_id, then=order) for order, script_id in enumerate(script_ids, start=1)],
+            default=F("execution_order")
+        )
+    )
+    
+    return {
+        "code": 200,
+        "message": "脚本顺序已更新",
+        "data": [
+            {"script_id": script_id, "execution_order": order}
+            for order, script_id in enumerate(script_ids, start=1)
+        ]
+    }
+
+
+@TestPlans.put("/{test_plan_id}/scripts/enabled", response_model=ResponseModel, summary="批量启用/禁用测试计划脚本")
+async def toggle_test_plan_scripts(
+    test_plan_id: int,
+    toggle_data: TestPlanScriptToggle,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """批量启用或禁用测试计划中的脚本"""
+    # 检查权限
+    await check_permissions(["test_plan:update"], current_user)
+    await check_test_plan_access(test_plan_id, current_user)
+    
+    updated = await TestPlanScript.filter(
+        test_plan_id=test_plan_id, script_id__in=toggle_data.script_ids
+    ).update(is_enabled=toggle_data.is_enabled)
+    
+    return {
+        "code": 200,
+        "message": "脚本状态已更新",
+        "data": {"updated": updated, "is_enabled": toggle_data.is_enabled}
+    }
+
+
+@TestPlans.get("/{test_plan_id}/slaves", response_model=ResponseModel, summary="获取测试计划从机")
+async def list_test_plan_slaves(
+    test_plan_id: int,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """获取测试计划已分配的从机"""
+    await check_test_plan_access(test_plan_id, current_user)
+    
+    links = await TestPlanSlave.filter(test_plan_id=test_plan_id, is_active=True).order_by('id').prefetch_related('slave')
+    
+    return {
+        "code": 200,
+        "message": "success",
+        "data": [plan_slave_data(link) for link in links]
+    }
+
+
+@TestPlans.post("/{test_plan_id}/scripts/bulk", response_model=ResponseModel, summary="批量关联测试计划脚本")
+async def bulk_attach_test_plan_scripts(
+    test_plan_id: int,
+    bulk_data: TestPlanScriptBulkCreate,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """批量为测试计划关联脚本，逐条返回处理结果"""
+    # 检查权限
+    await check_permissions(["test_plan:update"], current_user)
+    plan = await check_test_plan_access(test_plan_id, current_user)
+    
+    items = bulk_data.items
+    result = BulkResult(len(items))
+    script_ids = list({item.script_id for item in items})
+    
+    # 一次查询脚本和已有关联
+    script_projects = dict(await Script.filter(
+        id__in=script_ids, is_deleted=False
+    ).values_list('id', 'project_id_id'))
+    attached = set(await TestPlanScript.filter(
+        test_plan_id=test_plan_id, script_id__in=script_ids
+    ).values_list('script_id', flat=True))
+    
+    seen = set()
+    for index, item in enumerate(items):
+        if item.script_id not in script_projects:
+            result.fail(index, "脚本不存在")
+        elif script_projects[item.script_id] != plan.project_id_id:
+            result.fail(index, "脚本不属于测试计划所在项目")
+        elif item.script_id in attached:
+            result.fail(index, "脚本已关联该测试计划")
+        elif item.script_id in seen:
+            result.fail(index, "同批次中脚本重复")
+        seen.add(item.script_id)
+    
+    # 单个事务中批量插入
+    valid = result.pending()
+    if valid:
+        async with in_transaction():
+            await TestPlanScript.bulk_create([
+                TestPlanScript(
+                    test_plan_id=test_plan_id,
+                    script_id=items[index].script_id,
+                    execution_order=items[index].execution_order,
+                    is_enabled=items[index].is_enabled
+                )
+                for index in valid
+            ])
+            created = await TestPlanScript.filter(
+                test_plan_id=test_plan_id, script_id__in=[items[index].script_id for index in valid]
+            ).values_list('script_id', 'id')
+        count_cache.invalidate(TestPlanScript)
+        
+        id_map = dict(created)
+        for index in valid:
+            result.succeed(index, id_map.get(items[index].script_id))
+    
+    return {
+        "code": 200,
+        "message": "操作成功",
+        "data": result.to_dict()
+    }
+
+
+@TestPlans.post("/{test_plan_id}/scripts/bulk-remove", response_model=ResponseModel, summary="批量移除测试计划脚本")
+async def bulk_detach_test_plan_scripts(
+    test_plan_id: int,
+    bulk_data: BulkDeleteRequest,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """批量移除测试计划关联的脚本，ids 为脚本ID"""
+    # 检查权限
+    await check_permissions(["test_plan:update"], current_user)
+    await check_test_plan_access(test_plan_id, current_user)
+    
+    script_ids = bulk_data.ids
+    result = BulkResult(len(script_ids))
+    attached = dict(await TestPlanScript.filter(
+        test_plan_id=test_plan_id, script_id__in=script_ids
+    ).values_list('script_id', 'id'))
+    for index, script_id in enumerate(script_ids):
+        if script_id in attached:
+            result.succeed(index, attached[script_id])
+        else:
+            result.fail(index, "脚本未关联该测试计划")
+    
+    # 一条 DELETE 完成移除
+    if attached:
+        await TestPlanScript.filter(id__in=list(attached.values())).delete()
+        count_cache.invalidate(TestPlanScript)
+    
+    return {
+        "code": 200,
+        "message": "测试计划脚本批量移除完成",
+        "data": result.to_dict()
+    }
+
+
+@TestPlans.post("/{test_plan_id}/slaves/bulk", response_model=ResponseModel, summary="批量分配测试计划从机")
+async def bulk_assign_test_plan_slaves(
+    test_plan_id: int,
+    bulk_data: TestPlanSlaveBulkCreate,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """批量为测试计划分配从机，已取消的分配会被重新激活，逐条返回处理结果"""
+    # 检查权限
+    await check_permissions(["test_plan:update"], current_user)
+    await check_test_plan_access(test_plan_id, current_user)
+    
+    items = bulk_data.items
+    result = BulkResult(len(items))
+    slave_ids = list({item.slave_id for item in items})
+    
+    # 一次查询从机和已有分配
+    valid_slave_ids = set(await SlaveConfig.filter(
+        id__in=slave_ids, is_active=True, is_deleted=False
+    ).values_list('id', flat=True))
+    assignments = {
+        assignment.slave_id: assignment
+        for assignment in await TestPlanSlave.filter(test_plan_id=test_plan_id, slave_id__in=slave_ids)
+    }
+    
+    new_assignments = []
+    reactivated = []
+    seen = set()
+    for index, item in enumerate(items):
+        assignment = assignments.get(item.slave_id)
+        if item.slave_id not in valid_slave_ids:
+            result.fail(index, "从机不存在或未激活")
+        elif item.slave_id in seen:
+            result.fail(index, "同批次中从机重复")
+        elif assignment and assignment.is_active:
+            result.fail(index, "从机已分配给该测试计划")
+        elif assignment:
+            assignment.is_active = True
+            reactivated.append(assignment)
+        else:
+            new_assignments.append(TestPlanSlave(test_plan_id=test_plan_id, slave_id=item.slave_id))
+        seen.add(item.slave_id)
+    
+    # 单个事务中批量写入
+    valid = result.pending()
+    if valid:
+        async with in_transaction():
+            if new_assignments:
+                await TestPlanSlave.bulk_create(new_assignments)
+            if reactivated:
+                await TestPlanSlave.bulk_update(reactivated, fields=["is_active"])
+            created = await TestPlanSlave.filter(
+                test_plan_id=test_plan_id, slave_id__in=[items[index].slave_id for index in valid]
+            ).values_list('slave_id', 'id')
+        count_cache.invalidate(TestPlanSlave)
+        
+        id_map = dict(created)
+        for index in valid:
+            result.succeed(index, id_map.get(items[index].slave_id))
+    
+    return {
+        "code": 200,
+        "message": "操作成功",
+        "data": result.to_dict()
+    }
+
+
+@TestPlans.post("/{test_plan_id}/slaves/bulk-remove", response_model=ResponseModel, summary="批量取消测试计划从机")
+async def bulk_unassign_test_plan_slaves(
+    test_plan_id: int,
+    bulk_data: BulkDeleteRequest,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """批量取消测试计划的从机分配（置为未激活），ids 为从机ID"""
+    # 检查权限
+    await check_permissions(["test_plan:update"], current_user)
+    await check_test_plan_access(test_plan_id, current_user)
+    
+    slave_ids = bulk_data.ids
+    result = BulkResult(len(slave_ids))
+    active = dict(await TestPlanSlave.filter(
+        test_plan_id=test_plan_id, slave_id__in=slave_ids, is_active=True
+    ).values_list('slave_id', 'id'))
+    for index, slave_id in enumerate(slave_ids):
+        if slave_id in active:
+            result.succeed(index, active[slave_id])
+        else:
+            result.fail(index, "从机未分配给该测试计划")
+    
+    # 一条 UPDATE 完成取消
+    if active:
+        await TestPlanSlave.filter(id__in=list(active.values())).update(is_active=False)
+        count_cache.invalidate(TestPlanSlave)
+    
+    return {
+        "code": 200,
+        "message": "测试计划从机批量取消完成",
+        "data": result.to_dict()
+    }
+
+
+@TestPlans.get("/{test_plan_id}/datasets", response_model=ResponseModel, summary="获取测试计划数据集")
+async def list_test_plan_datasets(
+    test_plan_id: int,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """获取测试计划关联的数据集"""
+    await check_test_plan_access(test_plan_id, current_user)
+    
+    links = await TestPlanDataset.filter(
+        test_plan_id=test_plan_id, dataset__is_deleted=False
+    ).prefetch_related('dataset').order_by('id')
+    
+    return {
+        "code": 200,
+        "message": "success",
+        "data": [
+            {
+                "dataset_id": link.dataset_id,
+                "name": link.dataset.name,
+                "mode": link.mode,
+                "file_size": link.dataset.file_size,
+                "line_count": link.dataset.line_count,
+                "created_at": link.created_at
+            }
+            for link in links
+        ]
+    }
+
+
+@TestPlans.post("/{test_plan_id}/datasets", response_model=ResponseModel, summary="关联测试计划数据集")
+async def attach_test_plan_dataset(
+    test_plan_id: int,
+    link_data: TestPlanDatasetCreate,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """
+    关联数据集到测试计划，下次执行时生效
+    
+    partition 方式在执行启动时按从机数切分，每台从机只下载自己的分片；full 方式每台从机下载完整文件。
+    """
+    # 检查权限
+    await check_permissions(["test_plan:update"], current_user)
+    test_plan = await check_test_plan_access(test_plan_id, current_user)
+    
+    dataset = await Dataset.get_or_none(id=link_data.dataset_id, is_deleted=False)
+    if not dataset:
+        raise HTTPException(status_code=400, detail="数据集不存在")
+    if dataset.project_id != test_plan.project_id_id:
+        raise HTTPException(status_code=400, detail="数据集不属于测试计划所在项目")
+    
+    link, created = await TestPlanDataset.get_or_create(
+        test_plan_id=test_plan_id,
+        dataset_id=dataset.id,
+        defaults={"mode": link_data.mode}
+    )
+    if not created and link.mode != link_data.mode:
+        link.mode = link_data.mode
+        await link.save()
+    
+    return {
+        "code": 200,
+        "message": "数据集关联成功",
+        "data": {"dataset_id": dataset.id, "name": dataset.name, "mode": link.mode}
+    }
+
+
+@TestPlans.delete("/{test_plan_id}/datasets/{dataset_id}", response_model=ResponseModel, summary="取消关联测试计划数据集")
+async def detach_test_plan_dataset(
+    test_plan_id: int,
+    dataset_id: int,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """取消测试计划与数据集的关联"""
+    # 检查权限
+    await check_permissions(["test_plan:update"], current_user)
+    await check_test_plan_access(test_plan_id, current_user)
+    
+    deleted = await TestPlanDataset.filter(test_plan_id=test_plan_id, dataset_id=dataset_id).delete()
+    if not deleted:
+        raise HTTPException(status_code=404, detail="测试计划未关联该数据集")
+    
+    return {
+        "code": 200,
+        "message": "数据集取消关联成功",
+        "data": None
+    }
+
+
+@TestPlans.get("/{test_plan_id}/sla-rules", response_model=ResponseModel, summary="获取测试计划 SLA 规则")
+async def list_sla_rules(
+    test_plan_id: int,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """获取测试计划的 SLA 规则"""
+    await check_test_plan_access(test_plan_id, current_user)
+    
+    rules = await SlaRule.filter(test_plan_id=test_plan_id).order_by('id')
+    
+    return {
+        "code": 200,
+        "message": "success",
+        "data": [sla_rule_data(rule) for rule in rules]
+    }
+
+
+@TestPlans.post("/{test_plan_id}/sla-rules", response_model=ResponseModel, summary="创建 SLA 规则")
+async def create_sla_rule(
+    test_plan_id: int,
+    rule_data: SlaRuleCreate,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """
+    创建 SLA 规则，下次执行时生效
+    
+    硬性规则在执行期间被违反时提前终止执行；吞吐(rps)规则只在执行结束后判定。
+    """
+    # 检查权限
+    await check_permissions(["test_plan:update"], current_user)
+    await check_test_plan_access(test_plan_id, current_user)
+    
+    rule = await SlaRule.create(test_plan_id=test_plan_id, **rule_data.model_dump())
+    
+    return {
+        "code": 200,
+        "message": "SLA 规则创建成功",
+        "data": sla_rule_data(rule)
+    }
+
+
+@TestPlans.put("/{test_plan_id}/sla-rules/{rule_id}", response_model=ResponseModel, summary="更新 SLA 规则")
+async def update_sla_rule(
+    test_plan_id: int,
+    rule_id: int,
+    rule_data: SlaRuleUpdate,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """更新 SLA 规则，下次执行时生效"""
+    # 检查权限
+    await check_permissions(["test_plan:update"], current_user)
+    await check_test_plan_access(test_plan_id, current_user)
+    
+    rule = await SlaRule.get_or_none(id=rule_id, test_plan_id=test_plan_id)
+    if not rule:
+        raise HTTPException(status_code=404, detail="SLA 规则不存在")
+    
+    update_data = rule_data.model_dump(exclude_unset=True)
+    if update_data:
+        await rule.update_from_dict(update_data).save()
+    
+    return {
+        "code": 200,
+        "message": "SLA 规则更新成功",
+        "data": sla_rule_data(rule)
+    }
+
+
+@TestPlans.delete("/{test_plan_id}/sla-rules/{rule_id}", response_model=ResponseModel, summary="删除 SLA 规则")
+async def delete_sla_rule(
+    test_plan_id: int,
+    rule_id: int,
+    current_user: UserInfo = Depends(get_current_active_user)
+):
+    """删除 SLA 规则"""
+    # 检查权限
+    await check_permissions(["test_plan:update"], current_user)
+    await check_test_plan_access(test_plan_id, current_user)
+    
+    deleted = await SlaRule.filter(id=rule_id, test_plan_id=test_plan_id).delete()
+    if not deleted:
+        raise HTTPException(status_code=404, detail="SLA 规则不存在")
+    
+    return {
+        "code": 200,
+        "message": "SLA 规则删除成功",
+        "data": None
+    }
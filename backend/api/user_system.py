@@ -17,6 +17,7 @@ from security import (
     get_password_hash
 )
 from schemas.common_schemas import ResponseModel
+from services.pagination import count_cache, fetch_page, build_page_data, TOTAL_MODE_PATTERN
 from schemas.user_schemas import UserCreate, UserUpdate
 from schemas.role_schemas import RoleCreate, RoleUpdate
 
@@ -136,6 +137,7 @@ async def list_users(
     username: Optional[str] = Query(None, description="用户名筛选"),
     email: Optional[str] = Query(None, description="邮箱筛选"),
     is_active: Optional[bool] = Query(None, description="激活状态筛选"),
+    total_mode: str = Query("exact", alias="total", pattern=TOTAL_MODE_PATTERN, description="总数统计方式: exact/approx/none"),
     current_user: UserInfo = Depends(get_current_active_user)
 ):
     """获取用户列表（分页）"""
@@ -143,21 +145,22 @@ async def list_users(
     await check_permissions(["user:read"], current_user)
     
     # 构建查询条件
-    query = UserInfo.filter(is_deleted=False)
+    filters = {"is_deleted": False}
     
     if username:
-        query = query.filter(username__icontains=username)
+        filters["username__icontains"] = username
     if email:
-        query = query.filter(email__icontains=email)
+        filters["email__icontains"] = email
     if is_active is not None:
-        query = query.filter(is_active=is_active)
+        filters["is_active"] = is_active
     
-    # 计算总数
-    total = await query.count()
+    query = UserInfo.filter(**filters)
+    
+    # 计算总数（带缓存）
+    total = await count_cache.count(UserInfo, filters, query, total_mode)
     
     # 分页查询
-    offset = (page - 1) * page_size
-    users = await query.offset(offset).limit(page_size)
+    users, has_next = await fetch_page(query, page, page_size)
     
     # 获取用户的角色信息
     user_ids = [u.id for u in users]
@@ -196,21 +199,10 @@ async def list_users(
             "updated_at": user.updated_at
         }
         items.append(user_data)
-    # 计算总页数
-    total_pages = (total + page_size - 1) // page_size
-    
     return {
         "code": 200,
         "message": "success",
-        "data": {
-            "items": items,
-            "total": total,
-            "page": page,
-            "size": page_size,
-            "pages": total_pages,
-            "has_next": page < total_pages,
-            "has_prev": page > 1
-        }
+        "data": build_page_data(items, total, page, page_size, has_next)
     }
 
 
@@ -0,0 +1,204 @@
+"""
+热点查询索引基准测试
+在临时 SQLite 数据库中为脚本、测试计划、项目成员、用户组织角色、组织各生成指定行数(默认 100 万)的数据，
+分别在回滚与应用索引迁移(migrations/models/*_hot_query_indexes.py)后执行与接口相同的列表与权限检查查询，
+输出各查询的 p50/p95 耗时。
+
+用法: python benchmark_indexes.py [--rows 1000000] [--repeat 50] [--db /tmp/perfx_bench.sqlite3]
+"""
+import argparse
+import asyncio
+import importlib.util
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+# 添加项目根目录到 Python 路径
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from tortoise import Tortoise
+from config import database_connection
+from models import Script, TestPlan, Project, ProjectMember, UserOrgRole, Organize
+
+# 每批插入的行数
+SEED_BATCH = 10000
+# 软删除比例
+DELETED_RATIO = 0.1
+
+
+def load_migration():
+    """加载索引迁移模块，基准测试直接使用它的 upgrade/downgrade SQL"""
+    path = next(project_root.glob("migrations/models/*_hot_query_indexes.py"))
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+async def insert_rows(conn, table: str, columns: List[str], rows) -> None:
+    sql = f'INSERT INTO "{table}" ({", ".join(columns)}) VALUES ({", ".join("?" * len(columns))})'
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= SEED_BATCH:
+            await conn.execute_many(sql, batch)
+            batch = []
+    if batch:
+        await conn.execute_many(sql, batch)
+
+
+async def seed(rows: int) -> Dict[str, int]:
+    """生成基准数据：用户与项目各 rows/100 个，热点表各 rows 行"""
+    conn = Tortoise.get_connection("default")
+    rnd = random.Random(42)
+    now = datetime.now().isoformat()
+    users = max(rows // 100, 10)
+    projects = max(rows // 100, 10)
+
+    def deleted() -> int:
+        return int(rnd.random() < DELETED_RATIO)
+
+    await insert_rows(conn, "users", ["username", "email", "password_hash", "is_active", "is_superuser", "created_at", "updated_at", "is_deleted"], (
+        (f"user{i}", f"user{i}@perfxm.com", "x", 1, 0, now, now, 0) for i in range(users)
+    ))
+    await insert_rows(conn, "roles", ["name", "permissions", "is_system", "created_at", "updated_at", "is_deleted"], [
+        ("基准角色", "[]", 0, now, now, 0)
+    ])
+    await insert_rows(conn, "projects", ["name", "status", "manager_id_id", "created_at", "updated_at", "is_deleted"], (
+        (f"project{i}", "active", rnd.randint(1, users), now, now, deleted()) for i in range(projects)
+    ))
+    # (项目, 用户) 唯一，按用户轮转项目保证不重复
+    await insert_rows(conn, "project_members", ["project_id", "user_id", "role_id", "joined_at", "is_active"], (
+        (1 + (i // users * 7 + i) % projects, 1 + i % users, 1, now, int(rnd.random() > DELETED_RATIO)) for i in range(rows)
+    ))
+    await insert_rows(conn, "organizations", ["name", "parent_id", "level", "sort_order", "created_at", "updated_at", "is_deleted"], (
+        (f"org{i}", (i // 10) or None, 1, i % 10, now, now, deleted()) for i in range(1, rows + 1)
+    ))
+    await insert_rows(conn, "user_organization_roles", ["user_id", "organization_id", "role_id", "joined_at", "is_active"], (
+        (1 + i % users, 1 + i, 1, now, int(rnd.random() > DELETED_RATIO)) for i in range(rows)
+    ))
+    await insert_rows(conn, "scripts", ["name", "file_path", "script_version", "script_type", "author_id_id", "project_id_id", "is_active", "created_at", "updated_at", "is_deleted"], (
+        (f"script{i}", f"scripts/{i}.py", "1.0.0", "python", rnd.randint(1, users), rnd.randint(1, projects), 1, now, now, deleted()) for i in range(rows)
+    ))
+    await insert_rows(conn, "test_plans", [
+        "name", "project_id_id", "creator_id_id", "status", "priority", "retention_mode",
+        "total_cases", "passed_cases", "failed_cases", "is_active", "created_at", "updated_at", "is_deleted"
+    ], (
+        (f"plan{i}", rnd.randint(1, projects), rnd.randint(1, users), "draft", "medium", "full", 0, 0, 0, 1, now, now, deleted()) for i in range(rows)
+    ))
+    return {"users": users, "projects": projects, "rows": rows}
+
+
+def build_queries(sizes: Dict[str, int]) -> Dict[str, Callable[[random.Random], Awaitable]]:
+    """与接口一致的查询，参数随机"""
+    users, projects, rows = sizes["users"], sizes["projects"], sizes["rows"]
+
+    async def accessible_projects(rnd: random.Random) -> List[int]:
+        user_id = rnd.randint(1, users)
+        member_project_ids = await ProjectMember.filter(user_id=user_id, is_active=True).values_list('project_id', flat=True)
+        manager_project_ids = await Project.filter(manager_id=user_id, is_deleted=False).values_list('id', flat=True)
+        return list(set(member_project_ids) | set(manager_project_ids))
+
+    async def script_list(rnd: random.Random) -> None:
+        query = Script.filter(is_deleted=False, project_id_id__in=await accessible_projects(rnd))
+        await query.count()
+        await query.offset(0).limit(21)
+
+    async def test_plan_list(rnd: random.Random) -> None:
+        query = TestPlan.filter(is_deleted=False, project_id=rnd.randint(1, projects))
+        await query.count()
+        await query.offset(0).limit(21)
+
+    async def script_access(rnd: random.Random) -> None:
+        script = await Script.get_or_none(id=rnd.randint(1, rows), is_deleted=False)
+        if script:
+            await ProjectMember.filter(project_id=script.project_id_id, user_id=rnd.randint(1, users), is_active=True).exists()
+
+    async def user_organizations(rnd: random.Random) -> None:
+        await UserOrgRole.filter(user_id=rnd.randint(1, users), is_active=True).values_list('organization_id', flat=True)
+
+    async def organization_children(rnd: random.Random) -> None:
+        await Organize.filter(parent_id=rnd.randint(1, rows // 10), is_deleted=False).order_by('sort_order')
+
+    return {
+        "项目访问范围": accessible_projects,
+        "脚本列表(分页+计数)": script_list,
+        "测试计划列表(分页+计数)": test_plan_list,
+        "脚本权限检查": script_access,
+        "用户所属组织": user_organizations,
+        "子组织列表": organization_children,
+    }
+
+
+async def measure(queries: Dict[str, Callable], repeat: int) -> Dict[str, List[float]]:
+    timings = {}
+    for name, query in queries.items():
+        rnd = random.Random(7)
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            await query(rnd)
+            samples.append((time.perf_counter() - start) * 1000)
+        timings[name] = samples
+    return timings
+
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+async def run_benchmark(rows: int, repeat: int, db_path: str) -> None:
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    await Tortoise.init(config={
+        "connections": {"default": database_connection(f"sqlite://{db_path}")},
+        "apps": {"models": {"models": ["models"], "default_connection": "default"}},
+    })
+    try:
+        await Tortoise.generate_schemas()
+        conn = Tortoise.get_connection("default")
+        migration = load_migration()
+
+        print(f"生成基准数据: 每张热点表 {rows} 行...")
+        start = time.perf_counter()
+        sizes = await seed(rows)
+        print(f"数据生成完成，耗时 {time.perf_counter() - start:.1f}s")
+        queries = build_queries(sizes)
+
+        await conn.execute_script(await migration.downgrade(conn))
+        await conn.execute_script("ANALYZE")
+        before = await measure(queries, repeat)
+
+        start = time.perf_counter()
+        await conn.execute_script(await migration.upgrade(conn))
+        await conn.execute_script("ANALYZE")
+        print(f"创建索引耗时 {time.perf_counter() - start:.1f}s")
+        after = await measure(queries, repeat)
+    finally:
+        await Tortoise.close_connections()
+
+    print(f"\n查询耗时(毫秒，每项 {repeat} 次)")
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print(f"{'查询':<24}{'无索引 p50':>12}{'无索引 p95':>12}{'有索引 p50':>12}{'有索引 p95':>12}{'加速':>8}")
+    for name in queries:
+        p50_before, p50_after = statistics.median(before[name]), statistics.median(after[name])
+        print(
+            f"{name:<24}{p50_before:>12.2f}{percentile(before[name], 0.95):>12.2f}"
+            f"{p50_after:>12.2f}{percentile(after[name], 0.95):>12.2f}{p50_before / p50_after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="热点查询索引基准测试")
+    parser.add_argument("--rows", type=int, default=1000000, help="每张热点表的行数")
+    parser.add_argument("--repeat", type=int, default=50, help="每个查询的执行次数")
+    parser.add_argument("--db", default="/tmp/perfx_bench.sqlite3", help="临时数据库文件路径")
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.rows, args.repeat, args.db))
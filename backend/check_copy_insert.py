@@ -0,0 +1,142 @@
+"""
+PostgreSQL COPY 写入检查
+在本地 PostgreSQL 上验证 services.copy_insert.bulk_insert 的 COPY 路径：分别写入采样与时序指标
+(含事务内写入，对应维护任务的分钟汇总)，逐行读回与写入值比对，并输出 COPY 与 bulk_create 的写入耗时。
+
+需要安装 asyncpg(pip install -e .[postgres])，并准备一个专用的空数据库，例如:
+
+    createdb perfx_copy_check
+    DATABASE_URL=postgres://postgres:@127.0.0.1:5432/perfx_copy_check python check_copy_insert.py
+
+表结构按模型创建(已存在时跳过)，检查写入的数据在结束时删除。
+
+用法: python check_copy_insert.py [--rows 20000] [--db postgres://...]
+"""
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import List, Sequence
+
+# 添加项目根目录到 Python 路径
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from tortoise import Tortoise
+from tortoise.models import Model
+from tortoise.transactions import in_transaction
+from config import DATABASE_URL, database_connection
+from models import UserInfo, Project, TestPlan, TestExecution, ExecutionSample, MetricPoint
+from services.copy_insert import bulk_insert, uses_copy
+
+SAMPLE_FIELDS = ('slave_id', 'timestamp', 'intended_ts', 'label', 'latency', 'status_code', 'success', 'bytes', 'weight')
+METRIC_FIELDS = ('source', 'name', 'ts', 'value')
+
+
+def build_samples(execution: TestExecution, rows: int) -> List[ExecutionSample]:
+    """覆盖空值、布尔、长标签与小数权重的采样"""
+    return [
+        ExecutionSample(
+            execution=execution,
+            slave_id=None if i % 7 == 0 else i % 5,
+            timestamp=1700000000000 + i,
+            intended_ts=None if i % 3 == 0 else 1700000000000 + i - 2,
+            label=f"接口/{i % 13}/" + "x" * (i % 200),
+            latency=i % 1000 / 7,
+            status_code=500 if i % 50 == 0 else 200,
+            success=i % 50 != 0,
+            bytes=i % 65536,
+            weight=1.0 if i % 11 else 2.5
+        )
+        for i in range(rows)
+    ]
+
+
+def build_metrics(execution: TestExecution, rows: int, source: str) -> List[MetricPoint]:
+    return [
+        MetricPoint(execution=execution, source=source, name=("rps", "cpu_usage", "memory_usage")[i % 3], ts=1700000000 + i, value=i / 3)
+        for i in range(rows)
+    ]
+
+
+async def verify(model, objects: Sequence[Model], fields: Sequence[str], **filters) -> None:
+    """按写入顺序读回并逐行比对"""
+    stored = await model.filter(**filters).order_by('id').values_list(*fields)
+    expected = [tuple(getattr(obj, name) for name in fields) for obj in objects]
+    if len(stored) != len(expected):
+        raise AssertionError(f"{model.__name__} 写入 {len(expected)} 行，读回 {len(stored)} 行")
+    for index, (row, want) in enumerate(zip(stored, expected)):
+        if any(
+            abs(a - b) > 1e-4 if isinstance(b, float) else a != b
+            for a, b in zip(row, want)
+        ):
+            raise AssertionError(f"{model.__name__} 第 {index} 行不一致: {row} != {want}")
+
+
+async def timed(label: str, rows: int, write) -> float:
+    start = time.perf_counter()
+    await write()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28}{elapsed * 1000:>10.1f} ms{rows / elapsed:>14.0f} 行/秒")
+    return elapsed
+
+
+async def run_check(rows: int, url: str) -> None:
+    connection = database_connection(url)
+    if connection["engine"] != "tortoise.backends.asyncpg":
+        raise SystemExit("需要 PostgreSQL 数据库 URL(postgres://...)，并安装 asyncpg")
+    await Tortoise.init(config={
+        "connections": {"default": connection},
+        "apps": {"models": {"models": ["models"], "default_connection": "default"}},
+    })
+    execution = None
+    try:
+        await Tortoise.generate_schemas(safe=True)
+        if not uses_copy(ExecutionSample, rows) or not uses_copy(MetricPoint, rows):
+            raise SystemExit("当前行数不会使用 COPY，请调大 --rows 或调小 DB_COPY_MIN_ROWS")
+
+        tag = uuid.uuid4().hex[:8]
+        user = await UserInfo.create(username=f"copy_{tag}", email=f"copy_{tag}@perfxm.com", password_hash="x")
+        project = await Project.create(name=f"copy_{tag}", manager_id=user)
+        plan = await TestPlan.create(name=f"copy_{tag}", project_id=project, creator_id=user)
+        execution = await TestExecution.create(execution_id=str(uuid.uuid4()), test_plan=plan)
+
+        print(f"写入 {rows} 行(COPY 阈值以上)")
+        samples = build_samples(execution, rows)
+        await timed("采样 COPY", rows, lambda: bulk_insert(samples))
+        await verify(ExecutionSample, samples, SAMPLE_FIELDS, execution_id=execution.id)
+
+        metrics = build_metrics(execution, rows, "copy")
+        await timed("时序指标 COPY", rows, lambda: bulk_insert(metrics))
+        await verify(MetricPoint, metrics, METRIC_FIELDS, execution_id=execution.id, source="copy")
+
+        async def write_in_transaction():
+            async with in_transaction():
+                await bulk_insert(rollups)
+        rollups = build_metrics(execution, rows, "rollup")
+        await timed("时序指标 COPY(事务内)", rows, write_in_transaction)
+        await verify(MetricPoint, rollups, METRIC_FIELDS, execution_id=execution.id, source="rollup")
+
+        baseline = build_metrics(execution, rows, "bulk_create")
+        await timed("时序指标 bulk_create(对照)", rows, lambda: MetricPoint.bulk_create(baseline))
+        await verify(MetricPoint, baseline, METRIC_FIELDS, execution_id=execution.id, source="bulk_create")
+        print("读回比对通过")
+    finally:
+        if execution is not None:
+            await ExecutionSample.filter(execution_id=execution.id).delete()
+            await MetricPoint.filter(execution_id=execution.id).delete()
+            await execution.delete()
+            await plan.delete()
+            await project.delete()
+            await user.delete()
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PostgreSQL COPY 写入检查")
+    parser.add_argument("--rows", type=int, default=20000, help="每种数据写入的行数")
+    parser.add_argument("--db", default=DATABASE_URL, help="PostgreSQL 数据库 URL，默认取 DATABASE_URL")
+    args = parser.parse_args()
+    asyncio.run(run_check(args.rows, args.db))
@@ -15,6 +15,7 @@ from tortoise import Tortoise
 from config import TORTOISE_ORM
 from models import UserInfo, Role, Organize, UserOrgRole
 from security import get_password_hash
+from services.org_hierarchy import rebuild_paths
 
 async def init_database():
     """初始化数据库基础数据"""
@@ -170,6 +171,9 @@ async def init_database():
 
         print(" 设置组织层级关系")
 
+    # 生成组织层级路径
+    await rebuild_paths()
+
     # 创建超级管理员用户
     admin_user_data = {
         "username": "admin",
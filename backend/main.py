@@ -4,7 +4,7 @@ from tortoise.contrib.fastapi import register_tortoise
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from config import TORTOISE_ORM, APP_NAME, APP_VERSION, DEBUG, IS_INIT_SCRIPT
+from config import TORTOISE_ORM, APP_NAME, APP_VERSION, DEBUG, IS_INIT_SCRIPT, EXECUTION_FLUSH_INTERVAL, RESULT_FINALIZE_INTERVAL, QUEUE_DISPATCH_INTERVAL, MONITOR_COLLECT_INTERVAL, MAINTENANCE_INTERVAL
 
 # 导入路由
 from api.projects import Projects
@@ -14,12 +14,59 @@ from api.user_system import User_system
 from api.roles import Roles
 from api.slave_config import Slaves
 from api.organizations import Organizations
+from api.executions import Executions
+from api.dashboard import Dashboard
+from api.datasets import Datasets
+from api.monitors import Monitors
+from services.org_hierarchy import rebuild_paths
+from services.executions import registry, flush_live_executions, finalize_finished_executions
+from services.dashboard import dashboard
+from services.db_writer import db_writer
+from services.maintenance import run_maintenance
+from services.execution_queue import execution_queue
+from services.scheduler import scheduler
+from services.tasks import start_periodic, start_task, stop_all
+from services import dispatcher, monitoring
+from services.clock_sync import clock_sync
+from models import Organize
 import uvicorn
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """应用生命周期：数据库已由 register_tortoise 初始化"""
+    # 回填缺失的组织层级路径（历史数据或迁移后首次启动）
+    if await Organize.filter(path=None).exists():
+        await rebuild_paths()
+    
+    # SQLite 下高频写入经单一写入任务合并提交
+    start_task("db_writer", db_writer.run())
+
+    # 恢复从机时钟偏差、运行中的执行与仪表盘汇总，并启动后台汇总任务
+    await clock_sync.load()
+    await registry.load()
+    await dashboard.load()
+    start_periodic("flush_live_executions", EXECUTION_FLUSH_INTERVAL, flush_live_executions)
+    start_periodic("dashboard_refresh", 1, dashboard.refresh)
+    start_periodic("finalize_executions", RESULT_FINALIZE_INTERVAL, finalize_finished_executions)
+    start_periodic("collect_monitors", MONITOR_COLLECT_INTERVAL, monitoring.monitor_collector.collect)
+    start_periodic("maintenance", MAINTENANCE_INTERVAL, run_maintenance)
+    
+    # 派发排队中的执行，并从数据库重建测试计划调度
+    start_periodic("dispatch_queue", QUEUE_DISPATCH_INTERVAL, execution_queue.dispatch)
+    await scheduler.load()
+    start_task("plan_scheduler", scheduler.run())
+    yield
+    await stop_all()
+    await dispatcher.close()
+    await monitoring.close()
+
+
 app = FastAPI(
     title=APP_NAME,
     version=APP_VERSION,
-    debug=DEBUG
+    debug=DEBUG,
+    lifespan=lifespan
 )
 
 # 配置 CORS
@@ -51,6 +98,10 @@ app.include_router(User_system, prefix="/api/users", tags=["用户管理"])
 app.include_router(Roles, prefix="/api/users/system/roles", tags=["角色管理"])
 app.include_router(Slaves, prefix="/api/slaves", tags=["负载机配置"])
 app.include_router(Organizations, prefix="/api/organizations", tags=["组织管理"])
+app.include_router(Executions, prefix="/api/executions", tags=["执行管理"])
+app.include_router(Dashboard, prefix="/api/dashboard", tags=["仪表盘"])
+app.include_router(Datasets, prefix="/api/datasets", tags=["测试数据"])
+app.include_router(Monitors, prefix="/api/monitors", tags=["被测系统监控"])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,500 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # SQLite 与 PostgreSQL 的建表语句不同(自增主键、列注释)，按数据库方言分别给出
+    if db.capabilities.dialect == "postgres":
+        return """
+        CREATE TABLE IF NOT EXISTS "roles" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "name" VARCHAR(50) NOT NULL UNIQUE,
+    "description" TEXT,
+    "permissions" JSONB NOT NULL,
+    "is_system" BOOL NOT NULL,
+    "org_id" INT,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL,
+    "is_deleted" BOOL NOT NULL
+);
+COMMENT ON COLUMN "roles"."name" IS '角色名称';
+COMMENT ON COLUMN "roles"."description" IS '角色描述';
+COMMENT ON COLUMN "roles"."permissions" IS '角色权限列表';
+COMMENT ON COLUMN "roles"."is_system" IS '是否系统角色';
+COMMENT ON COLUMN "roles"."org_id" IS '所属组织ID';
+COMMENT ON COLUMN "roles"."created_at" IS '创建时间';
+COMMENT ON COLUMN "roles"."updated_at" IS '更新时间';
+COMMENT ON COLUMN "roles"."is_deleted" IS '删除标志';
+COMMENT ON TABLE "roles" IS '角色模型';
+CREATE TABLE IF NOT EXISTS "slave_configs" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "name" VARCHAR(100) NOT NULL,
+    "description" TEXT,
+    "ip_address" VARCHAR(45) NOT NULL,
+    "port" INT NOT NULL,
+    "username" VARCHAR(50),
+    "auth_type" VARCHAR(20) NOT NULL,
+    "auth_value" VARCHAR(255),
+    "tags" JSONB NOT NULL,
+    "status" VARCHAR(20) NOT NULL,
+    "cpu_usage" DOUBLE PRECISION,
+    "memory_usage" DOUBLE PRECISION,
+    "disk_usage" DOUBLE PRECISION,
+    "last_heartbeat" TIMESTAMPTZ,
+    "max_concurrent_tasks" INT NOT NULL,
+    "current_tasks" INT NOT NULL,
+    "is_active" BOOL NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL,
+    "is_deleted" BOOL NOT NULL
+);
+COMMENT ON COLUMN "slave_configs"."name" IS '从机名称';
+COMMENT ON COLUMN "slave_configs"."description" IS '描述';
+COMMENT ON COLUMN "slave_configs"."ip_address" IS 'IP地址';
+COMMENT ON COLUMN "slave_configs"."port" IS '端口号';
+COMMENT ON COLUMN "slave_configs"."username" IS '登录用户名';
+COMMENT ON COLUMN "slave_configs"."auth_type" IS '认证类型';
+COMMENT ON COLUMN "slave_configs"."auth_value" IS '认证值(密码/密钥/令牌)';
+COMMENT ON COLUMN "slave_configs"."tags" IS '标签列表';
+COMMENT ON COLUMN "slave_configs"."status" IS '状态';
+COMMENT ON COLUMN "slave_configs"."cpu_usage" IS 'CPU使用率';
+COMMENT ON COLUMN "slave_configs"."memory_usage" IS '内存使用率';
+COMMENT ON COLUMN "slave_configs"."disk_usage" IS '磁盘使用率';
+COMMENT ON COLUMN "slave_configs"."last_heartbeat" IS '最后心跳时间';
+COMMENT ON COLUMN "slave_configs"."max_concurrent_tasks" IS '最大并发任务数';
+COMMENT ON COLUMN "slave_configs"."current_tasks" IS '当前任务数';
+COMMENT ON COLUMN "slave_configs"."is_active" IS '是否激活';
+COMMENT ON COLUMN "slave_configs"."created_at" IS '创建时间';
+COMMENT ON COLUMN "slave_configs"."updated_at" IS '更新时间';
+COMMENT ON COLUMN "slave_configs"."is_deleted" IS '删除标志';
+COMMENT ON TABLE "slave_configs" IS '从机配置模型';
+CREATE TABLE IF NOT EXISTS "users" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "username" VARCHAR(50) NOT NULL UNIQUE,
+    "email" VARCHAR(100) NOT NULL UNIQUE,
+    "password_hash" VARCHAR(255) NOT NULL,
+    "phone" VARCHAR(20),
+    "real_name" VARCHAR(50),
+    "avatar" VARCHAR(255),
+    "is_active" BOOL NOT NULL,
+    "is_superuser" BOOL NOT NULL,
+    "last_login" TIMESTAMPTZ,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL,
+    "is_deleted" BOOL NOT NULL
+);
+COMMENT ON COLUMN "users"."username" IS '用户名';
+COMMENT ON COLUMN "users"."email" IS '邮箱';
+COMMENT ON COLUMN "users"."password_hash" IS '密码哈希';
+COMMENT ON COLUMN "users"."phone" IS '手机号';
+COMMENT ON COLUMN "users"."real_name" IS '真实姓名';
+COMMENT ON COLUMN "users"."avatar" IS '头像URL';
+COMMENT ON COLUMN "users"."is_active" IS '是否激活';
+COMMENT ON COLUMN "users"."is_superuser" IS '是否超级用户';
+COMMENT ON COLUMN "users"."last_login" IS '最后登录时间';
+COMMENT ON COLUMN "users"."created_at" IS '创建时间';
+COMMENT ON COLUMN "users"."updated_at" IS '更新时间';
+COMMENT ON COLUMN "users"."is_deleted" IS '删除标志';
+COMMENT ON TABLE "users" IS '用户信息模型';
+CREATE TABLE IF NOT EXISTS "organizations" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "name" VARCHAR(100) NOT NULL,
+    "description" TEXT,
+    "parent_id" INT,
+    "level" INT NOT NULL,
+    "sort_order" INT NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL,
+    "is_deleted" BOOL NOT NULL,
+    "manager_id_id" INT REFERENCES "users" ("id") ON DELETE CASCADE
+);
+COMMENT ON COLUMN "organizations"."name" IS '组织名称';
+COMMENT ON COLUMN "organizations"."description" IS '组织描述';
+COMMENT ON COLUMN "organizations"."parent_id" IS '父级组织ID';
+COMMENT ON COLUMN "organizations"."level" IS '组织层级';
+COMMENT ON COLUMN "organizations"."sort_order" IS '排序顺序';
+COMMENT ON COLUMN "organizations"."created_at" IS '创建时间';
+COMMENT ON COLUMN "organizations"."updated_at" IS '更新时间';
+COMMENT ON COLUMN "organizations"."is_deleted" IS '删除标志';
+COMMENT ON COLUMN "organizations"."manager_id_id" IS '组织管理员';
+COMMENT ON TABLE "organizations" IS '组织架构模型';
+CREATE TABLE IF NOT EXISTS "projects" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "name" VARCHAR(100) NOT NULL,
+    "description" TEXT,
+    "status" VARCHAR(20) NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL,
+    "is_deleted" BOOL NOT NULL,
+    "manager_id_id" INT NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE
+);
+COMMENT ON COLUMN "projects"."name" IS '项目名称';
+COMMENT ON COLUMN "projects"."description" IS '项目描述';
+COMMENT ON COLUMN "projects"."status" IS '项目状态';
+COMMENT ON COLUMN "projects"."created_at" IS '创建时间';
+COMMENT ON COLUMN "projects"."updated_at" IS '更新时间';
+COMMENT ON COLUMN "projects"."is_deleted" IS '删除标志';
+COMMENT ON COLUMN "projects"."manager_id_id" IS '项目经理';
+COMMENT ON TABLE "projects" IS '项目信息模型';
+CREATE TABLE IF NOT EXISTS "project_members" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "joined_at" TIMESTAMPTZ NOT NULL,
+    "is_active" BOOL NOT NULL,
+    "project_id" INT NOT NULL REFERENCES "projects" ("id") ON DELETE CASCADE,
+    "role_id" INT NOT NULL REFERENCES "roles" ("id") ON DELETE CASCADE,
+    "user_id" INT NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_project_mem_project_1c5e7a" UNIQUE ("project_id", "user_id")
+);
+COMMENT ON COLUMN "project_members"."joined_at" IS '加入时间';
+COMMENT ON COLUMN "project_members"."is_active" IS '是否激活';
+COMMENT ON COLUMN "project_members"."project_id" IS '所属项目';
+COMMENT ON COLUMN "project_members"."role_id" IS '项目中的角色';
+COMMENT ON COLUMN "project_members"."user_id" IS '用户';
+COMMENT ON TABLE "project_members" IS '用户-项目关联模型';
+CREATE TABLE IF NOT EXISTS "scripts" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "name" VARCHAR(100) NOT NULL,
+    "file_path" VARCHAR(255) NOT NULL,
+    "file_size" INT,
+    "script_version" VARCHAR(50) NOT NULL,
+    "description" TEXT,
+    "script_type" VARCHAR(20) NOT NULL,
+    "is_active" BOOL NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL,
+    "is_deleted" BOOL NOT NULL,
+    "author_id_id" INT REFERENCES "users" ("id") ON DELETE CASCADE,
+    "project_id_id" INT NOT NULL REFERENCES "projects" ("id") ON DELETE CASCADE
+);
+COMMENT ON COLUMN "scripts"."name" IS '脚本名称';
+COMMENT ON COLUMN "scripts"."file_path" IS '脚本路径';
+COMMENT ON COLUMN "scripts"."file_size" IS '脚本大小(字节)';
+COMMENT ON COLUMN "scripts"."script_version" IS '脚本版本';
+COMMENT ON COLUMN "scripts"."description" IS '脚本描述';
+COMMENT ON COLUMN "scripts"."script_type" IS '脚本类型';
+COMMENT ON COLUMN "scripts"."is_active" IS '是否激活';
+COMMENT ON COLUMN "scripts"."created_at" IS '创建时间';
+COMMENT ON COLUMN "scripts"."updated_at" IS '更新时间';
+COMMENT ON COLUMN "scripts"."is_deleted" IS '删除标志';
+COMMENT ON COLUMN "scripts"."author_id_id" IS '作者';
+COMMENT ON COLUMN "scripts"."project_id_id" IS '所属项目';
+COMMENT ON TABLE "scripts" IS '脚本模型';
+CREATE TABLE IF NOT EXISTS "test_plans" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "name" VARCHAR(100) NOT NULL,
+    "description" TEXT,
+    "status" VARCHAR(20) NOT NULL,
+    "priority" VARCHAR(10) NOT NULL,
+    "scheduled_start" TIMESTAMPTZ,
+    "scheduled_end" TIMESTAMPTZ,
+    "actual_start" TIMESTAMPTZ,
+    "actual_end" TIMESTAMPTZ,
+    "total_cases" INT NOT NULL,
+    "passed_cases" INT NOT NULL,
+    "failed_cases" INT NOT NULL,
+    "is_active" BOOL NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL,
+    "is_deleted" BOOL NOT NULL,
+    "creator_id_id" INT NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE,
+    "project_id_id" INT NOT NULL REFERENCES "projects" ("id") ON DELETE CASCADE
+);
+COMMENT ON COLUMN "test_plans"."name" IS '测试计划名称';
+COMMENT ON COLUMN "test_plans"."description" IS '测试计划描述';
+COMMENT ON COLUMN "test_plans"."status" IS '状态';
+COMMENT ON COLUMN "test_plans"."priority" IS '优先级';
+COMMENT ON COLUMN "test_plans"."scheduled_start" IS '计划开始时间';
+COMMENT ON COLUMN "test_plans"."scheduled_end" IS '计划结束时间';
+COMMENT ON COLUMN "test_plans"."actual_start" IS '实际开始时间';
+COMMENT ON COLUMN "test_plans"."actual_end" IS '实际结束时间';
+COMMENT ON COLUMN "test_plans"."total_cases" IS '总用例数';
+COMMENT ON COLUMN "test_plans"."passed_cases" IS '通过用例数';
+COMMENT ON COLUMN "test_plans"."failed_cases" IS '失败用例数';
+COMMENT ON COLUMN "test_plans"."is_active" IS '是否激活';
+COMMENT ON COLUMN "test_plans"."created_at" IS '创建时间';
+COMMENT ON COLUMN "test_plans"."updated_at" IS '更新时间';
+COMMENT ON COLUMN "test_plans"."is_deleted" IS '删除标志';
+COMMENT ON COLUMN "test_plans"."creator_id_id" IS '创建者';
+COMMENT ON COLUMN "test_plans"."project_id_id" IS '所属项目';
+COMMENT ON TABLE "test_plans" IS '测试计划模型';
+CREATE TABLE IF NOT EXISTS "test_plan_scripts" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "execution_order" INT NOT NULL,
+    "is_enabled" BOOL NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "script_id" INT NOT NULL REFERENCES "scripts" ("id") ON DELETE CASCADE,
+    "test_plan_id" INT NOT NULL REFERENCES "test_plans" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_test_plan_s_test_pl_d0586e" UNIQUE ("test_plan_id", "script_id")
+);
+COMMENT ON COLUMN "test_plan_scripts"."execution_order" IS '执行顺序';
+COMMENT ON COLUMN "test_plan_scripts"."is_enabled" IS '是否启用';
+COMMENT ON COLUMN "test_plan_scripts"."created_at" IS '创建时间';
+COMMENT ON COLUMN "test_plan_scripts"."script_id" IS '脚本';
+COMMENT ON COLUMN "test_plan_scripts"."test_plan_id" IS '测试计划';
+COMMENT ON TABLE "test_plan_scripts" IS '测试计划-脚本关联模型';
+CREATE TABLE IF NOT EXISTS "test_plan_slaves" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "assigned_at" TIMESTAMPTZ NOT NULL,
+    "is_active" BOOL NOT NULL,
+    "slave_id" INT NOT NULL REFERENCES "slave_configs" ("id") ON DELETE CASCADE,
+    "test_plan_id" INT NOT NULL REFERENCES "test_plans" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_test_plan_s_test_pl_84cbbd" UNIQUE ("test_plan_id", "slave_id")
+);
+COMMENT ON COLUMN "test_plan_slaves"."assigned_at" IS '分配时间';
+COMMENT ON COLUMN "test_plan_slaves"."is_active" IS '是否激活';
+COMMENT ON COLUMN "test_plan_slaves"."slave_id" IS '从机';
+COMMENT ON COLUMN "test_plan_slaves"."test_plan_id" IS '测试计划';
+COMMENT ON TABLE "test_plan_slaves" IS '测试计划-从机关联模型';
+CREATE TABLE IF NOT EXISTS "user_organization_roles" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "joined_at" TIMESTAMPTZ NOT NULL,
+    "is_active" BOOL NOT NULL,
+    "organization_id" INT NOT NULL REFERENCES "organizations" ("id") ON DELETE CASCADE,
+    "role_id" INT NOT NULL REFERENCES "roles" ("id") ON DELETE CASCADE,
+    "user_id" INT NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_user_organi_user_id_1dae50" UNIQUE ("user_id", "organization_id", "role_id")
+);
+COMMENT ON COLUMN "user_organization_roles"."joined_at" IS '加入时间';
+COMMENT ON COLUMN "user_organization_roles"."is_active" IS '是否激活';
+COMMENT ON COLUMN "user_organization_roles"."organization_id" IS '组织';
+COMMENT ON COLUMN "user_organization_roles"."role_id" IS '角色';
+COMMENT ON COLUMN "user_organization_roles"."user_id" IS '用户';
+COMMENT ON TABLE "user_organization_roles" IS '用户-组织-角色关联模型';
+CREATE TABLE IF NOT EXISTS "aerich" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "version" VARCHAR(255) NOT NULL,
+    "app" VARCHAR(100) NOT NULL,
+    "content" JSONB NOT NULL
+);"""
+    return """
+        CREATE TABLE IF NOT EXISTS "roles" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "name" VARCHAR(50) NOT NULL UNIQUE /* 角色名称 */,
+    "description" TEXT /* 角色描述 */,
+    "permissions" JSON NOT NULL /* 角色权限列表 */,
+    "is_system" INT NOT NULL /* 是否系统角色 */,
+    "org_id" INT /* 所属组织ID */,
+    "created_at" TIMESTAMP NOT NULL /* 创建时间 */,
+    "updated_at" TIMESTAMP NOT NULL /* 更新时间 */,
+    "is_deleted" INT NOT NULL /* 删除标志 */
+) /* 角色模型 */;
+CREATE TABLE IF NOT EXISTS "slave_configs" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "name" VARCHAR(100) NOT NULL /* 从机名称 */,
+    "description" TEXT /* 描述 */,
+    "ip_address" VARCHAR(45) NOT NULL /* IP地址 */,
+    "port" INT NOT NULL /* 端口号 */,
+    "username" VARCHAR(50) /* 登录用户名 */,
+    "auth_type" VARCHAR(20) NOT NULL /* 认证类型 */,
+    "auth_value" VARCHAR(255) /* 认证值(密码/密钥/令牌) */,
+    "tags" JSON NOT NULL /* 标签列表 */,
+    "status" VARCHAR(20) NOT NULL /* 状态 */,
+    "cpu_usage" REAL /* CPU使用率 */,
+    "memory_usage" REAL /* 内存使用率 */,
+    "disk_usage" REAL /* 磁盘使用率 */,
+    "last_heartbeat" TIMESTAMP /* 最后心跳时间 */,
+    "max_concurrent_tasks" INT NOT NULL /* 最大并发任务数 */,
+    "current_tasks" INT NOT NULL /* 当前任务数 */,
+    "is_active" INT NOT NULL /* 是否激活 */,
+    "created_at" TIMESTAMP NOT NULL /* 创建时间 */,
+    "updated_at" TIMESTAMP NOT NULL /* 更新时间 */,
+    "is_deleted" INT NOT NULL /* 删除标志 */
+) /* 从机配置模型 */;
+CREATE TABLE IF NOT EXISTS "users" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "username" VARCHAR(50) NOT NULL UNIQUE /* 用户名 */,
+    "email" VARCHAR(100) NOT NULL UNIQUE /* 邮箱 */,
+    "password_hash" VARCHAR(255) NOT NULL /* 密码哈希 */,
+    "phone" VARCHAR(20) /* 手机号 */,
+    "real_name" VARCHAR(50) /* 真实姓名 */,
+    "avatar" VARCHAR(255) /* 头像URL */,
+    "is_active" INT NOT NULL /* 是否激活 */,
+    "is_superuser" INT NOT NULL /* 是否超级用户 */,
+    "last_login" TIMESTAMP /* 最后登录时间 */,
+    "created_at" TIMESTAMP NOT NULL /* 创建时间 */,
+    "updated_at" TIMESTAMP NOT NULL /* 更新时间 */,
+    "is_deleted" INT NOT NULL /* 删除标志 */
+) /* 用户信息模型 */;
+CREATE TABLE IF NOT EXISTS "organizations" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "name" VARCHAR(100) NOT NULL /* 组织名称 */,
+    "description" TEXT /* 组织描述 */,
+    "parent_id" INT /* 父级组织ID */,
+    "level" INT NOT NULL /* 组织层级 */,
+    "sort_order" INT NOT NULL /* 排序顺序 */,
+    "created_at" TIMESTAMP NOT NULL /* 创建时间 */,
+    "updated_at" TIMESTAMP NOT NULL /* 更新时间 */,
+    "is_deleted" INT NOT NULL /* 删除标志 */,
+    "manager_id_id" INT REFERENCES "users" ("id") ON DELETE CASCADE /* 组织管理员 */
+) /* 组织架构模型 */;
+CREATE TABLE IF NOT EXISTS "projects" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "name" VARCHAR(100) NOT NULL /* 项目名称 */,
+    "description" TEXT /* 项目描述 */,
+    "status" VARCHAR(20) NOT NULL /* 项目状态 */,
+    "created_at" TIMESTAMP NOT NULL /* 创建时间 */,
+    "updated_at" TIMESTAMP NOT NULL /* 更新时间 */,
+    "is_deleted" INT NOT NULL /* 删除标志 */,
+    "manager_id_id" INT NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE /* 项目经理 */
+) /* 项目信息模型 */;
+CREATE TABLE IF NOT EXISTS "project_members" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "joined_at" TIMESTAMP NOT NULL /* 加入时间 */,
+    "is_active" INT NOT NULL /* 是否激活 */,
+    "project_id" INT NOT NULL REFERENCES "projects" ("id") ON DELETE CASCADE /* 所属项目 */,
+    "role_id" INT NOT NULL REFERENCES "roles" ("id") ON DELETE CASCADE /* 项目中的角色 */,
+    "user_id" INT NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE /* 用户 */,
+    CONSTRAINT "uid_project_mem_project_1c5e7a" UNIQUE ("project_id", "user_id")
+) /* 用户-项目关联模型 */;
+CREATE TABLE IF NOT EXISTS "scripts" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "name" VARCHAR(100) NOT NULL /* 脚本名称 */,
+    "file_path" VARCHAR(255) NOT NULL /* 脚本路径 */,
+    "file_size" INT /* 脚本大小(字节) */,
+    "script_version" VARCHAR(50) NOT NULL /* 脚本版本 */,
+    "description" TEXT /* 脚本描述 */,
+    "script_type" VARCHAR(20) NOT NULL /* 脚本类型 */,
+    "is_active" INT NOT NULL /* 是否激活 */,
+    "created_at" TIMESTAMP NOT NULL /* 创建时间 */,
+    "updated_at" TIMESTAMP NOT NULL /* 更新时间 */,
+    "is_deleted" INT NOT NULL /* 删除标志 */,
+    "author_id_id" INT REFERENCES "users" ("id") ON DELETE CASCADE /* 作者 */,
+    "project_id_id" INT NOT NULL REFERENCES "projects" ("id") ON DELETE CASCADE /* 所属项目 */
+) /* 脚本模型 */;
+CREATE TABLE IF NOT EXISTS "test_plans" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "name" VARCHAR(100) NOT NULL /* 测试计划名称 */,
+    "description" TEXT /* 测试计划描述 */,
+    "status" VARCHAR(20) NOT NULL /* 状态 */,
+    "priority" VARCHAR(10) NOT NULL /* 优先级 */,
+    "scheduled_start" TIMESTAMP /* 计划开始时间 */,
+    "scheduled_end" TIMESTAMP /* 计划结束时间 */,
+    "actual_start" TIMESTAMP /* 实际开始时间 */,
+    "actual_end" TIMESTAMP /* 实际结束时间 */,
+    "total_cases" INT NOT NULL /* 总用例数 */,
+    "passed_cases" INT NOT NULL /* 通过用例数 */,
+    "failed_cases" INT NOT NULL /* 失败用例数 */,
+    "is_active" INT NOT NULL /* 是否激活 */,
+    "created_at" TIMESTAMP NOT NULL /* 创建时间 */,
+    "updated_at" TIMESTAMP NOT NULL /* 更新时间 */,
+    "is_deleted" INT NOT NULL /* 删除标志 */,
+    "creator_id_id" INT NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE /* 创建者 */,
+    "project_id_id" INT NOT NULL REFERENCES "projects" ("id") ON DELETE CASCADE /* 所属项目 */
+) /* 测试计划模型 */;
+CREATE TABLE IF NOT EXISTS "test_plan_scripts" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "execution_order" INT NOT NULL /* 执行顺序 */,
+    "is_enabled" INT NOT NULL /* 是否启用 */,
+    "created_at" TIMESTAMP NOT NULL /* 创建时间 */,
+    "script_id" INT NOT NULL REFERENCES "scripts" ("id") ON DELETE CASCADE /* 脚本 */,
+    "test_plan_id" INT NOT NULL REFERENCES "test_plans" ("id") ON DELETE CASCADE /* 测试计划 */,
+    CONSTRAINT "uid_test_plan_s_test_pl_d0586e" UNIQUE ("test_plan_id", "script_id")
+) /* 测试计划-脚本关联模型 */;
+CREATE TABLE IF NOT EXISTS "test_plan_slaves" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "assigned_at" TIMESTAMP NOT NULL /* 分配时间 */,
+    "is_active" INT NOT NULL /* 是否激活 */,
+    "slave_id" INT NOT NULL REFERENCES "slave_configs" ("id") ON DELETE CASCADE /* 从机 */,
+    "test_plan_id" INT NOT NULL REFERENCES "test_plans" ("id") ON DELETE CASCADE /* 测试计划 */,
+    CONSTRAINT "uid_test_plan_s_test_pl_84cbbd" UNIQUE ("test_plan_id", "slave_id")
+) /* 测试计划-从机关联模型 */;
+CREATE TABLE IF NOT EXISTS "user_organization_roles" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "joined_at" TIMESTAMP NOT NULL /* 加入时间 */,
+    "is_active" INT NOT NULL /* 是否激活 */,
+    "organization_id" INT NOT NULL REFERENCES "organizations" ("id") ON DELETE CASCADE /* 组织 */,
+    "role_id" INT NOT NULL REFERENCES "roles" ("id") ON DELETE CASCADE /* 角色 */,
+    "user_id" INT NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE /* 用户 */,
+    CONSTRAINT "uid_user_organi_user_id_1dae50" UNIQUE ("user_id", "organization_id", "role_id")
+) /* 用户-组织-角色关联模型 */;
+CREATE TABLE IF NOT EXISTS "aerich" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "version" VARCHAR(255) NOT NULL,
+    "app" VARCHAR(100) NOT NULL,
+    "content" JSON NOT NULL
+);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
+
+
+MODELS_STATE = (
+    "eJztXVtzm8gS/isuPWWrnCxC3HTebMd71nsSK2U752xtkqJGMMhsEGgBOevdzX8/MwOI4S"
+    "YxoMvImhdfgEbo65me7q+7h78H88CGXvRmEs6A7/4FB/86+3vggzn+o3Lu/GwAFov8DD4Q"
+    "g6lHLg6Sq0DsBj45A6ZRHAIrRicd4EUQHbJhZIXuAl+CRT4vdWgp5Kf+eanpUw3/NNARDc"
+    "jDz0tVN6b4TnZgoVu5/oxFaOm7fyyhGQczGD/CEIl++oIOu74N/4RR9u/iq+m40LML39u1"
+    "8Q3IcTN+XpBjN378E7kQP8/UtAJvOffzixfP8WPgr652/RgfnUEfhiCG+PZxuMQQ+EvPSy"
+    "HLUEmeNL8keURKxoYOWHoYSCydPEB+bGCat5MH8/76wTQHFZAzCQrC9JCF9IQUhB41It9+"
+    "hh/htTxUdMUYaYqBLiGPuTqif08+OgcmESTw3D4MvpPzIAbJFQTjHFTyuwLr1SMI63HNri"
+    "8hix65jGyG4zposwM5tvmY7A5uaTCqimSjv8eOVB61DZDPwZ+mB/1Z/Ij+HUrSGoD/e3F3"
+    "9fPF3St01Q/47gGaWsnEu01Pyck5rIUcdfp5K+A/wD8bBnVJrJMO0sG7XxVoI8v5vDScti"
+    "pYg/jD9a8P+CbzKPrDo4F+9f7iV6KD+XN65t3k9t/Z5ZRirt5NLkv6WIAQ+rHJZGEKMpsN"
+    "zUFVIY80rAqg02q5edtyPmzFBOVge/AJegxAr67vBHInmzPsZ3AsRU7gPgzAURDGZhDaMG"
+    "RAuSi0P6glZqi10RjBq0IDmZSxoYPk78NAbYUQ42GCuAr1W3QmduewHu+iZAlvOxV9k/3B"
+    "1eKqysMpBt1B0Guqg0zLWHWUlgpAX9ue+N5zav/WWfqb99f3DxfvPxTM/duLh2t8Ri6Y+u"
+    "zoK620DK9ucva/m4efz/C/Z79Nbq8J6EEUz0Lyifl1D78N8DOBZRyYfvDNBDbl8mVHMywL"
+    "Y2G5sDuOhaLkUY0FTXOwj69OpZMZCxly1GBIn56KVSIEogexgipj4TIIPAj8hrilIFgaCl"
+    "MkuSvtr44wmgIZKX6saXgQGBJe/By75bK3Rt2Xk8m7gqYvb8pe3Mf3l9fI7yYqRhe5May3"
+    "0HPggxkMkZ/G5t5V5Dh38Sj/Q58CFHHriqTh4Ec19rc04tjd+VobaOZ4VpXwUxBCd+b/Bz"
+    "4TXdyg5wK+VRdnptzHxwiGN74TvCwNfM/GYHY0f/wQfFsxItWhiQBKjAY+e3Vxf3Xx9npA"
+    "lDEF1tdvILTNBq0sEZAmiCKE/hzix6haq/QOP/3nDnqgIfSk1DIJZ3fIvnG1SOWq6acIAm"
+    "kgBxSUBZCrp+byvHyEKM9OPxt/UgrehzD4HRJerkL1ZafO1zF9i+Si1iQfcp3HCBQNws9L"
+    "xYFovGqS5mwg+doJCZJPkHx7mNb0YBQk30EWPVoFvJN8yKmIlzUrXPM8yCX2NxMGyGy7T3"
+    "DQSxW6TPIvkjTsMhvkNpNBbp4LcmUqCJrkNEJjQZMImkTQJIIm2UvmoLfDggJCJ4nST5oh"
+    "OQ7wD0COzOF8CsOenEgau78n9+JKG5qsSDhZqUJaMz0ZkoLDTT6vJ3735CanBVwMo9hceM"
+    "Dvid0Dus8HdJuXj94eiLl0BjfTc/kU30jSmZRpaVWQp8oGRm6kvy7RHkN9hGJuSd1Yncd+"
+    "hxoW71P2Bch5tMQMvghi74DE3u+B63cKpQqCRxVJqTLA5mOoqScTSbWJqlFAlBNHbIFULr"
+    "fHOCqbhYxRtOxgqlfG5JZj4VjaHlWs3SHDqMy+s1USFoQ4D6D6LN/brr4K0cBmg5qS4Bzn"
+    "QqYNyji5oeFyemNsy+inrMuHwZxkjJkwpyQ4xzx3krggBChfqycbQCWQuQF7F3HAeYkMKF"
+    "rWeiagPLhfKvnCOrjbYkxN780Ah2lpSE+Auasw2Za1bgs6tY6x8lu7DJWJXmoi5ExfzYEx"
+    "/kKtw+Ec1Q1Rb/OFokSFr0j2sCUqu4C2NPz6FaiobVLyanNKXj3J6pTC9Oe8OmUBw7kbRV"
+    "mbblEfv9xPbhtix6JYmcpxrfjsnzPPjXbm+w0+fRn0U4yujHBuVJVIyYSOjhsaW8VsnZIw"
+    "ZOuVVNbHeZGUwTcoK8mNzOg5iuGcnWXJ5bjPVtM0i245U5yss53OzsyOKZcgnLHFo7kA3y"
+    "X9dIB0+K5NUcIlyGZRwiVKuEQJF08lXBX2sE1dS8aKba3vh98al13zMmVPZLXXzstvqtoa"
+    "hLskpNLqoRpKKq8raialqAKmVrTUcIj9BF22NtFSjRcKWkrQUvuYu9QA5LBzynE9aC4A+g"
+    "AG6AtCR4S/geSwM2G09SWLvTqq2qZZR1Wbu3XwuRr8o3RvuZYWpSDDd2BdGP1jmezYIzmv"
+    "0K+piukn2ZB/OEyQnTyo+QTDqJaXXdOqVpHcY8va8I30RurAAlJ60GXFSP4W9Pgh5gHv9H"
+    "g6vgmS7NMiE9vjnEg+queksPRpvRN5mDZOUWTIBeMtqNjToN8EFSuoWEHFHgsVS2sCaekx"
+    "YG+mLYvxHUYpjorDV0lSDxMs5cWdXcvtj6Mq+dAV92sqlFcDtgr/i9jTjXWIty3fLE/0zY"
+    "Wz6xpLRDl4S9grM797b/iqRdfcSpdz1qnLYbdzHpDynOfxwBO8CnzHnQ3qkj3U6fO1GR98"
+    "IX52dGXrvI8CLbz9lT5COI2HCmbTHQ1uyAG1ExL5IJEP2sc6Rw1GDvNBp0DG8k7Augscia"
+    "JglWkHvaIU17Pg5gM2uyPshOhKp7GvtEnFKc2ZOKWSiFsEYQ2v0xzZpJdzHtDogGQ8R3CE"
+    "fzoHeksG7ltjNee0DN/mRNdI6sBRVbrzL7HuXcb29jNsOAZizucUhPaZzQFR9C0IswdicZ"
+    "+nANebTa0hf/kcguYT8JbsOlhJ8T0NaPRVaWSRJL+F+xoMafhj9s9YAeqP2AuCCslEW23T"
+    "/7svxYjBjKkfKLv+SBqBEvpWn+qQ/+afI9k/OPA91++wfzB3ewYvluYyQuF+DeHlBaDBBS"
+    "pIlVB3sBg/1unqw0fMMOpOtkLrI6N/FuPt5OPlu+uzD3fXVzf3N+k0WGWpyMli9uLu+uJd"
+    "eTNQOA/C5w7olwX5VgDeRspQSdmXwakmbDf62kEPRTHetaAbxDnSbF614IEoNh8hCOMpZE"
+    "+0V6W3kGzfHy+hSxIJG/AK7Vh4r0DbGbHn3Y83z14tusArH/p61jIkrwCNQfS1xi9Ys2dy"
+    "vfj+wna16zBIqmWhjt9rNLKH2GfG/cGqjN93pKl6W95k282pHTVxQBWwv/cSBfOYMJFxro"
+    "AP2EU9IBfVJqIe8DRqwEQ9oKgHFPWAx1IP2Kk1myorwZUI26oqwffiasbmCWcmNe23qGS1"
+    "fX5NRQm9tX5zOUlxI/82tSSarUwxYW2rhLwekoVu0zZ37YRELYmoJdnHYtwwGEVdyWH4my"
+    "bbwHm9yZFkW+wQOPHxJ1sWoRuEbvzMgjcts0fE59B2l3N2yBVnaGDGH/cZ6xC0rTopWaFW"
+    "RmiNDSoDH1mP0F56KO5Cw7eu2Gd90FYjfkzkcmF9cBKG0ZqeNrmcqxT6NW5X2/GQCh/raN"
+    "ChjZMMuuqc9mhA4cISeN2MQ1n2mMaCOh3jRhBNUYVlKI2FDmahKHms40DYhJQkCmKkTAtE"
+    "dfxQY1hekuI506VJo2lWBKA4xvSQOS5c+YmWU1a0y2I8wz2WcIeX4Vg6L6A7wPU6gF4W4x"
+    "l0dTwa4loKWeUFdJHNFdncLahFZHNFNldkc3u7fSKby1U2t2KhO2zvUpHjvE+PNspimxee"
+    "N8DYz4soxeYje9h8pN7QbAF3Ll9K2c3EtIW8YnDFfi9dE8b9FFOkr06kxmknQO6j3qn5pQ"
+    "nVYdui9omeMd1LoF6X9u0e6rgVRVKVTrVRre9WUzT1Kf9qxFNMsPgiaqkOWEuFvpK1JO9d"
+    "CUK77h3OjQjXSO7PURx28FQ00iStWMRTwfv1QMM5GGEIffz1O0SklOAxUYboZ9qeyF1AKi"
+    "jDF08TtaEM0x3vmVaZggznYTLrdoTbNnq5W8MEcVmMc5T7+K47JiMKzlfPmJiu4n8R2LeN"
+    "jMvDcTMXEa1c/p6YcxjybmuL0zLKBbvKyj3sJdIjQfO6QC+LqlvFeatwvleYV9iMsneY1+"
+    "5uLcI8goSI8g4Z5SXv1Ozk6JZEj8zTlbRsk2Dh6Yp6Fb7qVZIts9niDUqEc0eYtVFVhBsi"
+    "3BDhxhbCjczx7BttFHf+5wb1bTXAV0IOyrTyFHGsss81wQadmW6OM/Dey62DC3rLY8WBeJ"
+    "ckSXM2xBDthEQbPV9BwUH28d4LxANet+6Gc+B6LHivBLgGeywBiDcjnnZqyt7JDgXZvuPm"
+    "I4iY3oZeEeR814h8V2480C3cqQ2lTu+C3sk23AuEHZOFWQlwvjuEjJ2/lB1r/yqGHe9GEE"
+    "Lgmaw2vSDEN+q6PnSy1kZ1jJsa+bHt4AkttDUFFGveB7CS4Bt1dTxS8FsALOfj3TtuLItg"
+    "sbhgsRCc0XIBQ+wZsmuiIMp9hwWtDcM21GQ/FNrZ5EkzZPtsL5i5NQxMi423V5LH1PVOb7"
+    "pNv8nnlLveRZGTSP2IvkjRFyn6Innqi6xkTto006QssRmEM+C7f5EOj55tIJPkVlyt4jq0"
+    "FPKTvOIKZ1Z0RSJFxCpb+fD6fpoMzbTBrCeQPLbn5S15BE4nAXKLEGa9eXM4n8IwenQX20"
+    "HxPbkfV1h2dPLX47eVnrjWhYF7m8CKo1rb6Eus9WOLe0P3b4DjapRtt6+zgB+9aJghWt97"
+    "4oezj2j1uEN34grCrU3UXad1M/AaMrsUtuuTu2a9ZtnSva/pZRd3+Y1tGf2UdZmhmLTv7W"
+    "qrSTN6iP6W+H/8RUVd6UFTyL8Hbreq0oLgUQWTqgwwwzTUOrBKRxpMiprSo2HjCysBk8mr"
+    "keS89jFfX1rOvi1XmOL1hw1jSoJzbPPl+jDYEreGCVtKgnNsWf3THdfp1ifuXsYuOdsKBc"
+    "5LxaLUYNtckVv2W3sCzUDY8WuL2wJdsyptBjxMo6aeQHMX2LIa5bYgU8sST5XPFzB0rcdB"
+    "TXScnjlfFxiD/JpNcXBzOCVKlvmKN59gGNVa0eYiK0qE50rO9hDvvrIKTyoGhNPLXyC6O6"
+    "lMRp8YQ7+GMfnlfnLbUIeRi5S5EteKz/4589yIIx+3NdprwMVgFGLiyqvRym9BOy9yGvgG"
+    "l2x51u0vZt//DzP6Eis="
+)
@@ -0,0 +1,591 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # SQLite 与 PostgreSQL 的建表语句不同(自增主键、列注释)，按数据库方言分别给出
+    if db.capabilities.dialect == "postgres":
+        return """
+        CREATE TABLE IF NOT EXISTS "datasets" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "name" VARCHAR(100) NOT NULL,
+    "description" TEXT,
+    "file_path" VARCHAR(255) NOT NULL,
+    "file_size" BIGINT NOT NULL,
+    "line_count" BIGINT NOT NULL,
+    "has_header" BOOL NOT NULL,
+    "checksum" VARCHAR(64) NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL,
+    "is_deleted" BOOL NOT NULL,
+    "project_id" INT NOT NULL REFERENCES "projects" ("id") ON DELETE CASCADE,
+    "uploaded_by_id" INT REFERENCES "users" ("id") ON DELETE CASCADE
+);
+COMMENT ON COLUMN "datasets"."name" IS '数据集名称';
+COMMENT ON COLUMN "datasets"."description" IS '描述';
+COMMENT ON COLUMN "datasets"."file_path" IS '文件路径';
+COMMENT ON COLUMN "datasets"."file_size" IS '文件大小(字节)';
+COMMENT ON COLUMN "datasets"."line_count" IS '数据行数(不含表头)';
+COMMENT ON COLUMN "datasets"."has_header" IS '首行是否为表头';
+COMMENT ON COLUMN "datasets"."checksum" IS '文件 SHA-256';
+COMMENT ON COLUMN "datasets"."created_at" IS '创建时间';
+COMMENT ON COLUMN "datasets"."updated_at" IS '更新时间';
+COMMENT ON COLUMN "datasets"."is_deleted" IS '删除标志';
+COMMENT ON COLUMN "datasets"."project_id" IS '所属项目';
+COMMENT ON COLUMN "datasets"."uploaded_by_id" IS '上传人';
+COMMENT ON TABLE "datasets" IS '测试数据文件模型(如账号、商品ID等参数化 CSV)';
+        CREATE TABLE IF NOT EXISTS "monitor_targets" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "name" VARCHAR(100) NOT NULL,
+    "description" TEXT,
+    "host" VARCHAR(255) NOT NULL,
+    "port" INT,
+    "method" VARCHAR(20) NOT NULL,
+    "scheme" VARCHAR(10) NOT NULL,
+    "metrics_path" VARCHAR(255) NOT NULL,
+    "auth_token" VARCHAR(255),
+    "interval" INT NOT NULL,
+    "extra_metrics" JSONB NOT NULL,
+    "last_collected_at" TIMESTAMPTZ,
+    "last_error" VARCHAR(255),
+    "is_active" BOOL NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL,
+    "is_deleted" BOOL NOT NULL,
+    "project_id" INT NOT NULL REFERENCES "projects" ("id") ON DELETE CASCADE
+);
+COMMENT ON COLUMN "monitor_targets"."name" IS '监控目标名称';
+COMMENT ON COLUMN "monitor_targets"."description" IS '描述';
+COMMENT ON COLUMN "monitor_targets"."host" IS '主机地址';
+COMMENT ON COLUMN "monitor_targets"."port" IS '采集端口(node_exporter 方式)';
+COMMENT ON COLUMN "monitor_targets"."method" IS '采集方式';
+COMMENT ON COLUMN "monitor_targets"."scheme" IS '采集协议';
+COMMENT ON COLUMN "monitor_targets"."metrics_path" IS '指标路径';
+COMMENT ON COLUMN "monitor_targets"."auth_token" IS '采集令牌(Bearer)';
+COMMENT ON COLUMN "monitor_targets"."interval" IS '采集间隔(秒)';
+COMMENT ON COLUMN "monitor_targets"."extra_metrics" IS '额外记录的原始指标名称列表';
+COMMENT ON COLUMN "monitor_targets"."last_collected_at" IS '最近一次采集成功时间';
+COMMENT ON COLUMN "monitor_targets"."last_error" IS '最近一次采集错误';
+COMMENT ON COLUMN "monitor_targets"."is_active" IS '是否启用';
+COMMENT ON COLUMN "monitor_targets"."created_at" IS '创建时间';
+COMMENT ON COLUMN "monitor_targets"."updated_at" IS '更新时间';
+COMMENT ON COLUMN "monitor_targets"."is_deleted" IS '删除标志';
+COMMENT ON COLUMN "monitor_targets"."project_id" IS '所属项目';
+COMMENT ON TABLE "monitor_targets" IS '被测系统监控目标模型(项目内的执行运行期间采集其资源指标)';
+        CREATE TABLE IF NOT EXISTS "sla_rules" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "label" VARCHAR(255),
+    "metric" VARCHAR(20) NOT NULL,
+    "operator" VARCHAR(5) NOT NULL,
+    "threshold" DOUBLE PRECISION NOT NULL,
+    "is_hard" BOOL NOT NULL,
+    "min_samples" INT NOT NULL,
+    "is_active" BOOL NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "test_plan_id" INT NOT NULL REFERENCES "test_plans" ("id") ON DELETE CASCADE
+);
+COMMENT ON COLUMN "sla_rules"."label" IS '请求标签，为空时针对全部请求';
+COMMENT ON COLUMN "sla_rules"."metric" IS '指标';
+COMMENT ON COLUMN "sla_rules"."operator" IS '比较方式';
+COMMENT ON COLUMN "sla_rules"."threshold" IS '阈值(延迟为毫秒，错误率为比例，吞吐为每秒请求数)';
+COMMENT ON COLUMN "sla_rules"."is_hard" IS '是否为硬性规则(违反时提前终止执行)';
+COMMENT ON COLUMN "sla_rules"."min_samples" IS '样本数达到该值后才开始判定';
+COMMENT ON COLUMN "sla_rules"."is_active" IS '是否启用';
+COMMENT ON COLUMN "sla_rules"."created_at" IS '创建时间';
+COMMENT ON COLUMN "sla_rules"."test_plan_id" IS '测试计划';
+COMMENT ON TABLE "sla_rules" IS '测试计划 SLA 断言规则模型';
+        CREATE TABLE IF NOT EXISTS "test_executions" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "execution_id" VARCHAR(36) NOT NULL UNIQUE,
+    "trigger" VARCHAR(20) NOT NULL,
+    "status" VARCHAR(20) NOT NULL,
+    "priority" VARCHAR(10) NOT NULL,
+    "queued_at" TIMESTAMPTZ,
+    "abort_reason" VARCHAR(255),
+    "slave_ids" JSONB NOT NULL,
+    "partition_slave_ids" JSONB,
+    "saturation_windows" JSONB NOT NULL,
+    "slaves_released" BOOL NOT NULL,
+    "started_at" TIMESTAMPTZ,
+    "finished_at" TIMESTAMPTZ,
+    "total_samples" BIGINT NOT NULL,
+    "error_samples" BIGINT NOT NULL,
+    "retention_mode" VARCHAR(20) NOT NULL,
+    "retention_samples" INT,
+    "aggregates" JSONB,
+    "sample_storage" VARCHAR(20) NOT NULL,
+    "compaction_point" BIGINT,
+    "compacted_at" TIMESTAMPTZ,
+    "report" JSONB,
+    "is_baseline" BOOL NOT NULL,
+    "comparison" JSONB,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "test_plan_id" INT NOT NULL REFERENCES "test_plans" ("id") ON DELETE CASCADE,
+    "triggered_by_id" INT REFERENCES "users" ("id") ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS "idx_test_execut_queued__6fb474" ON "test_executions" ("queued_at");
+COMMENT ON COLUMN "test_executions"."execution_id" IS '执行ID(UUID)';
+COMMENT ON COLUMN "test_executions"."trigger" IS '触发方式';
+COMMENT ON COLUMN "test_executions"."status" IS '执行状态';
+COMMENT ON COLUMN "test_executions"."priority" IS '入队时的测试计划优先级';
+COMMENT ON COLUMN "test_executions"."queued_at" IS '入队时间';
+COMMENT ON COLUMN "test_executions"."abort_reason" IS '提前终止原因';
+COMMENT ON COLUMN "test_executions"."slave_ids" IS '参与执行的从机ID列表';
+COMMENT ON COLUMN "test_executions"."partition_slave_ids" IS '启动时的从机列表，决定数据集分片的归属';
+COMMENT ON COLUMN "test_executions"."saturation_windows" IS '从机饱和时间窗口列表';
+COMMENT ON COLUMN "test_executions"."slaves_released" IS '从机任务数是否已释放';
+COMMENT ON COLUMN "test_executions"."started_at" IS '开始时间';
+COMMENT ON COLUMN "test_executions"."finished_at" IS '结束时间';
+COMMENT ON COLUMN "test_executions"."total_samples" IS '采样总数';
+COMMENT ON COLUMN "test_executions"."error_samples" IS '失败采样数';
+COMMENT ON COLUMN "test_executions"."retention_mode" IS '创建时测试计划的原始采样保留方式';
+COMMENT ON COLUMN "test_executions"."retention_samples" IS '蓄水池保留时每个标签每分钟保留的采样数';
+COMMENT ON COLUMN "test_executions"."aggregates" IS '精确的总体与各标签汇总及延迟直方图(非完整保留时用于报告)';
+COMMENT ON COLUMN "test_executions"."sample_storage" IS '采样存储方式';
+COMMENT ON COLUMN "test_executions"."compaction_point" IS '压缩时已写入分钟汇总的最大原始指标点ID，不大于它的指标点待删除';
+COMMENT ON COLUMN "test_executions"."compacted_at" IS '压缩归档时间，此后时序指标为分钟汇总';
+COMMENT ON COLUMN "test_executions"."report" IS '执行分析报告';
+COMMENT ON COLUMN "test_executions"."is_baseline" IS '是否为测试计划的对比基线';
+COMMENT ON COLUMN "test_executions"."comparison" IS '与基线的对比结果';
+COMMENT ON COLUMN "test_executions"."created_at" IS '创建时间';
+COMMENT ON COLUMN "test_executions"."test_plan_id" IS '测试计划';
+COMMENT ON COLUMN "test_executions"."triggered_by_id" IS '触发人';
+COMMENT ON TABLE "test_executions" IS '测试计划执行记录模型';
+        CREATE TABLE IF NOT EXISTS "error_fingerprints" (
+    "id" BIGSERIAL NOT NULL PRIMARY KEY,
+    "fingerprint" VARCHAR(16) NOT NULL,
+    "status_code" INT NOT NULL,
+    "error_type" VARCHAR(100),
+    "message" VARCHAR(255) NOT NULL,
+    "count" BIGINT NOT NULL,
+    "first_ts" BIGINT NOT NULL,
+    "last_ts" BIGINT NOT NULL,
+    "labels" JSONB NOT NULL,
+    "examples" JSONB NOT NULL,
+    "execution_id" INT NOT NULL REFERENCES "test_executions" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_error_finge_executi_8a53e9" UNIQUE ("execution_id", "fingerprint")
+);
+COMMENT ON COLUMN "error_fingerprints"."fingerprint" IS '错误指纹(状态码 + 异常类型 + 归一化消息的摘要)';
+COMMENT ON COLUMN "error_fingerprints"."status_code" IS '响应状态码';
+COMMENT ON COLUMN "error_fingerprints"."error_type" IS '异常类型';
+COMMENT ON COLUMN "error_fingerprints"."message" IS '归一化后的错误消息';
+COMMENT ON COLUMN "error_fingerprints"."count" IS '出现次数';
+COMMENT ON COLUMN "error_fingerprints"."first_ts" IS '首次出现时间(毫秒时间戳)';
+COMMENT ON COLUMN "error_fingerprints"."last_ts" IS '最近出现时间(毫秒时间戳)';
+COMMENT ON COLUMN "error_fingerprints"."labels" IS '按请求标签的出现次数';
+COMMENT ON COLUMN "error_fingerprints"."examples" IS '随机抽样保留的错误示例';
+COMMENT ON COLUMN "error_fingerprints"."execution_id" IS '所属执行';
+COMMENT ON TABLE "error_fingerprints" IS '执行失败采样的错误指纹模型(同类错误只保存一行计数与少量示例)';
+        CREATE TABLE IF NOT EXISTS "execution_samples" (
+    "id" BIGSERIAL NOT NULL PRIMARY KEY,
+    "slave_id" INT,
+    "timestamp" BIGINT NOT NULL,
+    "intended_ts" BIGINT,
+    "label" VARCHAR(255) NOT NULL,
+    "latency" DOUBLE PRECISION NOT NULL,
+    "status_code" INT NOT NULL,
+    "success" BOOL NOT NULL,
+    "bytes" INT NOT NULL,
+    "weight" DOUBLE PRECISION NOT NULL,
+    "execution_id" INT NOT NULL REFERENCES "test_executions" ("id") ON DELETE CASCADE
+);
+COMMENT ON COLUMN "execution_samples"."slave_id" IS '上报从机ID';
+COMMENT ON COLUMN "execution_samples"."timestamp" IS '请求开始时间(毫秒时间戳)';
+COMMENT ON COLUMN "execution_samples"."intended_ts" IS '计划发送时间(毫秒时间戳)，用于协调遗漏校正';
+COMMENT ON COLUMN "execution_samples"."label" IS '请求标签';
+COMMENT ON COLUMN "execution_samples"."latency" IS '响应时间(毫秒)';
+COMMENT ON COLUMN "execution_samples"."status_code" IS '响应状态码';
+COMMENT ON COLUMN "execution_samples"."success" IS '是否成功';
+COMMENT ON COLUMN "execution_samples"."bytes" IS '响应字节数';
+COMMENT ON COLUMN "execution_samples"."weight" IS '代表的采样数(抽样保留时大于 1)';
+COMMENT ON COLUMN "execution_samples"."execution_id" IS '所属执行';
+COMMENT ON TABLE "execution_samples" IS '执行原始采样模型（执行期间逐条写入）';
+        CREATE TABLE IF NOT EXISTS "metric_points" (
+    "id" BIGSERIAL NOT NULL PRIMARY KEY,
+    "source" VARCHAR(50) NOT NULL,
+    "name" VARCHAR(50) NOT NULL,
+    "ts" BIGINT NOT NULL,
+    "value" DOUBLE PRECISION NOT NULL,
+    "execution_id" INT REFERENCES "test_executions" ("id") ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS "idx_metric_poin_executi_622f4e" ON "metric_points" ("execution_id", "name", "ts");
+CREATE INDEX IF NOT EXISTS "idx_metric_poin_source_fd62f4" ON "metric_points" ("source", "name", "ts");
+COMMENT ON COLUMN "metric_points"."source" IS '指标来源';
+COMMENT ON COLUMN "metric_points"."name" IS '指标名称';
+COMMENT ON COLUMN "metric_points"."ts" IS '时间(秒级时间戳，按分钟汇总时为分钟起点)';
+COMMENT ON COLUMN "metric_points"."value" IS '指标值';
+COMMENT ON COLUMN "metric_points"."execution_id" IS '所属执行，平台级指标为空';
+COMMENT ON TABLE "metric_points" IS '时序指标点模型（平台/执行的汇总指标）';
+        CREATE TABLE IF NOT EXISTS "test_plan_datasets" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "mode" VARCHAR(20) NOT NULL,
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "dataset_id" INT NOT NULL REFERENCES "datasets" ("id") ON DELETE CASCADE,
+    "test_plan_id" INT NOT NULL REFERENCES "test_plans" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_test_plan_d_test_pl_1a2c6c" UNIQUE ("test_plan_id", "dataset_id")
+);
+COMMENT ON COLUMN "test_plan_datasets"."mode" IS '分发方式';
+COMMENT ON COLUMN "test_plan_datasets"."created_at" IS '关联时间';
+COMMENT ON COLUMN "test_plan_datasets"."dataset_id" IS '数据集';
+COMMENT ON COLUMN "test_plan_datasets"."test_plan_id" IS '测试计划';
+COMMENT ON TABLE "test_plan_datasets" IS '测试计划-数据集关联模型';
+        ALTER TABLE "organizations" ADD "path" VARCHAR(255);
+        ALTER TABLE "slave_configs" ADD "reported_tasks" INT NOT NULL DEFAULT 0;
+        ALTER TABLE "slave_configs" ADD "clock_offset" DOUBLE PRECISION;
+        ALTER TABLE "slave_configs" ADD "clock_rtt" DOUBLE PRECISION;
+        ALTER TABLE "slave_configs" ADD "clock_synced_at" TIMESTAMPTZ;
+        COMMENT ON COLUMN "slave_configs"."current_tasks" IS '当前任务数(服务端预留计数，由执行启动与结束维护)';
+        ALTER TABLE "test_plans" ADD "cron_expression" VARCHAR(100);
+        ALTER TABLE "test_plans" ADD "retention_mode" VARCHAR(20) NOT NULL DEFAULT 'full';
+        ALTER TABLE "test_plans" ADD "retention_samples" INT;
+        ALTER TABLE "test_plans" ADD "next_run_at" TIMESTAMPTZ;
+        COMMENT ON COLUMN organizations."path" IS '层级路径，如 /1/5/12/';
+COMMENT ON COLUMN slave_configs."reported_tasks" IS '从机心跳上报的当前任务数';
+COMMENT ON COLUMN slave_configs."clock_offset" IS '时钟偏差(毫秒，服务器时间 - 从机时间)';
+COMMENT ON COLUMN slave_configs."clock_rtt" IS '估计时钟偏差所用交换的往返时延(毫秒)';
+COMMENT ON COLUMN slave_configs."clock_synced_at" IS '时钟偏差更新时间';
+COMMENT ON COLUMN test_plans."cron_expression" IS '周期执行的 cron 表达式';
+COMMENT ON COLUMN test_plans."retention_mode" IS '原始采样保留方式';
+COMMENT ON COLUMN test_plans."retention_samples" IS '蓄水池保留时每个标签每分钟保留的采样数，为空时使用默认值';
+COMMENT ON COLUMN test_plans."next_run_at" IS '下次调度执行时间';
+        CREATE INDEX IF NOT EXISTS "idx_organizatio_path_5905ed" ON "organizations" ("path");
+        CREATE INDEX IF NOT EXISTS "idx_test_plans_next_ru_25448b" ON "test_plans" ("next_run_at");"""
+    return """
+        CREATE TABLE IF NOT EXISTS "datasets" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "name" VARCHAR(100) NOT NULL /* 数据集名称 */,
+    "description" TEXT /* 描述 */,
+    "file_path" VARCHAR(255) NOT NULL /* 文件路径 */,
+    "file_size" BIGINT NOT NULL /* 文件大小(字节) */,
+    "line_count" BIGINT NOT NULL /* 数据行数(不含表头) */,
+    "has_header" INT NOT NULL /* 首行是否为表头 */,
+    "checksum" VARCHAR(64) NOT NULL /* 文件 SHA-256 */,
+    "created_at" TIMESTAMP NOT NULL /* 创建时间 */,
+    "updated_at" TIMESTAMP NOT NULL /* 更新时间 */,
+    "is_deleted" INT NOT NULL /* 删除标志 */,
+    "project_id" INT NOT NULL REFERENCES "projects" ("id") ON DELETE CASCADE /* 所属项目 */,
+    "uploaded_by_id" INT REFERENCES "users" ("id") ON DELETE CASCADE /* 上传人 */
+) /* 测试数据文件模型(如账号、商品ID等参数化 CSV) */;
+        CREATE TABLE IF NOT EXISTS "monitor_targets" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "name" VARCHAR(100) NOT NULL /* 监控目标名称 */,
+    "description" TEXT /* 描述 */,
+    "host" VARCHAR(255) NOT NULL /* 主机地址 */,
+    "port" INT /* 采集端口(node_exporter 方式) */,
+    "method" VARCHAR(20) NOT NULL /* 采集方式 */,
+    "scheme" VARCHAR(10) NOT NULL /* 采集协议 */,
+    "metrics_path" VARCHAR(255) NOT NULL /* 指标路径 */,
+    "auth_token" VARCHAR(255) /* 采集令牌(Bearer) */,
+    "interval" INT NOT NULL /* 采集间隔(秒) */,
+    "extra_metrics" JSON NOT NULL /* 额外记录的原始指标名称列表 */,
+    "last_collected_at" TIMESTAMP /* 最近一次采集成功时间 */,
+    "last_error" VARCHAR(255) /* 最近一次采集错误 */,
+    "is_active" INT NOT NULL /* 是否启用 */,
+    "created_at" TIMESTAMP NOT NULL /* 创建时间 */,
+    "updated_at" TIMESTAMP NOT NULL /* 更新时间 */,
+    "is_deleted" INT NOT NULL /* 删除标志 */,
+    "project_id" INT NOT NULL REFERENCES "projects" ("id") ON DELETE CASCADE /* 所属项目 */
+) /* 被测系统监控目标模型(项目内的执行运行期间采集其资源指标) */;
+        CREATE TABLE IF NOT EXISTS "sla_rules" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "label" VARCHAR(255) /* 请求标签，为空时针对全部请求 */,
+    "metric" VARCHAR(20) NOT NULL /* 指标 */,
+    "operator" VARCHAR(5) NOT NULL /* 比较方式 */,
+    "threshold" REAL NOT NULL /* 阈值(延迟为毫秒，错误率为比例，吞吐为每秒请求数) */,
+    "is_hard" INT NOT NULL /* 是否为硬性规则(违反时提前终止执行) */,
+    "min_samples" INT NOT NULL /* 样本数达到该值后才开始判定 */,
+    "is_active" INT NOT NULL /* 是否启用 */,
+    "created_at" TIMESTAMP NOT NULL /* 创建时间 */,
+    "test_plan_id" INT NOT NULL REFERENCES "test_plans" ("id") ON DELETE CASCADE /* 测试计划 */
+) /* 测试计划 SLA 断言规则模型 */;
+        CREATE TABLE IF NOT EXISTS "test_executions" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "execution_id" VARCHAR(36) NOT NULL UNIQUE /* 执行ID(UUID) */,
+    "trigger" VARCHAR(20) NOT NULL /* 触发方式 */,
+    "status" VARCHAR(20) NOT NULL /* 执行状态 */,
+    "priority" VARCHAR(10) NOT NULL /* 入队时的测试计划优先级 */,
+    "queued_at" TIMESTAMP /* 入队时间 */,
+    "abort_reason" VARCHAR(255) /* 提前终止原因 */,
+    "slave_ids" JSON NOT NULL /* 参与执行的从机ID列表 */,
+    "partition_slave_ids" JSON /* 启动时的从机列表，决定数据集分片的归属 */,
+    "saturation_windows" JSON NOT NULL /* 从机饱和时间窗口列表 */,
+    "slaves_released" INT NOT NULL /* 从机任务数是否已释放 */,
+    "started_at" TIMESTAMP /* 开始时间 */,
+    "finished_at" TIMESTAMP /* 结束时间 */,
+    "total_samples" BIGINT NOT NULL /* 采样总数 */,
+    "error_samples" BIGINT NOT NULL /* 失败采样数 */,
+    "retention_mode" VARCHAR(20) NOT NULL /* 创建时测试计划的原始采样保留方式 */,
+    "retention_samples" INT /* 蓄水池保留时每个标签每分钟保留的采样数 */,
+    "aggregates" JSON /* 精确的总体与各标签汇总及延迟直方图(非完整保留时用于报告) */,
+    "sample_storage" VARCHAR(20) NOT NULL /* 采样存储方式 */,
+    "compaction_point" BIGINT /* 压缩时已写入分钟汇总的最大原始指标点ID，不大于它的指标点待删除 */,
+    "compacted_at" TIMESTAMP /* 压缩归档时间，此后时序指标为分钟汇总 */,
+    "report" JSON /* 执行分析报告 */,
+    "is_baseline" INT NOT NULL /* 是否为测试计划的对比基线 */,
+    "comparison" JSON /* 与基线的对比结果 */,
+    "created_at" TIMESTAMP NOT NULL /* 创建时间 */,
+    "test_plan_id" INT NOT NULL REFERENCES "test_plans" ("id") ON DELETE CASCADE /* 测试计划 */,
+    "triggered_by_id" INT REFERENCES "users" ("id") ON DELETE CASCADE /* 触发人 */
+) /* 测试计划执行记录模型 */;
+CREATE INDEX IF NOT EXISTS "idx_test_execut_queued__6fb474" ON "test_executions" ("queued_at");
+        CREATE TABLE IF NOT EXISTS "error_fingerprints" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "fingerprint" VARCHAR(16) NOT NULL /* 错误指纹(状态码 + 异常类型 + 归一化消息的摘要) */,
+    "status_code" INT NOT NULL /* 响应状态码 */,
+    "error_type" VARCHAR(100) /* 异常类型 */,
+    "message" VARCHAR(255) NOT NULL /* 归一化后的错误消息 */,
+    "count" BIGINT NOT NULL /* 出现次数 */,
+    "first_ts" BIGINT NOT NULL /* 首次出现时间(毫秒时间戳) */,
+    "last_ts" BIGINT NOT NULL /* 最近出现时间(毫秒时间戳) */,
+    "labels" JSON NOT NULL /* 按请求标签的出现次数 */,
+    "examples" JSON NOT NULL /* 随机抽样保留的错误示例 */,
+    "execution_id" INT NOT NULL REFERENCES "test_executions" ("id") ON DELETE CASCADE /* 所属执行 */,
+    CONSTRAINT "uid_error_finge_executi_8a53e9" UNIQUE ("execution_id", "fingerprint")
+) /* 执行失败采样的错误指纹模型(同类错误只保存一行计数与少量示例) */;
+        CREATE TABLE IF NOT EXISTS "execution_samples" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "slave_id" INT /* 上报从机ID */,
+    "timestamp" BIGINT NOT NULL /* 请求开始时间(毫秒时间戳) */,
+    "intended_ts" BIGINT /* 计划发送时间(毫秒时间戳)，用于协调遗漏校正 */,
+    "label" VARCHAR(255) NOT NULL /* 请求标签 */,
+    "latency" REAL NOT NULL /* 响应时间(毫秒) */,
+    "status_code" INT NOT NULL /* 响应状态码 */,
+    "success" INT NOT NULL /* 是否成功 */,
+    "bytes" INT NOT NULL /* 响应字节数 */,
+    "weight" REAL NOT NULL /* 代表的采样数(抽样保留时大于 1) */,
+    "execution_id" INT NOT NULL REFERENCES "test_executions" ("id") ON DELETE CASCADE /* 所属执行 */
+) /* 执行原始采样模型（执行期间逐条写入） */;
+        CREATE TABLE IF NOT EXISTS "metric_points" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "source" VARCHAR(50) NOT NULL /* 指标来源 */,
+    "name" VARCHAR(50) NOT NULL /* 指标名称 */,
+    "ts" BIGINT NOT NULL /* 时间(秒级时间戳，按分钟汇总时为分钟起点) */,
+    "value" REAL NOT NULL /* 指标值 */,
+    "execution_id" INT REFERENCES "test_executions" ("id") ON DELETE CASCADE /* 所属执行，平台级指标为空 */
+) /* 时序指标点模型（平台/执行的汇总指标） */;
+CREATE INDEX IF NOT EXISTS "idx_metric_poin_executi_622f4e" ON "metric_points" ("execution_id", "name", "ts");
+CREATE INDEX IF NOT EXISTS "idx_metric_poin_source_fd62f4" ON "metric_points" ("source", "name", "ts");
+        CREATE TABLE IF NOT EXISTS "test_plan_datasets" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "mode" VARCHAR(20) NOT NULL /* 分发方式 */,
+    "created_at" TIMESTAMP NOT NULL /* 关联时间 */,
+    "dataset_id" INT NOT NULL REFERENCES "datasets" ("id") ON DELETE CASCADE /* 数据集 */,
+    "test_plan_id" INT NOT NULL REFERENCES "test_plans" ("id") ON DELETE CASCADE /* 测试计划 */,
+    CONSTRAINT "uid_test_plan_d_test_pl_1a2c6c" UNIQUE ("test_plan_id", "dataset_id")
+) /* 测试计划-数据集关联模型 */;
+        ALTER TABLE "organizations" ADD "path" VARCHAR(255) /* 层级路径，如 /1/5/12/ */;
+        ALTER TABLE "slave_configs" ADD "clock_offset" REAL /* 时钟偏差(毫秒，服务器时间 - 从机时间) */;
+        ALTER TABLE "slave_configs" ADD "clock_synced_at" TIMESTAMP /* 时钟偏差更新时间 */;
+        ALTER TABLE "slave_configs" ADD "clock_rtt" REAL /* 估计时钟偏差所用交换的往返时延(毫秒) */;
+        ALTER TABLE "slave_configs" ADD "reported_tasks" INT NOT NULL DEFAULT 0 /* 从机心跳上报的当前任务数 */;
+        ALTER TABLE "test_plans" ADD "cron_expression" VARCHAR(100) /* 周期执行的 cron 表达式 */;
+        ALTER TABLE "test_plans" ADD "retention_samples" INT /* 蓄水池保留时每个标签每分钟保留的采样数，为空时使用默认值 */;
+        ALTER TABLE "test_plans" ADD "retention_mode" VARCHAR(20) NOT NULL DEFAULT 'full' /* 原始采样保留方式 */;
+        ALTER TABLE "test_plans" ADD "next_run_at" TIMESTAMP /* 下次调度执行时间 */;
+        CREATE INDEX "idx_organizatio_path_5905ed" ON "organizations" ("path");
+        CREATE INDEX "idx_test_plans_next_ru_25448b" ON "test_plans" ("next_run_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    if db.capabilities.dialect == "postgres":
+        return """
+        DROP INDEX IF EXISTS "idx_test_plans_next_ru_25448b";
+        DROP INDEX IF EXISTS "idx_organizatio_path_5905ed";
+        ALTER TABLE "organizations" DROP COLUMN "path";
+        ALTER TABLE "slave_configs" DROP COLUMN "reported_tasks";
+        ALTER TABLE "slave_configs" DROP COLUMN "clock_offset";
+        ALTER TABLE "slave_configs" DROP COLUMN "clock_rtt";
+        ALTER TABLE "slave_configs" DROP COLUMN "clock_synced_at";
+        COMMENT ON COLUMN "slave_configs"."current_tasks" IS '当前任务数';
+        ALTER TABLE "test_plans" DROP COLUMN "cron_expression";
+        ALTER TABLE "test_plans" DROP COLUMN "retention_mode";
+        ALTER TABLE "test_plans" DROP COLUMN "retention_samples";
+        ALTER TABLE "test_plans" DROP COLUMN "next_run_at";
+        DROP TABLE IF EXISTS "error_fingerprints";
+        DROP TABLE IF EXISTS "execution_samples";
+        DROP TABLE IF EXISTS "metric_points";
+        DROP TABLE IF EXISTS "test_plan_datasets";
+        DROP TABLE IF EXISTS "datasets";
+        DROP TABLE IF EXISTS "monitor_targets";
+        DROP TABLE IF EXISTS "sla_rules";
+        DROP TABLE IF EXISTS "test_executions";"""
+    return """
+        DROP INDEX IF EXISTS "idx_test_plans_next_ru_25448b";
+        DROP INDEX IF EXISTS "idx_organizatio_path_5905ed";
+        ALTER TABLE "organizations" DROP COLUMN "path";
+        ALTER TABLE "slave_configs" DROP COLUMN "clock_offset";
+        ALTER TABLE "slave_configs" DROP COLUMN "clock_synced_at";
+        ALTER TABLE "slave_configs" DROP COLUMN "clock_rtt";
+        ALTER TABLE "slave_configs" DROP COLUMN "reported_tasks";
+        ALTER TABLE "test_plans" DROP COLUMN "cron_expression";
+        ALTER TABLE "test_plans" DROP COLUMN "retention_samples";
+        ALTER TABLE "test_plans" DROP COLUMN "retention_mode";
+        ALTER TABLE "test_plans" DROP COLUMN "next_run_at";
+        DROP TABLE IF EXISTS "error_fingerprints";
+        DROP TABLE IF EXISTS "execution_samples";
+        DROP TABLE IF EXISTS "metric_points";
+        DROP TABLE IF EXISTS "test_plan_datasets";
+        DROP TABLE IF EXISTS "datasets";
+        DROP TABLE IF EXISTS "monitor_targets";
+        DROP TABLE IF EXISTS "sla_rules";
+        DROP TABLE IF EXISTS "test_executions";"""
+
+
+MODELS_STATE = (
+    "eJztXVl328ix/is6etI91zMGATSW++ZFkyixLR/Lzs3JeA5PA2hIGJMEA4Beksx/T1dja2"
+    "wUGuDSFPEi0wQKJKt6qfrqq+p/Xy5Djyzin1/jBMckufy/i39frvCS0Bf1S88uLvF6XV6A"
+    "NxLsLNi9XnoTexM7cRJhFx7m40VM6Fseid0oWCdBuIK7P28MT3c+byzHQ/Q1MhX6VzMIvL"
+    "bMzxud+AZ9jdXZ5w0yLeeK/mNbKhXwVHoBaT69SVMUuIx0eEd3ZzevP29MR7fhuqvmj0Xa"
+    "zLh4dfe3/4Fv5oUu/WrB6v6YX2KzCv65IfMkvCfJA4noV/n1N/p2sPLIdxLn/11/mfsBWX"
+    "gViwQePIC9P09+rNl7N6vkF3Yj/D5n7oaLzXJV3rz+kTyEq+LuYMUMeU9WJMIJgccn0QZM"
+    "tNosFpk1c6ul37S8Jf2KnIxHfLxZgKFBOv0C5XuX8/m724/zu+uP8/llYxDkEpxJsrfccA"
+    "UDiH7VmP36e/gKP6kz3dQtzdAtegv7msU75h/pR5eKSQWZet59vPyDXacjNL2D6bhUKvu3"
+    "odZXDzhq12t+f02z9CvXNZvrcZtq8zdK3ZZzZrhyL6sD2jZcNj4Vj45O21fqc6FD8Uv8fb"
+    "4gq/vkgf53pihb1Py3Fx9e/fnFhyt6FxvkIV0A0pXhXXZJTa+BLUrd89+6YYKP5HvH0K6J"
+    "DbJENoQPYAjN9emi4fdV+xYtf7z++0d4yDKO/7nglXv19sXfmd6XP7Irb27f/Sm/nTPGqz"
+    "e3L2s28IMFma8xNbLAJKgIST8TyuXconJ0JviWPmQOqAj1mAP0rs45wK616D8O/tWyCL0M"
+    "7juX94rY46v8riygjFI/slX6GrmKD7upg+h/LNVSG5vz1p3AVlVNM1VFMyykmyaylGJLaF"
+    "7atje8vPkTbA8VU+X7RWmfRbAiVO+bVKf9DVSVk9tC5VZhWbqbvnMFRoMdA+kquEmWYYEB"
+    "NV1qaz3geP5AsEeiFmuF4YLgVbu5qoI1czlUcl/2yn0pIZPZtm0UxjJUn1nJAItpmLfV6C"
+    "3n5e3tm8qW8/Kmvqd8evvymu78bFjQm4KkwzTuA3G/xJulyD7Dy5zMNnNx9+cXP6nIGLLF"
+    "GHqPHcbQOzcYuFRTe0RAPXPcsn7R2I4kwZJ0KL8iWVO/l4n+nL+QyhhIndE1C1EBMAxsPT"
+    "by++759Gd7t6vFj2xybnPIbt5e33188fZ9ZYq8fvHxGq6oFY8sf/fKqBmveMjF/998/PMF"
+    "/PfiH7fvrpnSwzi5j9gnlvd9/MclfCe8ScL5Kvw2xx4Xk+Xv5rqsjIXN2hs4FqqSJzUWDM"
+    "PXYRQ4ytmMhVxz3GDIvj0HJsRUiQsCBhLbKauCB9wpi3cElwJVgRDYgEFAXQxw/z1Tpo1x"
+    "HYW/EzeZC8E7VaHDuZfDpqCqAwzmIgAjLNP+vDENQoT8yJH4D78GLkLq5nlz54eYxpuCg7"
+    "R+MOCBeu9099N9GP46cfDh1A0Apv+lFW3Lhm1T7b+EEQnuV38lP5j2b+iXwiu3LbrNcOn3"
+    "5ZOexDj/Ix9v+bvlWInwtwINrk18qpd0MWZ+9Iu7Vy9eX192jfcdaP1TTKKblR+e/kDvq+"
+    "/mtG/XOQx6B7tfvuHIm3eM/oTEyXy9wPQBXMKktvdmz/jlrx/IAndgnJk1PtLnvaeP43I0"
+    "8syFGgA9zipMvaEacmqtKLx5aaku6+/gFb5nPxE+Gz4pU+N1FIU0AF3dk2gdpZ/ZSIM17n"
+    "m2LR9G4G768cXt/TNjqmHmkT2N4Gcs34SoCmeuCQ6MZsKiYungxc5sSF8Bomlo4NiYxLHr"
+    "KStdoQ8yXdOpCiCNsDnjeQyIs9gsUvIPthw8yy1I3yewps1m7Ev4kELQmKzltGbVTu4HtG"
+    "Tkfr2kk8HdlImJ0u6/jcnWbQMMn1jC7iDAX3daz69O1f6JjYqY5JhT+wyis8ZUHUhes+y0"
+    "aSmzi/+9gLhHUQEU0ax8QsEcyy4hNZ9BkK2G5LhlwRMMP5+uhg6zzLKtWV8EuJpANPrkD+"
+    "sBMZc+NOrIFvVVkk1Mjee15E46p1lNSmZgHukurG7E1psWPU7wlO5rTFkCk6oqJXe6tn2S"
+    "DBrw+8iYL0kcUydGRPuciOTLWXMVors/aXUXitVJmjzugBThSWQH0QxAdFNj8KmjZm6VzD"
+    "lAP4homNUaW21NqJdSksNpafYvNUbFPAW6fQWXiQOurqfyF8A/1zSpU7gLPMB6nJDkxjNM"
+    "Fqb43hM1npPFwlXb/eXu9l2X5XKJelYpcJOL/1wsgnhvBrz89x+X4gbUFLYPAf/TcHU1Ty"
+    "uYjlnsVWMWzS02AC1Wkg4NAlid6/WsmjeCB9QJYOQ7Xq4XRMhovMwRzPbrb+Jmsw0LHAcT"
+    "Qn9Ddbwci0ghBBMhu83RKKECWY2XwRRiuYy6mOxrJoerl/iSFAmNGk40ClwHOPeaf96TME"
+    "BfoL0+JkVh9r0ixPl3u2Pr3mUbQFy75dlWfLj4rXG5kArDw5oNQKjtOlV0tcRPP298X7Gq"
+    "UoY583N3wlZmsEGZBvNFbChbmBmISdmPQbt7//AdF0pM0OuhoNd4gb8Ssf2IFzmFrLqhYg"
+    "SvXZK6FDevj4PHAdmK7irLtdh4r4hJvvfzjjbyGTTEFp2nES/RTycryC6LBrw1QbknTZqO"
+    "Q+oMbKhB5GszILu/Ddm2AIlApLJUnwUpPU2HyhpX0eB5UExg+Ar4+BYLuBxDk9nyLO4VwX"
+    "ELAclR3PbIWBqcdkF1tHLbuDCLEHeiS4VMTfk+CEmlfj5p1DG/eq6IW3T/+vbTyzfXF+8/"
+    "XL+6ubvJ4tqC3couwlsl6/HD9Ys3U/ru2Om7eOO6JG7babYRfjkp2eti+FoYQ4X4Aql2zx"
+    "zRYci+zo+kDWrrHO/F/acy0suyvgGZop2N9G8kuH9oo5l2L/KlyCHX+NnP4urWCdHyKq8M"
+    "suQj8LR4rwvjTPeEtBIT/KiLvnSOPW8HE5I5IZmSG+ApIJlvCf2N7vuwg+bKX362DcFcsh"
+    "vn61CI3JquPcQq+GpZgKBUeZ85dIiIqbFWK8rzKo6YMdJcHR6haE71cV3w5WE//XH8ssYy"
+    "zTuLUH3SG3+9jMNNlE4y/soEesoJehbG6hvPlxKHC+gv1zSU9cNoKZ4/5Ye4YQJQbxB7UC"
+    "sZ1IcXh7ppcajBinuqPXw4lY/r3rN7lYvilafBzeHxkhSJNAk2m3hkDkemXBCkKnBVh4xY"
+    "ZVdgUmlPBv4eyzOzbUdqbPorXmxaptWWEKqQkB4lq0wtRRNzAJ9iCHS4flitDng+oUqfq5"
+    "h6nKXSqWRiU45i1mNGTE/SXk8iwApXQRJGH3F0395Qs3rD9iArvXWesHt7h1mWhWH3Ye0t"
+    "TdeHv8RjdTyQejM0bKaFyYU7xxfclXXLQMiwUBHucLa3fE9ppXQwGCprNzgzWcM1XU89RX"
+    "5ktNUNnsaXnrp3Tt07D7Dodg36qYfn1MOzpYfnQxgLVbnm90s+C6j74OSUbWRq4IaY+qCR"
+    "vxcmwTqMWrTe3bEnu11u95zfDU2cVdprVyvqnMzJd/gNJLqA0BYwU+QrvlgIu7ME35Luv2"
+    "HLjrqtDjKXOCDeVtGbOOjGW6NU+aAZ0GfpV7tXfrWx8MfuAxHbfEuJA1rgIUnW4xSf8cwc"
+    "PIjENOu3527Zcps1wJB6iYWbNtflDmiE59lnj4OdJezejDfJA40GvpAW56fbElUpuX0ffi"
+    "bohDAuk+5evSQ4ItGgThB7MQTwYaOvuIVRuZVCm4scDpiejbJAFrIado5QH2n7pX59hOfc"
+    "rO5fOVgTPJXyQcsGipMNXQksB+o6kY8KnIGvhmnP2jD6s5mydkYHEXspJWQl1NRQC+IO6x"
+    "Hb+oAdtIo9XJjHlWanXSjS2t2KF1awCj8Ld5M93e6x7K3maGGNXUQ2vqqU3Btfn9FQlgrL"
+    "sxHGc+wmwde28yQeaetbyp0Sz5f+9dPCkNGzcJfd7qe262fRantquz61XZ/ark9t1y/3Gz"
+    "WOTt0fo+36FurE1Af8EH3Aj8OAuI3u8QpOJmshPxTXnm3jPYTpXaz7dW/Wg0lcnf1lBFVW"
+    "bmcyDkBBFKgboLfQlPWfsv6HyPpzg3HK9B8l6K+sB5Jn/dc4IitR/4WXkTsTbaqakZMKS7"
+    "Mcq9OKaLJtVJLtcR3vYDUHJ501aUhVXCbXCm6nbakXz2fP0fOZ+lwafGtBvrb1zejuDJrf"
+    "L3OKp7LyF0Y5zkiPwyiZh1HrEZrdbRkqQjLXqhuareZVgNQ3x+nr46h6AgnPAxiaQMIJJJ"
+    "xAwlMECVOQI6IOs5if3ZCT3Nfm/A+TNWszdYXl1lDPrNqe8cJSnzuADGU8xG68BfoCh42h"
+    "Ofw8uw1V5BzHMdX+kqzGnmYHZrmN7j+EC7k2qdI04wyx1zPschi8BXPlEPJuyDWDk3ujrX"
+    "zFle4TqFZhZ0VtRVv7CU1o64S2HoLYytcMTmjrUbjFnAlkR1vTxpMi86CUOCDTvuRwDTdF"
+    "2axyEOq380qTCSY5j9B4gkkmmGSCSSaYRF5GVWWXJOwsaRqlnzVCchrKPwI4AvFUTMaCIq"
+    "/Tp0hliH3Q26rLSbPvzXANNvrtnJEeydIh0Uj9ZfDRW/as89Jf+nkj9XfHHnJeiktInMzX"
+    "C7waqTvoivaePubpa+8A2HA2g7sR4nKKP4oTz7mlpRc5l53bY6ia+VO9Wxc0kLMU9ChTV/"
+    "wJLUDyrzzzHNIXaUPlCVs+Erb8exisBkXzFcGTCuaRipX8rMMzCeb7ADtnV7dq+C7AOZ42"
+    "/mjhqSrqhKqieG1HdGCLqZqTkFzPlWQvUb28V4bF+mpbqqkeR+eMtCCkc05Ccp2XTpIUmN"
+    "RU5XeIKr/64H6q+J/o4O6rY256P67gKGMnjVSwdCSnXa3WfZXO7WMy1a4yu7REyLm9ugNj"
+    "+EH9O3QXWn0k6u2+cWJJyRXJHpcltQ/V1oafbCfQnANBqjL9JSdIrUm0DOI4L9mv2qO7IW"
+    "BN7ETaAVYMY+pwArmBTqDJXxDP4x9xQpbiKEspJz1hgodZ+LMkBjoze4ZcwuheLB4tBeSu"
+    "KuEDpONXcE8swglsnliEE4twYhHKxCJsoId9qFU5Kraz0jN5OS77xmXqnkjRd+vp1/XtTI"
+    "X7BKQy9lALJFXyirpBKY7A1AuWms3ATzBV9zFYqvPGCZaaYKlDzF1uAEpYvOcHCyJ8PktF"
+    "6IT0L+GxLEyVcdZnsueKUpGRO7CujH5bZU2jFP+K/uMggJ9U61jngqRfdP6VRHErLrvtcK"
+    "i65AGrJmc/Kz8rA1BAzg6mqlvp6wkeP8Y8kB0ez8Y306T4tMjFDjgn0o8aOSlc02l3Io9T"
+    "STyRDKVAvCco9jzgtwmKnaDYCYo9FSi2fq5lKF7PXReTO4zSfQThq6Kg4wRLJblzKN3+NF"
+    "jJx2bcb2EoFwO2qf4n0VZQdIj3pW/WJ/rjxNlthSUTHbyn2hszf3h7gqJEd76TKue8UlfC"
+    "aucyIJU5z7PAHzbt3OP80rOtmZ4FnkcbAQqy4ekOHF3pIXa2+YwFKOrF3ZsXF+CTYo++jd"
+    "kJmDYwd+hF+5Gk0A6eOGWP5Moe0V/ddtjCtgNendbTFmQDDh0fDnhhJy2kDrjpmCQ/+EIn"
+    "Gl0wTGyWkbpuWYCu+zar3KWvbYVY/HOkSX2kR2uL2KyUkDzpVJ6sLQeaGK5BL2InIPMysq"
+    "vb8YBo4lsagypg6PvKoIOO+wzz7kHeGOLJQ0Tih3DR5kkuQtyx5lekaqr3QUwq5duGAiuO"
+    "orlXDDQ02FHUfr44GQ4BVjNjsKSLVnkUNX1fs8zyTrCi7ltOca6PPmMtb+Eg8/we1k0r5c"
+    "PwSyMylZ6JxC0Wfn376eWb64v3H65f3dzdZKT2AnZiF6twxIfrF2+awD2dUgNgoVxKekyI"
+    "R+2zDcgyIK+lQH63dJmu2ECgvhTSXC/fnwzNY8UHusc41pCIdAwwoGqwcgTdHW/GXbYLDG"
+    "jUgZfrzF3t6bTVpA54npMy4JghSzOL1CSdRmA1B6adqilsmqJ0djP6CmHRo8cWWLCj7ToM"
+    "JASTOzY+Djp1drmy6SB5aXa/KVeW67K9rZoYXlwXkx0ubsURpICLC03uAMOUs7fdCN33BT"
+    "Hrw1Gm+v+7Bf5KXoUrP7i/bIfiisvPHoHjvhJQBb2zNySnExc8AROcP3vGfDnfII+gbv2E"
+    "JmBNLmDtidKy+cEoIS37HDiRsvMggzU4PNQnEjpLpSol9Sy4eQ/LLkR5yNQHjX29D16mdw"
+    "NmegMxW4dRS/jQTTDIbpfcUTQxKzzQiAZ//SOdlwzto0SXc15G7uXENBiD10eIb8CVru6D"
+    "oOCdE92BiiBMq64IHZJUjeP4WxjlX0goZYUBjXfcmXy0aqbNr3ixEbdBISX3NOC1n4Pyjg"
+    "vtRSxl9jz/j61j9By8IKKzgpC+qOsB0oIJvhdqy5PffyL9ePgkruw9eE7kJLlwtQhWA06S"
+    "k+70uPVmvolpuN+C2XRnCytSA7OFB1qdXr3/BAk+0893aEj/jR76u8jaLckyjH4M0H5dUG"
+    "4DACfEQqz60pLUEl4Qfxlgh6qY7FYwLeYcGZ6sVljgOJk/EBwlDhHP5zSld5DTORwuYbLU"
+    "Jkt2It+FIzs8XxNP75xIOqel3KWZz3EXoftlHvp+dsJX/92pJij7zMxZdDbE64oOfz1Crt"
+    "p4LHSceOyQDPC0DaDalSPk4qeLKsZYXpKDppLaJUqGWDOTkt2Uup8SGMA+7WbNqfDp4qsT"
+    "iJwMDegoaesi5FuMDuHp+ROA31QZDDJZM/6xcofl35viJ7Vgdxl3RO3iU1q8IWyhP8/dRB"
+    "FZJfMEx1+E2Ewd4ofDXNHQPTztOEJMmLmaN4M57jv5mg1kp+MAsUMtcUQTiPPKkI+0nOlX"
+    "V/tVdfdM4XHbgjXXRMguV22go6W7rYm0GU8TzFlQ9Als7VZY61YP/DQTgUNN2ORXcd8Nd+"
+    "cn5hBITtAFVdTKTUGZzVxJpHLeMrUIZvpH5W7aPSCOY6KzIw5OTTakSQlOxMFWX2VqsnEe"
+    "Y6HFcZ2abEjVZKNBLhWs1QZe4a5KteFZUs3Y0usRMtNhK7VBfdffibvJvneDJFq94dk2mi"
+    "gzLMnvHVm7XfXjLQfWvZS4MaBsu+/DJmKpXMTSYjC1lgh0p5jrclIfS1UOzZvXV58+3bwe"
+    "xLPQjB6pZq2+U5epZrhUI1lEwf192wGM3XrnRA6Y26eL2wYvLoUVb9mkAH3GlQTvPs9/Ir"
+    "SKaLNagZpGDHr5OBbrKAijIPkhon1e5pBDn3jBZimu/vTAdtuY+Xk0keIvXdun7s+ggHsG"
+    "XYFNgge1LJj148BvocDXDUUVtRkUB1YED5LG2M1W0TTbeWYrsBNGyZxGtbFYW+66nNw0za"
+    "46eKSxLJZBBvHx90LITCvEAk+IlVkROhFqJtJcNU8lVPYwtnyWId/Na/mpm2scJQHzkgeZ"
+    "r0N8lCEPx3HjEkP8BlhJVRT2K5qNzBwt7WKQJ54MDcoTbQMI00hVDMaUNrl0hpp20ZNzBM"
+    "TUZYzSA5K+URWH38Tmb6v0iUzkSqWpbYKno1suv61CztE2i5IcySdziqXRvW1BdzdhNLRF"
+    "WnpIlLdgPVdY64Xh+SrUE7ts2mrjJ+MOE1s0bIuGJTOqkqdExuEbw5yzG+sHqyB+GGT8mu"
+    "gpWZ9nYJyz9ZMwwYvuzlEvg/vuHih1UZnZH3TdNYsWUormDGBz2KqqaaaqaIaFdNNEllIg"
+    "zc1L2yDnlzd/giW4YvPmmkyiKIyGWaYhKrNlkA18KctTUc1KktsnIglZMb8TslAiAEBT8o"
+    "BgnU8fMCDibJBAukC6LOZI0QG2ufJG1VmfvZQ6JxvaXZpFvJFeq6zcRzVYOvQ/NFyN/TWU"
+    "unGYkVkXS52ouFoPmr6fhpopnZmXTYfAqLm8M+Ycvqe75T1Vt1BQWZU6DTDBdKEZomkBFJ"
+    "Dh6Gyf0xmbMQWLkK7oNUu6erEjIg1iE74zqpnzfWCiGj6Ul9gmdONHThqmmnrbsMnLFCyS"
+    "EyuRruPxFQh7gh9gws7jhMq21fJtSXY1JA+Z9MqQjuFuUFpbiZQUfZJrLXbD5RqYq1SZ6z"
+    "BbOPv7P23Sci/GSINmwqavFnMohQvQzLbzjAu/3PLTNpvsfCEBt/uWHb7pnYpjAyac92Rn"
+    "xHYmkc5VOqu14nk1OVZkhHgOmMzOWTYChnF1a7KnFNby4yjFfQ3LqJSEFkWBDrD4sk65Wc"
+    "mY5VftnjZNbh935xcqp+UOIm5EKXEaLkSlaIVZ3TBthd/D5dzCg3ju4JjkzTXECLi8pPRw"
+    "c7Ol+SNxGDtfI21Yj0yI3kzi9NzjD1RTAattFLTm0LtnVlXqNGZX5oIXVmizUQ5L2mIHKx"
+    "1spk0VMOdR9TC1zpaldXYLGZbOIueHoNKbknIHRDwtVifOAQ9saJSTTL3KRbaiHfUq7xr2"
+    "O9C8jIeKDhvuvVXenP3DT7lMk0s+/V4kWkfsqzR9boHaqWt43i/l4+SaENwJpGV0NM46Le"
+    "jjWBXmlSZ37GnnpcH0rL0U6Bupx7fsUe9DyfbCdhUWdEBips2alZQV3wbhwMGLI1W+7/o/"
+    "thd2lP7l++QjVX+wqYwv+BtU2DcV8DVHrjQFfE/0ZIiuwTidEnGcVbprbZD89IgTKfLzIu"
+    "wn4gnPqaxvsMaHlvXJWaYXuw/E2yxoDMQoy6LwZYv4KeUFK/vDRHyujQiyanG7+o6HTPhU"
+    "R8NEhM4zG9R65PsaDkRqdVO61+cWUbldFaSzJsAmq+Ct1Q9ewK+5yCvOshN2B/KC9uJLnh"
+    "fvduLRSp+pODCPtqRv5chO/il8g36bQMv+9IwdOF3nOAmrFQ3t5tFmNSBfXBM9of4IOlHA"
+    "s3IAErJcBcA5go3qSnvOOy12kw0UDg1xw+uyp+R10WWaVWnraPLBa2NhgANelTzVcTB533"
+    "wZootjIW+hJiVzlVtG1U4LI3xrSP3hznZlODGRBq6i2q6LyaxuW5lhiF7AdZJD6T4OFgOU"
+    "XheTWel8JaccSp/6psvB8Z1YoxNrdOqbPvVNn/qmS9Q3vbFCh9E88MR4xQ05ydnc/KJsKQ"
+    "o6kgMehb8TNxHWdkNOcm3zxDXbMhmkSXo2vtozlbtUZVP/wozi9+nDnozu+/KKG+PxcS53"
+    "uWDsQO8CTG7Zl5i+Km8suMOJ3PECz6PNaPLx3QJ/2MhGOt5DHUO1OVPlgInhymscbHE+Ki"
+    "zrQIC4GZOx5O2cKPw6fdq5KjP95F2dZ8MedraqfNInA+1FkYeoEsgn+JZiAW4N6FEzUFmA"
+    "htcO/NTajnkG1RmWgvRBpQWCz2ypPPi1WrWY/dTL36aKhCNWJIgyl47AVyoaq18O8IAVaY"
+    "+0OU8oml8wzgN+7ANFZ2uhGAZTFZIdgKntHceBu6ZGEVPfAnl1v7++BV7phY5UupQx7aC1"
+    "pa+2q8usKMh1iDAki423RCFl9NwnCOEC91ExiDUD6othqu4uoo9+T3s87ki//RR2SHKSaR"
+    "h5bYdqdneUb0oebjueia9NHNXatkycNrc8jvcTxHOygp8/IMnNCZ4SCyk91wooYNLluM8u"
+    "9JtYSG2hX6olsXikIiN5MFJu21PIJ2fYMYV8TzHkiwuXf6TOJcy8ia4pfbVcWVeljPRY7m"
+    "5boJcn93rFeUVWcVSYVzkjdHSY1+9pPcI8pokpyjtmlIfjmC41gxzdmuiJebqsinoGB1VP"
+    "nu5UAiNXCUx+OrVIvMGJSO4Il9vHFG7I6fJO4caTDDdyx3NstAHPeRWu/OBeKq2Lriu9Qw"
+    "5uaZUp4igI7S3BBk92744zNvSu3sFFWqRrqGlHIQJ0HcXwH4kh+glNPXDlCgpgXIj2weVl"
+    "dsM824eKa0MSut/23BIrVDPUh2qGuqlmqEE1I0scLET0XQhIrWxbwXDCqOMM6qi6l5Zw0J"
+    "niW0gX3wccP4hovCEoectn5AD/17QUWGl1F9qsEqUvxF9lViLUh1qJUDe3Eq7V7EB1J7TC"
+    "FAJy90s0VHD+MnRM8wd1tN1Hnz28mIuu6RUhubVusv6UabckZEOfJHnWdvyVbrQtBIpuxZ"
+    "cScmsd2RprGej6nz68kWZlmVAsKVAsqs54syYReIbilqiISt+0gbeG5VkoP12ldDZlsswC"
+    "x8l8Ed4HLQjMdsy/KnlKjfSyI6/ZEcamYTrsyGN03o30JpLTlPqZWi1NrZamVksytVpqZE"
+    "769OfYTVuE/qUjhzwIGwN2DJYaf9hlZZhnyPo8jO7xKvgX3kGLjtv0UVJ5PiZx2WHhrL0p"
+    "y0aZOqu51ZEY5bqfNrM+PyMVKWOXpLIzElOnnypyhyrMWyQtydIhUfwQrHejxbfseVLpcm"
+    "Bg9Mj5qLtoZ9KbTHm4JdBH7i7aQ1VZEMUxv8dqT3Si5yW3RlDVI0XH6VA6OsNum5RV9Mdv"
+    "vfMoHN1fDPLedA/+EErWY2xny92+CQW58jo4BZxut9MK5u2WFSMa/MQ7L1Bfansq/auaqg"
+    "CNeezjWnnMOTDJ/0r4P/zQidF8VPLC72EwjM9cETwpGAOpGLDNmTEAzzxRGGNiM59MHqiy"
+    "EwgteS2SkrNuy/2l5+zbMbcZ9h8xHXMSkuu23K6Po1vm1gjplpOQXLei/umeGeLtKeOn0f"
+    "J5V6HAsxpNmRtsj3PB637rSEULwJ7yrsV9Fd2yKz2u8CiLmkYqWrrAVnRR7qtkbluSiXP/"
+    "gkSB+3DZEh1nV55tC4xxec9jcXB3ODWR5eWKN7+SSPQMcE5EZg5xfxXvn9MHk0pAw9ntT1"
+    "C7e+HE00+Eo7SbGv7L3e27DgZQKVLHSgI3ufjPxSKIJfJxe2t7i3JBGZWYONfp1dsXf6+r"
+    "+9Wb25d1TAMe8FIsw7/7zeyP/wKQJblh"
+)
@@ -0,0 +1,194 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_datasets_project_live" ON "datasets" ("project_id") WHERE is_deleted = false;
+        CREATE INDEX IF NOT EXISTS "idx_organizations_children" ON "organizations" ("parent_id", "sort_order") WHERE is_deleted = false;
+        CREATE INDEX IF NOT EXISTS "idx_projects_manager_live" ON "projects" ("manager_id_id") WHERE is_deleted = false;
+        CREATE INDEX IF NOT EXISTS "idx_project_mem_user_id_dcfc1d" ON "project_members" ("user_id", "is_active", "project_id");
+        CREATE INDEX IF NOT EXISTS "idx_scripts_project_live" ON "scripts" ("project_id_id") WHERE is_deleted = false;
+        CREATE INDEX IF NOT EXISTS "idx_test_executions_baseline" ON "test_executions" ("test_plan_id") WHERE is_baseline = true;
+        CREATE INDEX IF NOT EXISTS "idx_test_execut_test_pl_de4b3b" ON "test_executions" ("test_plan_id", "status");
+        CREATE INDEX IF NOT EXISTS "idx_test_plans_project_475c85" ON "test_plans" ("project_id_id", "is_deleted");
+        CREATE INDEX IF NOT EXISTS "idx_user_organi_user_id_1e4400" ON "user_organization_roles" ("user_id", "is_active", "organization_id");
+        CREATE INDEX IF NOT EXISTS "idx_user_organi_organiz_43bdb0" ON "user_organization_roles" ("organization_id", "is_active");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_user_organi_organiz_43bdb0";
+        DROP INDEX IF EXISTS "idx_user_organi_user_id_1e4400";
+        DROP INDEX IF EXISTS "idx_test_plans_project_475c85";
+        DROP INDEX IF EXISTS "idx_test_execut_test_pl_de4b3b";
+        DROP INDEX IF EXISTS "idx_test_executions_baseline";
+        DROP INDEX IF EXISTS "idx_scripts_project_live";
+        DROP INDEX IF EXISTS "idx_project_mem_user_id_dcfc1d";
+        DROP INDEX IF EXISTS "idx_projects_manager_live";
+        DROP INDEX IF EXISTS "idx_organizations_children";
+        DROP INDEX IF EXISTS "idx_datasets_project_live";"""
+
+
+MODELS_STATE = (
+    "eJztXdmS28ix/RUGn/rG7RmB2HEj/KClx9O2pFaoJdthaQKBpdANiyRogNTi8fz7rSxsVV"
+    "hIFMCl2MRLiyKQIJlZS+bJk1m/TxeRj+bJz6+ctZOg9fT/Jr9Pl84C4RfVS9eTqbNalRfg"
+    "jbXjzsm9fnoTedNxk3XsePCwwJknCL/lo8SLw9U6jJZw9+eN7qvu543p+hp+rRkS/qvoCF"
+    "6bxueNigIdv3bk2eeNZpjuFf7HMmUs4Mv4gqYE+CZFkuCypsI7qje7ffV5Y7iqBdc9OX+s"
+    "psz0ycv7v/0PfDM/8vBXC5cPp/wSm2X47w2y19EDWj+iGH+VT7/ht8Olj76jBP77+zQI0d"
+    "wnr6erOPoX8tZ26E/hNvR9FaMkwYpMcsncXqH/3c7tYOdi8/ArIpb6sSI3TckzsH3gP5O/"
+    "/3rz/mYSJjY2KFojf/Kn1GTTP+DBqy82+SLMqMDfA18i79v5Q2+X61/IjaBj1/ai+WaxLG"
+    "9e/Vg/Rsvi7nBJBtMDWqLYwR+K31vHGxgmy818no2ofOSk2ipvSdVEyfgocDZzGGwgnX6B"
+    "8r2pbb+9+2Df33yw7WltIOYS1LDI3vKwfrGS8FdNyK9/gK/wkzxTDdVUdNXEt5CvWbxj/J"
+    "F+dKmYVJCo5+2H6R/kOraOXdq2VCr5t6bWl49O3KzX/P6KZvFXrmo21+M21eZvlLot521/"
+    "5U7ZSWXpHpkjko9niBVI1fnYoviF892eo+XD+hH/dyZJW9T8t+fvX/76/P0VvotMtAgvQu"
+    "nq9Da7JKfXwBal7ulvXTPBBzxXmk1QEetliWwIH8EQihfghSvoqvYtWv5w848P8JBFkvx7"
+    "Tiv36s3zfxC9L35kV17fvf1zfjtljJev715UbBCEc2SvHGxkjknACAk/E8otxcRyeCYEpt"
+    "pnDsia1mEO4Lta5wC51qD/JPxPwyL0InxoXd4Zsd2r/L4sIA1Sv2bJ+LXmSQHs6K6G/2PK"
+    "plxzELbuBJYsK4ohS4puaqphaKZUbAn1S9v2hhe3f4btgTFVvl+U9pmHS4T1vkl12t1ArJ"
+    "zYFiq3CtNUvfSdKzAa7BiaKoOrZuomGFBRhbbWo5PYj8jxUdxgrSiaI2fZbC5WsGIuF0se"
+    "yl65L8VlMsuy9MJYuhwQK+lgMcWhbTV4y3lxd/ea2XJe3Fb3lI9vXtzgnZ8MC3xTuG4xjf"
+    "eIvC/JZsGzz9AyZ7PNTO5/ff6TrOl9thhd7bDD6GrrBgOXKmqPEajHdhrWLxxfonW4QC3K"
+    "ZyQr6vcz0Z/zF0IZQ5NneM3SsAAYBrYeSwu67vn4Z/t3y/mPbHJuc8hu39zcf3j+5h0zRV"
+    "49/3ADV2TGI8vfvdIrxiseMvn77YdfJ/DfyT/v3t4QpUfJ+iEmn1je9+GfU/hOzmYd2cvo"
+    "m+34VEyWv5vrkhkLm5Xfcyywkmc1FnQ9UGEUuNLFjIVcc9RgyL49BSYUyAPnTskKHnGnLN"
+    "7hXApkCUJgHQYBdjHA/fcNkTZGCmaqWaLVvWSFjude9puCsgpQnKcBGGEa1ueNoSPE5UcO"
+    "xH/oNXAeYTfPt90ffBqvC/bS+tGAB+y9491PDWD4q8h1jqduADCDL41oWzZs62r/JYpR+L"
+    "D8K/pBtH+Lv5Sz9Jqi2wwbf1c+6UmM8z/y8Za/W46V2PlWoMGViY/1ki7GxI9+fv/y+aub"
+    "adt434PWPyYovl0G0fkP9K76rk/7Zp3DoHcd78s3J/btltG/RsnaXs2dpU0nbSp7b/aMX/"
+    "76Hs2dFowzs8YH/Lx3+HFUnkicuVABoIdZhag3kiNKrYzC65cW8qL6jrN0HshPhM+GT8rU"
+    "eBPHEQ5Alw8oXsXpZ9ZScbV7rrfl5BDcjT++uL17dk7WjTyyxxH8jOS8NKzCmWeAA6MYsK"
+    "iYKnixMwtSaIBo6go4NgZyrWraTJXwgwzPcFkBTUFkzvg+AeJMMouk/INN15nlFsTvI1jT"
+    "ZjPyJQJIIShE1nQbM3tn9wMasoKfpngyeJsyMVHa/bdKxpArW7cNMHxiCbujAH/tab2Ana"
+    "rdExuMmOCYU/MMwrPGkF1IoJMMuWFKs8n/TiDukWQARRQzn1Awx7JLmpzPIMiYQ4LeNOEJ"
+    "epBPV12FWWZa5qwrAswmEPUu+cNqQEylD/UqsoV9lfUmwcbzG3InrdOsIiUyMK+pHqxuyF"
+    "LrFj1N8JTua0RZHJOKlRI7Xds8SXoN+ENkzBcoSbATw6N9SkTw5ay+CuHdHzW6C8XqJEwe"
+    "t0eK8Cyyg9oMQHRDIfCpK2dulcg5wCCMcZjVGFttTaiXUoLDaWn2LzUGY54C3b6Cy8gFV9"
+    "eX6QvgnyuK0CncudPDepSQ4MbTDRKmBP4TNZ6bxcKs7f5yf/e2zXK5RDWrFHrryX8n8zA5"
+    "mAGnv/8x5TegIpF9CDiouqfKeVrBcI1irxqyaG6xAWiRSTrUCGBVrtc1mzeCB1QJYOi7s1"
+    "jNEZfRaJkTmO3Tb/xms3QTHAcDQn9ddv0ci0ghBEPTrCZHo4QKRDVeBlPw5TKqYqKvmRSu"
+    "XuJLQiQ0KjjRIHAd4Nwb+nlPwgBdgfbqmOSF2Q+KEOff7Z6se9MmgLhyy/VWfLj4rUm5kH"
+    "LDw4oFQKjluSy6WuKnnzdBIJmslG7MgtydsKQZbFCGTnwRC0onZrpGpKxd0O7BP3x3scYI"
+    "vQoJvSZz5yvi249okXPIquuyo8FrD6Uuxe2r0+BxQLbCu8pixTfeGTHB937a0dYCAg2RRe"
+    "dpxEv409ESssu8AW9FUOxJk6bjNHkGNlQg8rUIkN3dhmRbgESgJpNUnwkpPUWFyhpPUuB5"
+    "UEygBxL4+CYJuFxdEdnyJO7lwXELAcFR3ObIWBicdo51tPSauDDzyGlFlwqZivIDEBJK/X"
+    "TSqGV+dVwRt+j+1d3HF69vJu/e37y8vb/N4tqC3Uouwlsl6/H9zfPXY/ru1Om7ZON5KGna"
+    "abYRfikp0eti6FoYXYb4QpOtjjmi45B93R/rJqitdbwX95/LSC/L+npkivY20r+h8OGxiW"
+    "bavsiXIsdc42c/86tbRUjJq7wyyJKOwNPivTaMM90T0kpM8KMmXekcB94ORiRzRDIFN8BT"
+    "QDLfIPwbvXdRC82Vvny9DcFckBvtVcRFbk3XHmQWfLUsQJBY3mcOHWrIUEi7F+kZiyNmjD"
+    "RPhUdIiss+rg2+PO6n78YvKyzTvLMI1ie+8dM0iTZxOsnoKyPoKSboWRirazxfShwvoJ+u"
+    "cCgbRPGCP39KD3HdAKBeR1avVjJaF16c1k6L02qsuKfaw4dS+bDuPftXOS9eeR7cHBovSZ"
+    "FIAzlGHY/M4ciUC6LJElxVISPG7ApEKu3JQN9j+ka27QiNTX915puGabUlhCokhEfJmKkl"
+    "KXwO4FMMgY7XD6vRAc8nVOlzFVOPslQ6lQzHEKOY9ZQR05O015MIsKJluI7iD0780NzUk7"
+    "1he5CV3mqvyb2dwyzTdGD3IS02DS+Av8gndTyQetMVx0gLkwt3ji64K+uWgZBhakW4Q9ne"
+    "DHypkdJBYKis3eDMIA3XVDX1FOmR0VQ3eB5fes+klEsJzsbunXyLbtugH3t4jj08G3p4Pk"
+    "YJV5Vrfr/gswC7D25O2dYMBdwQQ+018g/CJFhFcYPW2zv2ZLeL7Z7Tu6HhZJX2ytUSOyc2"
+    "+g6/AcUTCG0BM9UCKeALYfeW4Fvg/Tdq2FG31UHmEkfE2xi98YNutDVKlfeaAV2Wfrl95Z"
+    "drC3/iPSK+zbeUOKIFHtfr1TDFZzwz1+lFYpp123O3bLn1GmBIvSTcTZurckc0wrPss4fB"
+    "zgJ2b3Y260ccDXxBDc5PuyVYKbF9H3omqAgRLpPqXb1AToziXp0gDmII4MPGX50GRuVWCm"
+    "0ucjxgejbIAlnIqls5Qn2i7ZecY2FTs7p75WBF8FzKB00LKE4WdCUwXajr1AKtwBnoapjm"
+    "rA2hPxspa2dwEHGQUkJSQo0NNUdevx6xjQ/YQ6vY44V5VGl22oUird1lvLCCVfiZu5vs+X"
+    "aPJW/VRwtp7MKz8bFSYm98XUZDWSoszkaY2I63zo4e4mD5MnLnxPPFf4O0MGTwLNxnt/ux"
+    "7fpFtNoe266PbdfHtutj2/XpYaPGwan7U7Rd30KdGPuAH6MP+GkYEHfxg7OEk8kayA/Fte"
+    "ttvIcovYt0v+7MejCQp5K/hKBKyu0MwgEoiAJVA3QW4j031InRMrdMEsVrO4rhYCmQ2XGI"
+    "KPPLbe8xnPtxihLmw356PZ4iOvIQjsVDoKbHyD04CQzBrFCC8xCYha+rR0XLiJ0bN2RFz2"
+    "mOpVlO1fuFN/03KO23W8d7WM0hbCBtI1IVl+m+gm1qmfLk2eyZ9mwmPxMGcZujr02dPNp7"
+    "leb3i5x0Ylb+wiinGemUC9Vdy6yQyNXzumLJeV0ijhac9PVpVD3ClpcBVY2w5QhbjrDlOc"
+    "KWKewSY4eZz8+uyQnua1P+h0HaxxmqRLJ9Wsc834ERzFKfewAxRTxWb7gFukKZtaHZ/4S9"
+    "DVak7SQJ1v4CLYeerwdmuYsf3kdzsTap0jTDDHHQU/VyYL4BBaYw+3YQOAO4O+O/dA2YGi"
+    "ConyGnV23Ff7sJceK/7HjugPrmP9XOJecZD2MEfUfQ9/jHy9DFlCPoexLSNWUC0UHftCMn"
+    "zzwoJY5YglCS2/qbouzi2Qt83HsJzojWXEaEPqI1I1ozojUjWiMu1YzZJRE5ZFuVOp75/k"
+    "SBmvNQ/gkwGoinEjQUm3mVPkUoQxyC98cuJ/WGQP01WGtEdEF6RAsXxQP1l6FYb8izLkt/"
+    "6ecN1N89echlKW6NkrW9mjvLgbqDdnHv8GOevvaOAFFnM7gdqC6n+E642qaWlk6sZXKgkS"
+    "4rxk/VNmbQWc+UtJ0UZv4nNODZn2hKPmRR0k7TTLdq8vZ1tVQwE+NrTD1izwOx539F4bJX"
+    "tM8InlWwr8mOlB8SeSHBfhfg5+IKfvXAA7jHV4afyTyWk51RORmt7RgPbD5VUxKC65nJSS"
+    "PZz5uMmKQhuSkb8ml0TrgVXDqnJATXeelECYFZjeWRxyiPrA7up4oP8g7urjqmpvduBccZ"
+    "iWqggoXjYu1rte6qdGofE6nol9ilIYLO7dUeOMMP6t7avNDqjqi4/caxhbdYkexpWVSHUG"
+    "1l+Il2dM8lEKiY6S84gWqF4kWYkUNr9mjvpFgRO5M+ioxhDBWObte1M+iOGCZ28iNZowU/"
+    "ylLKCU+ooGEW+hCOns7MgSGXKH7gi0dLAbGLX+gA6fSF5iPLcASbR5bhyDIcWYYisQxr6G"
+    "EX6lWOiu2tQk5cDsyhcZmqJ1K07Xr65Yd7U+EhAamMXdQASZW8o3ZQiiI4dYKlZjPwEwzZ"
+    "2wVLtd7I22OuwLc71hhmvyivNRxLDEdw7IQrCDUNBCwxDMI54j5ehxE6I/0LeKoOUWWStQ"
+    "ntuKIwMmKH98zot2TSYUsKrvA/rgYgmGye6liX9IvaX1GcNKLD2872qkoesbZz9rP0s9QD"
+    "i6TsYMiqmb4eQfpTzAPRQfpsfBNN8k+LXOyIcyL9qIGTwjPcZlf2NPXOI9VRCNx9BIQvAw"
+    "QcAeEREB4B4XMBhKvHkkb8VedVMbHDKDXQIHyVJO00wRILwXXXck1OcG70qXn/W3jSxYCt"
+    "q/9J9GDkHeJdSaTVib6bvrutvGUkpXdUe23m92+iUBQS21SqYng9sYA12WVAKnK2ae683z"
+    "QzoPNL11vzTXPHjjccRGjdV104edTXyNH0MxKgyJP7188n4JM6Pn7bIQeYWsAfwhetHamp"
+    "PTxxpFaLlT3Cv7rpZIpt5/O6jUdTiAYcugGchkOOpUgdcMM1UH5KiIoUvGAYjlFG6qppAr"
+    "oeWKR+GL+2JGTSzxEm9ZGejM5js1JC8KRTeTC6GGhitAK98B1gTcuIrm7XB7pLYCoEqoCh"
+    "H0i9zqnuMszbB3ltiK8fY5Q8RvMmT3IeOS1rPiNVUX0AYkIp39IlWHEkxbsioKFOThIP8s"
+    "VJdxFwqwmPJl20ypPE8fuKaZR3ghXVwHSLQ5DUGWnMC+fQ5/eQnl8pK4deGjVD6phI3GLh"
+    "V3cfX7y+mbx7f/Py9v42o9YXsBO5yMIR72+ev64D93hK9YCFcinhMSEatc82IFOHvJYE+d"
+    "3SZboiAwH7Upri+fn+pCs+KYFQfcL0hkSkq4MBZZ0URajecDPus6lhiKMOZ7HK3NWOTltF"
+    "6oiHX0k9zmQyFaNITeJpBFZzYdrJikSmqZbObkJfQSR69MkCC3a0PJeAhGBy13JOg05dXK"
+    "4M/w3SWmeR5sqYK7uM/EiXXFmJ2XBFu1Ux0eHiRhxBCLi40OQeMEwxO/AN0H1XELM6HEXq"
+    "QnA/d76il9EyCB+mzVBccfl6Bxz3FYEq8J2dITkVeeAJGOD8WTPiywU62oG6dRMagTWxgL"
+    "UnSsumB6OAtOxL4ESKzoMMV+DwQKEJz/hnpYSeBbfvYNmFKE8z1F5jX+2Cl6ntgJlaQ8xW"
+    "UdwQPrQTDLLbBXcUDYcUHihIgb/BiQ6XhiZWvMs5LSP2cmLohMEbaBrdBixd3XtBwXsnug"
+    "MVgZtWzQgdk1TtJMm3KM6/EFfKygE03vVm4tGqiTa/OvMNvw0KKbGnAa39HJR3PWhyYkqz"
+    "Z/l/LNXRnoEXhFRSENIVdT1CWnDtPHA1B8rvP5OuQHQSV/ROQGdy3l20nIfLHufdCXfG3W"
+    "pjbxIc7jdgNu3ZQkaqZ7bwSKvTy3cfIcFnBPkODem/wUN/H1m7BVpE8Y8e2q8Kim0A4ISY"
+    "Gqm+NAW1hB8mX3rYgRUT3QqGSZwj3RfVCnMnWduPyInXLuLP59Sl95DTOR4uYZDUJkl2ao"
+    "EHB4v4gcKf3jmTdE5DuUs9n+PNI++LHQVBdg5Z992pIij6zMxZdBbE65IKf32Erpp4LHic"
+    "+OSoDvC0daDalSNk8tOExRjLS2LQVFK7xOs+1sykRDelGqQEBrBPs1lzKny6+KoIIiddAT"
+    "pK2kBJC0xCh/DV/AnAb2IGg0jWTH4svX7597r4WS3YbcYdULv4lBZvCFvwz/M2cYyWa3vt"
+    "JF+42Ewt4sfDXLW+e3jacQQZMHMVfwZzPHDzNRvITqcBYvta4oQm4OeVaYGm5Ey/qtqv2N"
+    "0zhcctE9ZcQ9OsctUGOlq62xqaMqNpgjkLCj+BrN0SaSDrg59maOBQIzL5Zafrhrv3c3sQ"
+    "JCfwgspr5bqgyGZmEqmUt4wt4hD9a+Vu2j4gTmOiiyMOjk02hEkJjsTBRl9lbLJxGWOhwX"
+    "Edm2wI1WSjRi7lrNUGXuG+SrXhWULN2NLr4TLTcSu1QX0335G3yb53jSTK3nC9jSZKDIvy"
+    "ewfWbrN+vOnCupcSN3qUbXd92G5i6SeWNZ3lMn+DJanUOEsKhifs6EZc0ZztOgnK85X5eJ"
+    "9eN3Ykzm+d/IkMlrEj8XGpr4XRGosY2pPgVTmhj+8qJ8/tq6uPH29f9WKCKHqHZLhS9SXK"
+    "ZDhcqtBA4vDhoemgyna9UyJHZB/g5XfjzKfcijctVMBSw4qW989EOBPiR7xZLkFNAwa9eC"
+    "yQVRxGcbj+waN9WuaYQx/54WbBr/70YHtLnwV5vJMiRG0bvBrMoMR8Bn2LDeT0aqow68bS"
+    "30LSrxoKK2rTK1JlBI+SaNnPVlE322XmUxw3itc2jrsTvsbhVTmxiaRtlfqaQvJsOupVMX"
+    "AQymhawxb6XLxRRuhMyKOa4sl5soPZw8jyWQalt6/EJ5eunHgdEi+5l/laxAcZ8ngsPCp1"
+    "RW+ATDKlsF/RDmXmKmmfhTw1pitQQGnpQOnWZEknXG6DSrjIaZ8/MUdAgl3GOD1I6htWcf"
+    "SNb/42Sp/JRGZqYS0DPB3V9OhtFbKillEUDQk+mVO0D+9tc7y7ceO1DdLCg7a0BavZzEq3"
+    "Dj+QoeLZI9NWGT4Z95h6w2Fb3C/dwkqeE12Ibl1zyW5sEC7D5LGX8Sui52R9miNyydZfR2"
+    "tn3t7b6kX40N6lpSoqMj8Fr7tG0eRKUtwefBNLlhXFkCVFNzXVMDRTKpDm+qVtkPOL2z/D"
+    "EszYvL4moziO4n6WqYmKbBnNAkaX6ctaxUqC2ydGa7QkfifkyXgAgLrkEcG6AD+gR8RZo6"
+    "m0gXRZzJGiA2RzpY2qkk6AKblPNLS7NAt/q79GWbEPkzBV6NCoewr5q0tV4xAjkz6bKpId"
+    "tmI1fT8NNVPCNS2bDoFBc3lv3D7nAe+WD1jdXEElK3UeYILhQbtGwwQoIMPRyT6nEr5lCh"
+    "ZpqqRWLOmpxY6oKRCb0L1bjZyRBBNVD6AAxjLgvADNTcNUQ20aNnkhhYly6qemqs7wGokD"
+    "wQ8wYe1kjWWbqg23JLtqksdMemVIR383KK3+1KQUfRJrLfaixQq4tViZqyhbOLv7P03SYi"
+    "/GmgLtjo1ALuZQChdoM8vKMy70cktP22yy06UO1O5b9iDHd0quBZhw3jWeUO+JRDpX8axW"
+    "iudV5EgZlEaz1ER2zrIR0I9NXJE9p7CWHkcp7qubOlO0WpQtusAzzHr5ZkVtZsDaPW3r3D"
+    "zuLi9UTgsyeNyIUuI8XAimrIZYXTcsid7DxdzCQ5ZOx0cRpiWFh5vrTdd3xGHkBJC0pb5m"
+    "QPRmILfjHn+kqg9YbeOwMYfePrNYqfOYXZkLXlihyUY5LGnxHf10tJk21uhcRl3G2NxblO"
+    "beDWRYPIvcH5xKr0uKHRDRtFgVuUc8UqJW8DJ2U+fZivbUTb1t2O9B8yIee9pvuHdWeX32"
+    "9z+HM00uBfh7oXgVk69S97k5qrtu4Hm/lI8Ta0JQZ6SW0dEw6zSgj0NVmFea3JOnXZYG09"
+    "MAU6BvoB7fkEe9iwTbC5tVWNABkZG2k5ZSVnwThANHQw5U+aErFMle2FKcmO+TO+oSYVMZ"
+    "XpLYq/SQu8SQPV2aqlT+bSzuO2Zx3xM916JtoI5nXJxmBW9bNwQ/++JMCgD92AnW/MnQse"
+    "Svt8b7lvyJWcKXeI/I38xxfETozLzQZoP4OeUMmf1hJEVXRgRaNrhdXcdDJnyuo2EkSedZ"
+    "D2y9sr8Hz/rcICq2q6KppIWxQap7K7WFE/g1k7waLTsfuCdn6CC+5GVxckeOrfBZjCNzbE"
+    "tqV4765J9CHy9gIThwID0hCM4GOk0ya4lDOzveLHvkkiuiZ9Q7QUUSeFYuwEWmJwFwhxyd"
+    "XWkvead1vPUGior6uOFV2XPyuvAyTSq4VW30wStjoYcDzkqe6zgYvW+6RNFzEi5voSIlcg"
+    "VcRuNOiyYCs09t4t52ZTjvEQeuvNquiomsbkuaORC9gOskhtIDJ5z3UHpVTGSl01WeYih9"
+    "7PouBv93ZJSOjNKx6/vY9X3s+i5Q1/faCh3FdujzcY5rcoIzvelF2ZQk7UQOeEEM4tN2TU"
+    "5wbdOkNss0CKSJOjbFOjDNm+VmDWQbv0sf9mR035VzXBuPu3ne5YKxB71zsLxFX2K6qry2"
+    "4PYneSdzx443g4nJ93Pn/UY0QvIBahzYxk3M8Rj9lVc7luNyVFjWiABxM0FDid05ifhV+r"
+    "RLVWb6yfs6jYc87GJV+aTPNTqIIo9RQZBP8C2FBNQa0KGegFmA+tcV/NTYqnkGlRumpKm9"
+    "yg44n9lQlVA56Sj7qWkJAlWtMFYkHLMigZe5dAK+UtF0fdrDA5aEPe7mMqFoesG4DPixCx"
+    "SdrYV8GAwrJDoAU9k7TgN3jU0kxp4G4ur+cD0N/NILHah0IWPaXmtLV22zyywvyHWMMCSL"
+    "jbdEIWX03CUIoQL3QTGIOQPqi27I3j6ij25P2x13pN9+DDsEOeU0iv2mAzfbu83XJY+3Hc"
+    "/41yaKam2ZhpM2vjyN9xMmNlrCz++R5KYEz4mFlJ55BRQw4XLcFxf6jSykptAv1RJfPMLI"
+    "CB6MlNv2GPKJGXaMId9TDPmSwuUfqHMBM2+8a0pXLTPrqpCRHsndbQv08uRepzivyCoOCv"
+    "OY80MHh3ndntYhzCOaGKO8U0Z5TpLgpaaXo1sRPTNPl1RRz+AQ69HTHUtgxCqByU+u5ok3"
+    "KBHBHeFy+xjDDTFd3jHceJLhRu54Do024Dkvo2UQPgildd51pXPIQS2tIkUcBaG9Idigye"
+    "7tccYG39U5uEiLdHU57SiEgK4j6cGOGKKb0O7+uGNQcMygAMYFbx9cWmY/zLNDqLgyJKH7"
+    "bcctkaGaaV2oZlo71UyrUc3QwgnnPPouBIRWtiU5cPqo6/bqqHqQlnDQmeJbhBffRyd55N"
+    "F4TVDwls+aC/xfw5RgpVU9aLOKpK4QP8us1LQu1EpNa+dWwrWKHbDuuFaYQkDsfom6DM5f"
+    "ho4pQa+Otofos+fMbd41nRESW+sG6U+ZdkvSLOiTJM7a7nzFG20DgaJd8aWE2FrXLIW0DP"
+    "SCj+9fC7OyjCiWECgWVmeyWaEYPEN+SzCiwjdtoK1h+qaWn7xSOpsiWWbuJGt7Hj2EDQjM"
+    "dsyflTynRnrZcdjkeGNDN1xyHLJ22Y30RpLTmPoZWy2NrZbGVksitVqqZU669OfYT1uE7q"
+    "Ujxzwk2wHsGCw1/CBMZphnyLodxQ/OMvyPs4cWHXfpo4TyfAzkkYPESXtTko0yVFJzq2p8"
+    "lOtu2sz6/AxUpIhdksrOSESdQarIPaowb5G0QAsXxcljuNqPFt+Q5wmly56B0Y6zU/fRzq"
+    "QzmfJ4S2CgeftoD8WyIIojgE/VnuhMz1JujKDY40aH6VA4OsN+m5Qx+qO3XjuOBvcXg7w3"
+    "3oPfR4L1GNvbcndoQkGuvBZOAaXb7bQCu9myfESDn2jnBepLLV/Gf2VD5qAxD31cI485By"
+    "bpXwn/hx9aYzSXtzMIMyOLRT7VnlbePh4CfFQCxL+isB8nmhE8KyhEkx3AR2d6D0z0TKGQ"
+    "kRF9NrkkZjfhWvIaJAVn7pZ7VMfZt2d+NOxhfDqmJATXbbnln0a3xDXi0i0lIbhueX3cA7"
+    "PMm9POT6Nt9L7CiesK1ZkabLv55FVvdaCiOaBTcdfiropu2JV2KzzOIq+BihYuOOZdlLsq"
+    "mdqWROLtP0dx6D1OGyLs7Mr1tuDaKe/ZFUu3h1Mj4V6sePMrinnPEadEROYhd1fx4XmBMK"
+    "k4NJzd/gS1exBePf5EOI67ruG/3N+9bWERlSJVrCT01pP/TuZhIpCP21nbW5QLymBi4lyn"
+    "V2+e/6Oq7pev715UMQ14wAs+lsD+N7M//h/E2c7+"
+)
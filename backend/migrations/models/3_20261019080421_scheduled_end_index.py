@@ -0,0 +1,176 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_test_plans_schedul_f0645a" ON "test_plans" ("scheduled_end");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_test_plans_schedul_f0645a";"""
+
+
+MODELS_STATE = (
+    "eJztXdmS28ix/RUGn/rG7RmB2HEj/KClx9O2pFaoJdthaQKBpdANiyRogNTi8fz7rSxsVV"
+    "hIFMCl2MRLiyKQIJlZS+bJk1m/TxeRj+bJz6+ctZOg9fT/Jr9Pl84C4RfVS9eTqbNalRfg"
+    "jbXjzsm9fnoTedNxk3XsePCwwJknCL/lo8SLw9U6jJZw9+eN7qvu543p+hp+rRkS/qvoCF"
+    "6bxueNigIdv3bk2eeNZpjuFf7HMmUs4Mv4gqYE+CZFkuCypsI7qje7ffV5Y7iqBdc9OX+s"
+    "psz0ycv7v/0PfDM/8vBXC5cPp/wSm2X47w2y19EDWj+iGH+VT7/ht8Olj76jBP77+zQI0d"
+    "wnr6erOPoX8tZ26E/hNvR9FaMkwYpMcsncXqH/3c7tYOdi8/ArIpb6sSI3TckzsH3gP5O/"
+    "/3rz/mYSJjY2KFojf/Kn1GTTP+DBqy82+SLMqMDfA18i79v5Q2+X61/IjaBj1/ai+WaxLG"
+    "9e/Vg/Rsvi7nBJBtMDWqLYwR+K31vHGxgmy818no2ofOSk2ipvSdVEyfgocDZzGGwgnX6B"
+    "8r2pbb+9+2Df33yw7WltIOYS1LDI3vKwfrGS8FdNyK9/gK/wkzxTDdVUdNXEt5CvWbxj/J"
+    "F+dKmYVJCo5+2H6R/kOraOXdq2VCr5t6bWl49O3KzX/P6KZvFXrmo21+M21eZvlLot521/"
+    "5U7ZSWXpHpkjko9niBVI1fnYoviF892eo+XD+hH/dyZJW9T8t+fvX/76/P0VvotMtAgvQu"
+    "nq9Da7JKfXwBal7ulvXTPBBzxXmk1QEetliWwIH8EQihfghSvoqvYtWv5w848P8JBFkvx7"
+    "Tiv36s3zfxC9L35kV17fvf1zfjtljJev715UbBCEc2SvHGxkjknACAk/E8otxcRyeCYEpt"
+    "pnDsia1mEO4Lta5wC51qD/JPxPwyL0InxoXd4Zsd2r/L4sIA1Sv2bJ+LXmSQHs6K6G/2PK"
+    "plxzELbuBJYsK4ohS4puaqphaKZUbAn1S9v2hhe3f4btgTFVvl+U9pmHS4T1vkl12t1ArJ"
+    "zYFiq3CtNUvfSdKzAa7BiaKoOrZuomGFBRhbbWo5PYj8jxUdxgrSiaI2fZbC5WsGIuF0se"
+    "yl65L8VlMsuy9MJYuhwQK+lgMcWhbTV4y3lxd/ea2XJe3Fb3lI9vXtzgnZ8MC3xTuG4xjf"
+    "eIvC/JZsGzz9AyZ7PNTO5/ff6TrOl9thhd7bDD6GrrBgOXKmqPEajHdhrWLxxfonW4QC3K"
+    "ZyQr6vcz0Z/zF0IZQ5NneM3SsAAYBrYeSwu67vn4Z/t3y/mPbHJuc8hu39zcf3j+5h0zRV"
+    "49/3ADV2TGI8vfvdIrxiseMvn77YdfJ/DfyT/v3t4QpUfJ+iEmn1je9+GfU/hOzmYd2cvo"
+    "m+34VEyWv5vrkhkLm5Xfcyywkmc1FnQ9UGEUuNLFjIVcc9RgyL49BSYUyAPnTskKHnGnLN"
+    "7hXApkCUJgHQYBdjHA/fcNkTZGCmaqWaLVvWSFjude9puCsgpQnKcBGGEa1ueNoSPE5UcO"
+    "xH/oNXAeYTfPt90ffBqvC/bS+tGAB+y9491PDWD4q8h1jqduADCDL41oWzZs62r/JYpR+L"
+    "D8K/pBtH+Lv5Sz9Jqi2wwbf1c+6UmM8z/y8Za/W46V2PlWoMGViY/1ki7GxI9+fv/y+aub"
+    "adt434PWPyYovl0G0fkP9K76rk/7Zp3DoHcd78s3J/btltG/RsnaXs2dpU0nbSp7b/aMX/"
+    "76Hs2dFowzs8YH/Lx3+HFUnkicuVABoIdZhag3kiNKrYzC65cW8qL6jrN0HshPhM+GT8rU"
+    "eBPHEQ5Alw8oXsXpZ9ZScbV7rrfl5BDcjT++uL17dk7WjTyyxxH8jOS8NKzCmWeAA6MYsK"
+    "iYKnixMwtSaIBo6go4NgZyrWraTJXwgwzPcFkBTUFkzvg+AeJMMouk/INN15nlFsTvI1jT"
+    "ZjPyJQJIIShE1nQbM3tn9wMasoKfpngyeJsyMVHa/bdKxpArW7cNMHxiCbujAH/tab2Ana"
+    "rdExuMmOCYU/MMwrPGkF1IoJMMuWFKs8n/TiDukWQARRQzn1Awx7JLmpzPIMiYQ4LeNOEJ"
+    "epBPV12FWWZa5qwrAswmEPUu+cNqQEylD/UqsoV9lfUmwcbzG3InrdOsIiUyMK+pHqxuyF"
+    "LrFj1N8JTua0RZHJOKlRI7Xds8SXoN+ENkzBcoSbATw6N9SkTw5ay+CuHdHzW6C8XqJEwe"
+    "t0eK8Cyyg9oMQHRDIfCpK2dulcg5wCCMcZjVGFttTaiXUoLDaWn2LzUGY54C3b6Cy8gFV9"
+    "eX6QvgnyuK0CncudPDepSQ4MbTDRKmBP4TNZ6bxcKs7f5yf/e2zXK5RDWrFHrryX8n8zA5"
+    "mAGnv/8x5TegIpF9CDiouqfKeVrBcI1irxqyaG6xAWiRSTrUCGBVrtc1mzeCB1QJYOi7s1"
+    "jNEZfRaJkTmO3Tb/xms3QTHAcDQn9ddv0ci0ghBEPTrCZHo4QKRDVeBlPw5TKqYqKvmRSu"
+    "XuJLQiQ0KjjRIHAd4Nwb+nlPwgBdgfbqmOSF2Q+KEOff7Z6se9MmgLhyy/VWfLj4rUm5kH"
+    "LDw4oFQKjluSy6WuKnnzdBIJmslG7MgtydsKQZbFCGTnwRC0onZrpGpKxd0O7BP3x3scYI"
+    "vQoJvSZz5yvi249okXPIquuyo8FrD6Uuxe2r0+BxQLbCu8pixTfeGTHB937a0dYCAg2RRe"
+    "dpxEv409ESssu8AW9FUOxJk6bjNHkGNlQg8rUIkN3dhmRbgESgJpNUnwkpPUWFyhpPUuB5"
+    "UEygBxL4+CYJuFxdEdnyJO7lwXELAcFR3ObIWBicdo51tPSauDDzyGlFlwqZivIDEBJK/X"
+    "TSqGV+dVwRt+j+1d3HF69vJu/e37y8vb/N4tqC3Uouwlsl6/H9zfPXY/ru1Om7ZON5KGna"
+    "abYRfikp0eti6FoYXYb4QpOtjjmi45B93R/rJqitdbwX95/LSC/L+npkivY20r+h8OGxiW"
+    "bavsiXIsdc42c/86tbRUjJq7wyyJKOwNPivTaMM90T0kpM8KMmXekcB94ORiRzRDIFN8BT"
+    "QDLfIPwbvXdRC82Vvny9DcFckBvtVcRFbk3XHmQWfLUsQJBY3mcOHWrIUEi7F+kZiyNmjD"
+    "RPhUdIiss+rg2+PO6n78YvKyzTvLMI1ie+8dM0iTZxOsnoKyPoKSboWRirazxfShwvoJ+u"
+    "cCgbRPGCP39KD3HdAKBeR1avVjJaF16c1k6L02qsuKfaw4dS+bDuPftXOS9eeR7cHBovSZ"
+    "FIAzlGHY/M4ciUC6LJElxVISPG7ApEKu3JQN9j+ka27QiNTX915puGabUlhCokhEfJmKkl"
+    "KXwO4FMMgY7XD6vRAc8nVOlzFVOPslQ6lQzHEKOY9ZQR05O015MIsKJluI7iD0780NzUk7"
+    "1he5CV3mqvyb2dwyzTdGD3IS02DS+Av8gndTyQetMVx0gLkwt3ji64K+uWgZBhakW4Q9ne"
+    "DHypkdJBYKis3eDMIA3XVDX1FOmR0VQ3eB5fes+klEsJzsbunXyLbtugH3t4jj08G3p4Pk"
+    "YJV5Vrfr/gswC7D25O2dYMBdwQQ+018g/CJFhFcYPW2zv2ZLeL7Z7Tu6HhZJX2ytUSOyc2"
+    "+g6/AcUTCG0BM9UCKeALYfeW4Fvg/Tdq2FG31UHmEkfE2xi98YNutDVKlfeaAV2Wfrl95Z"
+    "drC3/iPSK+zbeUOKIFHtfr1TDFZzwz1+lFYpp123O3bLn1GmBIvSTcTZurckc0wrPss4fB"
+    "zgJ2b3Y260ccDXxBDc5PuyVYKbF9H3omqAgRLpPqXb1AToziXp0gDmII4MPGX50GRuVWCm"
+    "0ucjxgejbIAlnIqls5Qn2i7ZecY2FTs7p75WBF8FzKB00LKE4WdCUwXajr1AKtwBnoapjm"
+    "rA2hPxspa2dwEHGQUkJSQo0NNUdevx6xjQ/YQ6vY44V5VGl22oUird1lvLCCVfiZu5vs+X"
+    "aPJW/VRwtp7MKz8bFSYm98XUZDWSoszkaY2I63zo4e4mD5MnLnxPPFf4O0MGTwLNxnt/ux"
+    "7fpFtNoe266PbdfHtutj2/XpYaPGwan7U7Rd30KdGPuAH6MP+GkYEHfxg7OEk8kayA/Fte"
+    "ttvIcovYt0v+7MejCQp5K/hKBKyu0MwgEoiAJVA3QW4j031InRMrdMEsVrO4rhYCmQ2XGI"
+    "KPPLbe8xnPtxihLmw356PZ4iOvIQjsVDoKbHyD04CQzBrFCC8xCYha+rR0XLiJ0bN2RFz2"
+    "mOpVlO1fuFN/03KO23W8d7WM0hbCBtI1IVl+m+gm1qmfLk2eyZ9mwmPxMGcZujr02dPNp7"
+    "leb3i5x0Ylb+wiinGemUC9Vdy6yQyNXzumLJeV0ijhac9PVpVD3ClpcBVY2w5QhbjrDlOc"
+    "KWKewSY4eZz8+uyQnua1P+h0HaxxmqRLJ9Wsc834ERzFKfewAxRTxWb7gFukKZtaHZ/4S9"
+    "DVak7SQJ1v4CLYeerwdmuYsf3kdzsTap0jTDDHHQU/VyYL4BBaYw+3YQOAO4O+O/dA2YGi"
+    "ConyGnV23Ff7sJceK/7HjugPrmP9XOJecZD2MEfUfQ9/jHy9DFlCPoexLSNWUC0UHftCMn"
+    "zzwoJY5YglCS2/qbouzi2Qt83HsJzojWXEaEPqI1I1ozojUjWiMu1YzZJRE5ZFuVOp75/k"
+    "SBmvNQ/gkwGoinEjQUm3mVPkUoQxyC98cuJ/WGQP01WGtEdEF6RAsXxQP1l6FYb8izLkt/"
+    "6ecN1N89echlKW6NkrW9mjvLgbqDdnHv8GOevvaOAFFnM7gdqC6n+E642qaWlk6sZXKgkS"
+    "4rxk/VNmbQWc+UtJ0UZv4nNODZn2hKPmRR0k7TTLdq8vZ1tVQwE+NrTD1izwOx539F4bJX"
+    "tM8InlWwr8mOlB8SeSHBfhfg5+IKfvXAA7jHV4afyTyWk51RORmt7RgPbD5VUxKC65nJSS"
+    "PZz5uMmKQhuSkb8ml0TrgVXDqnJATXeelECYFZjeWRxyiPrA7up4oP8g7urjqmpvduBccZ"
+    "iWqggoXjYu1rte6qdGofE6nol9ilIYLO7dUeOMMP6t7avNDqjqi4/caxhbdYkexpWVSHUG"
+    "1l+Il2dM8lEKiY6S84gWqF4kWYkUNr9mjvpFgRO5M+ioxhDBWObte1M+iOGCZ28iNZowU/"
+    "ylLKCU+ooGEW+hCOns7MgSGXKH7gi0dLAbGLX+gA6fSF5iPLcASbR5bhyDIcWYYisQxr6G"
+    "EX6lWOiu2tQk5cDsyhcZmqJ1K07Xr65Yd7U+EhAamMXdQASZW8o3ZQiiI4dYKlZjPwEwzZ"
+    "2wVLtd7I22OuwLc71hhmvyivNRxLDEdw7IQrCDUNBCwxDMI54j5ehxE6I/0LeKoOUWWStQ"
+    "ntuKIwMmKH98zot2TSYUsKrvA/rgYgmGye6liX9IvaX1GcNKLD2872qkoesbZz9rP0s9QD"
+    "i6TsYMiqmb4eQfpTzAPRQfpsfBNN8k+LXOyIcyL9qIGTwjPcZlf2NPXOI9VRCNx9BIQvAw"
+    "QcAeEREB4B4XMBhKvHkkb8VedVMbHDKDXQIHyVJO00wRILwXXXck1OcG70qXn/W3jSxYCt"
+    "q/9J9GDkHeJdSaTVib6bvrutvGUkpXdUe23m92+iUBQS21SqYng9sYA12WVAKnK2ae683z"
+    "QzoPNL11vzTXPHjjccRGjdV104edTXyNH0MxKgyJP7188n4JM6Pn7bIQeYWsAfwhetHamp"
+    "PTxxpFaLlT3Cv7rpZIpt5/O6jUdTiAYcugGchkOOpUgdcMM1UH5KiIoUvGAYjlFG6qppAr"
+    "oeWKR+GL+2JGTSzxEm9ZGejM5js1JC8KRTeTC6GGhitAK98B1gTcuIrm7XB7pLYCoEqoCh"
+    "H0i9zqnuMszbB3ltiK8fY5Q8RvMmT3IeOS1rPiNVUX0AYkIp39IlWHEkxbsioKFOThIP8s"
+    "VJdxFwqwmPJl20ypPE8fuKaZR3ghXVwHSLQ5DUGWnMC+fQ5/eQnl8pK4deGjVD6phI3GLh"
+    "V3cfX7y+mbx7f/Py9v42o9YXsBO5yMIR72+ev64D93hK9YCFcinhMSEatc82IFOHvJYE+d"
+    "3SZboiAwH7Upri+fn+pCs+KYFQfcL0hkSkq4MBZZ0URajecDPus6lhiKMOZ7HK3NWOTltF"
+    "6oiHX0k9zmQyFaNITeJpBFZzYdrJikSmqZbObkJfQSR69MkCC3a0PJeAhGBy13JOg05dXK"
+    "4M/w3SWmeR5sqYK7uM/EiXXFmJ2XBFu1Ux0eHiRhxBCLi40OQeMEwxO/AN0H1XELM6HEXq"
+    "QnA/d76il9EyCB+mzVBccfl6Bxz3FYEq8J2dITkVeeAJGOD8WTPiywU62oG6dRMagTWxgL"
+    "UnSsumB6OAtOxL4ESKzoMMV+DwQKEJz/hnpYSeBbfvYNmFKE8z1F5jX+2Cl6ntgJlaQ8xW"
+    "UdwQPrQTDLLbBXcUDYcUHihIgb/BiQ6XhiZWvMs5LSP2cmLohMEbaBrdBixd3XtBwXsnug"
+    "MVgZtWzQgdk1TtJMm3KM6/EFfKygE03vVm4tGqiTa/OvMNvw0KKbGnAa39HJR3PWhyYkqz"
+    "Z/l/LNXRnoEXhFRSENIVdT1CWnDtPHA1B8rvP5OuQHQSV/ROQGdy3l20nIfLHufdCXfG3W"
+    "pjbxIc7jdgNu3ZQkaqZ7bwSKvTy3cfIcFnBPkODem/wUN/H1m7BVpE8Y8e2q8Kim0A4ISY"
+    "Gqm+NAW1hB8mX3rYgRUT3QqGSZwj3RfVCnMnWduPyInXLuLP59Sl95DTOR4uYZDUJkl2ao"
+    "EHB4v4gcKf3jmTdE5DuUs9n+PNI++LHQVBdg5Z992pIij6zMxZdBbE65IKf32Erpp4LHic"
+    "+OSoDvC0daDalSNk8tOExRjLS2LQVFK7xOs+1sykRDelGqQEBrBPs1lzKny6+KoIIiddAT"
+    "pK2kBJC0xCh/DV/AnAb2IGg0jWTH4svX7597r4WS3YbcYdULv4lBZvCFvwz/M2cYyWa3vt"
+    "JF+42Ewt4sfDXLW+e3jacQQZMHMVfwZzPHDzNRvITqcBYvta4oQm4OeVaYGm5Ey/qtqv2N"
+    "0zhcctE9ZcQ9OsctUGOlq62xqaMqNpgjkLCj+BrN0SaSDrg59maOBQIzL5Zafrhrv3c3sQ"
+    "JCfwgspr5bqgyGZmEqmUt4wt4hD9a+Vu2j4gTmOiiyMOjk02hEkJjsTBRl9lbLJxGWOhwX"
+    "Edm2wI1WSjRi7lrNUGXuG+SrXhWULN2NLr4TLTcSu1QX0335G3yb53jSTK3nC9jSZKDIvy"
+    "ewfWbrN+vOnCupcSN3qUbXd92G5i6SeWNZ3lMn+DJanUOEsKhifs6EZc0ZztOgnK85X5eJ"
+    "9eN3Ykzm+d/IkMlrEj8XGpr4XRGosY2pPgVTmhj+8qJ8/tq6uPH29f9WKCKHqHZLhS9SXK"
+    "ZDhcqtBA4vDhoemgyna9UyJHZB/g5XfjzKfcijctVMBSw4qW989EOBPiR7xZLkFNAwa9eC"
+    "yQVRxGcbj+waN9WuaYQx/54WbBr/70YHtLnwV5vJMiRG0bvBrMoMR8Bn2LDeT0aqow68bS"
+    "30LSrxoKK2rTK1JlBI+SaNnPVlE322XmUxw3itc2jrsTvsbhVTmxiaRtlfqaQvJsOupVMX"
+    "AQymhawxb6XLxRRuhMyKOa4sl5soPZw8jyWQalt6/EJ5eunHgdEi+5l/laxAcZ8ngsPCp1"
+    "RW+ATDKlsF/RDmXmKmmfhTw1pitQQGnpQOnWZEknXG6DSrjIaZ8/MUdAgl3GOD1I6htWcf"
+    "SNb/42Sp/JRGZqYS0DPB3V9OhtFbKillEUDQk+mVO0D+9tc7y7ceO1DdLCg7a0BavZzEq3"
+    "Dj+QoeLZI9NWGT4Z95h6w2Fb3C/dwkqeE12Ibl1zyW5sEC7D5LGX8Sui52R9miNyydZfR2"
+    "tn3t7b6kX40N6lpSoqMj8Fr7tG0eRKUtwefBNLlhXFkCVFNzXVMDRTKpDm+qVtkPOL2z/D"
+    "EszYvL4moziO4n6WqYmKbBnNAkaX6ctaxUqC2ydGa7QkfifkyXgAgLrkEcG6AD+gR8RZo6"
+    "m0gXRZzJGiA2RzpY2qkk6AKblPNLS7NAt/q79GWbEPkzBV6NCoewr5q0tV4xAjkz6bKpId"
+    "tmI1fT8NNVPCNS2bDoFBc3lv3D7nAe+WD1jdXEElK3UeYILhQbtGwwQoIMPRyT6nEr5lCh"
+    "ZpqqRWLOmpxY6oKRCb0L1bjZyRBBNVD6AAxjLgvADNTcNUQ20aNnkhhYly6qemqs7wGokD"
+    "wQ8wYe1kjWWbqg23JLtqksdMemVIR383KK3+1KQUfRJrLfaixQq4tViZqyhbOLv7P03SYi"
+    "/GmgLtjo1ALuZQChdoM8vKMy70cktP22yy06UO1O5b9iDHd0quBZhw3jWeUO+JRDpX8axW"
+    "iudV5EgZlEaz1ER2zrIR0I9NXJE9p7CWHkcp7qubOlO0WpQtusAzzHr5ZkVtZsDaPW3r3D"
+    "zuLi9UTgsyeNyIUuI8XAimrIZYXTcsid7DxdzCQ5ZOx0cRpiWFh5vrTdd3xGHkBJC0pb5m"
+    "QPRmILfjHn+kqg9YbeOwMYfePrNYqfOYXZkLXlihyUY5LGnxHf10tJk21uhcRl3G2NxblO"
+    "beDWRYPIvcH5xKr0uKHRDRtFgVuUc8UqJW8DJ2U+fZivbUTb1t2O9B8yIee9pvuHdWeX32"
+    "9z+HM00uBfh7oXgVk69S97k5qrtu4Hm/lI8Ta0JQZ6SW0dEw6zSgj0NVmFea3JOnXZYG09"
+    "MAU6BvoB7fkEe9iwTbC5tVWNABkZG2k5ZSVnwThANHQw5U+aErFMle2FKcmO+TO+oSYVMZ"
+    "XpLYq/SQu8SQPV2aqlT+bSzuO2Zx3xM916JtoI5nXJxmBW9bNwQ/++JMCgD92AnW/MnQse"
+    "Svt8b7lvyJWcKXeI/I38xxfETozLzQZoP4OeUMmf1hJEVXRgRaNrhdXcdDJnxGxZ1MCmnk"
+    "SGdJD2y8sr0Hz/LcICq2p6KppIOxQYp7K6WFE/g1k7wYLTseuCdl6CCu5GVRckeKrfBJjC"
+    "NTbEtmVw765J9Cny5gIThvID0gCI4GOk0ua4kjOzveLHukkiuiZ7S7qkgCx8oFtMj0JMDt"
+    "kKOzK+0l77SOt95ATVEfL7wqe04uOF6mSQG3qo0ueGUs9PC/WclzHQej901XKHpOwuUtVK"
+    "RELoDLWNxpzURg9ilN3NuuDMc94riVV9tVMZHVbUkzB6IXcJ3EUHrghPMeSq+Kiax0ushT"
+    "DKWPTd/FoP+OhNKRUDo2fR+bvo9N3wVq+l5boaPYDn0+ynFNTnCiN70om5KkncgBL3hBfN"
+    "quyQmubZrTZpkGgTRRx55YB2Z5s9SsgWTjd+nDnozuu1KOa+NxN827XDD2oHcOkrfoS0xX"
+    "ldcW3P4c72Tu2PFmMC/5fu6834jGRz5AiQPbt4k5HaO/8mqnclyOCssSEeBtJmgorzvnEL"
+    "9Kn3apykw/eV+H8ZCHXawqn/SxRgdR5DEKCPIJvqWOgFoDOpQTMAtQ/7KCnxo7Nc+gcMOU"
+    "NLVX1QHnMxuKEioHHWU/Na1AoIoVxoKEYxYk8DKXTsBXKnquT3t4wJKwp91cJhRNLxiXAT"
+    "92gaKztZAPg2GFRAdgKnvHaeCusYfE2NJAXN0frqWBX3qhA5UuZEzba23pqm12meUFuY4R"
+    "hmSx8ZYopIyeuwQhVOA+KAYxZ0B90Q3Z20f00e1pu+OO9NuPYYcgh5xGsd903mZ7s/m65P"
+    "G24xn/2kRRrS3TcNK+l6fxfsLERkv4+T2S3JTgObGQ0iOvgAImXI774kK/kYXUFPqlWuKL"
+    "RxgZwYORctseQz4xw44x5HuKIV9SuPwDdS5g5o13TemqZWZdFTLSI7m7bYFentzrFOcVWc"
+    "VBYR5zfOjgMK/b0zqEeUQTY5R3yijPSRK81PRydCuiZ+bpkirqGZxhPXq6YwmMWCUw+cHV"
+    "PPEGJSK4I1xuH2O4IabLO4YbTzLcyB3PodEGPOdltAzCB6G0zruudA45qKVVpIijILQ3BB"
+    "s02b09ztjguzoHF2mRri6nHYUQ0HUkPdgRQ3QT2t0edwwKjhkUwLjgbYNLy+yHeXYIFVeG"
+    "JDS/7bglMlQzrQvVTGunmmk1qhlaOOGcR9+FgNDKtiQHDh913V4NVQ/SEg46U3yL8OL76C"
+    "SPPBqvCQre8Vlzgf9rmBKstKoHXVaR1BXiZ5mVmtaFWqlp7dxKuFaxA9Yd1wpTCIjdL1GX"
+    "wfnL0DEl6NXQ9hB99py5zbumM0Jia90g/SnTbkmaBX2SxFnbna94o20gULQrvpQQW+uapZ"
+    "CWgV7w8f1rYVaWEcUSAsXC6kw2KxSDZ8hvCUZU+KYNtDVM39Tyg1dKZ1Mky8ydZG3Po4ew"
+    "AYHZjvmzkufUSC87DZucbmzohktOQ9Yuu5HeSHIaUz9jq6Wx1dLYakmkVku1zEmX/hz7aY"
+    "vQvXTkmGdkO4Adg6WGn4PJDPMMWbej+MFZhv9x9tCi4y59lFCej4E8co44aW9KslGGSmpu"
+    "VY2Pct1Nm1mfn4GKFLFLUtkZiagzSBW5RxXmLZIWaOGiOHkMV/vR4hvyPKF02TMw2nF06j"
+    "7amXQmUx5vCQw0bx/toVgWRHEC8KnaE53pUcqNERR72ugwHQpHZ9hvkzJGf/TWa8fR4P5i"
+    "kPfGe/D7SLAeY3tb7g5NKMiV18IpoHS7nVZgN1uWj2jwE+28QH2p5cv4r2zIHDTmoY9r5D"
+    "HnwCT9K+H/8ENrjObydgZhZmSxyKfa08rbxzOAj0qA+FcU9uNEM4JnBYVosgP46EzvgYme"
+    "KRQyMqLPJpfE7CZcS16DpODM3XKP6jj79syPhj2MT8eUhOC6Lbf80+iWuEZcuqUkBNctr4"
+    "97YJZ5c9r5abSN3lc4cV2hOlODbTefvOqtDlQ0B3Qq7lrcVdENu9JuhcdZ5DVQ0cIFx7yL"
+    "clclU9uSSLz95ygOvcdpQ4SdXbneFlw75T27Yun2cGok3IsVb35FMe854pSIyDzk7io+PC"
+    "8QJhWHhrPbn6B2D8Krx58Ix3HXNfyX+7u3LSyiUqSKlYTeevLfyTxMBPJxO2t7i3JBGUxM"
+    "nOv06s3zf1TV/fL13YsqpgEPeMHHEtj/ZvbH/wNo/c6z"
+)
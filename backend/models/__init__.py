@@ -9,6 +9,13 @@ from .project_member import ProjectMember
 from .user_org_role import UserOrgRole
 from .test_plan_script import TestPlanScript
 from .test_plan_slave import TestPlanSlave
+from .execution_model import TestExecution
+from .execution_sample import ExecutionSample
+from .metric_model import MetricPoint
+from .sla_rule import SlaRule
+from .dataset_model import Dataset, TestPlanDataset
+from .monitor_target import MonitorTarget
+from .error_fingerprint import ErrorFingerprint
 
 __all__ = [
     "UserInfo",
@@ -21,5 +28,13 @@ __all__ = [
     "ProjectMember",
     "UserOrgRole",
     "TestPlanScript",
-    "TestPlanSlave"
+    "TestPlanSlave",
+    "TestExecution",
+    "ExecutionSample",
+    "MetricPoint",
+    "SlaRule",
+    "Dataset",
+    "TestPlanDataset",
+    "MonitorTarget",
+    "ErrorFingerprint"
 ]
\ No newline at end of file
@@ -0,0 +1,44 @@
+from tortoise.models import Model
+from tortoise import fields
+from tortoise.indexes import PartialIndex
+
+
+class Dataset(Model):
+    """测试数据文件模型(如账号、商品ID等参数化 CSV)"""
+    id = fields.IntField(pk=True)
+    name = fields.CharField(max_length=100, description="数据集名称")
+    description = fields.TextField(null=True, description="描述")
+    project = fields.ForeignKeyField('models.Project', related_name='datasets', description="所属项目")
+    uploaded_by = fields.ForeignKeyField('models.UserInfo', related_name='datasets', null=True, description="上传人")
+    file_path = fields.CharField(max_length=255, description="文件路径")
+    file_size = fields.BigIntField(default=0, description="文件大小(字节)")
+    line_count = fields.BigIntField(default=0, description="数据行数(不含表头)")
+    has_header = fields.BooleanField(default=True, description="首行是否为表头")
+    checksum = fields.CharField(max_length=64, description="文件 SHA-256")
+    created_at = fields.DatetimeField(auto_now_add=True, description="创建时间")
+    updated_at = fields.DatetimeField(auto_now=True, description="更新时间")
+    is_deleted = fields.BooleanField(default=False, description="删除标志")
+
+    class Meta:
+        table = "datasets"
+        # 按项目查询未删除的数据集
+        indexes = (PartialIndex(fields=("project_id",), name="idx_datasets_project_live", condition={"is_deleted": False}),)
+
+    def __str__(self):
+        return f"{self.name} ({self.file_size} bytes)"
+
+
+class TestPlanDataset(Model):
+    """测试计划-数据集关联模型"""
+    id = fields.IntField(pk=True)
+    test_plan = fields.ForeignKeyField('models.TestPlan', related_name='test_plan_datasets', description="测试计划")
+    dataset = fields.ForeignKeyField('models.Dataset', related_name='test_plan_datasets', description="数据集")
+    mode = fields.CharField(max_length=20, default="partition", description="分发方式")  # partition 按从机切分, full 每台从机完整一份
+    created_at = fields.DatetimeField(auto_now_add=True, description="关联时间")
+
+    class Meta:
+        table = "test_plan_datasets"
+        unique_together = (("test_plan", "dataset"),)
+
+    def __str__(self):
+        return f"{self.test_plan_id} - {self.dataset_id} ({self.mode})"
@@ -0,0 +1,24 @@
+from tortoise.models import Model
+from tortoise import fields
+
+
+class ErrorFingerprint(Model):
+    """执行失败采样的错误指纹模型(同类错误只保存一行计数与少量示例)"""
+    id = fields.BigIntField(pk=True)
+    execution = fields.ForeignKeyField('models.TestExecution', related_name='error_fingerprints', description="所属执行")
+    fingerprint = fields.CharField(max_length=16, description="错误指纹(状态码 + 异常类型 + 归一化消息的摘要)")
+    status_code = fields.IntField(default=0, description="响应状态码")
+    error_type = fields.CharField(max_length=100, null=True, description="异常类型")
+    message = fields.CharField(max_length=255, description="归一化后的错误消息")
+    count = fields.BigIntField(default=0, description="出现次数")
+    first_ts = fields.BigIntField(description="首次出现时间(毫秒时间戳)")
+    last_ts = fields.BigIntField(description="最近出现时间(毫秒时间戳)")
+    labels = fields.JSONField(default={}, description="按请求标签的出现次数")
+    examples = fields.JSONField(default=[], description="随机抽样保留的错误示例")
+
+    class Meta:
+        table = "error_fingerprints"
+        unique_together = (("execution", "fingerprint"),)
+
+    def __str__(self):
+        return f"[{self.status_code}] {self.error_type or ''} {self.message} x{self.count}"
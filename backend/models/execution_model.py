@@ -0,0 +1,45 @@
+from tortoise.models import Model
+from tortoise import fields
+from tortoise.indexes import PartialIndex
+
+
+class TestExecution(Model):
+    """测试计划执行记录模型"""
+    id = fields.IntField(pk=True)
+    execution_id = fields.CharField(max_length=36, unique=True, description="执行ID(UUID)")
+    test_plan = fields.ForeignKeyField('models.TestPlan', related_name='executions', description="测试计划")
+    triggered_by = fields.ForeignKeyField('models.UserInfo', related_name='triggered_executions', null=True, description="触发人")
+    trigger = fields.CharField(max_length=20, default="manual", description="触发方式")  # manual, schedule
+    status = fields.CharField(max_length=20, default="running", description="执行状态")  # queued, running, stopping, completed, aborted, failed
+    priority = fields.CharField(max_length=10, default="medium", description="入队时的测试计划优先级")  # low, medium, high, urgent
+    queued_at = fields.DatetimeField(null=True, index=True, description="入队时间")
+    abort_reason = fields.CharField(max_length=255, null=True, description="提前终止原因")
+    slave_ids = fields.JSONField(default=[], description="参与执行的从机ID列表")
+    partition_slave_ids = fields.JSONField(null=True, description="启动时的从机列表，决定数据集分片的归属")
+    saturation_windows = fields.JSONField(default=[], description="从机饱和时间窗口列表")
+    slaves_released = fields.BooleanField(default=False, description="从机任务数是否已释放")
+    started_at = fields.DatetimeField(null=True, description="开始时间")
+    finished_at = fields.DatetimeField(null=True, description="结束时间")
+    total_samples = fields.BigIntField(default=0, description="采样总数")
+    error_samples = fields.BigIntField(default=0, description="失败采样数")
+    retention_mode = fields.CharField(max_length=20, default="full", description="创建时测试计划的原始采样保留方式")  # full, reservoir, aggregates
+    retention_samples = fields.IntField(null=True, description="蓄水池保留时每个标签每分钟保留的采样数")
+    aggregates = fields.JSONField(null=True, description="精确的总体与各标签汇总及延迟直方图(非完整保留时用于报告)")
+    sample_storage = fields.CharField(max_length=20, default="rows", description="采样存储方式")  # rows, columnar, archived
+    compaction_point = fields.BigIntField(null=True, description="压缩时已写入分钟汇总的最大原始指标点ID，不大于它的指标点待删除")
+    compacted_at = fields.DatetimeField(null=True, description="压缩归档时间，此后时序指标为分钟汇总")
+    report = fields.JSONField(null=True, description="执行分析报告")
+    is_baseline = fields.BooleanField(default=False, description="是否为测试计划的对比基线")
+    comparison = fields.JSONField(null=True, description="与基线的对比结果")
+    created_at = fields.DatetimeField(auto_now_add=True, description="创建时间")
+
+    class Meta:
+        table = "test_executions"
+        # 测试计划的执行状态检查(调度、删除)与基线查找
+        indexes = (
+            ("test_plan", "status"),
+            PartialIndex(fields=("test_plan_id",), name="idx_test_executions_baseline", condition={"is_baseline": True}),
+        )
+
+    def __str__(self):
+        return f"{self.execution_id} ({self.status})"
@@ -0,0 +1,23 @@
+from tortoise.models import Model
+from tortoise import fields
+
+
+class ExecutionSample(Model):
+    """执行原始采样模型（执行期间逐条写入）"""
+    id = fields.BigIntField(pk=True)
+    execution = fields.ForeignKeyField('models.TestExecution', related_name='samples', description="所属执行")
+    slave_id = fields.IntField(null=True, description="上报从机ID")
+    timestamp = fields.BigIntField(description="请求开始时间(毫秒时间戳)")
+    intended_ts = fields.BigIntField(null=True, description="计划发送时间(毫秒时间戳)，用于协调遗漏校正")
+    label = fields.CharField(max_length=255, description="请求标签")
+    latency = fields.FloatField(description="响应时间(毫秒)")
+    status_code = fields.IntField(default=0, description="响应状态码")
+    success = fields.BooleanField(default=True, description="是否成功")
+    bytes = fields.IntField(default=0, description="响应字节数")
+    weight = fields.FloatField(default=1.0, description="代表的采样数(抽样保留时大于 1)")
+
+    class Meta:
+        table = "execution_samples"
+
+    def __str__(self):
+        return f"{self.label} {self.latency}ms ({self.status_code})"
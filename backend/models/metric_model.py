@@ -0,0 +1,19 @@
+from tortoise.models import Model
+from tortoise import fields
+
+
+class MetricPoint(Model):
+    """时序指标点模型（平台/执行的汇总指标）"""
+    id = fields.BigIntField(pk=True)
+    execution = fields.ForeignKeyField('models.TestExecution', related_name='metric_points', null=True, description="所属执行，平台级指标为空")
+    source = fields.CharField(max_length=50, default="platform", description="指标来源")  # platform, execution, slave:<id>
+    name = fields.CharField(max_length=50, description="指标名称")  # rps, avg_latency, error_rate ...
+    ts = fields.BigIntField(description="时间(秒级时间戳，按分钟汇总时为分钟起点)")
+    value = fields.FloatField(description="指标值")
+
+    class Meta:
+        table = "metric_points"
+        indexes = (("execution", "name", "ts"), ("source", "name", "ts"))
+
+    def __str__(self):
+        return f"{self.source}.{self.name}@{self.ts} = {self.value}"
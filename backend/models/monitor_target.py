@@ -0,0 +1,30 @@
+from tortoise.models import Model
+from tortoise import fields
+
+
+class MonitorTarget(Model):
+    """被测系统监控目标模型(项目内的执行运行期间采集其资源指标)"""
+    id = fields.IntField(pk=True)
+    name = fields.CharField(max_length=100, description="监控目标名称")
+    description = fields.TextField(null=True, description="描述")
+    project = fields.ForeignKeyField('models.Project', related_name='monitor_targets', description="所属项目")
+    host = fields.CharField(max_length=255, description="主机地址")
+    port = fields.IntField(null=True, description="采集端口(node_exporter 方式)")
+    method = fields.CharField(max_length=20, default="node_exporter", description="采集方式")  # node_exporter 拉取, agent 推送
+    scheme = fields.CharField(max_length=10, default="http", description="采集协议")
+    metrics_path = fields.CharField(max_length=255, default="/metrics", description="指标路径")
+    auth_token = fields.CharField(max_length=255, null=True, description="采集令牌(Bearer)")
+    interval = fields.IntField(default=1, description="采集间隔(秒)")
+    extra_metrics = fields.JSONField(default=[], description="额外记录的原始指标名称列表")
+    last_collected_at = fields.DatetimeField(null=True, description="最近一次采集成功时间")
+    last_error = fields.CharField(max_length=255, null=True, description="最近一次采集错误")
+    is_active = fields.BooleanField(default=True, description="是否启用")
+    created_at = fields.DatetimeField(auto_now_add=True, description="创建时间")
+    updated_at = fields.DatetimeField(auto_now=True, description="更新时间")
+    is_deleted = fields.BooleanField(default=False, description="删除标志")
+
+    class Meta:
+        table = "monitor_targets"
+
+    def __str__(self):
+        return f"{self.name} ({self.host}) - {self.method}"
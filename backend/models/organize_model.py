@@ -1,5 +1,6 @@
 from tortoise.models import Model
 from tortoise import fields
+from tortoise.indexes import PartialIndex
 
 
 class Organize(Model):
@@ -9,6 +10,7 @@ class Organize(Model):
     description = fields.TextField(null=True, description="组织描述")
     parent_id = fields.IntField(null=True, description="父级组织ID")
     manager_id = fields.ForeignKeyField('models.UserInfo', related_name='managed_organizations', null=True, description="组织管理员")
+    path = fields.CharField(max_length=255, null=True, index=True, description="层级路径，如 /1/5/12/")
     level = fields.IntField(default=1, description="组织层级")
     sort_order = fields.IntField(default=0, description="排序顺序")
     created_at = fields.DatetimeField(auto_now_add=True, description="创建时间")
@@ -17,6 +19,8 @@ class Organize(Model):
 
     class Meta:
         table = "organizations"
+        # 按父级查询未删除的子组织并按排序顺序返回
+        indexes = (PartialIndex(fields=("parent_id", "sort_order"), name="idx_organizations_children", condition={"is_deleted": False}),)
 
     def __str__(self):
         return f"{self.name} (Level: {self.level})"
\ No newline at end of file
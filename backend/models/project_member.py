@@ -14,6 +14,8 @@ class ProjectMember(Model):
     class Meta:
         table = "project_members"
         unique_together = (("project", "user"),)
+        # 权限检查：用户参与的项目(覆盖索引，无需回表)
+        indexes = (("user", "is_active", "project"),)
 
     def __str__(self):
         return f"{self.user.username} - {self.project.name} ({self.role.name})"
\ No newline at end of file
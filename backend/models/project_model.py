@@ -1,5 +1,6 @@
 from tortoise.models import Model
 from tortoise import fields
+from tortoise.indexes import PartialIndex
 
 
 class Project(Model):
@@ -15,6 +16,8 @@ class Project(Model):
 
     class Meta:
         table = "projects"
+        # 权限检查：用户作为经理的未删除项目
+        indexes = (PartialIndex(fields=("manager_id_id",), name="idx_projects_manager_live", condition={"is_deleted": False}),)
 
     def __str__(self):
         return f"{self.name} (Manager: {self.manager_id.username if self.manager_id else 'None'})"
\ No newline at end of file
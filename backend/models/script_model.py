@@ -1,5 +1,6 @@
 from tortoise.models import Model
 from tortoise import fields
+from tortoise.indexes import PartialIndex
 
 
 class Script(Model):
@@ -20,6 +21,8 @@ class Script(Model):
 
     class Meta:
         table = "scripts"
+        # 按项目查询未删除的脚本(列表、计数)
+        indexes = (PartialIndex(fields=("project_id_id",), name="idx_scripts_project_live", condition={"is_deleted": False}),)
 
     def __str__(self):
         return f"{self.name} v{self.script_version} ({self.script_type})"
\ No newline at end of file
@@ -0,0 +1,22 @@
+from tortoise.models import Model
+from tortoise import fields
+
+
+class SlaRule(Model):
+    """测试计划 SLA 断言规则模型"""
+    id = fields.IntField(pk=True)
+    test_plan = fields.ForeignKeyField('models.TestPlan', related_name='sla_rules', description="测试计划")
+    label = fields.CharField(max_length=255, null=True, description="请求标签，为空时针对全部请求")
+    metric = fields.CharField(max_length=20, description="指标")  # avg, max, p50, p75, p90, p95, p99, p99.9, error_rate, rps
+    operator = fields.CharField(max_length=5, description="比较方式")  # lt, lte, gt, gte
+    threshold = fields.FloatField(description="阈值(延迟为毫秒，错误率为比例，吞吐为每秒请求数)")
+    is_hard = fields.BooleanField(default=False, description="是否为硬性规则(违反时提前终止执行)")
+    min_samples = fields.IntField(default=100, description="样本数达到该值后才开始判定")
+    is_active = fields.BooleanField(default=True, description="是否启用")
+    created_at = fields.DatetimeField(auto_now_add=True, description="创建时间")
+
+    class Meta:
+        table = "sla_rules"
+
+    def __str__(self):
+        return f"{self.label or '*'} {self.metric} {self.operator} {self.threshold}"
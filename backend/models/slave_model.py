@@ -18,8 +18,12 @@ class SlaveConfig(Model):
     memory_usage = fields.FloatField(null=True, description="内存使用率")
     disk_usage = fields.FloatField(null=True, description="磁盘使用率")
     last_heartbeat = fields.DatetimeField(null=True, description="最后心跳时间")
+    clock_offset = fields.FloatField(null=True, description="时钟偏差(毫秒，服务器时间 - 从机时间)")
+    clock_rtt = fields.FloatField(null=True, description="估计时钟偏差所用交换的往返时延(毫秒)")
+    clock_synced_at = fields.DatetimeField(null=True, description="时钟偏差更新时间")
     max_concurrent_tasks = fields.IntField(default=5, description="最大并发任务数")
-    current_tasks = fields.IntField(default=0, description="当前任务数")
+    current_tasks = fields.IntField(default=0, description="当前任务数(服务端预留计数，由执行启动与结束维护)")
+    reported_tasks = fields.IntField(default=0, description="从机心跳上报的当前任务数")
     is_active = fields.BooleanField(default=True, description="是否激活")
     created_at = fields.DatetimeField(auto_now_add=True, description="创建时间")
     updated_at = fields.DatetimeField(auto_now=True, description="更新时间")
@@ -12,7 +12,11 @@ class TestPlan(Model):
     status = fields.CharField(max_length=20, default="draft", description="状态")  # draft, active, completed, cancelled
     priority = fields.CharField(max_length=10, default="medium", description="优先级")  # low, medium, high, urgent
     scheduled_start = fields.DatetimeField(null=True, description="计划开始时间")
-    scheduled_end = fields.DatetimeField(null=True, description="计划结束时间")
+    scheduled_end = fields.DatetimeField(null=True, index=True, description="计划结束时间")
+    cron_expression = fields.CharField(max_length=100, null=True, description="周期执行的 cron 表达式")
+    retention_mode = fields.CharField(max_length=20, default="full", description="原始采样保留方式")  # full, reservoir, aggregates
+    retention_samples = fields.IntField(null=True, description="蓄水池保留时每个标签每分钟保留的采样数，为空时使用默认值")
+    next_run_at = fields.DatetimeField(null=True, index=True, description="下次调度执行时间")
     actual_start = fields.DatetimeField(null=True, description="实际开始时间")
     actual_end = fields.DatetimeField(null=True, description="实际结束时间")
     total_cases = fields.IntField(default=0, description="总用例数")
@@ -25,6 +29,8 @@ class TestPlan(Model):
 
     class Meta:
         table = "test_plans"
+        # 按项目查询测试计划；执行列表等关联查询不带删除标志，因此不使用部分索引
+        indexes = (("project_id", "is_deleted"),)
 
     def __str__(self):
         return f"{self.name} ({self.status})"
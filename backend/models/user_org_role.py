@@ -14,6 +14,8 @@ class UserOrgRole(Model):
     class Meta:
         table = "user_organization_roles"
         unique_together = (("user", "organization", "role"),)
+        # 用户所属组织(覆盖索引)与组织成员列表
+        indexes = (("user", "is_active", "organization"), ("organization", "is_active"))
 
     def __str__(self):
         return f"{self.user.username} - {self.organization.name} - {self.role.name}"
\ No newline at end of file
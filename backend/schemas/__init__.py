@@ -6,6 +6,8 @@ from .organize_schemas import *
 from .script_schemas import *
 from .test_plan_schemas import *
 from .slave_schemas import *
+from .execution_schemas import *
+from .monitor_schemas import *
 from .common_schemas import *
 
 __all__ = [
@@ -26,10 +28,17 @@ __all__ = [
 
     # Test Plan schemas
     "TestPlanCreate", "TestPlanUpdate", "TestPlanResponse", "TestPlanSlaveCreate",
+    "TestPlanDatasetCreate", "SlaRuleCreate", "SlaRuleUpdate",
 
     # Slave schemas
     "SlaveConfigCreate", "SlaveConfigUpdate", "SlaveConfigResponse",
 
+    # Execution schemas
+    "SampleItem", "SampleBatch", "ExecutionFinish", "ExecutionStop", "LogEntryItem", "LogBatch",
+
+    # Monitor schemas
+    "MonitorTargetCreate", "MonitorTargetUpdate", "MonitorPointItem", "MonitorPointBatch",
+
     # Common schemas
     "PaginationParams", "PaginatedResponse", "ErrorResponse", "SuccessResponse"
 ]
\ No newline at end of file
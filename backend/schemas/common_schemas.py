@@ -2,6 +2,8 @@ from typing import Generic, TypeVar, Optional, List, Any
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+from config import BULK_MAX_ITEMS
+
 T = TypeVar('T')
 
 class PaginationParams(BaseModel):
@@ -15,10 +17,10 @@ class PaginatedResponse(BaseModel, Generic[T]):
     code: int = Field(default=200, description="状态码")
     message: str = Field(default="success", description="响应消息")
     items: List[T] = Field(description="数据列表")
-    total: int = Field(description="总数量")
+    total: Optional[int] = Field(default=None, description="总数量，total=none 时不统计")
     page: int = Field(description="当前页码")
     size: int = Field(description="每页数量")
-    pages: int = Field(description="总页数")
+    pages: Optional[int] = Field(default=None, description="总页数，total=none 时不统计")
     has_next: bool = Field(description="是否有下一页")
     has_prev: bool = Field(description="是否有上一页")
 
@@ -47,4 +49,8 @@ class ResponseModel(BaseModel):
     """通用响应模型"""
     code: int = Field(default=200, description="状态码")
     message: str = Field(default="success", description="响应消息")
-    data: Optional[Any] = Field(default=None, description="响应数据")
\ No newline at end of file
+    data: Optional[Any] = Field(default=None, description="响应数据")
+
+class BulkDeleteRequest(BaseModel):
+    """批量删除请求"""
+    ids: List[int] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS, description="ID列表")
@@ -0,0 +1,43 @@
+from typing import Optional, List
+from pydantic import BaseModel, Field
+
+from config import SAMPLE_BATCH_MAX, LOG_BATCH_MAX
+
+class SampleItem(BaseModel):
+    """单条请求采样"""
+    timestamp: int = Field(..., ge=0, description="请求开始时间(毫秒时间戳)")
+    intended_ts: Optional[int] = Field(None, ge=0, description="计划发送时间(毫秒时间戳)，按发送节奏本应发出请求的时间")
+    label: str = Field(..., min_length=1, max_length=255, description="请求标签")
+    latency: float = Field(..., ge=0, description="响应时间(毫秒)")
+    status_code: int = Field(default=0, ge=0, description="响应状态码")
+    success: bool = Field(default=True, description="是否成功")
+    bytes: int = Field(default=0, ge=0, description="响应字节数")
+    error_type: Optional[str] = Field(None, max_length=100, description="异常类型(失败采样)")
+    error_message: Optional[str] = Field(None, max_length=65536, description="错误消息(失败采样)")
+    response_body: Optional[str] = Field(None, max_length=65536, description="响应内容(失败采样，仅作为示例保留)")
+
+class SampleBatch(BaseModel):
+    """采样批量上报"""
+    slave_id: Optional[int] = Field(None, description="上报从机ID")
+    samples: List[SampleItem] = Field(..., max_length=SAMPLE_BATCH_MAX, description="采样列表")
+
+class ExecutionFinish(BaseModel):
+    """结束执行"""
+    status: str = Field(default="completed", pattern="^(completed|aborted|failed)$", description="终止状态")
+
+class ExecutionStop(BaseModel):
+    """停止执行"""
+    mode: str = Field(default="graceful", pattern="^(graceful|hard)$", description="停止方式: graceful 排空在途请求后停止 / hard 立即终止")
+    reason: Optional[str] = Field(None, max_length=200, description="停止原因")
+
+class LogEntryItem(BaseModel):
+    """单行执行日志"""
+    timestamp: Optional[int] = Field(None, ge=0, description="日志时间(毫秒时间戳)，为空时使用接收时间")
+    level: str = Field(default="INFO", pattern="^(DEBUG|INFO|WARN|ERROR)$", description="日志级别")
+    message: str = Field(..., max_length=65536, description="日志内容")
+    source: str = Field(default="engine", max_length=20, description="日志来源")  # stdout, stderr, engine
+
+class LogBatch(BaseModel):
+    """执行日志批量上报"""
+    slave_id: Optional[int] = Field(None, description="上报从机ID")
+    entries: List[LogEntryItem] = Field(..., max_length=LOG_BATCH_MAX, description="日志列表")
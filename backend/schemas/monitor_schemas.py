@@ -0,0 +1,47 @@
+from typing import Optional, List
+from pydantic import BaseModel, Field
+
+from config import MONITOR_PUSH_BATCH_MAX
+
+METRIC_NAME_PATTERN = r"^[a-zA-Z_:][a-zA-Z0-9_:]*$"
+
+class MonitorTargetBase(BaseModel):
+    """监控目标基础信息"""
+    name: str = Field(..., min_length=1, max_length=100, description="监控目标名称")
+    description: Optional[str] = Field(None, description="描述")
+    host: str = Field(..., min_length=1, max_length=255, description="主机地址")
+    port: Optional[int] = Field(None, ge=1, le=65535, description="采集端口(node_exporter 方式)")
+    method: str = Field(default="node_exporter", pattern="^(node_exporter|agent)$", description="采集方式: node_exporter 拉取/agent 推送")
+    scheme: str = Field(default="http", pattern="^(http|https)$", description="采集协议")
+    metrics_path: str = Field(default="/metrics", max_length=255, pattern="^/", description="指标路径")
+    interval: int = Field(default=1, ge=1, le=300, description="采集间隔(秒)")
+    extra_metrics: List[str] = Field(default_factory=list, max_length=50, description="额外记录的原始指标名称")
+
+class MonitorTargetCreate(MonitorTargetBase):
+    """创建监控目标"""
+    project_id: int = Field(..., description="所属项目ID")
+    auth_token: Optional[str] = Field(None, max_length=255, description="采集令牌(Bearer)")
+
+class MonitorTargetUpdate(BaseModel):
+    """更新监控目标"""
+    name: Optional[str] = Field(None, min_length=1, max_length=100, description="监控目标名称")
+    description: Optional[str] = Field(None, description="描述")
+    host: Optional[str] = Field(None, min_length=1, max_length=255, description="主机地址")
+    port: Optional[int] = Field(None, ge=1, le=65535, description="采集端口")
+    method: Optional[str] = Field(None, pattern="^(node_exporter|agent)$", description="采集方式")
+    scheme: Optional[str] = Field(None, pattern="^(http|https)$", description="采集协议")
+    metrics_path: Optional[str] = Field(None, max_length=255, pattern="^/", description="指标路径")
+    auth_token: Optional[str] = Field(None, max_length=255, description="采集令牌")
+    interval: Optional[int] = Field(None, ge=1, le=300, description="采集间隔(秒)")
+    extra_metrics: Optional[List[str]] = Field(None, max_length=50, description="额外记录的原始指标名称")
+    is_active: Optional[bool] = Field(None, description="是否启用")
+
+class MonitorPointItem(BaseModel):
+    """代理推送的单个指标点"""
+    name: str = Field(..., max_length=50, pattern=METRIC_NAME_PATTERN, description="指标名称，如 cpu_usage/memory_usage/gc_time")
+    value: float = Field(..., description="指标值")
+    ts: Optional[int] = Field(None, ge=0, description="采集时间(毫秒时间戳)，为空时使用接收时间")
+
+class MonitorPointBatch(BaseModel):
+    """代理批量推送指标"""
+    points: List[MonitorPointItem] = Field(..., max_length=MONITOR_PUSH_BATCH_MAX, description="指标点列表")
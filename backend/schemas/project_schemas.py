@@ -2,6 +2,8 @@ from typing import Optional, List
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+from config import BULK_MAX_ITEMS
+
 class ProjectBase(BaseModel):
     """项目基础信息"""
     name: str = Field(..., min_length=1, max_length=100, description="项目名称")
@@ -38,6 +40,14 @@ class ProjectMemberCreate(BaseModel):
     user_id: int = Field(..., description="用户ID")
     role_id: int = Field(..., description="角色ID")
 
+class ProjectMemberBulkCreate(BaseModel):
+    """批量添加项目成员"""
+    items: List[ProjectMemberCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS, description="成员列表")
+
+class ProjectMemberBulkRemove(BaseModel):
+    """批量移除项目成员"""
+    user_ids: List[int] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS, description="用户ID列表")
+
 class ProjectMemberUpdate(BaseModel):
     """更新项目成员"""
     role_id: Optional[int] = Field(None, description="角色ID")
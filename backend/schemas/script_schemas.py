@@ -2,6 +2,8 @@ from typing import Optional, List
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+from config import BULK_MAX_ITEMS
+
 class ScriptBase(BaseModel):
     """脚本基础信息"""
     name: str = Field(..., min_length=1, max_length=100, description="脚本名称")
@@ -24,6 +26,18 @@ class ScriptUpdate(BaseModel):
     description: Optional[str] = Field(None, description="脚本描述")
     is_active: Optional[bool] = Field(None, description="是否激活")
 
+class ScriptBulkCreate(BaseModel):
+    """批量登记脚本元数据（文件已存在于服务器）"""
+    items: List[ScriptCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS, description="脚本列表")
+
+class ScriptBulkUpdateItem(ScriptUpdate):
+    """批量更新脚本条目"""
+    id: int = Field(..., description="脚本ID")
+
+class ScriptBulkUpdate(BaseModel):
+    """批量更新脚本"""
+    items: List[ScriptBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS, description="脚本列表")
+
 class ScriptResponse(ScriptBase):
     """脚本响应"""
     id: int = Field(..., description="脚本ID")
@@ -44,6 +58,19 @@ class TestPlanScriptCreate(BaseModel):
     execution_order: int = Field(default=1, description="执行顺序")
     is_enabled: bool = Field(default=True, description="是否启用")
 
+class TestPlanScriptBulkCreate(BaseModel):
+    """批量关联测试计划脚本"""
+    items: List[TestPlanScriptCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS, description="脚本关联列表")
+
+class TestPlanScriptReorder(BaseModel):
+    """调整测试计划脚本执行顺序"""
+    script_ids: List[int] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS, description="按执行顺序排列的脚本ID")
+
+class TestPlanScriptToggle(BaseModel):
+    """批量启用/禁用测试计划脚本"""
+    script_ids: List[int] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS, description="脚本ID列表")
+    is_enabled: bool = Field(..., description="是否启用")
+
 class TestPlanScriptUpdate(BaseModel):
     """更新测试计划-脚本关联"""
     execution_order: Optional[int] = Field(None, description="执行顺序")
@@ -2,6 +2,8 @@ from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+from config import BULK_MAX_ITEMS
+
 class SlaveConfigBase(BaseModel):
     """从机配置基础信息"""
     name: str = Field(..., min_length=1, max_length=100, description="从机名称")
@@ -30,6 +32,18 @@ class SlaveConfigUpdate(BaseModel):
     max_concurrent_tasks: Optional[int] = Field(None, ge=1, description="最大并发任务数")
     is_active: Optional[bool] = Field(None, description="是否激活")
 
+class SlaveConfigBulkCreate(BaseModel):
+    """批量创建从机配置"""
+    items: List[SlaveConfigCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS, description="从机配置列表")
+
+class SlaveConfigBulkUpdateItem(SlaveConfigUpdate):
+    """批量更新从机配置条目"""
+    id: int = Field(..., description="从机ID")
+
+class SlaveConfigBulkUpdate(BaseModel):
+    """批量更新从机配置"""
+    items: List[SlaveConfigBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS, description="从机配置列表")
+
 class SlaveConfigResponse(SlaveConfigBase):
     """从机配置响应"""
     id: int = Field(..., description="从机ID")
@@ -49,14 +63,23 @@ class SlaveConfigDetailResponse(SlaveConfigResponse):
     task_history: List[dict] = Field(default_factory=list, description="任务历史")
     system_info: Optional[Dict[str, Any]] = Field(None, description="系统信息")
 
+class ClockExchange(BaseModel):
+    """一次完整的时钟交换(毫秒时间戳)"""
+    client_send_ts: int = Field(..., ge=0, description="从机发送心跳时间 t0(从机时钟)")
+    server_receive_ts: int = Field(..., ge=0, description="服务器收到心跳时间 t1(取自上次心跳响应)")
+    server_send_ts: int = Field(..., ge=0, description="服务器响应时间 t2(取自上次心跳响应)")
+    client_receive_ts: int = Field(..., ge=0, description="从机收到响应时间 t3(从机时钟)")
+
 class SlaveHeartbeatCreate(BaseModel):
     """从机心跳"""
     slave_id: int = Field(..., description="从机ID")
+    client_send_ts: Optional[int] = Field(None, ge=0, description="本次心跳的发送时间 t0(从机时钟，毫秒时间戳)")
+    clock_exchange: Optional[ClockExchange] = Field(None, description="上一次心跳完成的时钟交换")
     status: str = Field(..., description="状态")
     cpu_usage: Optional[float] = Field(None, ge=0, le=100, description="CPU使用率")
     memory_usage: Optional[float] = Field(None, ge=0, le=100, description="内存使用率")
     disk_usage: Optional[float] = Field(None, ge=0, le=100, description="磁盘使用率")
-    current_tasks: int = Field(default=0, ge=0, description="当前任务数")
+    current_tasks: int = Field(default=0, ge=0, description="从机上报的当前任务数(仅记录，不影响服务端的任务预留)")
 
 class SlaveHeartbeatResponse(BaseModel):
     """从机心跳响应"""
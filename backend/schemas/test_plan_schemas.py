@@ -1,7 +1,21 @@
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 
+from config import BULK_MAX_ITEMS
+from services.cron import parse_cron
+from services.sla import SLA_METRIC_PATTERN, SLA_OPERATOR_PATTERN
+
+RETENTION_MODE_PATTERN = r"^(full|reservoir|aggregates)$"
+
+def check_cron_expression(value: Optional[str]) -> Optional[str]:
+    """校验 cron 表达式可解析且仍会触发，空字符串视为不设置"""
+    cron = parse_cron(value)
+    if cron is None:
+        return None
+    cron.next_after(datetime.now())
+    return cron.expression
+
 class TestPlanBase(BaseModel):
     """测试计划基础信息"""
     name: str = Field(..., min_length=1, max_length=100, description="测试计划名称")
@@ -12,6 +26,11 @@ class TestPlanBase(BaseModel):
     priority: str = Field(default="medium", description="优先级")
     scheduled_start: Optional[datetime] = Field(None, description="计划开始时间")
     scheduled_end: Optional[datetime] = Field(None, description="计划结束时间")
+    cron_expression: Optional[str] = Field(None, max_length=100, description="周期执行的 cron 表达式(分 时 日 月 周)")
+    retention_mode: str = Field(default="full", pattern=RETENTION_MODE_PATTERN, description="原始采样保留方式: full 全部/reservoir 蓄水池抽样/aggregates 仅汇总")
+    retention_samples: Optional[int] = Field(None, ge=1, le=100000, description="蓄水池抽样时每个标签每分钟保留的采样数，为空时使用默认值")
+
+    _check_cron_expression = field_validator("cron_expression")(check_cron_expression)
 
 class TestPlanCreate(TestPlanBase):
     """创建测试计划"""
@@ -24,8 +43,13 @@ class TestPlanUpdate(BaseModel):
     priority: Optional[str] = Field(None, description="优先级")
     scheduled_start: Optional[datetime] = Field(None, description="计划开始时间")
     scheduled_end: Optional[datetime] = Field(None, description="计划结束时间")
+    cron_expression: Optional[str] = Field(None, max_length=100, description="周期执行的 cron 表达式，空字符串表示取消")
+    retention_mode: Optional[str] = Field(None, pattern=RETENTION_MODE_PATTERN, description="原始采样保留方式: full/reservoir/aggregates")
+    retention_samples: Optional[int] = Field(None, ge=1, le=100000, description="蓄水池抽样时每个标签每分钟保留的采样数")
     is_active: Optional[bool] = Field(None, description="是否激活")
 
+    _check_cron_expression = field_validator("cron_expression")(check_cron_expression)
+
 class TestPlanResponse(TestPlanBase):
     """测试计划响应"""
     id: int = Field(..., description="测试计划ID")
@@ -34,6 +58,7 @@ class TestPlanResponse(TestPlanBase):
     total_cases: int = Field(..., description="总用例数")
     passed_cases: int = Field(..., description="通过用例数")
     failed_cases: int = Field(..., description="失败用例数")
+    next_run_at: Optional[datetime] = Field(None, description="下次调度执行时间")
     is_active: bool = Field(..., description="是否激活")
     created_at: datetime = Field(..., description="创建时间")
     updated_at: datetime = Field(..., description="更新时间")
@@ -50,6 +75,10 @@ class TestPlanSlaveCreate(BaseModel):
     """测试计划-从机关联"""
     slave_id: int = Field(..., description="从机ID")
 
+class TestPlanSlaveBulkCreate(BaseModel):
+    """批量分配测试计划从机"""
+    items: List[TestPlanSlaveCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS, description="从机分配列表")
+
 class TestPlanSlaveResponse(BaseModel):
     """测试计划-从机关联响应"""
     id: int = Field(..., description="关联ID")
@@ -58,6 +87,30 @@ class TestPlanSlaveResponse(BaseModel):
     is_active: bool = Field(..., description="是否激活")
     assigned_at: datetime = Field(..., description="分配时间")
 
+class TestPlanDatasetCreate(BaseModel):
+    """测试计划-数据集关联"""
+    dataset_id: int = Field(..., description="数据集ID")
+    mode: str = Field(default="partition", pattern="^(partition|full)$", description="下发方式: partition 按从机切分/full 每台从机完整下发")
+
+class SlaRuleCreate(BaseModel):
+    """创建 SLA 规则"""
+    label: Optional[str] = Field(None, max_length=255, description="请求标签，为空时针对全部请求")
+    metric: str = Field(..., pattern=SLA_METRIC_PATTERN, description="指标")
+    operator: str = Field(..., pattern=SLA_OPERATOR_PATTERN, description="比较方式")
+    threshold: float = Field(..., ge=0, description="阈值")
+    is_hard: bool = Field(default=False, description="是否为硬性规则(违反时提前终止执行)")
+    min_samples: int = Field(default=100, ge=1, description="样本数达到该值后才开始判定")
+
+class SlaRuleUpdate(BaseModel):
+    """更新 SLA 规则"""
+    label: Optional[str] = Field(None, max_length=255, description="请求标签")
+    metric: Optional[str] = Field(None, pattern=SLA_METRIC_PATTERN, description="指标")
+    operator: Optional[str] = Field(None, pattern=SLA_OPERATOR_PATTERN, description="比较方式")
+    threshold: Optional[float] = Field(None, ge=0, description="阈值")
+    is_hard: Optional[bool] = Field(None, description="是否为硬性规则")
+    min_samples: Optional[int] = Field(None, ge=1, description="最小判定样本数")
+    is_active: Optional[bool] = Field(None, description="是否启用")
+
 class TestPlanExecutionCreate(BaseModel):
     """测试计划执行"""
     test_plan_id: int = Field(..., description="测试计划ID")
@@ -96,6 +96,19 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     
     return user
 
+async def authenticate_token(token: Optional[str]):
+    """校验令牌并返回激活用户，失败返回 None（用于无法携带请求头的 WebSocket 连接）"""
+    from models import UserInfo
+    
+    payload = verify_token(token) if token else None
+    if payload is None or payload.get("user_id") is None:
+        return None
+    
+    user = await UserInfo.get_or_none(id=payload["user_id"])
+    if user is None or not user.is_active:
+        return None
+    return user
+
 async def get_current_active_user(current_user = Depends(get_current_user)):
     """获取当前激活用户"""
     if not current_user.is_active:
@@ -0,0 +1,420 @@
+"""
+执行结果分析模块
+基于列式结果用 NumPy 向量化计算执行报告：
+- 各标签的样本数、错误率、吞吐、延迟均值/极值/分位数与 Apdex
+- 协调遗漏校正后的延迟均值/最大值/分位数(按计划发送时间计时)，与原始延迟并列报告
+- 按秒的吞吐/延迟/错误时间序列(过长时合并为不超过 REPORT_MAX_POINTS 个点)
+- 按状态码与标签的错误分布
+- 延迟-并发曲线(并发数按 Little 定律由每秒吞吐 × 平均延迟估算)
+
+非完整保留(见 services.retention)的结果，样本数、错误数、均值、极值与分位数取自执行期间的精确汇总
+(分位数误差同直方图分桶)，Apdex 由直方图估算；时间序列与错误分布按保留行的权重还原，仅汇总保留时不提供。
+
+各标签分位数通过一次按(标签, 延迟)的排序得到，各组分位数直接按下标取值，不逐标签循环排序。
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import APDEX_THRESHOLD_MS, REPORT_MAX_POINTS
+from services.metrics import LatencyHistogram, bucket_value, BUCKET_COUNT
+from services.result_store import ColumnarResult
+
+REPORT_PERCENTILES = (50, 75, 90, 95, 99, 99.9)
+# 延迟-并发曲线的分组数
+CONCURRENCY_BINS = 20
+
+
+def _round(values: np.ndarray, digits: int = 2) -> List[float]:
+    return [round(float(v), digits) for v in values]
+
+
+def grouped_percentiles(sorted_values: np.ndarray, starts: np.ndarray, counts: np.ndarray, q: float) -> np.ndarray:
+    """
+    已按组排序的数组上，一次计算所有组的分位数(线性插值，与 np.percentile 默认方法一致)
+
+    Args:
+        sorted_values: 组内升序、组间连续存放的值
+        starts: 每组起始下标
+        counts: 每组元素数(须大于 0)
+        q: 分位数(0~100)
+    """
+    position = q / 100 * (counts - 1)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.minimum(lower + 1, counts - 1)
+    fraction = position - lower
+    low_values = sorted_values[starts + lower].astype(np.float64)
+    high_values = sorted_values[starts + upper].astype(np.float64)
+    return low_values + fraction * (high_values - low_values)
+
+
+def _label_stats(
+    labels: np.ndarray,
+    latency: np.ndarray,
+    success: np.ndarray,
+    sizes: np.ndarray,
+    label_names: List[str],
+    duration: float,
+    apdex_t: float
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """各标签统计与总体统计"""
+    label_count = len(label_names)
+    counts = np.bincount(labels, minlength=label_count)
+    failures = ~success
+    errors = np.bincount(labels, weights=failures, minlength=label_count)
+    latency_sum = np.bincount(labels, weights=latency, minlength=label_count)
+    bytes_sum = np.bincount(labels, weights=sizes, minlength=label_count)
+
+    # Apdex：成功且不超过 T 为满意，成功且不超过 4T 为可容忍，其余(含失败)为失望
+    satisfied = success & (latency <= apdex_t)
+    tolerating = success & (latency > apdex_t) & (latency <= 4 * apdex_t)
+    apdex_score = np.bincount(labels, weights=satisfied + 0.5 * tolerating, minlength=label_count)
+
+    # 一次排序得到各标签组内有序的延迟
+    order = np.lexsort((latency, labels))
+    sorted_latency = latency[order]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    present = counts > 0
+    percentiles = {
+        p: grouped_percentiles(sorted_latency, starts[present], counts[present], p)
+        for p in REPORT_PERCENTILES
+    }
+    minimum = sorted_latency[starts[present]]
+    maximum = sorted_latency[starts[present] + counts[present] - 1]
+
+    items = []
+    for position, label_id in enumerate(np.flatnonzero(present)):
+        count = int(counts[label_id])
+        item = {
+            "label": label_names[label_id],
+            "count": count,
+            "errors": int(errors[label_id]),
+            "error_rate": round(float(errors[label_id]) / count, 4),
+            "rps": round(count / duration, 2),
+            "avg": round(float(latency_sum[label_id]) / count, 2),
+            "min": round(float(minimum[position]), 2),
+            "max": round(float(maximum[position]), 2),
+            "bytes": int(bytes_sum[label_id]),
+            "apdex": round(float(apdex_score[label_id]) / count, 4),
+        }
+        item.update({f"p{p:g}": round(float(values[position]), 2) for p, values in percentiles.items()})
+        items.append(item)
+
+    total = int(len(latency))
+    total_errors = int(np.count_nonzero(failures))
+    overall = {
+        "count": total,
+        "errors": total_errors,
+        "error_rate": round(total_errors / total, 4),
+        "rps": round(total / duration, 2),
+        "avg": round(float(latency.mean(dtype=np.float64)), 2),
+        "min": round(float(sorted_latency.min()), 2),
+        "max": round(float(sorted_latency.max()), 2),
+        "bytes": int(sizes.sum(dtype=np.int64)),
+        "apdex": round(float(apdex_score.sum()) / total, 4),
+        "apdex_threshold": apdex_t,
+    }
+    overall.update({f"p{p:g}": round(float(v), 2) for p, v in zip(REPORT_PERCENTILES, np.percentile(latency, REPORT_PERCENTILES))})
+    return items, overall
+
+
+def _histogram_apdex(histogram: LatencyHistogram, errors: int, apdex_t: float) -> float:
+    """由直方图估算 Apdex：按桶代表值划分满意/可容忍，失败请求按比例从两者中扣除"""
+    values = np.array([bucket_value(i) for i in range(BUCKET_COUNT)])
+    counts = np.asarray(histogram.counts, dtype=np.float64)
+    satisfied = counts[values <= apdex_t].sum()
+    tolerating = counts[(values > apdex_t) & (values <= 4 * apdex_t)].sum()
+    success_ratio = 1 - errors / histogram.total
+    return float((satisfied + 0.5 * tolerating) * success_ratio / histogram.total)
+
+
+def _aggregate_item(histogram: LatencyHistogram, count: int, errors: int, size: int, duration: float, apdex_t: float) -> Dict[str, Any]:
+    """由精确汇总得到与 _label_stats 相同字段的统计"""
+    item = {
+        "count": count,
+        "errors": errors,
+        "error_rate": round(errors / count, 4),
+        "rps": round(count / duration, 2),
+        "avg": round(histogram.mean, 2),
+        "min": round(histogram.min, 2),
+        "max": round(histogram.max, 2),
+        "bytes": size,
+        "apdex": round(_histogram_apdex(histogram, errors, apdex_t), 4),
+    }
+    item.update({key: round(value, 2) for key, value in histogram.percentiles(REPORT_PERCENTILES).items()})
+    return item
+
+
+def _aggregate_stats(
+    aggregates: Dict[str, Any],
+    label_names: List[str],
+    duration: float,
+    apdex_t: float
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any], List[LatencyHistogram], LatencyHistogram]:
+    """非完整保留时由精确汇总计算各标签与总体统计，同时返回校正直方图(与标签统计顺序一致)"""
+    items, corrected = [], []
+    for label in label_names:
+        data = aggregates["labels"].get(label)
+        if not data or not data["count"]:
+            continue
+        histogram = LatencyHistogram.from_dict(data["histogram"])
+        items.append({"label": label, **_aggregate_item(histogram, data["count"], data["errors"], data["bytes"], duration, apdex_t)})
+        corrected.append(LatencyHistogram.from_dict(data["corrected"]))
+    overall = _aggregate_item(
+        LatencyHistogram.from_dict(aggregates["histogram"]),
+        aggregates["total"], aggregates["errors"], aggregates["bytes"], duration, apdex_t
+    )
+    overall["apdex_threshold"] = apdex_t
+    return items, overall, corrected, LatencyHistogram.from_dict(aggregates["corrected"])
+
+
+def _histogram_corrected(histogram: LatencyHistogram) -> Dict[str, Any]:
+    """由校正直方图得到校正延迟统计(发送延后的请求数与最大延后由保留行另行给出)"""
+    item = {"avg": round(histogram.mean, 2), "max": round(histogram.max, 2), "delayed": None, "max_delay": None}
+    item.update({key: round(value, 2) for key, value in histogram.percentiles(REPORT_PERCENTILES).items()})
+    return item
+
+
+def _corrected_stats(
+    labels: np.ndarray,
+    corrected: np.ndarray,
+    delay: np.ndarray,
+    label_count: int
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    协调遗漏校正后的各标签统计(与 _label_stats 的标签顺序一致)与总体统计
+
+    delayed 为实际发送晚于计划发送时间的请求数，max_delay 为最大发送延后(毫秒)。
+    """
+    counts = np.bincount(labels, minlength=label_count)
+    corrected_sum = np.bincount(labels, weights=corrected, minlength=label_count)
+    late = delay > 0
+    delayed = np.bincount(labels, weights=late, minlength=label_count)
+    max_delay = np.zeros(label_count)
+    np.maximum.at(max_delay, labels, delay)
+
+    order = np.lexsort((corrected, labels))
+    sorted_corrected = corrected[order]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    present = counts > 0
+    percentiles = {
+        p: grouped_percentiles(sorted_corrected, starts[present], counts[present], p)
+        for p in REPORT_PERCENTILES
+    }
+    maximum = sorted_corrected[starts[present] + counts[present] - 1]
+
+    items = []
+    for position, label_id in enumerate(np.flatnonzero(present)):
+        item = {
+            "avg": round(float(corrected_sum[label_id]) / int(counts[label_id]), 2),
+            "max": round(float(maximum[position]), 2),
+            "delayed": int(delayed[label_id]),
+            "max_delay": round(float(max_delay[label_id]), 2),
+        }
+        item.update({f"p{p:g}": round(float(values[position]), 2) for p, values in percentiles.items()})
+        items.append(item)
+
+    overall = {
+        "avg": round(float(corrected.mean(dtype=np.float64)), 2),
+        "max": round(float(sorted_corrected.max()), 2),
+        "delayed": int(np.count_nonzero(late)),
+        "max_delay": round(float(delay.max()), 2),
+    }
+    overall.update({f"p{p:g}": round(float(v), 2) for p, v in zip(REPORT_PERCENTILES, np.percentile(corrected, REPORT_PERCENTILES))})
+    return items, overall
+
+
+def _timeline(
+    timestamps: np.ndarray,
+    latency: np.ndarray,
+    success: np.ndarray,
+    start_ts: int,
+    weights: Optional[np.ndarray] = None
+) -> Tuple[Dict[str, Any], np.ndarray, np.ndarray, np.ndarray]:
+    """按秒的吞吐/延迟/错误序列，返回(报告序列, 每秒请求数, 每秒平均延迟, 每秒错误数)，给出行权重时按权重还原"""
+    seconds = ((timestamps - start_ts) // 1000).astype(np.int64)
+    if weights is None:
+        weights = np.ones(len(seconds))
+    requests = np.bincount(seconds, weights=weights)
+    errors = np.bincount(seconds, weights=~success * weights, minlength=len(requests))
+    latency_sum = np.bincount(seconds, weights=latency * weights, minlength=len(requests))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_latency = np.where(requests > 0, latency_sum / requests, 0.0)
+
+    # 序列过长时按 step 秒合并
+    step = max(1, int(np.ceil(len(requests) / REPORT_MAX_POINTS)))
+    points = int(np.ceil(len(requests) / step))
+    padded = points * step - len(requests)
+    merged_requests = np.pad(requests, (0, padded)).reshape(points, step).sum(axis=1)
+    merged_errors = np.pad(errors, (0, padded)).reshape(points, step).sum(axis=1)
+    merged_latency = np.pad(latency_sum, (0, padded)).reshape(points, step).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        merged_avg = np.where(merged_requests > 0, merged_latency / merged_requests, 0.0)
+    timeline = {
+        "step_seconds": step,
+        "offsets": (np.arange(points) * step).tolist(),
+        "rps": _round(merged_requests / step),
+        "avg_latency": _round(merged_avg),
+        "errors": np.rint(merged_errors).astype(np.int64).tolist(),
+    }
+    return timeline, requests, avg_latency, errors
+
+
+def _error_breakdown(
+    labels: np.ndarray,
+    status_codes: np.ndarray,
+    success: np.ndarray,
+    label_names: List[str],
+    weights: Optional[np.ndarray] = None
+) -> Dict[str, Any]:
+    """失败请求按状态码、按(标签, 状态码)的分布，给出行权重时按权重还原次数"""
+    failed = ~success
+    failed_codes = status_codes[failed].astype(np.int64)
+    failed_weights = np.ones(len(failed_codes)) if weights is None else np.asarray(weights, dtype=np.float64)[failed]
+    codes, code_inverse = np.unique(failed_codes, return_inverse=True)
+    code_counts = np.rint(np.bincount(code_inverse, weights=failed_weights, minlength=len(codes))).astype(np.int64)
+    pairs, pair_inverse = np.unique(labels[failed].astype(np.int64) * 65536 + failed_codes, return_inverse=True)
+    pair_counts = np.rint(np.bincount(pair_inverse, weights=failed_weights, minlength=len(pairs))).astype(np.int64)
+    order = np.argsort(-pair_counts, kind="stable")
+    return {
+        "by_status": [
+            {"status_code": int(code), "count": int(count)}
+            for code, count in sorted(zip(codes, code_counts), key=lambda item: -item[1])
+        ],
+        "by_label": [
+            {"label": label_names[int(pairs[i] // 65536)], "status_code": int(pairs[i] % 65536), "count": int(pair_counts[i])}
+            for i in order
+        ],
+    }
+
+
+def _concurrency_curve(requests: np.ndarray, avg_latency: np.ndarray) -> List[Dict[str, Any]]:
+    """
+    延迟-并发曲线
+
+    每秒并发数 L = λ × W(λ 为该秒吞吐，W 为平均延迟，单位秒)，按并发数分组后给出各组的平均并发、吞吐与延迟。
+    """
+    active = requests > 0
+    if not active.any():
+        return []
+    throughput = requests[active].astype(np.float64)
+    latency = avg_latency[active]
+    concurrency = throughput * latency / 1000
+    edges = np.linspace(concurrency.min(), concurrency.max(), CONCURRENCY_BINS + 1)
+    groups = np.clip(np.digitize(concurrency, edges[1:-1]), 0, CONCURRENCY_BINS - 1)
+    seconds = np.bincount(groups, minlength=CONCURRENCY_BINS)
+    sums = {
+        "concurrency": np.bincount(groups, weights=concurrency, minlength=CONCURRENCY_BINS),
+        "rps": np.bincount(groups, weights=throughput, minlength=CONCURRENCY_BINS),
+        # 延迟按请求数加权
+        "latency": np.bincount(groups, weights=latency * throughput, minlength=CONCURRENCY_BINS),
+    }
+    curve = []
+    for group in np.flatnonzero(seconds):
+        curve.append({
+            "concurrency": round(float(sums["concurrency"][group] / seconds[group]), 2),
+            "rps": round(float(sums["rps"][group] / seconds[group]), 2),
+            "avg_latency": round(float(sums["latency"][group] / sums["rps"][group]), 2),
+            "seconds": int(seconds[group]),
+        })
+    return curve
+
+
+def empty_report() -> Dict[str, Any]:
+    """无样本时的报告"""
+    return {"overall": {"count": 0, "errors": 0}, "labels": [], "timeline": None, "errors": None, "concurrency": []}
+
+
+def analyze(result: ColumnarResult, apdex_t: Optional[float] = None) -> Dict[str, Any]:
+    """
+    计算执行报告
+
+    Args:
+        result: 列式结果
+        apdex_t: Apdex 满意阈值(毫秒)，默认使用 APDEX_THRESHOLD_MS
+
+    Returns:
+        Dict: 报告，无样本时只包含空的总体统计
+    """
+    apdex_t = float(apdex_t or APDEX_THRESHOLD_MS)
+    aggregates = result.aggregates() if result.retention != "full" else None
+    if aggregates is not None:
+        return _analyze_aggregates(result, aggregates, apdex_t) if aggregates["total"] else empty_report()
+    if not result.rows:
+        return empty_report()
+
+    timestamps = np.asarray(result.column("timestamp"))
+    labels = np.asarray(result.column("label"))
+    latency = np.asarray(result.column("latency"), dtype=np.float64)
+    success = np.asarray(result.column("success"))
+    sizes = np.asarray(result.column("bytes"))
+    status_codes = np.asarray(result.column("status_code"))
+
+    start_ts = int(timestamps[0])
+    duration = max((int(timestamps[-1]) - start_ts) / 1000, 1.0)
+
+    items, overall = _label_stats(labels, latency, success, sizes, result.labels, duration, apdex_t)
+    overall["duration"] = round(duration, 3)
+    corrected = result.corrected_latency()
+    corrected_items, overall["corrected"] = _corrected_stats(labels, corrected, corrected - latency, len(result.labels))
+    for item, corrected_item in zip(items, corrected_items):
+        item["corrected"] = corrected_item
+    timeline, requests, avg_latency, _ = _timeline(timestamps, latency, success, start_ts)
+
+    return {
+        "start_ts": start_ts,
+        "end_ts": int(timestamps[-1]),
+        "overall": overall,
+        "labels": items,
+        "timeline": timeline,
+        "errors": _error_breakdown(labels, status_codes, success, result.labels),
+        "concurrency": _concurrency_curve(requests, avg_latency),
+    }
+
+
+def _analyze_aggregates(result: ColumnarResult, aggregates: Dict[str, Any], apdex_t: float) -> Dict[str, Any]:
+    """非完整保留结果的报告：统计取自精确汇总，时间序列与错误分布由保留行按权重还原"""
+    start_ts, end_ts = aggregates["first_ts"], aggregates["last_ts"]
+    duration = max((end_ts - start_ts) / 1000, 1.0)
+    items, overall, corrected_histograms, corrected_overall = _aggregate_stats(aggregates, result.labels, duration, apdex_t)
+    overall["duration"] = round(duration, 3)
+    overall["corrected"] = _histogram_corrected(corrected_overall)
+    for item, histogram in zip(items, corrected_histograms):
+        item["corrected"] = _histogram_corrected(histogram)
+    report = {
+        "start_ts": start_ts,
+        "end_ts": end_ts,
+        "overall": overall,
+        "labels": items,
+        "timeline": None,
+        "errors": None,
+        "concurrency": [],
+        "retention": {"mode": result.retention, "rows": result.rows},
+    }
+    if not result.rows:
+        return report
+
+    timestamps = np.asarray(result.column("timestamp"))
+    labels = np.asarray(result.column("label"))
+    latency = np.asarray(result.column("latency"), dtype=np.float64)
+    success = np.asarray(result.column("success"))
+    weights = np.asarray(result.column("weight"), dtype=np.float64)
+
+    # 发送延后的请求数按权重还原，最大延后取自保留行
+    delay = result.corrected_latency() - latency
+    label_count = len(result.labels)
+    delayed = np.bincount(labels, weights=(delay > 0) * weights, minlength=label_count)
+    max_delay = np.zeros(label_count)
+    np.maximum.at(max_delay, labels, delay)
+    for item in items:
+        label_id = result.label_id(item["label"])
+        item["corrected"]["delayed"] = int(round(float(delayed[label_id])))
+        item["corrected"]["max_delay"] = round(float(max_delay[label_id]), 2)
+    overall["corrected"]["delayed"] = int(round(float(delayed.sum())))
+    overall["corrected"]["max_delay"] = round(float(delay.max()), 2)
+
+    timeline, requests, avg_latency, _ = _timeline(timestamps, latency, success, start_ts, weights)
+    report["timeline"] = timeline
+    report["errors"] = _error_breakdown(labels, np.asarray(result.column("status_code")), success, result.labels, weights)
+    report["concurrency"] = _concurrency_curve(requests, avg_latency)
+    return report
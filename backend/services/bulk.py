@@ -0,0 +1,45 @@
+"""
+批量操作辅助模块
+统一记录批量接口的逐条处理结果
+"""
+from typing import Any, Dict, List, Optional
+
+
+class BulkResult:
+    """
+    批量操作结果
+
+    每个请求条目对应一条结果，按请求顺序返回：
+    {"index": 0, "success": True, "id": 12} 或 {"index": 1, "success": False, "error": "..."}
+    """
+
+    def __init__(self, total: int):
+        self._results: List[Dict[str, Any]] = [
+            {"index": index, "success": True, "id": None} for index in range(total)
+        ]
+
+    def fail(self, index: int, error: str) -> None:
+        """标记条目失败，同一条目只保留第一个错误"""
+        result = self._results[index]
+        if result["success"]:
+            self._results[index] = {"index": index, "success": False, "error": error}
+
+    def succeed(self, index: int, item_id: Optional[int]) -> None:
+        """记录条目成功及其ID"""
+        self._results[index]["id"] = item_id
+
+    def is_failed(self, index: int) -> bool:
+        return not self._results[index]["success"]
+
+    def pending(self) -> List[int]:
+        """尚未失败的条目下标"""
+        return [r["index"] for r in self._results if r["success"]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        succeeded = sum(1 for r in self._results if r["success"])
+        return {
+            "total": len(self._results),
+            "succeeded": succeeded,
+            "failed": len(self._results) - succeeded,
+            "results": self._results
+        }
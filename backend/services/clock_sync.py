@@ -0,0 +1,60 @@
+"""
+从机时钟同步模块
+按 NTP 的方式通过心跳交换估计每台从机的时钟偏差，采样入库时将从机时间戳换算到服务器时间：
+
+    从机发送心跳时记录 t0，服务器收到时记录 t1、响应前记录 t2，从机收到响应时记录 t3，
+    下一次心跳携带上一次交换的 (t0, t1, t2, t3)：
+        往返时延 delay  = (t3 - t0) - (t2 - t1)
+        时钟偏差 offset = ((t1 - t0) + (t2 - t3)) / 2      (服务器时间 - 从机时间)
+
+单次交换的误差不超过 delay / 2，因此在最近 CLOCK_SYNC_WINDOW 次交换中取往返时延最小的一次作为估计。
+偏差同时保存在 SlaveConfig 上，服务重启后在首次交换前沿用上次的估计。
+"""
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from config import CLOCK_SYNC_WINDOW, CLOCK_SYNC_MAX_RTT
+from models import SlaveConfig
+
+
+class ClockSync:
+    """各从机的时钟偏差估计"""
+
+    def __init__(self, window: int = CLOCK_SYNC_WINDOW):
+        self.window = window
+        # 从机ID -> 最近交换的 (往返时延, 偏差)
+        self._samples: Dict[int, Deque[Tuple[float, float]]] = {}
+        self._offsets: Dict[int, float] = {}
+
+    def add(self, slave_id: int, t0: int, t1: int, t2: int, t3: int) -> Optional[Tuple[float, float]]:
+        """
+        记录一次时钟交换(毫秒时间戳)
+
+        Returns:
+            Optional[Tuple[float, float]]: 更新后的 (偏差, 所用交换的往返时延)；交换无效时返回 None
+        """
+        delay = (t3 - t0) - (t2 - t1)
+        if delay < 0 or t3 < t0 or t2 < t1 or delay > CLOCK_SYNC_MAX_RTT:
+            return None
+        offset = ((t1 - t0) + (t2 - t3)) / 2
+        samples = self._samples.get(slave_id)
+        if samples is None:
+            samples = self._samples[slave_id] = deque(maxlen=self.window)
+        samples.append((delay, offset))
+        best_delay, best_offset = min(samples)
+        self._offsets[slave_id] = best_offset
+        return best_offset, best_delay
+
+    def offset(self, slave_id: Optional[int]) -> int:
+        """从机时间换算到服务器时间需要加上的毫秒数，未知时为 0"""
+        if slave_id is None:
+            return 0
+        return int(round(self._offsets.get(slave_id, 0.0)))
+
+    async def load(self) -> None:
+        """启动时恢复已保存的偏差"""
+        rows = await SlaveConfig.filter(is_deleted=False, clock_offset__isnull=False).values_list('id', 'clock_offset')
+        self._offsets.update(rows)
+
+
+clock_sync = ClockSync()
@@ -0,0 +1,183 @@
+"""
+基线对比模块
+在两次执行的 标签 × 延迟分桶 直方图上逐标签比较，所有标签一次向量化计算：
+
+- 分位数差异：分位数的置信区间由顺序统计量给出，
+  秩区间 n·q ± z·sqrt(n·q·(1-q)) 对应的桶即区间上下界；候选区间下界高于基线区间上界视为显著变慢
+- Mann–Whitney U 检验：桶内视为并列，按桶累计计算 U 统计量并做并列校正，
+  单侧 p 值检验候选延迟是否整体偏大
+- 错误率：两比例 z 检验
+
+显著(p < REGRESSION_ALPHA)且 p95 相对变慢超过 REGRESSION_MIN_DELTA 的标签判定为性能回退；
+错误率显著升高同样判定为回退。
+"""
+import math
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from config import REGRESSION_ALPHA, REGRESSION_MIN_DELTA
+from services.metrics import BUCKET_COUNT, bucket_value
+from services.result_store import ColumnarResult
+
+COMPARISON_PERCENTILES = (50, 90, 95, 99)
+# 95% 置信水平
+CONFIDENCE_Z = 1.96
+
+_BUCKET_VALUES = np.array([bucket_value(i) for i in range(BUCKET_COUNT)])
+_erfc = np.vectorize(math.erfc, otypes=[np.float64])
+
+
+def _values_at_ranks(cumulative: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """各行累计计数中第 rank 个样本(从 1 开始)所在桶的代表值"""
+    indices = (cumulative < ranks[:, None]).sum(axis=1)
+    return _BUCKET_VALUES[np.minimum(indices, BUCKET_COUNT - 1)]
+
+
+def percentile_bounds(histograms: np.ndarray, q: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    各行直方图的分位数估计及其置信区间
+
+    Returns:
+        (估计值, 区间下界, 区间上界)
+    """
+    counts = histograms.sum(axis=1).astype(np.float64)
+    cumulative = np.cumsum(histograms, axis=1)
+    p = q / 100
+    center = np.ceil(counts * p)
+    spread = CONFIDENCE_Z * np.sqrt(counts * p * (1 - p))
+    low_rank = np.clip(np.floor(counts * p - spread), 1, np.maximum(counts, 1))
+    high_rank = np.clip(np.ceil(counts * p + spread), 1, np.maximum(counts, 1))
+    return (
+        _values_at_ranks(cumulative, np.clip(center, 1, np.maximum(counts, 1))),
+        _values_at_ranks(cumulative, low_rank),
+        _values_at_ranks(cumulative, high_rank),
+    )
+
+
+def mann_whitney(baseline: np.ndarray, candidate: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    分桶数据上的 Mann–Whitney U 检验(逐行)
+
+    U 为 候选样本大于基线样本 的对数(并列计 1/2)，方差按桶内并列校正。
+
+    Returns:
+        (效应量 U/(n1·n2)，即候选比基线慢的概率；单侧 p 值)
+    """
+    baseline = baseline.astype(np.float64)
+    candidate = candidate.astype(np.float64)
+    n1 = baseline.sum(axis=1)
+    n2 = candidate.sum(axis=1)
+    below = np.cumsum(baseline, axis=1) - baseline
+    u = (candidate * (below + baseline / 2)).sum(axis=1)
+
+    n = n1 + n2
+    ties = baseline + candidate
+    tie_term = (ties ** 3 - ties).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+        z = (u - n1 * n2 / 2) / np.sqrt(variance)
+        effect = u / (n1 * n2)
+    z = np.where(variance > 0, z, 0.0)
+    p_value = 0.5 * _erfc(z / math.sqrt(2))
+    return np.nan_to_num(effect, nan=0.5), p_value
+
+
+def error_rate_test(base_errors: np.ndarray, base_counts: np.ndarray, errors: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """两比例 z 检验，返回候选错误率更高的单侧 p 值"""
+    base_errors = base_errors.astype(np.float64)
+    errors = errors.astype(np.float64)
+    pooled = (base_errors + errors) / np.maximum(base_counts + counts, 1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        se = np.sqrt(pooled * (1 - pooled) * (1 / base_counts + 1 / counts))
+        z = (errors / counts - base_errors / base_counts) / se
+    z = np.where(se > 0, z, 0.0)
+    return 0.5 * _erfc(z / math.sqrt(2))
+
+
+def _label_errors(report: Dict[str, Any]) -> Dict[str, int]:
+    return {item["label"]: item["errors"] for item in report.get("labels", [])}
+
+
+def compare_results(
+    baseline: ColumnarResult,
+    candidate: ColumnarResult,
+    baseline_report: Dict[str, Any],
+    candidate_report: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    逐标签比较候选执行与基线执行
+
+    Args:
+        baseline/candidate: 两次执行的列式结果
+        baseline_report/candidate_report: 两次执行的分析报告(提供各标签错误数)
+
+    Returns:
+        Dict: {"regressed": bool, "labels": [...], "missing_labels": [...], "new_labels": [...]}
+    """
+    shared = [label for label in candidate.labels if baseline.label_id(label) is not None]
+    base_hist = baseline.histograms()[[baseline.label_id(label) for label in shared]] if shared else np.zeros((0, BUCKET_COUNT))
+    cand_hist = candidate.histograms()[[candidate.label_id(label) for label in shared]] if shared else np.zeros((0, BUCKET_COUNT))
+    base_counts = base_hist.sum(axis=1)
+    cand_counts = cand_hist.sum(axis=1)
+    # 任一侧无样本的标签不参与比较
+    valid = (base_counts > 0) & (cand_counts > 0)
+    shared = [label for label, ok in zip(shared, valid) if ok]
+    base_hist, cand_hist = base_hist[valid], cand_hist[valid]
+    base_counts, cand_counts = base_counts[valid], cand_counts[valid]
+
+    effect, p_value = mann_whitney(base_hist, cand_hist)
+
+    base_error_map = _label_errors(baseline_report)
+    cand_error_map = _label_errors(candidate_report)
+    base_errors = np.array([base_error_map.get(label, 0) for label in shared], dtype=np.float64)
+    cand_errors = np.array([cand_error_map.get(label, 0) for label in shared], dtype=np.float64)
+    error_p = error_rate_test(base_errors, base_counts, cand_errors, cand_counts)
+
+    bounds = {q: (percentile_bounds(base_hist, q), percentile_bounds(cand_hist, q)) for q in COMPARISON_PERCENTILES}
+    base_p95, cand_p95 = bounds[95][0][0], bounds[95][1][0]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        p95_delta = np.where(base_p95 > 0, (cand_p95 - base_p95) / base_p95, 0.0)
+    latency_regressed = (p_value < REGRESSION_ALPHA) & (p95_delta > REGRESSION_MIN_DELTA)
+    error_regressed = error_p < REGRESSION_ALPHA
+
+    items: List[Dict[str, Any]] = []
+    for i, label in enumerate(shared):
+        percentiles = {}
+        for q, ((b_est, b_low, b_high), (c_est, c_low, c_high)) in bounds.items():
+            percentiles[f"p{q:g}"] = {
+                "baseline": round(float(b_est[i]), 2),
+                "candidate": round(float(c_est[i]), 2),
+                "delta_pct": round(float((c_est[i] - b_est[i]) / b_est[i]), 4) if b_est[i] else None,
+                "baseline_ci": [round(float(b_low[i]), 2), round(float(b_high[i]), 2)],
+                "candidate_ci": [round(float(c_low[i]), 2), round(float(c_high[i]), 2)],
+                # 置信区间不重叠
+                "significant": bool(c_low[i] > b_high[i] or c_high[i] < b_low[i]),
+            }
+        items.append({
+            "label": label,
+            "baseline_count": int(base_counts[i]),
+            "candidate_count": int(cand_counts[i]),
+            "percentiles": percentiles,
+            "mann_whitney": {"effect": round(float(effect[i]), 4), "p_value": float(p_value[i])},
+            "error_rate": {
+                "baseline": round(float(base_errors[i] / base_counts[i]), 4),
+                "candidate": round(float(cand_errors[i] / cand_counts[i]), 4),
+                "p_value": float(error_p[i]),
+            },
+            "latency_regressed": bool(latency_regressed[i]),
+            "error_regressed": bool(error_regressed[i]),
+            "regressed": bool(latency_regressed[i] or error_regressed[i]),
+        })
+    # 回退标签排在前面，其余按效应量降序
+    items.sort(key=lambda item: (not item["regressed"], -item["mann_whitney"]["effect"]))
+
+    return {
+        "regressed": any(item["regressed"] for item in items),
+        "regressed_labels": [item["label"] for item in items if item["regressed"]],
+        "alpha": REGRESSION_ALPHA,
+        "min_delta": REGRESSION_MIN_DELTA,
+        "labels": items,
+        "missing_labels": [label for label in baseline.labels if candidate.label_id(label) is None],
+        "new_labels": [label for label in candidate.labels if baseline.label_id(label) is None],
+    }
@@ -0,0 +1,145 @@
+"""
+cron 表达式解析模块
+支持标准 5 段格式：分 时 日 月 周
+
+- 每段支持 *、数字、范围 a-b、步长 */n 与 a-b/n、逗号列表
+- 月份与星期支持英文缩写(JAN-DEC、SUN-SAT)，星期 0 与 7 都表示周日
+- 支持 @yearly/@annually/@monthly/@weekly/@daily/@midnight/@hourly
+- 日与周同时受限时按标准 cron 语义取并集(满足其一即触发)
+"""
+from datetime import datetime, timedelta
+from typing import Dict, FrozenSet, Optional, Tuple
+
+MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+MONTH_NAMES = {name: i for i, name in enumerate(
+    ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"), start=1
+)}
+WEEKDAY_NAMES = {name: i for i, name in enumerate(("SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"))}
+
+# (字段名, 最小值, 最大值, 名称表)
+FIELDS: Tuple[Tuple[str, int, int, Dict[str, int]], ...] = (
+    ("分钟", 0, 59, {}),
+    ("小时", 0, 23, {}),
+    ("日", 1, 31, {}),
+    ("月", 1, 12, MONTH_NAMES),
+    ("星期", 0, 7, WEEKDAY_NAMES),
+)
+
+# 最多向后搜索的年数(2 月 29 日且限定星期的表达式最长 28 年触发一次)
+SEARCH_YEARS = 28
+
+
+def _parse_value(text: str, name: str, low: int, high: int, names: Dict[str, int]) -> int:
+    value = names.get(text.upper())
+    if value is None:
+        if not text.isdigit():
+            raise ValueError(f"{name}字段取值无效: {text}")
+        value = int(text)
+    if not low <= value <= high:
+        raise ValueError(f"{name}字段取值超出范围 {low}-{high}: {text}")
+    return value
+
+
+def _parse_field(text: str, name: str, low: int, high: int, names: Dict[str, int]) -> FrozenSet[int]:
+    values = set()
+    for part in text.split(","):
+        if not part:
+            raise ValueError(f"{name}字段格式无效: {text}")
+        base, _, step_text = part.partition("/")
+        step = 1
+        if step_text:
+            if not step_text.isdigit() or int(step_text) == 0:
+                raise ValueError(f"{name}字段步长无效: {part}")
+            step = int(step_text)
+        if base == "*":
+            start, end = low, high
+        elif "-" in base:
+            start_text, end_text = base.split("-", 1)
+            start = _parse_value(start_text, name, low, high, names)
+            end = _parse_value(end_text, name, low, high, names)
+            if start > end:
+                raise ValueError(f"{name}字段范围无效: {part}")
+        else:
+            start = _parse_value(base, name, low, high, names)
+            # 单个值带步长(如 5/15)表示从该值到最大值
+            end = high if step_text else start
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronExpression:
+    """解析后的 cron 表达式"""
+
+    def __init__(self, expression: str):
+        self.expression = expression.strip()
+        text = MACROS.get(self.expression.lower(), self.expression)
+        parts = text.split()
+        if len(parts) != 5:
+            raise ValueError("cron 表达式须为 5 段: 分 时 日 月 周")
+        parsed = [_parse_field(part, *spec) for part, spec in zip(parts, FIELDS)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # 7 与 0 都表示周日
+        self.weekdays = frozenset(day % 7 for day in weekdays)
+        self.day_restricted = parts[2] != "*"
+        self.weekday_restricted = parts[4] != "*"
+        self._sorted_minutes = sorted(self.minutes)
+
+    def __repr__(self) -> str:
+        return f"CronExpression({self.expression!r})"
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        # isoweekday 周一为 1、周日为 7
+        weekday_ok = moment.isoweekday() % 7 in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        if self.day_restricted:
+            return day_ok
+        if self.weekday_restricted:
+            return weekday_ok
+        return True
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        严格晚于 moment 的下一个触发时间(精确到分钟)
+
+        按 月 -> 日 -> 时 -> 分 逐级跳过不匹配的区间，带时区的 moment 按其时区的本地时间计算。
+
+        Raises:
+            ValueError: 表达式不会再触发(如 2 月 30 日)
+        """
+        current = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = current.year + SEARCH_YEARS
+        while current.year <= limit:
+            if current.month not in self.months:
+                year, month = (current.year + 1, 1) if current.month == 12 else (current.year, current.month + 1)
+                current = current.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(current):
+                current = (current + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if current.hour not in self.hours:
+                current = (current + timedelta(hours=1)).replace(minute=0)
+                continue
+            minute = next((m for m in self._sorted_minutes if m >= current.minute), None)
+            if minute is None:
+                current = (current + timedelta(hours=1)).replace(minute=0)
+                continue
+            return current.replace(minute=minute)
+        raise ValueError(f"cron 表达式不会再触发: {self.expression}")
+
+
+def parse_cron(expression: Optional[str]) -> Optional[CronExpression]:
+    """解析 cron 表达式，为空时返回 None"""
+    if not expression or not expression.strip():
+        return None
+    return CronExpression(expression)
@@ -0,0 +1,214 @@
+"""
+仪表盘汇总模块
+在内存中持续维护仪表盘所需的汇总数据，读取时不再查询明细表：
+- 项目/脚本/测试计划数量：模型写入后由后台任务重新计数
+- 平台吞吐：按到达时间的秒级环形缓冲
+- 延迟趋势：按分钟汇总，分钟结束时写入时序表，启动时从时序表恢复
+- 从机资源：从机写入(含心跳)后由后台任务重新加载
+"""
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Type
+
+from tortoise import timezone
+from tortoise.models import Model
+
+from config import DASHBOARD_TREND_MINUTES, DASHBOARD_RPS_WINDOW, SLAVE_HEARTBEAT_TIMEOUT
+from models import Project, Script, TestPlan, SlaveConfig, MetricPoint
+from services.copy_insert import bulk_insert
+from services.metrics import SecondBucket
+from services.pagination import count_cache
+
+# 计数项 -> 模型
+COUNTED_MODELS: Dict[str, Type[Model]] = {
+    "projects": Project,
+    "scripts": Script,
+    "test_plans": TestPlan,
+}
+
+# 平台趋势写入时序表使用的指标名
+TREND_METRICS = ("rps", "avg_latency", "error_rate")
+
+
+class DashboardRollup:
+    """仪表盘汇总数据"""
+
+    def __init__(self, trend_minutes: int, rps_window: int, heartbeat_timeout: int):
+        self.trend_minutes = trend_minutes
+        self.rps_window = rps_window
+        self.heartbeat_timeout = heartbeat_timeout
+        self.counts: Dict[str, int] = {name: 0 for name in COUNTED_MODELS}
+        # 待重新计数/加载的模型名
+        self._dirty: Set[str] = {model.__name__ for model in COUNTED_MODELS.values()} | {SlaveConfig.__name__}
+        self._fleet: Dict[int, Dict[str, Any]] = {}
+        # 平台秒级/分钟级汇总(按采样到达时间)
+        self._second = 0
+        self._second_bucket = SecondBucket()
+        self._seconds: Deque[Tuple[int, SecondBucket]] = deque(maxlen=max(rps_window * 2, 60))
+        self._minute = 0
+        self._minute_bucket = SecondBucket()
+        self._minutes: Deque[Tuple[int, SecondBucket]] = deque(maxlen=trend_minutes)
+        self._unsaved_minutes: List[Tuple[int, SecondBucket]] = []
+        self.loaded = False
+
+    # ==================== 写入 ====================
+
+    def mark_dirty(self, model: Type[Model]) -> None:
+        """模型发生写入，下次后台刷新时重新统计"""
+        if model in COUNTED_MODELS.values() or model is SlaveConfig:
+            self._dirty.add(model.__name__)
+
+    def record(self, batch: SecondBucket, now: Optional[float] = None) -> None:
+        """记录一批到达的采样"""
+        self._rotate(now if now is not None else time.time())
+        self._second_bucket.merge(batch)
+        self._minute_bucket.merge(batch)
+
+    def _rotate(self, now: float) -> None:
+        second = int(now)
+        if second != self._second:
+            if self._second_bucket.count:
+                self._seconds.append((self._second, self._second_bucket))
+                self._second_bucket = SecondBucket()
+            self._second = second
+        minute = second - second % 60
+        if minute != self._minute:
+            if self._minute and self._minute_bucket.count:
+                closed = (self._minute, self._minute_bucket)
+                self._minutes.append(closed)
+                self._unsaved_minutes.append(closed)
+                self._minute_bucket = SecondBucket()
+            self._minute = minute
+
+    # ==================== 后台刷新 ====================
+
+    async def load(self) -> None:
+        """启动时恢复延迟趋势，并完成首次计数"""
+        since = int(time.time()) // 60 * 60 - self.trend_minutes * 60
+        points = await MetricPoint.filter(
+            source="platform", execution_id=None, name__in=TREND_METRICS, ts__gte=since
+        ).order_by('ts').values_list('ts', 'name', 'value')
+        minutes: Dict[int, Dict[str, float]] = {}
+        for ts, name, value in points:
+            minutes.setdefault(ts, {})[name] = value
+        self._minutes.clear()
+        for ts, values in sorted(minutes.items()):
+            bucket = SecondBucket()
+            bucket.count = int(round(values.get("rps", 0) * 60))
+            bucket.errors = int(round(values.get("error_rate", 0) * bucket.count))
+            bucket.latency_sum = values.get("avg_latency", 0) * bucket.count
+            self._minutes.append((ts, bucket))
+        await self.refresh()
+        self.loaded = True
+
+    async def refresh(self) -> None:
+        """后台周期调用：滚动时间窗口、持久化已结束的分钟、刷新被写入过的统计"""
+        self._rotate(time.time())
+
+        if self._unsaved_minutes:
+            minutes, self._unsaved_minutes = self._unsaved_minutes, []
+            await bulk_insert([
+                MetricPoint(source="platform", name=name, ts=ts, value=value)
+                for ts, bucket in minutes
+                for name, value in zip(TREND_METRICS, (bucket.count / 60, bucket.avg_latency, bucket.error_rate))
+            ])
+
+        dirty, self._dirty = self._dirty, set()
+        for name, model in COUNTED_MODELS.items():
+            if model.__name__ in dirty:
+                self.counts[name] = await model.filter(is_deleted=False).count()
+        if SlaveConfig.__name__ in dirty:
+            slaves = await SlaveConfig.filter(is_deleted=False).values(
+                'id', 'name', 'ip_address', 'status', 'is_active', 'cpu_usage', 'memory_usage',
+                'disk_usage', 'current_tasks', 'max_concurrent_tasks', 'last_heartbeat'
+            )
+            self._fleet = {slave["id"]: slave for slave in slaves}
+
+    # ==================== 读取 ====================
+
+    def throughput(self) -> Dict[str, Any]:
+        """平台最近 rps_window 秒的吞吐、平均延迟与错误率"""
+        now_second = int(time.time())
+        self._rotate(now_second)
+        since = now_second - self.rps_window
+        window = SecondBucket()
+        for second, bucket in self._seconds:
+            if second >= since:
+                window.merge(bucket)
+        return {
+            "rps": round(window.count / self.rps_window, 2),
+            "avg_latency": round(window.avg_latency, 2),
+            "error_rate": round(window.error_rate, 4),
+            "window_seconds": self.rps_window
+        }
+
+    def trend(self) -> List[Dict[str, Any]]:
+        """最近 trend_minutes 分钟的吞吐/延迟/失败数趋势，无流量的分钟补零"""
+        current = int(time.time()) // 60 * 60
+        minutes = dict(self._minutes)
+        points = []
+        for ts in range(current - self.trend_minutes * 60, current, 60):
+            bucket = minutes.get(ts) or SecondBucket()
+            points.append({
+                "ts": ts,
+                "time": datetime.fromtimestamp(ts).strftime("%H:%M"),
+                "rps": round(bucket.count / 60, 2),
+                "latency": round(bucket.avg_latency, 2),
+                "failures": bucket.errors
+            })
+        return points
+
+    def fleet(self) -> Dict[str, Any]:
+        """从机资源利用情况，超过心跳超时未上报的从机视为离线"""
+        now = timezone.now()
+        nodes = []
+        online = busy = capacity = used = 0
+        cpu = []
+        memory = []
+        for slave in self._fleet.values():
+            status = slave["status"]
+            heartbeat = slave["last_heartbeat"]
+            if status == "online" and heartbeat and (now - heartbeat).total_seconds() > self.heartbeat_timeout:
+                status = "offline"
+            if status == "online" and slave["is_active"]:
+                online += 1
+                capacity += slave["max_concurrent_tasks"]
+                used += slave["current_tasks"]
+                if slave["current_tasks"]:
+                    busy += 1
+                if slave["cpu_usage"] is not None:
+                    cpu.append(slave["cpu_usage"])
+                if slave["memory_usage"] is not None:
+                    memory.append(slave["memory_usage"])
+            nodes.append({
+                "id": slave["id"],
+                "name": slave["name"],
+                "ip_address": slave["ip_address"],
+                "status": status,
+                "cpu_usage": slave["cpu_usage"],
+                "memory_usage": slave["memory_usage"],
+                "disk_usage": slave["disk_usage"],
+                "current_tasks": slave["current_tasks"],
+                "max_concurrent_tasks": slave["max_concurrent_tasks"],
+                "last_heartbeat": heartbeat
+            })
+        nodes.sort(key=lambda node: node["id"])
+        return {
+            "total": len(nodes),
+            "online": online,
+            "offline": len(nodes) - online,
+            "busy": busy,
+            "capacity": capacity,
+            "used": used,
+            "utilization": round(used / capacity, 4) if capacity else 0.0,
+            "avg_cpu": round(sum(cpu) / len(cpu), 2) if cpu else None,
+            "avg_memory": round(sum(memory) / len(memory), 2) if memory else None,
+            "nodes": nodes
+        }
+
+
+dashboard = DashboardRollup(DASHBOARD_TREND_MINUTES, DASHBOARD_RPS_WINDOW, SLAVE_HEARTBEAT_TIMEOUT)
+
+# 任意写入(含信号触发与手动失效)都会经过计数缓存，借此标记需要刷新的统计
+count_cache.add_listener(dashboard.mark_dirty)
@@ -0,0 +1,135 @@
+"""
+测试数据集模块
+- 上传：按块流式写入磁盘，同时计算 SHA-256、大小与行数，不把整个文件读入内存
+- 切分：按字节偏移把数据区(表头之后)均分为 N 段，每个切分点向后对齐到下一行的行首，
+  只需 N 次定位读取、不改写原文件；各分片互不重叠且完整覆盖全部数据行
+- 下发：从机只下载自己的分片，响应先输出表头行，再按块读取分片的字节区间
+"""
+import asyncio
+import hashlib
+import os
+import uuid
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from fastapi import UploadFile
+
+from config import DATASET_DIR, DATASET_MAX_SIZE, DATASET_CHUNK_SIZE
+from models import TestExecution
+
+
+class DatasetTooLarge(Exception):
+    """上传文件超过 DATASET_MAX_SIZE"""
+
+
+async def save_upload(upload: UploadFile, has_header: bool) -> Dict:
+    """
+    将上传文件按块写入数据集目录
+
+    Returns:
+        Dict: {"file_path", "file_size", "line_count", "checksum"}
+
+    Raises:
+        DatasetTooLarge: 文件超过大小上限(已写入的部分会被删除)
+    """
+    os.makedirs(DATASET_DIR, exist_ok=True)
+    extension = os.path.splitext(upload.filename or "")[1] or ".csv"
+    file_path = os.path.join(DATASET_DIR, f"{uuid.uuid4().hex}{extension}")
+    digest = hashlib.sha256()
+    size = newlines = 0
+    last_byte = b""
+    try:
+        with open(file_path, "wb") as f:
+            while True:
+                chunk = await upload.read(DATASET_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > DATASET_MAX_SIZE:
+                    raise DatasetTooLarge()
+                digest.update(chunk)
+                newlines += chunk.count(b"\n")
+                last_byte = chunk[-1:]
+                await asyncio.to_thread(f.write, chunk)
+    except BaseException:
+        os.remove(file_path)
+        raise
+
+    # 最后一行没有换行符时同样计为一行
+    lines = newlines + (1 if size and last_byte != b"\n" else 0)
+    if has_header and lines:
+        lines -= 1
+    return {"file_path": file_path, "file_size": size, "line_count": lines, "checksum": digest.hexdigest()}
+
+
+def _line_end(f, offset: int, size: int) -> int:
+    """offset 所在行之后下一行的行首；offset 恰为行首时返回 offset"""
+    if offset <= 0:
+        return 0
+    f.seek(offset - 1)
+    position = offset - 1
+    while position < size:
+        chunk = f.read(64 * 1024)
+        if not chunk:
+            break
+        index = chunk.find(b"\n")
+        if index >= 0:
+            return position + index + 1
+        position += len(chunk)
+    return size
+
+
+def read_header(path: str) -> bytes:
+    """表头行(含换行符)"""
+    with open(path, "rb") as f:
+        return f.readline()
+
+
+@lru_cache(maxsize=256)
+def _partition_ranges(path: str, size: int, parts: int, has_header: bool) -> Tuple[Tuple[int, int], ...]:
+    with open(path, "rb") as f:
+        data_start = _line_end(f, 1, size) if has_header and size else 0
+        span = size - data_start
+        bounds = [data_start]
+        for i in range(1, parts):
+            target = data_start + span * i // parts
+            bounds.append(max(bounds[-1], _line_end(f, target, size)))
+        bounds.append(size)
+    return tuple(zip(bounds[:-1], bounds[1:]))
+
+
+def partition_ranges(path: str, parts: int, has_header: bool) -> List[Tuple[int, int]]:
+    """
+    将数据区切分为 parts 段，返回各段的字节区间 [start, end)
+
+    切分点对齐到行首，分片按字节大致均分；数据行少于分片数时部分分片为空。
+    数据集文件上传后不再修改，结果按(路径, 大小, 分片数)缓存。
+    """
+    return list(_partition_ranges(path, os.path.getsize(path), max(parts, 1), has_header))
+
+
+def iter_file_range(path: str, start: int, end: int, prefix: bytes = b"") -> Iterator[bytes]:
+    """按块读取文件的字节区间，可在最前面附加表头"""
+    if prefix:
+        yield prefix
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = f.read(min(DATASET_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def slave_partition(execution: TestExecution, slave_id: int) -> Optional[Tuple[int, int]]:
+    """
+    从机在执行中的分片(序号, 分片数)，从机不属于该执行时返回 None
+
+    分片归属以执行启动时的从机列表为准，启动失败的从机其分片空置，不会重新分配给其他从机造成重复。
+    """
+    slave_ids = execution.partition_slave_ids or execution.slave_ids
+    if slave_id not in slave_ids:
+        return None
+    return slave_ids.index(slave_id), len(slave_ids)
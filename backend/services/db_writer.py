@@ -0,0 +1,107 @@
+"""
+单写入者模块
+SQLite 同一时刻只允许一个写事务，心跳、采样写入、实时汇总等高频写入并发时，
+每条语句各自提交既放大 fsync 次数，也容易在多进程部署下触发 "database is locked"。
+
+开启 SQLITE_SINGLE_WRITER 时，高频写入提交到队列，由唯一的写入任务串行执行：
+到达的写入最多 SQLITE_WRITE_BATCH 个合并为一个事务提交，每个写入在各自的保存点中执行，
+单个写入失败只回滚自身并把异常抛回调用方；写入高峰时请求排队等待而不是报错。
+事务提交后才返回结果给调用方。非 SQLite 数据库或未开启时直接执行。
+"""
+import asyncio
+import contextvars
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, TypeVar
+
+from tortoise.transactions import in_transaction
+
+from config import TORTOISE_ORM, SQLITE_SINGLE_WRITER, SQLITE_WRITE_BATCH, SQLITE_WRITE_DELAY
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+# (写入函数, 结果)
+Job = Tuple[Callable[[], Awaitable[Any]], asyncio.Future]
+
+# 写入任务内部再次提交的写入直接执行，避免等待自身
+_in_writer: contextvars.ContextVar[bool] = contextvars.ContextVar("in_db_writer", default=False)
+
+
+class DbWriter:
+    """SQLite 单写入者"""
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._queue is not None
+
+    async def submit(self, func: Callable[[], Awaitable[T]]) -> T:
+        """提交写入并等待其所在事务提交，返回写入函数的结果"""
+        if self._queue is None or _in_writer.get():
+            return await func()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((func, future))
+        return await future
+
+    async def run(self) -> None:
+        """写入任务主循环(随应用启动)，SQLite 且开启 SQLITE_SINGLE_WRITER 时才接管写入"""
+        engine = TORTOISE_ORM["connections"]["default"]["engine"]
+        if not SQLITE_SINGLE_WRITER or engine != "tortoise.backends.sqlite":
+            return
+        queue = self._queue = asyncio.Queue()
+        _in_writer.set(True)
+        try:
+            while True:
+                batch = [await queue.get()]
+                if SQLITE_WRITE_DELAY > 0:
+                    # 稍等片刻让并发到达的写入进入同一事务
+                    await asyncio.sleep(SQLITE_WRITE_DELAY / 1000)
+                while len(batch) < SQLITE_WRITE_BATCH and not queue.empty():
+                    batch.append(queue.get_nowait())
+                await self._execute(batch)
+        finally:
+            # 应用退出：后续写入直接执行，已排队的写入在退出前完成
+            self._queue = None
+            pending = []
+            while not queue.empty():
+                pending.append(queue.get_nowait())
+            if pending:
+                await self._execute(pending)
+
+    async def _execute(self, batch: List[Job]) -> None:
+        results: List[Tuple[asyncio.Future, Any, Optional[BaseException]]] = []
+        try:
+            async with in_transaction():
+                for func, future in batch:
+                    try:
+                        async with in_transaction():
+                            result = await func()
+                        results.append((future, result, None))
+                    except Exception as e:
+                        results.append((future, None, e))
+        except BaseException as e:
+            # 事务已回滚，整批写入都未提交；写入任务被取消(应用退出)时同样通知调用方后继续向上抛出，避免调用方一直等待
+            if isinstance(e, Exception):
+                logger.exception("批量写入事务提交失败")
+                error = e
+            else:
+                error = RuntimeError("写入任务已停止，写入未提交")
+                error.__cause__ = e
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            if not isinstance(e, Exception):
+                raise
+            return
+        for future, result, error in results:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+
+db_writer = DbWriter()
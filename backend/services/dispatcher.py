@@ -0,0 +1,100 @@
+"""
+从机指令下发模块
+通过从机代理服务的 HTTP 接口下发执行的启动/停止指令：
+
+    POST {scheme}://{ip}:{port}/api/agent/executions/{execution_id}/start
+    POST {scheme}://{ip}:{port}/api/agent/executions/{execution_id}/stop
+
+指令对所有从机并发发送，整体受截止时间约束：截止时间内未响应的从机记为超时，
+不会因个别从机失联而拖慢调用方。所有请求共用一个连接池客户端。
+"""
+import asyncio
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+import httpx
+
+from config import SLAVE_AGENT_SCHEME
+from models import SlaveConfig
+
+AGENT_PATH = "/api/agent/executions/{execution_id}/{action}"
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(limits=httpx.Limits(max_connections=500, max_keepalive_connections=100))
+    return _client
+
+
+async def close() -> None:
+    """关闭连接池(应用退出时调用)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def agent_url(slave: SlaveConfig, path: str) -> str:
+    """从机代理服务地址，IPv6 地址加方括号"""
+    host = f"[{slave.ip_address}]" if ":" in slave.ip_address else slave.ip_address
+    return f"{SLAVE_AGENT_SCHEME}://{host}:{slave.port}{path}"
+
+
+def _headers(slave: SlaveConfig) -> Dict[str, str]:
+    # 只有令牌认证的从机需要携带凭据，密码/密钥用于 SSH 登录
+    if slave.auth_type == "token" and slave.auth_value:
+        return {"Authorization": f"Bearer {slave.auth_value}"}
+    return {}
+
+
+async def _send(slave: SlaveConfig, path: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+    try:
+        response = await _get_client().post(
+            agent_url(slave, path), json=payload, headers=_headers(slave), timeout=timeout
+        )
+    except httpx.TimeoutException:
+        return {"slave_id": slave.id, "ok": False, "error": "timeout"}
+    except httpx.HTTPError as e:
+        return {"slave_id": slave.id, "ok": False, "error": str(e) or type(e).__name__}
+    return {"slave_id": slave.id, "ok": response.is_success, "status_code": response.status_code}
+
+
+async def broadcast(
+    slaves: Iterable[SlaveConfig],
+    execution_id: str,
+    action: str,
+    payload: Union[Dict[str, Any], Callable[[SlaveConfig], Dict[str, Any]]],
+    deadline: float
+) -> List[Dict[str, Any]]:
+    """
+    向从机并发下发指令
+
+    Args:
+        slaves: 目标从机
+        execution_id: 执行ID
+        action: 指令 start/stop
+        payload: 请求体，各从机请求体不同时传入按从机生成请求体的函数
+        deadline: 截止时间(秒)，到期仍未完成的请求被取消并记为超时
+
+    Returns:
+        List[Dict]: 每个从机的下发结果 {"slave_id", "ok", "status_code"/"error"}
+    """
+    slaves = list(slaves)
+    if not slaves:
+        return []
+    path = AGENT_PATH.format(execution_id=execution_id, action=action)
+    tasks = {
+        asyncio.create_task(_send(slave, path, payload(slave) if callable(payload) else payload, deadline)): slave
+        for slave in slaves
+    }
+    done, pending = await asyncio.wait(tasks, timeout=deadline)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+    return [
+        task.result() if task in done else {"slave_id": slave.id, "ok": False, "error": "timeout"}
+        for task, slave in tasks.items()
+    ]
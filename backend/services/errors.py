@@ -0,0 +1,220 @@
+"""
+错误聚合模块
+失败采样不逐条保存错误文本，而是按指纹聚合：
+
+- 指纹 = 状态码 + 异常类型 + 归一化消息(去掉 UUID、十六进制 ID、IP、数字等易变部分)的摘要
+- 每个指纹累计总次数、各请求标签次数，并按秒计数写入时序表(source="error:<指纹>")
+- 每个指纹用蓄水池抽样保留 ERROR_EXAMPLES 条示例(原始消息与响应内容)，内存与存储只与错误种类数成正比
+- 指纹数超过 ERROR_MAX_FINGERPRINTS 后新出现的错误归入同一个溢出指纹
+"""
+import hashlib
+import random
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import ERROR_EXAMPLES, ERROR_EXAMPLE_LENGTH, ERROR_MAX_FINGERPRINTS
+from models import ErrorFingerprint, MetricPoint
+from services.copy_insert import bulk_insert
+
+# 每个指纹记录的最多请求标签数
+MAX_LABELS = 50
+OVERFLOW_FINGERPRINT = "overflow"
+
+_NORMALIZERS = (
+    (re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"), "<uuid>"),
+    (re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}(?::\d+)?\b"), "<ip>"),
+    (re.compile(r"\b0x[0-9a-fA-F]+\b"), "<hex>"),
+    (re.compile(r"\b(?=[0-9a-fA-F]*\d)[0-9a-fA-F]{8,}\b"), "<hex>"),
+    (re.compile(r"\d+(?:\.\d+)?"), "<n>"),
+    (re.compile(r"\s+"), " "),
+)
+
+
+def normalize_message(message: Optional[str]) -> str:
+    """去掉错误消息中的易变部分，使同类错误得到相同文本"""
+    if not message:
+        return ""
+    text = message[:1000]
+    for pattern, replacement in _NORMALIZERS:
+        text = pattern.sub(replacement, text)
+    return text.strip()[:255]
+
+
+def fingerprint(status_code: int, error_type: Optional[str], normalized: str) -> str:
+    """错误指纹(16 位十六进制)"""
+    key = f"{status_code}\x1f{error_type or ''}\x1f{normalized}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+class ErrorGroup:
+    """单个错误指纹的累计"""
+
+    __slots__ = ("fingerprint", "status_code", "error_type", "message", "count", "first_ts", "last_ts",
+                 "labels", "examples", "record_id", "dirty")
+
+    def __init__(self, key: str, status_code: int, error_type: Optional[str], message: str, timestamp: int):
+        self.fingerprint = key
+        self.status_code = status_code
+        self.error_type = error_type
+        self.message = message
+        self.count = 0
+        self.first_ts = timestamp
+        self.last_ts = timestamp
+        self.labels: Dict[str, int] = {}
+        self.examples: List[Dict[str, Any]] = []
+        self.record_id: Optional[int] = None
+        self.dirty = True
+
+    def to_dict(self, examples: bool = False) -> Dict[str, Any]:
+        data = {
+            "fingerprint": self.fingerprint,
+            "status_code": self.status_code,
+            "error_type": self.error_type,
+            "message": self.message,
+            "count": self.count,
+            "first_ts": self.first_ts,
+            "last_ts": self.last_ts,
+            "labels": self.labels,
+        }
+        if examples:
+            data["examples"] = self.examples
+        return data
+
+
+class ErrorAggregator:
+    """执行的错误聚合器"""
+
+    def __init__(self, execution_id: int):
+        self.execution_id = execution_id
+        self.groups: Dict[str, ErrorGroup] = {}
+        # (指纹, 秒) -> 尚未写入时序表的次数
+        self.pending: Dict[Tuple[str, int], int] = {}
+        self._random = random.Random()
+
+    def record(
+        self,
+        timestamp: int,
+        label: str,
+        slave_id: Optional[int],
+        status_code: int,
+        error_type: Optional[str] = None,
+        error_message: Optional[str] = None,
+        response_body: Optional[str] = None
+    ) -> None:
+        """记录一条失败采样"""
+        normalized = normalize_message(error_message)
+        key = fingerprint(status_code, error_type, normalized)
+        group = self.groups.get(key)
+        if group is None:
+            if len(self.groups) >= ERROR_MAX_FINGERPRINTS:
+                key = OVERFLOW_FINGERPRINT
+                group = self.groups.get(key)
+                if group is None:
+                    group = self.groups[key] = ErrorGroup(key, 0, None, "其他错误(错误种类超出上限)", timestamp)
+            else:
+                group = self.groups[key] = ErrorGroup(key, status_code, error_type, normalized, timestamp)
+
+        group.count += 1
+        group.first_ts = min(group.first_ts, timestamp)
+        group.last_ts = max(group.last_ts, timestamp)
+        if label in group.labels or len(group.labels) < MAX_LABELS:
+            group.labels[label] = group.labels.get(label, 0) + 1
+        group.dirty = True
+
+        # 蓄水池抽样：第 n 条以 k/n 的概率替换已有示例，保留的示例是全部错误的均匀样本
+        slot = len(group.examples) if len(group.examples) < ERROR_EXAMPLES else self._random.randrange(group.count)
+        if slot < ERROR_EXAMPLES:
+            example = {
+                "timestamp": timestamp,
+                "label": label,
+                "slave_id": slave_id,
+                "status_code": status_code,
+                "error_type": error_type,
+                "message": (error_message or "")[:ERROR_EXAMPLE_LENGTH],
+                "response": (response_body or "")[:ERROR_EXAMPLE_LENGTH],
+            }
+            if slot < len(group.examples):
+                group.examples[slot] = example
+            else:
+                group.examples.append(example)
+
+        pending_key = (key, timestamp // 1000)
+        self.pending[pending_key] = self.pending.get(pending_key, 0) + 1
+
+    def top(self, limit: int = 20, label: Optional[str] = None, examples: bool = False) -> List[Dict[str, Any]]:
+        """出现次数最多的错误"""
+        groups = [group for group in self.groups.values() if label is None or label in group.labels]
+        groups.sort(key=lambda group: -group.count)
+        return [group.to_dict(examples) for group in groups[:limit]]
+
+    async def load(self) -> None:
+        """服务重启后从数据库恢复已保存的指纹，继续累计"""
+        for record in await ErrorFingerprint.filter(execution_id=self.execution_id):
+            group = ErrorGroup(record.fingerprint, record.status_code, record.error_type, record.message, record.first_ts)
+            group.count = record.count
+            group.last_ts = record.last_ts
+            group.labels = record.labels or {}
+            group.examples = record.examples or []
+            group.record_id = record.id
+            group.dirty = False
+            self.groups[record.fingerprint] = group
+
+    async def flush(self, before: Optional[int] = None) -> None:
+        """
+        写出变化的指纹与已结束秒的计数
+
+        Args:
+            before: 只写出早于该秒的计数，为 None 时全部写出(执行结束)
+        """
+        closed = [key for key in self.pending if before is None or key[1] < before]
+        if closed:
+            await bulk_insert([
+                MetricPoint(execution_id=self.execution_id, source=f"error:{key}", name="errors", ts=second, value=self.pending.pop((key, second)))
+                for key, second in closed
+            ])
+
+        for group in self.groups.values():
+            if not group.dirty:
+                continue
+            values = {
+                "status_code": group.status_code,
+                "error_type": group.error_type,
+                "message": group.message,
+                "count": group.count,
+                "first_ts": group.first_ts,
+                "last_ts": group.last_ts,
+                "labels": group.labels,
+                "examples": group.examples,
+            }
+            if group.record_id is None:
+                record = await ErrorFingerprint.create(execution_id=self.execution_id, fingerprint=group.fingerprint, **values)
+                group.record_id = record.id
+            else:
+                await ErrorFingerprint.filter(id=group.record_id).update(**values)
+            group.dirty = False
+
+
+async def top_errors(execution_id: int, limit: int = 20, label: Optional[str] = None, examples: bool = False) -> List[Dict[str, Any]]:
+    """已结束执行出现次数最多的错误"""
+    query = ErrorFingerprint.filter(execution_id=execution_id).order_by('-count', 'id')
+    if label is None:
+        records = await query.limit(limit)
+    else:
+        # 标签计数保存在 JSON 中，按标签筛选时在应用侧过滤
+        records = [record for record in await query if label in (record.labels or {})][:limit]
+    items = []
+    for record in records:
+        item = {
+            "fingerprint": record.fingerprint,
+            "status_code": record.status_code,
+            "error_type": record.error_type,
+            "message": record.message,
+            "count": record.count,
+            "first_ts": record.first_ts,
+            "last_ts": record.last_ts,
+            "labels": record.labels,
+        }
+        if examples:
+            item["examples"] = record.examples
+        items.append(item)
+    return items
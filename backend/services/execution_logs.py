@@ -0,0 +1,237 @@
+"""
+执行日志模块
+负载机上报的日志按执行追加，每行分配递增偏移量(从 0 开始)：
+- 运行中的执行在内存中保留最近 LOG_RING_SIZE 行的环形缓冲，供实时跟随读取
+- 累积的日志以 gzip 成员追加写入分段文件，索引文件记录每个成员的起始偏移与字节位置，
+  按偏移范围读取时只解压命中的成员，不需要把整份日志读入内存
+"""
+import asyncio
+import bisect
+import gzip
+import json
+import os
+import time
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from config import EXECUTION_DATA_DIR, LOG_RING_SIZE, LOG_FLUSH_LINES, LOG_SEGMENT_BYTES
+
+INDEX_FILE = "index.tsv"
+
+# 索引项：(起始偏移, 行数, 分段文件名, 字节位置, 字节长度)
+IndexEntry = Tuple[int, int, str, int, int]
+
+
+def log_directory(execution_id: str) -> str:
+    """执行日志目录"""
+    return os.path.join(EXECUTION_DATA_DIR, execution_id, "logs")
+
+
+def load_index(directory: str) -> List[IndexEntry]:
+    """读取分段索引，目录不存在时返回空索引"""
+    path = os.path.join(directory, INDEX_FILE)
+    if not os.path.exists(path):
+        return []
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) == 5:
+                entries.append((int(parts[0]), int(parts[1]), parts[2], int(parts[3]), int(parts[4])))
+    return entries
+
+
+def read_segments(directory: str, index: List[IndexEntry], offset: int, limit: int) -> List[Dict[str, Any]]:
+    """
+    从分段文件读取 [offset, offset+limit) 范围内的日志
+
+    通过索引定位第一个命中的 gzip 成员，逐个成员读取解压，直到凑满 limit 行。
+    """
+    if not index or limit <= 0:
+        return []
+    starts = [entry[0] for entry in index]
+    position = max(bisect.bisect_right(starts, offset) - 1, 0)
+    lines: List[Dict[str, Any]] = []
+    handles: Dict[str, Any] = {}
+    try:
+        for first, count, segment, byte_pos, byte_len in index[position:]:
+            if first + count <= offset:
+                continue
+            handle = handles.get(segment)
+            if handle is None:
+                handle = handles[segment] = open(os.path.join(directory, segment), "rb")
+            handle.seek(byte_pos)
+            chunk = gzip.decompress(handle.read(byte_len)).decode("utf-8").splitlines()
+            skip = max(offset - first, 0)
+            for raw in islice(chunk, skip, skip + limit - len(lines)):
+                lines.append(json.loads(raw))
+            if len(lines) >= limit:
+                break
+    finally:
+        for handle in handles.values():
+            handle.close()
+    return lines
+
+
+class ExecutionLog:
+    """
+    运行中执行的日志
+
+    偏移量划分为三段：[0, flushed) 已写入分段文件；[flushed, next_offset) 在待写入列表中；
+    环形缓冲保存最近的若干行(可能同时覆盖前两段)，用于避免实时读取访问磁盘。
+    """
+
+    def __init__(self, execution_id: str):
+        self.execution_id = execution_id
+        self.directory = log_directory(execution_id)
+        self._index = load_index(self.directory)
+        self.flushed = self._index[-1][0] + self._index[-1][1] if self._index else 0
+        self.next_offset = self.flushed
+        self._ring: Deque[Dict[str, Any]] = deque(maxlen=LOG_RING_SIZE)
+        self._pending: List[Dict[str, Any]] = []
+        self._segment: Optional[str] = self._index[-1][2] if self._index else None
+        self._lock = asyncio.Lock()
+        self._changed = asyncio.Event()
+        self.closed = False
+
+    # ==================== 写入 ====================
+
+    def append(self, slave_id: Optional[int], entries: Iterable) -> int:
+        """
+        追加一批日志
+
+        Args:
+            slave_id: 上报的从机ID
+            entries: 具有 timestamp/level/message/source 属性的日志行
+
+        Returns:
+            int: 追加行数
+        """
+        now = int(time.time() * 1000)
+        count = 0
+        for entry in entries:
+            line = {
+                "offset": self.next_offset,
+                "timestamp": entry.timestamp if entry.timestamp is not None else now,
+                "level": entry.level,
+                "message": entry.message,
+                "slave_id": slave_id,
+                "source": entry.source
+            }
+            self._pending.append(line)
+            self._ring.append(line)
+            self.next_offset += 1
+            count += 1
+        if count:
+            self._notify()
+        return count
+
+    def _notify(self) -> None:
+        # 唤醒所有等待新日志的读取方，之后换一个新的事件对象
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    @property
+    def needs_flush(self) -> bool:
+        return len(self._pending) >= LOG_FLUSH_LINES
+
+    async def flush(self) -> None:
+        """将待写入的日志按 LOG_FLUSH_LINES 一组追加到分段文件"""
+        async with self._lock:
+            while self._pending:
+                batch = self._pending[:LOG_FLUSH_LINES]
+                entry = await asyncio.to_thread(self._write, self.flushed, batch)
+                self._index.append(entry)
+                # 写入完成后才移出待写入列表，写入期间仍可从内存读取
+                del self._pending[:len(batch)]
+                self.flushed += len(batch)
+
+    def _write(self, first: int, batch: List[Dict[str, Any]]) -> IndexEntry:
+        os.makedirs(self.directory, exist_ok=True)
+        data = gzip.compress(
+            "".join(json.dumps(line, ensure_ascii=False) + "\n" for line in batch).encode("utf-8")
+        )
+        segment = self._segment
+        if segment is None or os.path.getsize(os.path.join(self.directory, segment)) + len(data) > LOG_SEGMENT_BYTES:
+            segment = self._segment = f"{first:012d}.log.gz"
+        with open(os.path.join(self.directory, segment), "ab") as f:
+            byte_pos = f.tell()
+            f.write(data)
+        entry = (first, len(batch), segment, byte_pos, len(data))
+        with open(os.path.join(self.directory, INDEX_FILE), "a", encoding="utf-8") as f:
+            f.write("\t".join(str(value) for value in entry) + "\n")
+        return entry
+
+    async def close(self) -> None:
+        """执行结束：写出剩余日志并通知跟随方"""
+        await self.flush()
+        self.closed = True
+        self._notify()
+
+    # ==================== 读取 ====================
+
+    async def read(self, offset: int, limit: int) -> List[Dict[str, Any]]:
+        """读取 [offset, offset+limit) 范围的日志，优先使用内存数据"""
+        lines: List[Dict[str, Any]] = []
+        while len(lines) < limit and offset < self.next_offset:
+            ring_start = self.next_offset - len(self._ring)
+            if offset >= self.flushed:
+                chunk = self._pending[offset - self.flushed:offset - self.flushed + limit - len(lines)]
+            elif offset >= ring_start:
+                chunk = list(islice(self._ring, offset - ring_start, offset - ring_start + limit - len(lines)))
+            else:
+                end = min(self.flushed, ring_start, offset + limit - len(lines))
+                chunk = await asyncio.to_thread(read_segments, self.directory, list(self._index), offset, end - offset)
+            if not chunk:
+                break
+            lines.extend(chunk)
+            offset += len(chunk)
+        return lines
+
+    async def wait(self, offset: int, timeout: float) -> bool:
+        """等待偏移 offset 处出现新日志，返回是否有新日志"""
+        if self.next_offset > offset or self.closed:
+            return self.next_offset > offset
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.next_offset > offset
+
+
+class ExecutionLogStore:
+    """运行中执行日志的登记表"""
+
+    def __init__(self):
+        self._logs: Dict[str, ExecutionLog] = {}
+
+    def get(self, execution_id: str) -> Optional[ExecutionLog]:
+        return self._logs.get(execution_id)
+
+    def open(self, execution_id: str) -> ExecutionLog:
+        log = self._logs.get(execution_id)
+        if log is None:
+            log = self._logs[execution_id] = ExecutionLog(execution_id)
+        return log
+
+    async def close(self, execution_id: str) -> None:
+        log = self._logs.pop(execution_id, None)
+        if log:
+            await log.close()
+
+    async def flush_all(self) -> None:
+        """后台周期调用：写出所有运行中执行的待写入日志"""
+        for log in list(self._logs.values()):
+            await log.flush()
+
+    async def read_history(self, execution_id: str, offset: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        """读取已结束执行的日志，返回(日志行, 总行数)"""
+        directory = log_directory(execution_id)
+        index = await asyncio.to_thread(load_index, directory)
+        total = index[-1][0] + index[-1][1] if index else 0
+        lines = await asyncio.to_thread(read_segments, directory, index, offset, limit)
+        return lines, total
+
+
+log_store = ExecutionLogStore()
@@ -0,0 +1,204 @@
+"""
+执行队列模块
+测试计划的执行先以 queued 状态入队(持久化在 test_executions 表)，由队列在从机容量满足时启动：
+
+- 派发顺序：有效优先级 = 计划优先级(low/medium/high/urgent 对应 0~3) + 排队分钟数 / QUEUE_AGING_MINUTES，
+  排队越久优先级越高，低优先级执行不会被持续插队而饿死
+- 容量预留：执行需要占用测试计划全部在线从机各一个任务数；靠前的执行因容量不足等待时，
+  其从机对后面的执行保留，后面的执行只能使用互不相关的从机
+- 抢占(QUEUE_PREEMPTION)：urgent 执行容量不足时，立即终止占用其从机的 low 执行，被抢占的执行按原入队时间重新排队
+- 预计开始时间：按各测试计划历史平均执行时长模拟从机的占用与释放
+"""
+import asyncio
+import heapq
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from tortoise import timezone
+
+from config import QUEUE_AGING_MINUTES, QUEUE_PREEMPTION, QUEUE_DEFAULT_DURATION
+from models import TestPlan, TestExecution, SlaveConfig, TestPlanSlave, UserInfo
+from services.executions import (
+    create_execution,
+    start_execution,
+    stop_execution,
+    plan_slaves,
+    reserve_slaves,
+    unreserve_slaves,
+)
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_LEVELS = {"low": 0, "medium": 1, "high": 2, "urgent": 3}
+# 计算平均执行时长时参考的最近执行数
+DURATION_HISTORY = 10
+
+
+def effective_priority(execution: TestExecution, now: datetime) -> float:
+    """排队老化后的有效优先级"""
+    base = PRIORITY_LEVELS.get(execution.priority, PRIORITY_LEVELS["medium"])
+    waited = (now - (execution.queued_at or execution.created_at)).total_seconds() / 60
+    return base + max(waited, 0) / QUEUE_AGING_MINUTES
+
+
+def _ordered(executions: List[TestExecution], now: datetime) -> List[TestExecution]:
+    return sorted(executions, key=lambda e: (-effective_priority(e, now), e.queued_at or e.created_at, e.id))
+
+
+class ExecutionQueue:
+    """执行队列"""
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+
+    async def submit(
+        self,
+        plan: TestPlan,
+        user: Optional[UserInfo],
+        trigger: str = "manual"
+    ) -> Tuple[TestExecution, Optional[List[Dict]]]:
+        """
+        执行入队并立即尝试派发
+
+        Returns:
+            Tuple[TestExecution, Optional[List[Dict]]]: (执行记录, 已启动时为各从机启动指令下发结果，仍在排队时为 None)
+        """
+        execution = await create_execution(plan, user, trigger)
+        started = await self.dispatch()
+        await execution.refresh_from_db()
+        return execution, started.get(execution.execution_id)
+
+    async def dispatch(self) -> Dict[str, List[Dict]]:
+        """
+        按有效优先级依次启动容量满足的排队执行(后台周期调用)
+
+        Returns:
+            Dict[str, List[Dict]]: 本次启动的执行ID -> 各从机启动指令下发结果
+        """
+        started: Dict[str, List[Dict]] = {}
+        async with self._lock:
+            queued = await TestExecution.filter(status="queued")
+            if not queued:
+                return started
+            now = timezone.now()
+            plans = {plan.id: plan for plan in await TestPlan.filter(id__in={e.test_plan_id for e in queued})}
+            # 靠前的执行等待中的从机，对后面的执行保留
+            blocked: Set[int] = set()
+            for execution in _ordered(queued, now):
+                plan = plans.get(execution.test_plan_id)
+                if plan is None or plan.is_deleted or not plan.is_active:
+                    await stop_execution(execution, "hard", "测试计划已删除或停用")
+                    continue
+                slave_ids, available = await plan_slaves(plan.id)
+                if not slave_ids:
+                    await stop_execution(execution, "hard", "测试计划未分配从机")
+                    continue
+                if set(slave_ids) & blocked:
+                    blocked.update(slave_ids)
+                    continue
+                # 分配了从机但全部不在线时等待从机上线
+                if not available:
+                    blocked.update(slave_ids)
+                    continue
+                reserved = await reserve_slaves(available)
+                if not reserved and QUEUE_PREEMPTION and execution.priority == "urgent":
+                    if await self._preempt(execution, [slave.id for slave in available]):
+                        reserved = await reserve_slaves(available)
+                if not reserved:
+                    blocked.update(slave_ids)
+                    continue
+                results = await start_execution(execution, plan, available)
+                if results is None:
+                    # 排队期间已被取消
+                    await unreserve_slaves([slave.id for slave in available])
+                else:
+                    started[execution.execution_id] = results
+        return started
+
+    async def _preempt(self, execution: TestExecution, slave_ids: List[int]) -> bool:
+        """终止占用这些从机的 low 执行并将其重新入队，返回是否有执行被抢占"""
+        victims = [
+            victim for victim in await TestExecution.filter(status__in=("running", "stopping"), priority="low")
+            if set(victim.slave_ids) & set(slave_ids)
+        ]
+        for victim in victims:
+            await stop_execution(victim, "hard", f"被紧急执行 {execution.execution_id} 抢占")
+            await victim.fetch_related('test_plan', 'triggered_by')
+            requeued = await create_execution(
+                victim.test_plan, victim.triggered_by, victim.trigger, queued_at=victim.queued_at or victim.created_at
+            )
+            logger.info("执行 %s 被 %s 抢占，已重新入队为 %s", victim.execution_id, execution.execution_id, requeued.execution_id)
+        return bool(victims)
+
+    async def _plan_durations(self, plan_ids: Set[int]) -> Dict[int, float]:
+        """各测试计划最近完成执行的平均时长(秒)"""
+        rows = await TestExecution.filter(
+            test_plan_id__in=plan_ids, status="completed", started_at__isnull=False, finished_at__isnull=False
+        ).order_by('-id').limit(DURATION_HISTORY * max(len(plan_ids), 1)).values_list('test_plan_id', 'started_at', 'finished_at')
+        history: Dict[int, List[float]] = {}
+        for plan_id, started_at, finished_at in rows:
+            durations = history.setdefault(plan_id, [])
+            if len(durations) < DURATION_HISTORY:
+                durations.append((finished_at - started_at).total_seconds())
+        return {plan_id: sum(values) / len(values) for plan_id, values in history.items()}
+
+    async def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        当前队列(按派发顺序)及各执行的预计开始时间
+
+        从机的每个任务槽按运行中执行的预计结束时间占用，排队执行依次取其全部从机最早空闲的时刻开始。
+        """
+        queued = await TestExecution.filter(status="queued").prefetch_related('test_plan')
+        if not queued:
+            return []
+        now = timezone.now()
+        ordered = _ordered(queued, now)
+        running = await TestExecution.filter(status__in=("running", "stopping"))
+        durations = await self._plan_durations({e.test_plan_id for e in queued} | {e.test_plan_id for e in running})
+
+        def duration(plan_id: int) -> timedelta:
+            return timedelta(seconds=durations.get(plan_id, QUEUE_DEFAULT_DURATION))
+
+        plan_ids = {e.test_plan_id for e in queued}
+        links: Dict[int, List[int]] = {}
+        for plan_id, slave_id in await TestPlanSlave.filter(
+            test_plan_id__in=plan_ids, is_active=True
+        ).values_list('test_plan_id', 'slave_id'):
+            links.setdefault(plan_id, []).append(slave_id)
+        slave_ids = {slave_id for ids in links.values() for slave_id in ids}
+        capacity = dict(await SlaveConfig.filter(id__in=slave_ids).values_list('id', 'max_concurrent_tasks'))
+
+        # 每台从机的任务槽最早空闲时间(最小堆)
+        slots: Dict[int, List[datetime]] = {slave_id: [now] * max(capacity.get(slave_id, 1), 1) for slave_id in slave_ids}
+        for execution in running:
+            end = max((execution.started_at or now) + duration(execution.test_plan_id), now)
+            for slave_id in execution.slave_ids:
+                if slave_id in slots:
+                    heapq.heapreplace(slots[slave_id], end)
+
+        items = []
+        for position, execution in enumerate(ordered, start=1):
+            required = [slave_id for slave_id in links.get(execution.test_plan_id, []) if slave_id in slots]
+            start = max([now] + [slots[slave_id][0] for slave_id in required])
+            end = start + duration(execution.test_plan_id)
+            for slave_id in required:
+                heapq.heapreplace(slots[slave_id], end)
+            items.append({
+                "position": position,
+                "execution_id": execution.execution_id,
+                "test_plan_id": execution.test_plan_id,
+                "test_plan_name": execution.test_plan.name,
+                "priority": execution.priority,
+                "effective_priority": round(effective_priority(execution, now), 2),
+                "queued_at": execution.queued_at,
+                "estimated_start": start,
+            })
+        return items
+
+    async def position(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """排队执行的队列位置与预计开始时间，不在队列中时返回 None"""
+        return next((item for item in await self.snapshot() if item["execution_id"] == execution_id), None)
+
+
+execution_queue = ExecutionQueue()
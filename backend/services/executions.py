@@ -0,0 +1,522 @@
+"""
+测试执行模块
+负责执行记录的创建与从机分配、采样上报的写入与实时聚合、执行的停止与收尾
+"""
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from tortoise import timezone
+from tortoise.expressions import F, Q
+
+from config import EXECUTION_SERIES_DELAY, SLAVE_START_TIMEOUT, SLAVE_STOP_TIMEOUT, SLAVE_DRAIN_TIMEOUT
+from models import (
+    TestPlan,
+    TestExecution,
+    ExecutionSample,
+    MetricPoint,
+    UserInfo,
+    SlaRule,
+    SlaveConfig,
+    TestPlanSlave,
+    TestPlanDataset
+)
+from services import dispatcher
+from services.clock_sync import clock_sync
+from services.copy_insert import bulk_insert
+from services.dashboard import dashboard
+from services.db_writer import db_writer
+from services.errors import ErrorAggregator, top_errors
+from services.execution_logs import log_store
+from services.metrics import ExecutionStats, SecondBucket
+from services.pagination import count_cache
+from services.analysis import analyze, empty_report
+from services.comparison import compare_results
+from services.result_store import ColumnarResult, finalize_samples
+from services.retention import SampleRetention
+from services.sla import SlaTracker, evaluate_report
+from services.saturation import saturation_report
+
+# 报告中列出的错误指纹数
+REPORT_TOP_ERRORS = 10
+
+# 执行的终止状态
+FINISHED_STATUSES = ("completed", "aborted", "failed")
+
+
+class LiveExecution:
+    """运行中的执行及其实时聚合数据"""
+
+    def __init__(self, execution: TestExecution, test_plan_name: str, sla_rules: Optional[List[SlaRule]] = None):
+        self.id = execution.id
+        self.execution_id = execution.execution_id
+        self.test_plan_id = execution.test_plan_id
+        self.test_plan_name = test_plan_name
+        self.started_at = execution.started_at
+        # 参与执行的从机，只接收这些从机上报的采样
+        self.slave_ids = set(execution.slave_ids or [])
+        self.stats = ExecutionStats()
+        self.sla = SlaTracker(sla_rules or [])
+        # 失败采样按错误指纹聚合
+        self.errors = ErrorAggregator(execution.id)
+        self.retention = SampleRetention(execution.retention_mode, execution.retention_samples)
+        # 优雅停止的截止时间(time.monotonic)，到期后结束执行
+        self.stop_deadline: Optional[float] = None
+        # 已写入执行记录的采样计数
+        self.saved_total = execution.total_samples
+        self.saved_errors = execution.error_samples
+        if execution.aggregates:
+            self.stats.restore(execution.aggregates)
+        self.stats.total = execution.total_samples
+        self.stats.errors = execution.error_samples
+
+    def summary(self) -> Dict:
+        """仪表盘/列表使用的实时摘要"""
+        rate = self.stats.recent_rate()
+        p99, corrected_p99 = self.stats.histogram.percentile(99), self.stats.corrected.percentile(99)
+        return {
+            "execution_id": self.execution_id,
+            "test_plan_id": self.test_plan_id,
+            "test_plan_name": self.test_plan_name,
+            "started_at": self.started_at,
+            "samples": self.stats.total,
+            "errors": self.stats.errors,
+            "rps": round(rate["rps"], 2),
+            "avg_latency": round(rate["avg_latency"], 2),
+            "error_rate": round(rate["error_rate"], 4),
+            "p99": round(p99, 2) if p99 is not None else None,
+            "corrected_p99": round(corrected_p99, 2) if corrected_p99 is not None else None,
+            "sla": self.sla.status()
+        }
+
+
+class ExecutionRegistry:
+    """运行中执行的登记表（按执行ID索引）"""
+
+    def __init__(self):
+        self._live: Dict[str, LiveExecution] = {}
+
+    def get(self, execution_id: str) -> Optional[LiveExecution]:
+        return self._live.get(execution_id)
+
+    def add(self, execution: TestExecution, test_plan_name: str, sla_rules: Optional[List[SlaRule]] = None) -> LiveExecution:
+        live = LiveExecution(execution, test_plan_name, sla_rules)
+        self._live[execution.execution_id] = live
+        return live
+
+    def remove(self, execution_id: str) -> Optional[LiveExecution]:
+        return self._live.pop(execution_id, None)
+
+    def all(self) -> List[LiveExecution]:
+        return list(self._live.values())
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    async def load(self) -> None:
+        """
+        启动时恢复运行中的执行（实时聚合数据从当前计数继续累积）
+
+        重启前正在优雅停止的执行不再等待从机排空，在下一次后台周期中直接结束。
+        """
+        executions = await TestExecution.filter(status__in=("running", "stopping")).prefetch_related('test_plan')
+        rules = await SlaRule.filter(
+            test_plan_id__in=[execution.test_plan_id for execution in executions], is_active=True
+        )
+        for execution in executions:
+            if execution.execution_id not in self._live:
+                plan_rules = [rule for rule in rules if rule.test_plan_id == execution.test_plan_id]
+                live = self.add(execution, execution.test_plan.name, plan_rules)
+                await live.errors.load()
+                if execution.status == "stopping":
+                    live.stop_deadline = time.monotonic()
+                log_store.open(execution.execution_id)
+
+
+registry = ExecutionRegistry()
+
+
+async def plan_slaves(plan_id: int) -> Tuple[List[int], List[SlaveConfig]]:
+    """测试计划分配的从机ID，以及其中当前在线可用的从机"""
+    slave_ids = list(await TestPlanSlave.filter(test_plan_id=plan_id, is_active=True).values_list('slave_id', flat=True))
+    available = await SlaveConfig.filter(
+        id__in=slave_ids, is_active=True, is_deleted=False, status="online"
+    ).order_by('id') if slave_ids else []
+    return slave_ids, list(available)
+
+
+async def reserve_slaves(slaves: List[SlaveConfig]) -> bool:
+    """
+    为执行占用每台从机一个任务数，全部占用成功才返回 True，否则回退已占用的部分
+
+    任务数的检查与递增在一条 UPDATE 中完成，并发执行之间不会超出从机的最大并发任务数。
+    """
+    reserved = []
+    for slave in slaves:
+        updated = await SlaveConfig.filter(
+            id=slave.id, current_tasks__lt=F('max_concurrent_tasks')
+        ).update(current_tasks=F('current_tasks') + 1)
+        if not updated:
+            await unreserve_slaves(reserved)
+            return False
+        reserved.append(slave.id)
+    if reserved:
+        count_cache.invalidate(SlaveConfig)
+    return True
+
+
+async def unreserve_slaves(slave_ids: List[int]) -> None:
+    """归还从机任务数"""
+    if slave_ids:
+        await SlaveConfig.filter(id__in=slave_ids, current_tasks__gt=0).update(current_tasks=F('current_tasks') - 1)
+        count_cache.invalidate(SlaveConfig)
+
+
+async def release_slaves(execution: TestExecution) -> None:
+    """释放执行占用的从机任务数，同一执行只释放一次"""
+    released = await TestExecution.filter(id=execution.id, slaves_released=False).update(slaves_released=True)
+    execution.slaves_released = True
+    if released:
+        await unreserve_slaves(execution.slave_ids)
+
+
+async def create_execution(
+    plan: TestPlan,
+    user: Optional[UserInfo],
+    trigger: str = "manual",
+    queued_at: Optional[datetime] = None
+) -> TestExecution:
+    """
+    创建排队中的执行记录，由执行队列在从机容量满足时启动
+
+    Args:
+        plan: 测试计划
+        user: 触发人，调度触发时为 None
+        trigger: 触发方式 manual/schedule
+        queued_at: 入队时间，被抢占后重新入队的执行沿用原入队时间
+    """
+    return await TestExecution.create(
+        execution_id=str(uuid.uuid4()),
+        test_plan=plan,
+        triggered_by=user,
+        trigger=trigger,
+        status="queued",
+        priority=plan.priority,
+        retention_mode=plan.retention_mode,
+        retention_samples=plan.retention_samples,
+        queued_at=queued_at or timezone.now()
+    )
+
+
+async def start_execution(execution: TestExecution, plan: TestPlan, slaves: List[SlaveConfig]) -> Optional[List[Dict]]:
+    """
+    启动已占用从机的执行：登记为运行中并向从机下发启动指令
+
+    启动指令下发失败的从机立即释放，不计入执行的从机列表；没有任何从机接受启动指令时执行记为失败。
+
+    Returns:
+        Optional[List[Dict]]: 各从机启动指令下发结果，执行已不在排队中时返回 None(调用方负责释放占用)
+    """
+    now = timezone.now()
+    # 以条件更新认领排队中的执行，排队期间已被取消时不再启动
+    slave_ids = [slave.id for slave in slaves]
+    claimed = await TestExecution.filter(id=execution.id, status="queued").update(
+        status="running", started_at=now, slave_ids=slave_ids, partition_slave_ids=slave_ids
+    )
+    if not claimed:
+        return None
+    count_cache.invalidate(TestExecution)
+    execution.status = "running"
+    execution.started_at = now
+    execution.slave_ids = slave_ids
+    execution.partition_slave_ids = slave_ids
+    plan.status = "active"
+    plan.actual_start = now
+    await TestPlan.filter(id=plan.id).update(status="active", actual_start=now)
+    count_cache.invalidate(TestPlan)
+
+    rules = await SlaRule.filter(test_plan_id=plan.id, is_active=True)
+    live = registry.add(execution, plan.name, rules)
+    log_store.open(execution.execution_id)
+
+    # 数据集按启动时的从机列表切分，从机以自己在 slave_ids 中的位置下载对应分片，下载地址带上各自的从机ID
+    links = await TestPlanDataset.filter(test_plan_id=plan.id, dataset__is_deleted=False).prefetch_related('dataset')
+
+    def payload(slave: SlaveConfig) -> Dict:
+        return {
+            "test_plan_id": plan.id,
+            "slave_ids": slave_ids,
+            "datasets": [
+                {
+                    "dataset_id": link.dataset.id,
+                    "name": link.dataset.name,
+                    "mode": link.mode,
+                    "checksum": link.dataset.checksum,
+                    "url": f"/api/datasets/{link.dataset.id}/partition?execution_id={execution.execution_id}&slave_id={slave.id}"
+                }
+                for link in links
+            ]
+        }
+
+    results = await dispatcher.broadcast(slaves, execution.execution_id, "start", payload, SLAVE_START_TIMEOUT)
+    failed = [result["slave_id"] for result in results if not result["ok"]]
+    if failed:
+        await unreserve_slaves(failed)
+        execution.slave_ids = [slave_id for slave_id in execution.slave_ids if slave_id not in failed]
+        await execution.save(update_fields=['slave_ids'])
+        live.slave_ids = set(execution.slave_ids)
+    if not execution.slave_ids:
+        # 没有从机在执行，不会再有采样或结束上报，直接结束以免一直占据运行中状态
+        execution.abort_reason = "没有从机接受启动指令"
+        await finish_execution(execution, "failed")
+    return results
+
+
+async def ingest_samples(live: LiveExecution, slave_id: Optional[int], samples: Iterable) -> Tuple[int, Optional[SlaRule]]:
+    """
+    写入一批采样，更新实时聚合并判定 SLA
+
+    实时聚合包含全部采样，原始采样按执行的保留方式写入(蓄水池抽样的采样在分钟结束后写入)。
+
+    Args:
+        live: 运行中的执行
+        slave_id: 上报的从机ID
+        samples: 具有 timestamp/intended_ts/label/latency/status_code/success/bytes 属性的采样(从机时钟)，
+            失败采样可附带 error_type/error_message/response_body
+
+    Returns:
+        Tuple[int, Optional[SlaRule]]: (接收条数, 被违反的硬性规则)
+    """
+    rows = []
+    accepted = 0
+    batch = SecondBucket()
+    stats = live.stats
+    # 从机时间戳换算为服务器时间，多台从机的采样按同一时钟归入秒级序列
+    offset = clock_sync.offset(slave_id)
+    for sample in samples:
+        timestamp = sample.timestamp + offset
+        intended_ts = sample.intended_ts + offset if sample.intended_ts is not None else None
+        row = ExecutionSample(
+            execution_id=live.id,
+            slave_id=slave_id,
+            timestamp=timestamp,
+            intended_ts=intended_ts,
+            label=sample.label,
+            latency=sample.latency,
+            status_code=sample.status_code,
+            success=sample.success,
+            bytes=sample.bytes
+        )
+        if live.retention.offer(row):
+            rows.append(row)
+        accepted += 1
+        stats.record(timestamp, sample.label, sample.latency, sample.success, sample.bytes, intended_ts)
+        batch.add(sample.latency, sample.success, sample.bytes)
+        if not sample.success:
+            live.errors.record(
+                timestamp, sample.label, slave_id, sample.status_code,
+                getattr(sample, "error_type", None), getattr(sample, "error_message", None), getattr(sample, "response_body", None)
+            )
+    if rows:
+        await db_writer.submit(lambda: bulk_insert(rows))
+    if accepted:
+        dashboard.record(batch)
+    return accepted, live.sla.check(stats)
+
+
+async def _flush(live: LiveExecution, before: Optional[int]) -> None:
+    """
+    将已结束的秒写入时序表，写出已结束分钟的抽样采样与变化的错误指纹，并同步执行记录上的采样计数；
+    非完整保留的执行同时保存精确汇总，报告与服务重启后的恢复都依赖它
+    """
+    closed = live.stats.pop_closed_seconds(before)
+    if closed:
+        await bulk_insert([
+            MetricPoint(execution_id=live.id, source="execution", name=name, ts=second, value=value)
+            for second, bucket in closed
+            for name, value in (
+                ("rps", bucket.count),
+                ("avg_latency", bucket.avg_latency),
+                ("max_latency", bucket.latency_max),
+                ("errors", bucket.errors)
+            )
+        ])
+    await bulk_insert(live.retention.pop_closed(before))
+    await live.errors.flush(before)
+    stats = live.stats
+    if stats.total != live.saved_total or stats.errors != live.saved_errors:
+        values = {"total_samples": stats.total, "error_samples": stats.errors}
+        if not live.retention.is_full:
+            values["aggregates"] = stats.export()
+        await TestExecution.filter(id=live.id).update(**values)
+        live.saved_total, live.saved_errors = stats.total, stats.errors
+
+
+async def flush_live_executions() -> None:
+    """后台周期调用：结束排空超时的执行，写出所有运行中执行已结束的秒级数据与待写入日志"""
+    now = time.monotonic()
+    for live in registry.all():
+        if live.stop_deadline is not None and now >= live.stop_deadline:
+            execution = await TestExecution.get_or_none(id=live.id)
+            if execution and registry.get(live.execution_id) is live:
+                await finish_execution(execution, "aborted")
+
+    before = int(time.time()) - EXECUTION_SERIES_DELAY
+    for live in registry.all():
+        await db_writer.submit(lambda: _flush(live, before))
+    await log_store.flush_all()
+
+
+async def finish_execution(execution: TestExecution, status: str = "completed") -> TestExecution:
+    """
+    结束执行：写出剩余的实时数据并更新执行与测试计划的结束时间
+
+    Args:
+        execution: 执行记录
+        status: 终止状态 completed/aborted/failed，被手动停止的执行即使从机正常收尾也记为 aborted
+    """
+    if execution.status == "stopping" and status == "completed":
+        status = "aborted"
+    live = registry.remove(execution.execution_id)
+    if live:
+        await db_writer.submit(lambda: _flush(live, None))
+        execution.total_samples = live.stats.total
+        execution.error_samples = live.stats.errors
+        if not live.retention.is_full:
+            execution.aggregates = live.stats.export()
+    await log_store.close(execution.execution_id)
+    await release_slaves(execution)
+    execution.status = status
+    execution.finished_at = timezone.now()
+    await execution.save()
+    await TestPlan.filter(id=execution.test_plan_id).update(actual_end=execution.finished_at)
+    count_cache.invalidate(TestPlan)
+    return execution
+
+
+async def abort_execution(execution: TestExecution, reason: str) -> TestExecution:
+    """提前终止执行并记录原因"""
+    execution.abort_reason = reason[:255]
+    return await finish_execution(execution, "aborted")
+
+
+async def stop_execution(execution: TestExecution, mode: str, reason: str) -> Optional[List[Dict]]:
+    """
+    停止执行：向全部从机并发下发停止指令，下发受 SLAVE_STOP_TIMEOUT 截止时间约束
+
+    - hard: 从机立即终止压测，执行立即结束，已上报的部分结果照常整理生成报告
+    - graceful: 从机停止发起新请求并排空在途请求，执行进入 stopping 状态继续接收采样，
+      从机上报结束或 SLAVE_DRAIN_TIMEOUT 到期后结束
+
+    两种方式都立即释放从机任务数。
+
+    排队中的执行直接取消。
+
+    Returns:
+        Optional[List[Dict]]: 各从机停止指令下发结果，执行已结束时返回 None
+    """
+    if execution.status == "queued":
+        finished_at = timezone.now()
+        cancelled = await TestExecution.filter(id=execution.id, status="queued").update(
+            status="aborted", abort_reason=reason[:255], finished_at=finished_at, slaves_released=True
+        )
+        if not cancelled:
+            return None
+        count_cache.invalidate(TestExecution)
+        execution.status, execution.abort_reason, execution.finished_at = "aborted", reason[:255], finished_at
+        return []
+
+    live = registry.get(execution.execution_id)
+    if live is None:
+        return None
+    slaves = await SlaveConfig.filter(id__in=execution.slave_ids)
+    payload = {"mode": mode, "drain_timeout": SLAVE_DRAIN_TIMEOUT if mode == "graceful" else 0}
+    broadcast = dispatcher.broadcast(slaves, execution.execution_id, "stop", payload, SLAVE_STOP_TIMEOUT)
+
+    if mode == "hard":
+        results, _ = await asyncio.gather(broadcast, abort_execution(execution, reason))
+        return results
+
+    execution.status = "stopping"
+    execution.abort_reason = reason[:255]
+    await execution.save(update_fields=['status', 'abort_reason'])
+    live.stop_deadline = time.monotonic() + SLAVE_DRAIN_TIMEOUT
+    results, _ = await asyncio.gather(broadcast, release_slaves(execution))
+    return results
+
+
+async def build_report(execution: TestExecution) -> None:
+    """
+    基于列式结果生成执行报告并更新测试计划的用例统计：
+    测试计划配置了 SLA 规则时按规则判定结果计数，否则按样本成功/失败计数；
+    执行期间有从机饱和时附带饱和窗口内的采样统计；附带出现次数最多的错误指纹
+    """
+    result = ColumnarResult.open(execution.execution_id)
+    report = await asyncio.to_thread(analyze, result) if result else empty_report()
+    report["top_errors"] = await top_errors(execution.id, REPORT_TOP_ERRORS)
+    if execution.saturation_windows:
+        end_ms = int((execution.finished_at or timezone.now()).timestamp() * 1000)
+        report["saturation"] = await asyncio.to_thread(saturation_report, result, execution.saturation_windows, end_ms)
+    rules = await SlaRule.filter(test_plan_id=execution.test_plan_id, is_active=True)
+    if rules:
+        report["sla"] = evaluate_report(rules, report)
+    execution.report = report
+    await execution.save(update_fields=['report'])
+
+    if rules:
+        total, passed, failed = report["sla"]["total"], report["sla"]["passed"], report["sla"]["failed"]
+    else:
+        overall = report["overall"]
+        total, passed, failed = overall["count"], overall["count"] - overall["errors"], overall["errors"]
+    await TestPlan.filter(id=execution.test_plan_id).update(
+        total_cases=total,
+        passed_cases=passed,
+        failed_cases=failed
+    )
+    count_cache.invalidate(TestPlan)
+
+
+async def compare_executions(baseline: TestExecution, candidate: TestExecution) -> Optional[Dict]:
+    """比较两次已生成报告的执行，任一方缺少列式结果时返回 None"""
+    baseline_result = ColumnarResult.open(baseline.execution_id)
+    candidate_result = ColumnarResult.open(candidate.execution_id)
+    if not baseline_result or not candidate_result or baseline.report is None or candidate.report is None:
+        return None
+    comparison = await asyncio.to_thread(
+        compare_results, baseline_result, candidate_result, baseline.report, candidate.report
+    )
+    comparison["baseline_execution_id"] = baseline.execution_id
+    return comparison
+
+
+async def detect_regression(execution: TestExecution) -> None:
+    """与测试计划的基线执行比较，并记录对比结果"""
+    baseline = await TestExecution.filter(
+        test_plan_id=execution.test_plan_id, is_baseline=True
+    ).exclude(id=execution.id).first()
+    if not baseline:
+        return
+    comparison = await compare_executions(baseline, execution)
+    if comparison is not None:
+        execution.comparison = comparison
+        await execution.save(update_fields=['comparison'])
+
+
+async def finalize_finished_executions() -> None:
+    """
+    后台周期调用：将已结束执行的原始采样整理为列式文件，生成报告并与基线对比(排队中被取消的执行除外)
+
+    由后台任务完成而不是在结束请求中同步执行，服务重启后未完成的整理也会继续。
+    """
+    executions = await TestExecution.filter(
+        Q(sample_storage="rows") | Q(report__isnull=True),
+        status__in=FINISHED_STATUSES,
+        started_at__isnull=False
+    ).order_by('id').limit(10)
+    for execution in executions:
+        if execution.sample_storage == "rows":
+            await finalize_samples(execution)
+        await build_report(execution)
+        await detect_regression(execution)
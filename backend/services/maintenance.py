@@ -0,0 +1,241 @@
+"""
+执行数据维护模块
+后台定期执行，所有删除都按 MAINTENANCE_BATCH 行分批提交，单个事务很短，不会长时间占用写锁：
+
+- 压缩：结束超过 COMPACT_AFTER_DAYS 天的执行(对比基线除外)，秒级时序指标合并为分钟汇总，
+  列式原始结果打包压缩为 <ARCHIVE_DIR>/<execution_id>/samples.tar.gz 后从数据目录删除，
+  报告、错误指纹等汇总数据保留；解压归档到原目录并把 sample_storage 改回 columnar 即可恢复下钻查询
+- 清理：软删除超过 PURGE_GRACE_DAYS 天的测试计划(连同其执行数据与文件)、脚本与数据集(连同文件)物理删除
+
+分钟汇总的写入与压缩进度(compaction_point)在同一事务中提交，中途中断后重新执行不会重复汇总。
+"""
+import asyncio
+import logging
+import os
+import shutil
+import tarfile
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+from tortoise import timezone
+from tortoise.models import Model
+from tortoise.transactions import in_transaction
+
+from config import (
+    MAINTENANCE_BATCH,
+    COMPACT_AFTER_DAYS,
+    ARCHIVE_DIR,
+    PURGE_GRACE_DAYS,
+    EXECUTION_DATA_DIR
+)
+from models import TestPlan, TestExecution, ExecutionSample, MetricPoint, ErrorFingerprint, Script, Dataset
+from services.copy_insert import bulk_insert
+from services.pagination import count_cache
+from services.result_store import samples_directory
+from services.script_files import remove_script_file
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FILE = "samples.tar.gz"
+# 压缩时每次读取的时间窗口(秒)，内存占用与窗口内的指标点数成正比
+ROLLUP_WINDOW = 3600
+# 执行未结束的状态，所属测试计划暂不物理删除
+ACTIVE_STATUSES = ("queued", "running", "stopping")
+
+# 时序指标点: (来源, 名称, 秒级时间戳, 值)
+Point = Tuple[str, str, int, float]
+
+
+def rollup_points(points: Iterable[Point]) -> List[Point]:
+    """
+    秒级指标点合并为分钟汇总(时间戳为分钟起点)
+
+    - max* 指标取最大值，min* 指标取最小值
+    - avg* 指标按同来源同一秒的 rps 加权(没有 rps 时按点平均)
+    - 其余指标取该分钟内各秒的平均值，即每秒平均
+    """
+    points = list(points)
+    rps = {(source, ts): value for source, name, ts, value in points if name == "rps"}
+    groups: Dict[Tuple[str, str, int], List[float]] = {}
+    for source, name, ts, value in points:
+        key = (source, name, ts - ts % 60)
+        group = groups.get(key)
+        if name.startswith("max"):
+            groups[key] = [max(group[0], value)] if group else [value]
+        elif name.startswith("min"):
+            groups[key] = [min(group[0], value)] if group else [value]
+        else:
+            weight = rps.get((source, ts), 1.0) if name.startswith("avg") else 1.0
+            if group is None:
+                group = groups[key] = [0.0, 0.0]
+            group[0] += value * weight
+            group[1] += weight
+    rollups = []
+    for (source, name, minute), group in groups.items():
+        if len(group) == 1:
+            value = group[0]
+        else:
+            value = group[0] / group[1] if group[1] else 0.0
+        rollups.append((source, name, minute, round(value, 4)))
+    return rollups
+
+
+def archive_directory(directory: str, archive_path: str) -> int:
+    """
+    将目录打包为 tar.gz(先写临时文件再改名)，返回归档文件大小
+
+    目录不存在时返回 0。
+    """
+    if not os.path.isdir(directory):
+        return 0
+    os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+    tmp_path = archive_path + ".tmp"
+    with tarfile.open(tmp_path, "w:gz") as tar:
+        tar.add(directory, arcname=os.path.basename(directory))
+    os.replace(tmp_path, archive_path)
+    return os.path.getsize(archive_path)
+
+
+async def delete_in_batches(model: Type[Model], **filters: Any) -> int:
+    """按主键分批删除，每批一个短事务，批次之间让出事件循环"""
+    deleted = 0
+    while True:
+        ids = await model.filter(**filters).order_by('id').limit(MAINTENANCE_BATCH).values_list('id', flat=True)
+        if not ids:
+            return deleted
+        deleted += await model.filter(id__in=ids).delete()
+        await asyncio.sleep(0)
+
+
+async def _write_rollups(execution: TestExecution) -> None:
+    """按时间窗口读取执行的秒级指标，写入分钟汇总并记录压缩进度"""
+    points = MetricPoint.filter(execution_id=execution.id)
+    first_ts = await points.order_by('ts').limit(1).values_list('ts', flat=True)
+    last_ts = await points.order_by('-ts').limit(1).values_list('ts', flat=True)
+    max_id = await points.order_by('-id').limit(1).values_list('id', flat=True)
+    rollups: List[Point] = []
+    if first_ts:
+        start = first_ts[0] - first_ts[0] % 60
+        # 窗口按分钟对齐，同一分钟的点不会跨窗口
+        while start <= last_ts[0]:
+            rows = await MetricPoint.filter(
+                execution_id=execution.id, ts__gte=start, ts__lt=start + ROLLUP_WINDOW
+            ).values_list('source', 'name', 'ts', 'value')
+            rollups.extend(rollup_points(rows))
+            start += ROLLUP_WINDOW
+            await asyncio.sleep(0)
+
+    compaction_point = max_id[0] if max_id else 0
+    async with in_transaction():
+        await bulk_insert([
+            MetricPoint(execution_id=execution.id, source=source, name=name, ts=ts, value=value)
+            for source, name, ts, value in rollups
+        ], batch_size=MAINTENANCE_BATCH)
+        await TestExecution.filter(id=execution.id).update(compaction_point=compaction_point)
+    execution.compaction_point = compaction_point
+
+
+async def compact_execution(execution: TestExecution) -> None:
+    """压缩单个执行：时序指标合并为分钟汇总，列式原始结果归档到冷存储"""
+    if execution.compaction_point is None:
+        await _write_rollups(execution)
+    await delete_in_batches(MetricPoint, execution_id=execution.id, id__lte=execution.compaction_point)
+
+    if execution.sample_storage == "columnar":
+        directory = samples_directory(execution.execution_id)
+        archive_path = os.path.join(ARCHIVE_DIR, execution.execution_id, ARCHIVE_FILE)
+        await asyncio.to_thread(archive_directory, directory, archive_path)
+        await asyncio.to_thread(shutil.rmtree, directory, True)
+        execution.sample_storage = "archived"
+
+    execution.compacted_at = timezone.now()
+    await execution.save(update_fields=['sample_storage', 'compacted_at'])
+
+
+async def compact_executions() -> int:
+    """
+    压缩结束超过 COMPACT_AFTER_DAYS 天且报告已生成的执行，每次最多 MAINTENANCE_BATCH 个，返回压缩的执行数
+
+    对比基线不压缩：与基线对比需要读取其列式结果的直方图，取消基线后按正常规则压缩。
+    """
+    if COMPACT_AFTER_DAYS <= 0:
+        return 0
+    cutoff = timezone.now() - timedelta(days=COMPACT_AFTER_DAYS)
+    executions = await TestExecution.filter(
+        compacted_at__isnull=True,
+        finished_at__lt=cutoff,
+        report__isnull=False,
+        is_baseline=False,
+        sample_storage__in=("columnar", "archived")
+    ).order_by('id').limit(MAINTENANCE_BATCH)
+    for execution in executions:
+        await compact_execution(execution)
+    return len(executions)
+
+
+async def purge_execution(execution: TestExecution) -> None:
+    """物理删除执行及其全部数据与文件"""
+    for model in (ExecutionSample, MetricPoint, ErrorFingerprint):
+        await delete_in_batches(model, execution_id=execution.id)
+    await execution.delete()
+    for root in (EXECUTION_DATA_DIR, ARCHIVE_DIR):
+        await asyncio.to_thread(shutil.rmtree, os.path.join(root, execution.execution_id), True)
+
+
+async def purge_deleted() -> Dict[str, int]:
+    """物理删除软删除超过 PURGE_GRACE_DAYS 天的测试计划、脚本与数据集，返回各类删除数"""
+    purged = {"test_plans": 0, "scripts": 0, "datasets": 0}
+    if PURGE_GRACE_DAYS <= 0:
+        return purged
+    cutoff = timezone.now() - timedelta(days=PURGE_GRACE_DAYS)
+
+    plans = await TestPlan.filter(is_deleted=True, updated_at__lt=cutoff).order_by('id').limit(MAINTENANCE_BATCH)
+    for plan in plans:
+        if await TestExecution.filter(test_plan_id=plan.id, status__in=ACTIVE_STATUSES).exists():
+            continue
+        for execution in await TestExecution.filter(test_plan_id=plan.id):
+            await purge_execution(execution)
+        # 计划的脚本/从机/数据集关联与 SLA 规则随外键级联删除，数据量很小
+        await plan.delete()
+        purged["test_plans"] += 1
+
+    while True:
+        scripts = await Script.filter(is_deleted=True, updated_at__lt=cutoff).order_by('id').limit(MAINTENANCE_BATCH)
+        if not scripts:
+            break
+        script_ids = [script.id for script in scripts]
+        # 只删除脚本目录内且不再被其他脚本引用的文件
+        shared = set(await Script.filter(
+            file_path__in={script.file_path for script in scripts}
+        ).exclude(id__in=script_ids).values_list('file_path', flat=True))
+        for file_path in {script.file_path for script in scripts} - shared:
+            await asyncio.to_thread(remove_script_file, file_path)
+        purged["scripts"] += await Script.filter(id__in=script_ids).delete()
+        await asyncio.sleep(0)
+
+    while True:
+        datasets = await Dataset.filter(is_deleted=True, updated_at__lt=cutoff).order_by('id').limit(MAINTENANCE_BATCH)
+        if not datasets:
+            break
+        for dataset in datasets:
+            if os.path.exists(dataset.file_path):
+                await asyncio.to_thread(os.remove, dataset.file_path)
+        purged["datasets"] += await Dataset.filter(id__in=[dataset.id for dataset in datasets]).delete()
+        await asyncio.sleep(0)
+
+    if purged["test_plans"]:
+        count_cache.invalidate(TestPlan)
+        count_cache.invalidate(TestExecution)
+    if purged["scripts"]:
+        count_cache.invalidate(Script)
+    if purged["datasets"]:
+        count_cache.invalidate(Dataset)
+    return purged
+
+
+async def run_maintenance() -> None:
+    """后台周期调用：压缩归档旧执行并物理删除过期的软删除数据"""
+    compacted = await compact_executions()
+    purged = await purge_deleted()
+    if compacted or any(purged.values()):
+        logger.info("数据维护完成: 压缩执行 %s 个, 物理删除 %s", compacted, purged)
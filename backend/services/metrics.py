@@ -0,0 +1,335 @@
+"""
+执行指标聚合模块
+提供固定分桶的延迟直方图与执行期间的实时聚合器
+
+延迟分桶在所有执行间共享：100ms 以下按 1ms 线性分桶，以上按 2% 几何增长分桶，
+任意两个直方图可直接按桶相加，分位数误差不超过 1ms 或 2%。
+
+协调遗漏(coordinated omission)校正：闭环压测中服务端卡顿会推迟后续请求的发送，
+只按实际发送时间计时会漏掉排队等待的时间。采样携带计划发送时间 intended_ts 时，
+校正延迟 = 实际发送延后的时间 + 响应时间，即用户从本该发出请求起实际等待的时间；
+原始直方图与校正直方图分别累积、同时报告。
+"""
+import math
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+# 线性分桶上限(毫秒)，此前每 1ms 一个桶
+LINEAR_LIMIT = 100
+# 几何分桶增长率
+BUCKET_GROWTH = 1.02
+# 可区分的最大延迟(毫秒)，更大的值计入最后一个桶
+MAX_LATENCY = 3600 * 1000
+
+_LOG_GROWTH = math.log(BUCKET_GROWTH)
+BUCKET_COUNT = LINEAR_LIMIT + int(math.ceil(math.log(MAX_LATENCY / LINEAR_LIMIT) / _LOG_GROWTH)) + 1
+
+# 实时聚合保留的已结束秒级数据点数
+RECENT_SECONDS = 120
+
+
+def bucket_index(latency: float) -> int:
+    """延迟(毫秒)所在桶的下标"""
+    if latency < LINEAR_LIMIT:
+        return int(latency) if latency > 0 else 0
+    index = LINEAR_LIMIT + int(math.log(latency / LINEAR_LIMIT) / _LOG_GROWTH)
+    return min(index, BUCKET_COUNT - 1)
+
+
+def corrected_latency(timestamp: int, latency: float, intended_ts: Optional[int]) -> float:
+    """按计划发送时间校正的延迟(毫秒)，未提供计划发送时间或未延后发送时与原始延迟相同"""
+    if intended_ts is None or intended_ts >= timestamp:
+        return latency
+    return latency + (timestamp - intended_ts)
+
+
+def bucket_lower(index: int) -> float:
+    """桶的下界(毫秒)"""
+    if index < LINEAR_LIMIT:
+        return float(index)
+    return LINEAR_LIMIT * BUCKET_GROWTH ** (index - LINEAR_LIMIT)
+
+
+def bucket_upper(index: int) -> float:
+    """桶的上界(毫秒)"""
+    return bucket_lower(index + 1)
+
+
+def bucket_value(index: int) -> float:
+    """桶的代表值(桶中点)"""
+    return (bucket_lower(index) + bucket_upper(index)) / 2
+
+
+class LatencyHistogram:
+    """固定分桶延迟直方图"""
+
+    __slots__ = ("counts", "total", "sum", "min", "max")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * BUCKET_COUNT
+        self.total = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, latency: float, count: int = 1) -> None:
+        """记录一个延迟值"""
+        self.counts[bucket_index(latency)] += count
+        self.total += count
+        self.sum += latency * count
+        if self.min is None or latency < self.min:
+            self.min = latency
+        if self.max is None or latency > self.max:
+            self.max = latency
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """合并另一个直方图"""
+        if not other.total:
+            return
+        counts = self.counts
+        for index, count in enumerate(other.counts):
+            if count:
+                counts[index] += count
+        self.total += other.total
+        self.sum += other.sum
+        if self.min is None or (other.min is not None and other.min < self.min):
+            self.min = other.min
+        if self.max is None or (other.max is not None and other.max > self.max):
+            self.max = other.max
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.total if self.total else None
+
+    def percentile(self, p: float) -> Optional[float]:
+        """分位数(p 取 0~100)，结果限制在实际最小/最大值之间"""
+        if not self.total:
+            return None
+        rank = max(1, int(math.ceil(p / 100 * self.total)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(max(bucket_value(index), self.min), self.max)
+        return self.max
+
+    def percentiles(self, ps: Iterable[float]) -> Dict[str, Optional[float]]:
+        return {f"p{p:g}": self.percentile(p) for p in ps}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """稀疏表示：仅保存非空桶"""
+        return {
+            "total": self.total,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "buckets": {str(i): c for i, c in enumerate(self.counts) if c}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls()
+        for index, count in data.get("buckets", {}).items():
+            histogram.counts[int(index)] = count
+        histogram.total = data.get("total", 0)
+        histogram.sum = data.get("sum", 0.0)
+        histogram.min = data.get("min")
+        histogram.max = data.get("max")
+        return histogram
+
+
+class SecondBucket:
+    """单秒汇总"""
+
+    __slots__ = ("count", "errors", "latency_sum", "latency_max", "bytes")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.bytes = 0
+
+    def add(self, latency: float, success: bool, size: int) -> None:
+        self.count += 1
+        if not success:
+            self.errors += 1
+        self.latency_sum += latency
+        if latency > self.latency_max:
+            self.latency_max = latency
+        self.bytes += size
+
+    def merge(self, other: "SecondBucket") -> None:
+        self.count += other.count
+        self.errors += other.errors
+        self.latency_sum += other.latency_sum
+        if other.latency_max > self.latency_max:
+            self.latency_max = other.latency_max
+        self.bytes += other.bytes
+
+    @property
+    def avg_latency(self) -> float:
+        return self.latency_sum / self.count if self.count else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.count if self.count else 0.0
+
+
+class LabelStats:
+    """单个请求标签的汇总"""
+
+    __slots__ = ("count", "errors", "bytes", "histogram", "corrected")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+        self.histogram = LatencyHistogram()
+        self.corrected = LatencyHistogram()
+
+
+class ExecutionStats:
+    """
+    执行实时聚合器
+
+    按采样时间(秒)累积单秒汇总，按标签累积直方图；已结束的秒由后台任务取出
+    写入时序表，并在内存中保留最近 RECENT_SECONDS 秒用于实时展示。
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.errors = 0
+        self.bytes = 0
+        self.histogram = LatencyHistogram()
+        # 协调遗漏校正后的延迟直方图
+        self.corrected = LatencyHistogram()
+        self.labels: Dict[str, LabelStats] = {}
+        self.first_ts: Optional[int] = None
+        self.last_ts: Optional[int] = None
+        # 尚未写入时序表的秒 -> 汇总
+        self.open_seconds: Dict[int, SecondBucket] = {}
+        # 已写入时序表的最近若干秒
+        self.recent: Deque[Tuple[int, SecondBucket]] = deque(maxlen=RECENT_SECONDS)
+        # 最近一次取出的秒，之后才到达的更早采样不再进入时序
+        self.flushed_until: Optional[int] = None
+        self.late_samples = 0
+
+    def record(
+        self,
+        timestamp: int,
+        label: str,
+        latency: float,
+        success: bool,
+        size: int = 0,
+        intended_ts: Optional[int] = None
+    ) -> None:
+        """
+        记录一条采样
+
+        Args:
+            timestamp: 请求开始时间(毫秒时间戳)
+            label: 请求标签
+            latency: 响应时间(毫秒)
+            success: 是否成功
+            size: 响应字节数
+            intended_ts: 计划发送时间(毫秒时间戳)
+        """
+        self.total += 1
+        if not success:
+            self.errors += 1
+        self.bytes += size
+        self.histogram.record(latency)
+        corrected = corrected_latency(timestamp, latency, intended_ts)
+        self.corrected.record(corrected)
+
+        stats = self.labels.get(label)
+        if stats is None:
+            stats = self.labels[label] = LabelStats()
+        stats.count += 1
+        if not success:
+            stats.errors += 1
+        stats.bytes += size
+        stats.histogram.record(latency)
+        stats.corrected.record(corrected)
+
+        if self.first_ts is None or timestamp < self.first_ts:
+            self.first_ts = timestamp
+        if self.last_ts is None or timestamp > self.last_ts:
+            self.last_ts = timestamp
+
+        second = timestamp // 1000
+        if self.flushed_until is not None and second <= self.flushed_until:
+            self.late_samples += 1
+            return
+        bucket = self.open_seconds.get(second)
+        if bucket is None:
+            bucket = self.open_seconds[second] = SecondBucket()
+        bucket.add(latency, success, size)
+
+    def export(self) -> Dict[str, Any]:
+        """导出总体与各标签的精确汇总(直方图为稀疏表示)，用于持久化"""
+        return {
+            "total": self.total,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "first_ts": self.first_ts,
+            "last_ts": self.last_ts,
+            "histogram": self.histogram.to_dict(),
+            "corrected": self.corrected.to_dict(),
+            "labels": {
+                label: {
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "bytes": stats.bytes,
+                    "histogram": stats.histogram.to_dict(),
+                    "corrected": stats.corrected.to_dict()
+                }
+                for label, stats in self.labels.items()
+            }
+        }
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        """从 export 的结果恢复汇总(服务重启后继续累积)"""
+        self.total = data.get("total", 0)
+        self.errors = data.get("errors", 0)
+        self.bytes = data.get("bytes", 0)
+        self.first_ts = data.get("first_ts")
+        self.last_ts = data.get("last_ts")
+        self.histogram = LatencyHistogram.from_dict(data.get("histogram", {}))
+        self.corrected = LatencyHistogram.from_dict(data.get("corrected", {}))
+        self.labels = {}
+        for label, item in data.get("labels", {}).items():
+            stats = self.labels[label] = LabelStats()
+            stats.count = item.get("count", 0)
+            stats.errors = item.get("errors", 0)
+            stats.bytes = item.get("bytes", 0)
+            stats.histogram = LatencyHistogram.from_dict(item.get("histogram", {}))
+            stats.corrected = LatencyHistogram.from_dict(item.get("corrected", {}))
+
+    def pop_closed_seconds(self, before: Optional[int] = None) -> List[Tuple[int, SecondBucket]]:
+        """
+        取出已结束的秒
+
+        Args:
+            before: 取出早于该秒的数据，为 None 时全部取出(执行结束)
+        """
+        seconds = sorted(s for s in self.open_seconds if before is None or s < before)
+        closed = [(second, self.open_seconds.pop(second)) for second in seconds]
+        if closed:
+            self.flushed_until = closed[-1][0]
+            self.recent.extend(closed)
+        return closed
+
+    def recent_rate(self, window: int = 10) -> Dict[str, float]:
+        """最近 window 个已结束秒的吞吐、平均延迟与错误率"""
+        points = list(self.recent)[-window:]
+        count = sum(b.count for _, b in points)
+        if not points or not count:
+            return {"rps": 0.0, "avg_latency": 0.0, "error_rate": 0.0}
+        span = points[-1][0] - points[0][0] + 1
+        return {
+            "rps": count / span,
+            "avg_latency": sum(b.latency_sum for _, b in points) / count,
+            "error_rate": sum(b.errors for _, b in points) / count
+        }
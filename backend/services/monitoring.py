@@ -0,0 +1,253 @@
+"""
+被测系统监控模块
+执行运行期间采集其所属项目的监控目标资源指标，与执行的吞吐/延迟写入同一时序表(metric_points)：
+
+- node_exporter：按目标的采集间隔拉取 Prometheus 文本格式指标，派生出 CPU/内存/负载/GC/网络等指标
+- agent：目标上的代理通过接口推送指标点
+
+指标点以 source="monitor:<目标ID>" 写入每个运行中执行，时间为服务器秒级时间戳，
+与执行自身的秒级序列(source="execution")分辨率一致，可直接叠加对比。
+"""
+import asyncio
+import logging
+import math
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+from tortoise import timezone
+
+from config import MONITOR_SCRAPE_TIMEOUT
+from models import MonitorTarget, MetricPoint, TestPlan
+from services.copy_insert import bulk_insert
+from services.db_writer import db_writer
+from services.executions import registry
+
+logger = logging.getLogger(__name__)
+
+# 原始指标: (名称, 标签, 值)
+RawSample = Tuple[str, Dict[str, str], float]
+
+_LINE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)')
+_LABEL = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+
+# CPU 空闲模式
+CPU_IDLE_MODES = ("idle", "iowait")
+# GC 累计耗时(秒)计数器：JVM(client_java / Micrometer)与 Go 运行时
+GC_COUNTERS = ("jvm_gc_collection_seconds_sum", "jvm_gc_pause_seconds_sum", "go_gc_duration_seconds_sum")
+# 两次采集间隔超过采集间隔的该倍数时不计算速率(执行间隙的长时间平均没有意义)
+RATE_MAX_GAP = 5
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(limits=httpx.Limits(max_connections=100, max_keepalive_connections=50))
+    return _client
+
+
+async def close() -> None:
+    """关闭连接池(应用退出时调用)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def parse_prometheus(text: str) -> List[RawSample]:
+    """解析 Prometheus 文本格式，忽略注释与无法解析的行"""
+    samples = []
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        match = _LINE.match(line)
+        if not match:
+            continue
+        name, labels_text, value_text = match.groups()
+        try:
+            value = float(value_text)
+        except ValueError:
+            continue
+        labels = dict(_LABEL.findall(labels_text)) if labels_text else {}
+        samples.append((name, labels, value))
+    return samples
+
+
+def _sum(samples: Iterable[RawSample], name: str, exclude: Optional[Dict[str, Iterable[str]]] = None) -> Optional[float]:
+    total, found = 0.0, False
+    for sample_name, labels, value in samples:
+        if sample_name != name or math.isnan(value):
+            continue
+        if exclude and any(labels.get(key) in values for key, values in exclude.items()):
+            continue
+        total += value
+        found = True
+    return total if found else None
+
+
+class MonitorCollector:
+    """监控目标采集器"""
+
+    def __init__(self):
+        # 目标ID -> 上次采集的计数器值(含 "_ts" 采集时间)
+        self._counters: Dict[int, Dict[str, float]] = {}
+        # 目标ID -> 上次尝试采集的时间(time.monotonic)
+        self._attempted: Dict[int, float] = {}
+
+    def derive(self, target: MonitorTarget, samples: List[RawSample], now: float) -> Dict[str, float]:
+        """
+        由原始指标派生监控指标
+
+        - cpu_usage: 全部 CPU 非空闲时间占比(%)，由两次采集间 node_cpu_seconds_total 的增量计算
+        - memory_usage: 1 - MemAvailable / MemTotal (%)
+        - load1: 1 分钟平均负载
+        - gc_time: 每秒 GC 耗时(毫秒/秒)
+        - net_rx_bytes / net_tx_bytes: 每秒网络收发字节(不含 lo)
+        - extra_metrics 中的原始指标按名称求和后原样记录
+        """
+        metrics: Dict[str, float] = {}
+        counters: Dict[str, float] = {"_ts": now}
+        cpu_total = _sum(samples, "node_cpu_seconds_total")
+        if cpu_total is not None:
+            counters["cpu_total"] = cpu_total
+            cpu_busy = _sum(samples, "node_cpu_seconds_total", {"mode": CPU_IDLE_MODES})
+            counters["cpu_busy"] = cpu_busy or 0.0
+        gc_values = [value for value in (_sum(samples, name) for name in GC_COUNTERS) if value is not None]
+        if gc_values:
+            counters["gc_seconds"] = sum(gc_values)
+        for key, name in (("net_rx_bytes", "node_network_receive_bytes_total"), ("net_tx_bytes", "node_network_transmit_bytes_total")):
+            value = _sum(samples, name, {"device": ("lo",)})
+            if value is not None:
+                counters[key] = value
+
+        previous = self._counters.get(target.id)
+        self._counters[target.id] = counters
+        elapsed = now - previous["_ts"] if previous else 0
+        if previous and 0 < elapsed <= max(target.interval, 1) * RATE_MAX_GAP:
+            if "cpu_total" in counters and "cpu_total" in previous:
+                total = counters["cpu_total"] - previous["cpu_total"]
+                if total > 0:
+                    metrics["cpu_usage"] = round(100 * (counters["cpu_busy"] - previous["cpu_busy"]) / total, 2)
+            if "gc_seconds" in counters and "gc_seconds" in previous:
+                metrics["gc_time"] = round(max(counters["gc_seconds"] - previous["gc_seconds"], 0) * 1000 / elapsed, 3)
+            for key in ("net_rx_bytes", "net_tx_bytes"):
+                if key in counters and key in previous:
+                    metrics[key] = round(max(counters[key] - previous[key], 0) / elapsed, 2)
+
+        mem_total = _sum(samples, "node_memory_MemTotal_bytes")
+        mem_available = _sum(samples, "node_memory_MemAvailable_bytes")
+        if mem_total and mem_available is not None:
+            metrics["memory_usage"] = round(100 * (1 - mem_available / mem_total), 2)
+        load1 = _sum(samples, "node_load1")
+        if load1 is not None:
+            metrics["load1"] = load1
+        for name in target.extra_metrics or []:
+            value = _sum(samples, name)
+            if value is not None:
+                metrics[name[:50]] = value
+        return metrics
+
+    async def scrape(self, target: MonitorTarget) -> Dict[str, float]:
+        """
+        拉取一次目标指标
+
+        Raises:
+            httpx.HTTPError: 请求失败或响应状态码非 2xx
+        """
+        host = f"[{target.host}]" if ":" in target.host else target.host
+        port = f":{target.port}" if target.port else ""
+        headers = {"Authorization": f"Bearer {target.auth_token}"} if target.auth_token else {}
+        response = await _get_client().get(
+            f"{target.scheme}://{host}{port}{target.metrics_path}", headers=headers, timeout=MONITOR_SCRAPE_TIMEOUT
+        )
+        response.raise_for_status()
+        samples = await asyncio.to_thread(parse_prometheus, response.text)
+        return self.derive(target, samples, time.time())
+
+    async def _live_executions(self) -> Dict[int, List[int]]:
+        """运行中执行按项目分组: 项目ID -> 执行主键列表"""
+        lives = registry.all()
+        if not lives:
+            return {}
+        plan_projects = dict(await TestPlan.filter(
+            id__in={live.test_plan_id for live in lives}
+        ).values_list('id', 'project_id_id'))
+        projects: Dict[int, List[int]] = {}
+        for live in lives:
+            project_id = plan_projects.get(live.test_plan_id)
+            if project_id is not None:
+                projects.setdefault(project_id, []).append(live.id)
+        return projects
+
+    async def collect(self) -> None:
+        """后台周期调用：并发拉取到期的 node_exporter 目标并写入其项目内所有运行中执行"""
+        projects = await self._live_executions()
+        if not projects:
+            return
+        targets = await MonitorTarget.filter(
+            project_id__in=list(projects), method="node_exporter", is_active=True, is_deleted=False
+        )
+        now = time.monotonic()
+        due = [target for target in targets if now - self._attempted.get(target.id, 0) >= max(target.interval, 1)]
+        if not due:
+            return
+        for target in due:
+            self._attempted[target.id] = now
+
+        results = await asyncio.gather(*(self.scrape(target) for target in due), return_exceptions=True)
+        ts = int(time.time())
+        points, succeeded = [], []
+        for target, result in zip(due, results):
+            if isinstance(result, BaseException):
+                error = str(result) or type(result).__name__
+                if error != target.last_error:
+                    logger.warning("监控目标 %s 采集失败: %s", target.id, error)
+                    await MonitorTarget.filter(id=target.id).update(last_error=error[:255])
+                continue
+            succeeded.append(target.id)
+            points.extend(
+                MetricPoint(execution_id=execution_id, source=f"monitor:{target.id}", name=name, ts=ts, value=value)
+                for execution_id in projects[target.project_id]
+                for name, value in result.items()
+            )
+        if points:
+            await db_writer.submit(lambda: bulk_insert(points))
+        if succeeded:
+            await MonitorTarget.filter(id__in=succeeded).update(last_collected_at=timezone.now(), last_error=None)
+
+    async def record_push(self, target: MonitorTarget, points: Iterable[Any]) -> int:
+        """
+        写入代理推送的指标点
+
+        Args:
+            target: 监控目标
+            points: 具有 name/value/ts(毫秒时间戳，可为空) 属性的指标点
+
+        Returns:
+            int: 写入的指标点数(项目内没有运行中执行时为 0)
+        """
+        execution_ids = (await self._live_executions()).get(target.project_id, [])
+        if not execution_ids:
+            return 0
+        now = int(time.time())
+        rows = [
+            MetricPoint(
+                execution_id=execution_id,
+                source=f"monitor:{target.id}",
+                name=point.name,
+                ts=point.ts // 1000 if point.ts is not None else now,
+                value=point.value
+            )
+            for execution_id in execution_ids
+            for point in points
+        ]
+        if rows:
+            await db_writer.submit(lambda: bulk_insert(rows))
+            await MonitorTarget.filter(id=target.id).update(last_collected_at=timezone.now(), last_error=None)
+        return len(rows) // len(execution_ids)
+
+
+monitor_collector = MonitorCollector()
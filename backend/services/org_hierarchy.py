@@ -0,0 +1,112 @@
+"""
+组织层级索引
+基于物化路径 (materialized path) 维护组织的祖先/后代关系，
+使子树统计、子树成员查询和祖先判断都只需一次查询
+"""
+from typing import Dict, Optional
+
+from pypika_tortoise.terms import Function as PypikaFunction
+from tortoise.expressions import F, Function
+
+from models import Organize
+from services.pagination import count_cache
+from services.org_tree import org_tree
+
+
+class _ReplaceFunction(PypikaFunction):
+    def __init__(self, term, old, new, alias=None):
+        super().__init__("REPLACE", term, old, new, alias=alias)
+
+
+class Replace(Function):
+    """字符串替换 REPLACE(field, old, new)，SQLite/PostgreSQL/MySQL 均支持"""
+
+    database_func = _ReplaceFunction
+
+
+def build_path(org_id: int, parent_path: Optional[str] = None) -> str:
+    """根据父级路径生成组织路径"""
+    return f"{parent_path or '/'}{org_id}/"
+
+
+def is_ancestor(ancestor: Organize, descendant: Organize) -> bool:
+    """判断 ancestor 是否为 descendant 的祖先（不含自身）"""
+    if not ancestor.path or not descendant.path:
+        return False
+    return descendant.path != ancestor.path and descendant.path.startswith(ancestor.path)
+
+
+async def count_descendants(org: Organize) -> int:
+    """统计所有未删除的后代组织数量（单次查询）"""
+    return await Organize.filter(path__startswith=org.path, is_deleted=False).exclude(id=org.id).count()
+
+
+async def assign_path(org: Organize, parent: Optional[Organize] = None) -> None:
+    """为新建组织写入路径"""
+    org.path = build_path(org.id, parent.path if parent else None)
+    await org.save(update_fields=["path"])
+
+
+async def move_subtree(org: Organize, parent: Optional[Organize]) -> None:
+    """
+    将组织及其全部后代移动到新的父级下
+
+    通过一条 UPDATE 同时改写整棵子树的路径前缀与层级。
+
+    Args:
+        org: 被移动的组织（path/level 为移动前的值）
+        parent: 新的父级组织，None 表示移动为顶级组织
+    """
+    old_path = org.path
+    new_path = build_path(org.id, parent.path if parent else None)
+    new_level = parent.level + 1 if parent else 1
+    level_delta = new_level - org.level
+
+    # 每个组织ID在同一路径中只出现一次，因此旧前缀在子树路径中只会匹配开头
+    await Organize.filter(path__startswith=old_path).update(
+        path=Replace("path", old_path, new_path),
+        level=F("level") + level_delta
+    )
+    count_cache.invalidate(Organize)
+
+    org.path = new_path
+    org.level = new_level
+
+
+async def rebuild_paths() -> int:
+    """
+    根据 parent_id 重建全部组织路径和层级
+
+    用于历史数据回填或修复，返回更新的组织数量。
+    """
+    orgs = await Organize.all()
+    org_dict = {org.id: org for org in orgs}
+    resolved: Dict[int, str] = {}
+
+    def resolve(org: Organize) -> str:
+        chain = []
+        node = org
+        # 沿父级向上查找，遇到已解析节点、顶级节点、缺失父级或环时停止
+        while node and node.id not in resolved and node.id not in chain:
+            chain.append(node.id)
+            node = org_dict.get(node.parent_id) if node.parent_id else None
+        path = resolved[node.id] if node and node.id in resolved else "/"
+        for org_id in reversed(chain):
+            path = build_path(org_id, path)
+            resolved[org_id] = path
+        return resolved[org.id]
+
+    changed = []
+    for org in orgs:
+        path = resolve(org)
+        level = path.count("/") - 1
+        if org.path != path or org.level != level:
+            org.path = path
+            org.level = level
+            changed.append(org)
+
+    if changed:
+        await Organize.bulk_update(changed, fields=["path", "level"], batch_size=500)
+        count_cache.invalidate(Organize)
+        org_tree.invalidate()
+    return len(changed)
@@ -0,0 +1,240 @@
+"""
+组织树缓存
+在内存中维护组织树快照，组织变更时通过模型信号增量更新，
+按用户裁剪视图并生成 ETag，避免每次请求全表加载组织
+"""
+import asyncio
+import json
+import secrets
+import time
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from tortoise.signals import post_save, post_delete
+
+from config import ORG_TREE_CACHE_TTL
+from models import Organize, UserInfo, UserOrgRole
+
+
+class OrgTreeCache:
+    """
+    组织树快照
+
+    节点按 id 存放，children 关系由 parent_id 推导；完整树与各用户裁剪后的树
+    序列化结果按版本号缓存，任何组织变更都会使版本号递增。
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        # 进程级随机前缀，避免重启后版本号重复导致 ETag 误命中
+        self._epoch = secrets.token_hex(4)
+        self._nodes: Optional[Dict[int, Dict[str, Any]]] = None
+        self._managers: Dict[int, Optional[Dict[str, Any]]] = {}
+        self._loaded_at = 0.0
+        self._version = 0
+        self._lock = asyncio.Lock()
+        # 用户所属组织ID及其版本号
+        self._user_orgs: Dict[int, FrozenSet[int]] = {}
+        self._user_versions: Dict[int, int] = {}
+        # etag -> 序列化后的树
+        self._rendered: Dict[str, bytes] = {}
+
+    # ==================== 加载与失效 ====================
+
+    def invalidate(self) -> None:
+        """丢弃整个快照，下次访问时全量重建"""
+        self._nodes = None
+        self._managers = {}
+        self._reset_users()
+        self._bump()
+
+    def invalidate_user(self, user_id: int) -> None:
+        """用户的组织归属发生变化"""
+        self._user_orgs.pop(user_id, None)
+        self._user_versions[user_id] = self._user_versions.get(user_id, 0) + 1
+
+    def _reset_users(self) -> None:
+        """丢弃全部用户的组织归属缓存，版本号递增使进行中的查询结果不再写入"""
+        for user_id in set(self._user_orgs) | set(self._user_versions):
+            self._user_versions[user_id] = self._user_versions.get(user_id, 0) + 1
+        self._user_orgs = {}
+
+    def _bump(self) -> None:
+        self._version += 1
+        self._rendered = {}
+
+    async def _ensure_loaded(self) -> Dict[int, Dict[str, Any]]:
+        if self._nodes is not None and time.monotonic() - self._loaded_at < self.ttl:
+            return self._nodes
+        async with self._lock:
+            if self._nodes is None or time.monotonic() - self._loaded_at >= self.ttl:
+                organizations = await Organize.filter(is_deleted=False).prefetch_related('manager_id')
+                nodes = {}
+                managers = {}
+                for org in organizations:
+                    if org.manager_id:
+                        managers[org.manager_id.id] = self._manager_data(org.manager_id)
+                    nodes[org.id] = self._node_data(org, org.manager_id.id if org.manager_id else None)
+                self._nodes = nodes
+                self._managers = managers
+                # 用户组织归属同样可能被其他进程或批量更新修改，随快照一起过期
+                self._reset_users()
+                self._loaded_at = time.monotonic()
+                self._bump()
+        return self._nodes
+
+    @staticmethod
+    def _manager_data(manager: UserInfo) -> Dict[str, Any]:
+        return {
+            "id": manager.id,
+            "username": manager.username,
+            "real_name": manager.real_name
+        }
+
+    @staticmethod
+    def _node_data(org: Organize, manager_id: Optional[int]) -> Dict[str, Any]:
+        return {
+            "id": org.id,
+            "name": org.name,
+            "level": org.level,
+            "parent_id": org.parent_id,
+            "sort_order": org.sort_order,
+            "manager_id": manager_id
+        }
+
+    # ==================== 增量更新 ====================
+
+    async def apply_save(self, org: Organize) -> None:
+        """组织新增或修改后更新快照"""
+        if self._nodes is None:
+            return
+        if org.is_deleted:
+            self.apply_delete(org.id)
+            return
+
+        manager_id = getattr(org, "manager_id_id", None)
+        if manager_id and manager_id not in self._managers:
+            manager = await UserInfo.get_or_none(id=manager_id)
+            self._managers[manager_id] = self._manager_data(manager) if manager else None
+
+        old = self._nodes.get(org.id)
+        node = self._node_data(org, manager_id)
+        self._nodes[org.id] = node
+        # 父级变化时后代层级由数据库批量更新，这里按树结构同步调整
+        if old and old["parent_id"] != node["parent_id"]:
+            self._relevel(org.id)
+        self._bump()
+
+    def apply_delete(self, org_id: int) -> None:
+        """组织删除后更新快照"""
+        if self._nodes is None:
+            return
+        if self._nodes.pop(org_id, None) is not None:
+            self._bump()
+
+    def apply_manager_change(self, user: UserInfo) -> None:
+        """管理员用户信息变化后更新快照"""
+        if user.id in self._managers:
+            self._managers[user.id] = self._manager_data(user)
+            self._bump()
+
+    def _relevel(self, org_id: int) -> None:
+        children = self._children_index()
+        stack = [org_id]
+        while stack:
+            current = self._nodes[stack.pop()]
+            for child_id in children.get(current["id"], []):
+                self._nodes[child_id]["level"] = current["level"] + 1
+                stack.append(child_id)
+
+    # ==================== 查询 ====================
+
+    async def _get_user_orgs(self, user_id: int) -> FrozenSet[int]:
+        org_ids = self._user_orgs.get(user_id)
+        if org_ids is None:
+            version = self._user_versions.get(user_id, 0)
+            org_ids = frozenset(await UserOrgRole.filter(user_id=user_id, is_active=True).values_list('organization_id', flat=True))
+            # 查询期间归属未发生变化时才写入缓存
+            if self._user_versions.get(user_id, 0) == version:
+                self._user_orgs[user_id] = org_ids
+        return org_ids
+
+    async def get_tree(self, user: UserInfo) -> Tuple[str, bytes]:
+        """
+        获取用户可见的组织树
+
+        Returns:
+            Tuple[str, bytes]: (ETag, JSON 序列化后的树)
+        """
+        nodes = await self._ensure_loaded()
+        if user.is_superuser:
+            visible = None
+            etag = f'"{self._epoch}-{self._version}"'
+        else:
+            visible = await self._get_user_orgs(user.id)
+            etag = f'"{self._epoch}-{self._version}-u{user.id}.{self._user_versions.get(user.id, 0)}"'
+
+        rendered = self._rendered.get(etag)
+        if rendered is None:
+            tree = self._build_tree(nodes, visible)
+            rendered = json.dumps(tree, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            self._rendered[etag] = rendered
+        return etag, rendered
+
+    def _children_index(self, visible: Optional[FrozenSet[int]] = None) -> Dict[Optional[int], List[int]]:
+        index: Dict[Optional[int], List[int]] = {}
+        ordered = sorted(self._nodes.values(), key=lambda n: (n["sort_order"], n["id"]))
+        for node in ordered:
+            if visible is not None and node["id"] not in visible:
+                continue
+            index.setdefault(node["parent_id"], []).append(node["id"])
+        return index
+
+    def _build_tree(self, nodes: Dict[int, Dict[str, Any]], visible: Optional[FrozenSet[int]]) -> List[Dict[str, Any]]:
+        """
+        构建树形结构
+
+        与原实现保持一致：父级为空的节点作为根，父级不可见的节点不出现在树中。
+        """
+        children = self._children_index(visible)
+
+        def render(org_id: int) -> Dict[str, Any]:
+            node = nodes[org_id]
+            return {
+                "id": node["id"],
+                "name": node["name"],
+                "level": node["level"],
+                "parent_id": node["parent_id"],
+                "manager": self._managers.get(node["manager_id"]) if node["manager_id"] else None,
+                "children": [render(child_id) for child_id in children.get(org_id, [])]
+            }
+
+        return [render(org_id) for org_id in children.get(None, [])]
+
+
+org_tree = OrgTreeCache(ORG_TREE_CACHE_TTL)
+
+
+# 注册模型信号，组织、管理员、用户组织归属变化时增量更新快照
+@post_save(Organize)
+async def _on_organize_save(sender, instance, created, using_db, update_fields) -> None:
+    await org_tree.apply_save(instance)
+
+
+@post_delete(Organize)
+async def _on_organize_delete(sender, instance, using_db) -> None:
+    org_tree.apply_delete(instance.id)
+
+
+@post_save(UserInfo)
+async def _on_user_save(sender, instance, created, using_db, update_fields) -> None:
+    org_tree.apply_manager_change(instance)
+
+
+@post_save(UserOrgRole)
+async def _on_user_org_role_save(sender, instance, created, using_db, update_fields) -> None:
+    org_tree.invalidate_user(instance.user_id)
+
+
+@post_delete(UserOrgRole)
+async def _on_user_org_role_delete(sender, instance, using_db) -> None:
+    org_tree.invalidate_user(instance.user_id)
@@ -0,0 +1,161 @@
+"""
+分页辅助模块
+提供列表接口的 COUNT 缓存、总数统计模式和分页响应构建
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from tortoise.models import Model
+from tortoise.queryset import QuerySet
+from tortoise.signals import post_save, post_delete
+
+import models
+from config import COUNT_CACHE_MAX_ENTRIES, COUNT_CACHE_TTL, COUNT_CACHE_APPROX_TTL
+
+# 总数统计方式：exact 精确（缓存随写入失效）、approx 允许短时间过期的缓存值、none 不统计
+TOTAL_MODES = ("exact", "approx", "none")
+TOTAL_MODE_PATTERN = "^(exact|approx|none)$"
+
+
+def _normalize_value(value: Any) -> Any:
+    """规范化筛选值，使集合类参数与顺序无关"""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(sorted(set(value)))
+    return value
+
+
+class CountCache:
+    """
+    COUNT 结果缓存
+
+    以 (模型, 规范化筛选条件) 为键缓存总数，每个模型维护一个写入版本号，
+    模型发生写入时版本号递增，精确模式下旧版本的缓存即视为失效。
+    """
+
+    def __init__(self, max_entries: int, exact_ttl: float, approx_ttl: float):
+        self.max_entries = max_entries
+        self.exact_ttl = exact_ttl
+        self.approx_ttl = approx_ttl
+        # key -> (写入版本号, 总数, 缓存时间)
+        self._entries: "OrderedDict[Tuple, Tuple[int, int, float]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        # 写入监听器，供其他汇总数据跟随模型写入刷新
+        self._listeners: List[Callable[[Type[Model]], None]] = []
+
+    def add_listener(self, listener: Callable[[Type[Model]], None]) -> None:
+        """注册写入监听器，模型每次失效时以模型类调用"""
+        self._listeners.append(listener)
+
+    def version(self, model: Type[Model]) -> int:
+        """获取模型当前写入版本号"""
+        return self._versions.get(model.__name__, 0)
+
+    def invalidate(self, model: Type[Model]) -> None:
+        """模型发生写入，使其全部缓存失效"""
+        self._versions[model.__name__] = self.version(model) + 1
+        for listener in self._listeners:
+            listener(model)
+
+    @staticmethod
+    def make_key(model: Type[Model], filters: Dict[str, Any]) -> Tuple:
+        """生成缓存键：忽略值为 None 的条件，并按字段名排序"""
+        items = tuple(sorted(
+            (field, _normalize_value(value))
+            for field, value in filters.items()
+            if value is not None
+        ))
+        return (model.__name__, items)
+
+    async def count(
+        self,
+        model: Type[Model],
+        filters: Dict[str, Any],
+        query: QuerySet,
+        mode: str = "exact"
+    ) -> Optional[int]:
+        """
+        获取查询总数
+
+        Args:
+            model: 查询的模型
+            filters: 构成 query 的全部筛选条件
+            query: 已应用 filters 的查询集
+            mode: 总数统计方式 exact/approx/none
+
+        Returns:
+            Optional[int]: 总数，mode 为 none 时返回 None
+        """
+        if mode == "none":
+            return None
+
+        key = self.make_key(model, filters)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry:
+            version, total, cached_at = entry
+            age = now - cached_at
+            if mode == "approx" and age < self.approx_ttl:
+                return total
+            if version == self.version(model) and age < self.exact_ttl:
+                self._entries.move_to_end(key)
+                return total
+
+        version = self.version(model)
+        total = await query.count()
+        self._entries[key] = (version, total, now)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return total
+
+
+count_cache = CountCache(COUNT_CACHE_MAX_ENTRIES, COUNT_CACHE_TTL, COUNT_CACHE_APPROX_TTL)
+
+
+async def fetch_page(query: QuerySet, page: int, page_size: int) -> Tuple[List[Any], bool]:
+    """
+    获取一页数据
+
+    多取一行用于判断是否还有下一页，这样在不统计总数时也能给出 has_next。
+
+    Returns:
+        Tuple[List, bool]: (当前页数据, 是否还有下一页)
+    """
+    rows = await query.offset((page - 1) * page_size).limit(page_size + 1)
+    return rows[:page_size], len(rows) > page_size
+
+
+def build_page_data(
+    items: List[Any],
+    total: Optional[int],
+    page: int,
+    page_size: int,
+    has_next: bool
+) -> Dict[str, Any]:
+    """构建分页响应数据，未统计总数时 total/pages 为 None"""
+    total_pages = (total + page_size - 1) // page_size if total is not None else None
+    return {
+        "items": items,
+        "total": total,
+        "page": page,
+        "size": page_size,
+        "pages": total_pages,
+        "has_next": has_next,
+        "has_prev": page > 1
+    }
+
+
+# 注册写入信号：任意模型保存或删除后使其计数缓存失效
+# 注意 QuerySet.update()/delete() 与 bulk_create 不会触发信号，需手动调用 count_cache.invalidate
+_cached_models = [getattr(models, name) for name in models.__all__]
+
+
+@post_save(*_cached_models)
+async def _invalidate_on_save(sender, instance, created, using_db, update_fields) -> None:
+    count_cache.invalidate(sender)
+
+
+@post_delete(*_cached_models)
+async def _invalidate_on_delete(sender, instance, using_db) -> None:
+    count_cache.invalidate(sender)
@@ -0,0 +1,385 @@
+"""
+执行结果列式存储模块
+执行结束后将原始采样从数据库整理为按列存放的文件：
+
+    <EXECUTION_DATA_DIR>/<execution_id>/samples/
+        meta.json         行数、时间范围、标签字典、各列类型
+        timestamp.npy     int64   请求开始时间(毫秒)，已按时间排序
+        intended_ts.npy   int64   计划发送时间(毫秒)，未上报时等于请求开始时间
+        label.npy         uint16/uint32 标签字典编码
+        latency.npy       float32 响应时间(毫秒)
+        status_code.npy   uint16
+        success.npy       bool
+        bytes.npy         uint32
+        slave_id.npy      int32   为空时为 -1
+        weight.npy        float32 每行代表的采样数(完整保留时为 1，见 services.retention)
+        histograms.npy    int64   标签 × 延迟分桶的计数矩阵(分桶见 services.metrics)
+        corrected_histograms.npy  int64   协调遗漏校正后延迟的 标签 × 分桶 计数矩阵
+        aggregates.json   非完整保留时执行期间的精确汇总，两个直方图矩阵也由它生成而不是由保留的行计算
+
+列文件为未压缩的 .npy，可直接内存映射；体积通过窄类型与标签字典编码压缩，
+按时间排序后时间范围查询只需二分定位再切片，分析时只读取用到的列。
+"""
+import asyncio
+import json
+import os
+import shutil
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import EXECUTION_DATA_DIR, MAINTENANCE_BATCH, RESULT_FINALIZE_BATCH
+from models import TestExecution, ExecutionSample
+from services.metrics import BUCKET_COUNT, LINEAR_LIMIT, BUCKET_GROWTH, LatencyHistogram
+
+SAMPLES_DIR = "samples"
+META_FILE = "meta.json"
+HISTOGRAM_FILE = "histograms.npy"
+CORRECTED_HISTOGRAM_FILE = "corrected_histograms.npy"
+AGGREGATES_FILE = "aggregates.json"
+
+# 列名 -> 数据类型(标签列类型按字典大小决定)
+COLUMN_DTYPES = {
+    "timestamp": np.int64,
+    "intended_ts": np.int64,
+    "latency": np.float32,
+    "status_code": np.uint16,
+    "success": np.bool_,
+    "bytes": np.uint32,
+    "slave_id": np.int32,
+    "weight": np.float32,
+}
+COLUMNS = ("timestamp", "intended_ts", "label", "latency", "status_code", "success", "bytes", "slave_id", "weight")
+
+
+def samples_directory(execution_id: str) -> str:
+    """执行列式结果目录"""
+    return os.path.join(EXECUTION_DATA_DIR, execution_id, SAMPLES_DIR)
+
+
+def bucket_indices(latency: np.ndarray) -> np.ndarray:
+    """向量化计算延迟所在的桶下标，与 services.metrics.bucket_index 一致"""
+    latency = np.maximum(np.asarray(latency, dtype=np.float64), 0)
+    linear = np.floor(latency)
+    geometric = LINEAR_LIMIT + np.floor(np.log(np.maximum(latency, LINEAR_LIMIT) / LINEAR_LIMIT) / np.log(BUCKET_GROWTH))
+    return np.minimum(np.where(latency < LINEAR_LIMIT, linear, geometric), BUCKET_COUNT - 1).astype(np.int64)
+
+
+def label_histograms(labels: np.ndarray, latency: np.ndarray, label_count: int) -> np.ndarray:
+    """一次 bincount 得到 标签 × 分桶 的计数矩阵"""
+    keys = labels.astype(np.int64) * BUCKET_COUNT + bucket_indices(latency)
+    return np.bincount(keys, minlength=label_count * BUCKET_COUNT).reshape(label_count, BUCKET_COUNT)
+
+
+def corrected_latencies(timestamps: np.ndarray, intended: np.ndarray, latency: np.ndarray) -> np.ndarray:
+    """向量化计算协调遗漏校正后的延迟，与 services.metrics.corrected_latency 一致"""
+    delay = np.maximum(np.asarray(timestamps, dtype=np.int64) - np.asarray(intended, dtype=np.int64), 0)
+    return np.asarray(latency, dtype=np.float64) + delay
+
+
+def weighted_percentiles(values: np.ndarray, weights: np.ndarray, percentiles: Tuple[float, ...]) -> np.ndarray:
+    """按权重计算分位数(取累计权重首次达到该比例的值)，用于抽样保留的行"""
+    order = np.argsort(values, kind="stable")
+    cumulative = np.cumsum(np.asarray(weights, dtype=np.float64)[order])
+    ranks = np.asarray(percentiles, dtype=np.float64) / 100 * cumulative[-1]
+    positions = np.minimum(np.searchsorted(cumulative, ranks, side="left"), len(order) - 1)
+    return np.asarray(values, dtype=np.float64)[order][positions]
+
+
+def aggregate_histograms(aggregates: Dict[str, Any], labels: List[str], key: str) -> np.ndarray:
+    """由精确汇总得到 标签 × 分桶 计数矩阵(key 为 histogram 或 corrected)"""
+    matrix = np.zeros((len(labels), BUCKET_COUNT), dtype=np.int64)
+    for label_id, label in enumerate(labels):
+        item = aggregates["labels"].get(label)
+        if item:
+            for index, count in item[key].get("buckets", {}).items():
+                matrix[label_id, int(index)] = count
+    return matrix
+
+
+def write_columns(
+    directory: str,
+    columns: Dict[str, np.ndarray],
+    labels: List[str],
+    aggregates: Optional[Dict[str, Any]] = None,
+    retention: str = "full"
+) -> Dict[str, Any]:
+    """
+    按时间排序后写出列文件与元数据
+
+    先写入临时目录再整体替换，中途失败不会留下半成品。
+    给出精确汇总(非完整保留)时直方图由汇总生成，汇总一并写出。
+    """
+    order = np.argsort(columns["timestamp"], kind="stable")
+    tmp_directory = directory + ".tmp"
+    shutil.rmtree(tmp_directory, ignore_errors=True)
+    os.makedirs(tmp_directory)
+    for name in COLUMNS:
+        np.save(os.path.join(tmp_directory, f"{name}.npy"), columns[name][order])
+    if aggregates is not None:
+        np.save(os.path.join(tmp_directory, HISTOGRAM_FILE), aggregate_histograms(aggregates, labels, "histogram"))
+        np.save(os.path.join(tmp_directory, CORRECTED_HISTOGRAM_FILE), aggregate_histograms(aggregates, labels, "corrected"))
+        with open(os.path.join(tmp_directory, AGGREGATES_FILE), "w", encoding="utf-8") as f:
+            json.dump(aggregates, f, ensure_ascii=False)
+    else:
+        np.save(os.path.join(tmp_directory, HISTOGRAM_FILE), label_histograms(columns["label"], columns["latency"], len(labels)))
+        corrected = corrected_latencies(columns["timestamp"], columns["intended_ts"], columns["latency"])
+        np.save(os.path.join(tmp_directory, CORRECTED_HISTOGRAM_FILE), label_histograms(columns["label"], corrected, len(labels)))
+
+    timestamps = columns["timestamp"]
+    meta = {
+        "rows": int(len(timestamps)),
+        "start_ts": int(timestamps.min()) if len(timestamps) else None,
+        "end_ts": int(timestamps.max()) if len(timestamps) else None,
+        "labels": labels,
+        "dtypes": {name: str(columns[name].dtype) for name in COLUMNS},
+        "retention": retention,
+    }
+    with open(os.path.join(tmp_directory, META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(tmp_directory, directory)
+    return meta
+
+
+async def finalize_samples(execution: TestExecution) -> Dict[str, Any]:
+    """
+    将执行的原始采样整理为列式文件并删除数据库中的采样行
+
+    按主键分批读取，避免一次性构造大量 ORM 对象；标签在读取过程中完成字典编码。
+    非完整保留的执行使用执行记录上的精确汇总生成直方图，只出现在汇总中的标签也加入标签字典。
+    列文件写出后先分批删除采样行再切换存储状态；删除中途中断时列文件已完整，
+    重试时直接沿用，不会由残缺的采样行重新整理。
+    """
+    directory = samples_directory(execution.execution_id)
+    if os.path.exists(os.path.join(directory, META_FILE)):
+        with open(os.path.join(directory, META_FILE), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    else:
+        meta = await _write_samples(execution, directory)
+
+    await _delete_samples(execution.id)
+    execution.sample_storage = "columnar"
+    await execution.save(update_fields=['sample_storage'])
+    return meta
+
+
+async def _write_samples(execution: TestExecution, directory: str) -> Dict[str, Any]:
+    """读取执行的全部采样行并写出列文件"""
+    label_ids: Dict[str, int] = {}
+    chunks: Dict[str, List[np.ndarray]] = {name: [] for name in COLUMNS}
+    last_id = 0
+    while True:
+        rows = await ExecutionSample.filter(execution_id=execution.id, id__gt=last_id).order_by('id').limit(
+            RESULT_FINALIZE_BATCH
+        ).values_list('id', 'timestamp', 'intended_ts', 'label', 'latency', 'status_code', 'success', 'bytes', 'slave_id', 'weight')
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        _, timestamps, intended, labels, latencies, status_codes, successes, sizes, slave_ids, weights = zip(*rows)
+        chunks["timestamp"].append(np.array(timestamps, dtype=np.int64))
+        chunks["intended_ts"].append(np.array([t if i is None else i for t, i in zip(timestamps, intended)], dtype=np.int64))
+        chunks["label"].append(np.array([label_ids.setdefault(label, len(label_ids)) for label in labels], dtype=np.uint32))
+        chunks["latency"].append(np.array(latencies, dtype=np.float32))
+        chunks["status_code"].append(np.array(status_codes, dtype=np.uint16))
+        chunks["success"].append(np.array(successes, dtype=np.bool_))
+        chunks["bytes"].append(np.array(sizes, dtype=np.uint32))
+        chunks["slave_id"].append(np.array([-1 if s is None else s for s in slave_ids], dtype=np.int32))
+        chunks["weight"].append(np.array(weights, dtype=np.float32))
+
+    aggregates = execution.aggregates if execution.retention_mode != "full" else None
+    if aggregates is not None:
+        for label in aggregates["labels"]:
+            label_ids.setdefault(label, len(label_ids))
+    label_dtype = np.uint16 if len(label_ids) <= np.iinfo(np.uint16).max + 1 else np.uint32
+    columns = {
+        name: np.concatenate(parts) if parts else np.array([], dtype=COLUMN_DTYPES.get(name, label_dtype))
+        for name, parts in chunks.items()
+    }
+    columns["label"] = columns["label"].astype(label_dtype)
+    labels = sorted(label_ids, key=label_ids.get)
+
+    return await asyncio.to_thread(write_columns, directory, columns, labels, aggregates, execution.retention_mode)
+
+
+async def _delete_samples(execution_pk: int):
+    """按主键分批删除执行的采样行，每批一个短事务，批次之间让出事件循环，不长时间占用 SQLite 写锁"""
+    while True:
+        ids = await ExecutionSample.filter(execution_id=execution_pk).order_by('id').limit(
+            MAINTENANCE_BATCH
+        ).values_list('id', flat=True)
+        if not ids:
+            break
+        await ExecutionSample.filter(id__in=ids).delete()
+        await asyncio.sleep(0)
+
+
+class ColumnarResult:
+    """
+    内存映射的列式结果
+
+    列在首次访问时以只读方式映射，查询时按时间二分定位行区间，只对用到的列切片计算。
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(os.path.join(directory, META_FILE), "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self.labels: List[str] = self.meta["labels"]
+        self._label_ids = {label: i for i, label in enumerate(self.labels)}
+        self._columns: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def open(cls, execution_id: str) -> Optional["ColumnarResult"]:
+        directory = samples_directory(execution_id)
+        if not os.path.exists(os.path.join(directory, META_FILE)):
+            return None
+        return cls(directory)
+
+    @property
+    def rows(self) -> int:
+        return self.meta["rows"]
+
+    def column(self, name: str) -> np.ndarray:
+        """获取列(只读内存映射)，早于权重列引入的结果权重全部为 1"""
+        array = self._columns.get(name)
+        if array is None:
+            if name == "weight" and name not in self.meta["dtypes"]:
+                array = self._columns[name] = np.ones(self.rows, dtype=np.float32)
+            else:
+                array = self._columns[name] = np.load(os.path.join(self.directory, f"{name}.npy"), mmap_mode="r")
+        return array
+
+    def histograms(self) -> np.ndarray:
+        """标签 × 分桶计数矩阵，早于该文件生成的结果在首次访问时补算"""
+        path = os.path.join(self.directory, HISTOGRAM_FILE)
+        if not os.path.exists(path):
+            np.save(path, label_histograms(self.column("label"), self.column("latency"), len(self.labels)))
+        return np.load(path)
+
+    @property
+    def has_intended(self) -> bool:
+        """是否记录了计划发送时间(早于该列引入的结果没有)"""
+        return "intended_ts" in self.meta["dtypes"]
+
+    def corrected_latency(self) -> np.ndarray:
+        """协调遗漏校正后的延迟列，未记录计划发送时间时与原始延迟相同"""
+        if not self.has_intended:
+            return np.asarray(self.column("latency"), dtype=np.float64)
+        return corrected_latencies(self.column("timestamp"), self.column("intended_ts"), self.column("latency"))
+
+    def corrected_histograms(self) -> np.ndarray:
+        """协调遗漏校正后的 标签 × 分桶计数矩阵，缺少时在首次访问时补算"""
+        path = os.path.join(self.directory, CORRECTED_HISTOGRAM_FILE)
+        if not os.path.exists(path):
+            np.save(path, label_histograms(self.column("label"), self.corrected_latency(), len(self.labels)))
+        return np.load(path)
+
+    @property
+    def retention(self) -> str:
+        """原始采样保留方式，早于该字段的结果均为完整保留"""
+        return self.meta.get("retention", "full")
+
+    def aggregates(self) -> Optional[Dict[str, Any]]:
+        """非完整保留时的精确汇总"""
+        path = os.path.join(self.directory, AGGREGATES_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def label_id(self, label: str) -> Optional[int]:
+        return self._label_ids.get(label)
+
+    def row_range(self, start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> Tuple[int, int]:
+        """时间范围 [start_ts, end_ts) (毫秒) 对应的行区间"""
+        timestamps = self.column("timestamp")
+        lo = int(np.searchsorted(timestamps, start_ts, side="left")) if start_ts is not None else 0
+        hi = int(np.searchsorted(timestamps, end_ts, side="left")) if end_ts is not None else self.rows
+        return lo, max(lo, hi)
+
+    def select(
+        self,
+        columns: Tuple[str, ...],
+        label: Optional[str] = None,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None
+    ) -> Dict[str, np.ndarray]:
+        """按标签与时间范围选取若干列，标签不存在时返回空数组"""
+        lo, hi = self.row_range(start_ts, end_ts)
+        mask = None
+        if label is not None:
+            label_id = self.label_id(label)
+            if label_id is None:
+                lo = hi = 0
+            else:
+                mask = self.column("label")[lo:hi] == label_id
+        selected = {}
+        for name in columns:
+            values = self.column(name)[lo:hi]
+            selected[name] = values[mask] if mask is not None else values
+        return selected
+
+    def summarize(
+        self,
+        label: Optional[str] = None,
+        start_ts: Optional[int] = None,
+        end_ts: Optional[int] = None,
+        percentiles: Tuple[float, ...] = (50, 90, 95, 99)
+    ) -> Dict[str, Any]:
+        """
+        标签/时间范围内的样本数、错误数、吞吐与延迟分位数
+
+        抽样保留的结果按行权重还原样本数、错误数、吞吐、均值与分位数；
+        非完整保留且不限时间范围时直接取自精确汇总。
+        """
+        aggregates = self.aggregates() if self.retention != "full" and start_ts is None and end_ts is None else None
+        if aggregates is not None:
+            return self._summarize_aggregates(aggregates, label, percentiles)
+        data = self.select(("timestamp", "latency", "success", "weight"), label, start_ts, end_ts)
+        latency = data["latency"]
+        weights = np.asarray(data["weight"], dtype=np.float64)
+        count = int(round(float(weights.sum())))
+        result: Dict[str, Any] = {"count": count, "errors": 0, "error_rate": 0.0, "rps": 0.0, "avg": None, "min": None, "max": None}
+        result.update({f"p{p:g}": None for p in percentiles})
+        if not count:
+            return result
+        errors = int(round(float(weights[~np.asarray(data["success"])].sum())))
+        timestamps = data["timestamp"]
+        duration = max((int(timestamps[-1]) - int(timestamps[0])) / 1000, 1.0)
+        if self.retention == "full":
+            values = np.percentile(latency, percentiles)
+        else:
+            values = weighted_percentiles(latency, weights, percentiles)
+        result.update({
+            "errors": errors,
+            "error_rate": round(errors / count, 4),
+            "rps": round(count / duration, 2),
+            "avg": round(float(np.average(latency, weights=weights)), 2),
+            "min": round(float(latency.min()), 2),
+            "max": round(float(latency.max()), 2),
+        })
+        result.update({f"p{p:g}": round(float(v), 2) for p, v in zip(percentiles, values)})
+        return result
+
+    def _summarize_aggregates(self, aggregates: Dict[str, Any], label: Optional[str], percentiles: Tuple[float, ...]) -> Dict[str, Any]:
+        """由精确汇总得到与 summarize 相同字段的统计"""
+        data = aggregates if label is None else aggregates["labels"].get(label, {"count": 0})
+        count = data.get("total", data.get("count", 0))
+        result: Dict[str, Any] = {"count": count, "errors": 0, "error_rate": 0.0, "rps": 0.0, "avg": None, "min": None, "max": None}
+        result.update({f"p{p:g}": None for p in percentiles})
+        if not count:
+            return result
+        histogram = LatencyHistogram.from_dict(data["histogram"])
+        duration = max((aggregates["last_ts"] - aggregates["first_ts"]) / 1000, 1.0)
+        result.update({
+            "errors": data["errors"],
+            "error_rate": round(data["errors"] / count, 4),
+            "rps": round(count / duration, 2),
+            "avg": round(histogram.mean, 2),
+            "min": round(histogram.min, 2),
+            "max": round(histogram.max, 2),
+        })
+        result.update({key: round(value, 2) for key, value in histogram.percentiles(percentiles).items()})
+        return result
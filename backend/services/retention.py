@@ -0,0 +1,87 @@
+"""
+原始采样保留模块
+长时间稳定性测试逐条保存全部原始采样的存储开销不可接受，测试计划可选择保留方式：
+
+- full: 保留全部原始采样
+- reservoir: 按(标签, 分钟)做蓄水池抽样，每组最多保留 N 条，是该组全部采样的均匀随机子集；
+  分钟结束后写入，每条保留采样的 weight = 该组采样总数 / 保留条数，按权重汇总即可还原该组规模
+- aggregates: 不保留原始采样，只保留汇总
+
+保留方式在写入时生效。无论哪种方式，执行期间的实时汇总与延迟直方图都基于全部采样，
+非完整保留的执行结束时把精确汇总保存到执行记录，报告的样本数、错误数与分位数均来自精确汇总，
+原始采样只用于时间序列、错误分布等下钻分析。
+"""
+import random
+from typing import Dict, List, Optional, Tuple
+
+from config import RETENTION_RESERVOIR_SIZE
+from models import ExecutionSample
+
+RETENTION_MODES = ("full", "reservoir", "aggregates")
+
+
+class Reservoir:
+    """单个(标签, 分钟)的蓄水池"""
+
+    __slots__ = ("seen", "rows")
+
+    def __init__(self):
+        self.seen = 0
+        self.rows: List[ExecutionSample] = []
+
+
+class SampleRetention:
+    """执行的原始采样保留策略"""
+
+    def __init__(self, mode: str = "full", size: Optional[int] = None):
+        self.mode = mode if mode in RETENTION_MODES else "full"
+        self.size = max(size or RETENTION_RESERVOIR_SIZE, 1)
+        # (标签, 分钟) -> 蓄水池
+        self.reservoirs: Dict[Tuple[str, int], Reservoir] = {}
+        self._random = random.Random()
+
+    @property
+    def is_full(self) -> bool:
+        return self.mode == "full"
+
+    def offer(self, row: ExecutionSample) -> bool:
+        """
+        提交一条采样
+
+        Returns:
+            bool: 是否需要立即写入(完整保留)；蓄水池抽样的采样暂存到分钟结束
+        """
+        if self.mode == "full":
+            return True
+        if self.mode == "aggregates":
+            return False
+        key = (row.label, row.timestamp // 60000)
+        reservoir = self.reservoirs.get(key)
+        if reservoir is None:
+            reservoir = self.reservoirs[key] = Reservoir()
+        reservoir.seen += 1
+        if len(reservoir.rows) < self.size:
+            reservoir.rows.append(row)
+        else:
+            # 第 n 条以 N/n 的概率替换一条已保留的采样
+            slot = self._random.randrange(reservoir.seen)
+            if slot < self.size:
+                reservoir.rows[slot] = row
+        return False
+
+    def pop_closed(self, before: Optional[int] = None) -> List[ExecutionSample]:
+        """
+        取出已结束分钟的抽样结果并设置权重
+
+        Args:
+            before: 取出在该秒之前结束的分钟，为 None 时全部取出(执行结束)
+        """
+        closed = [key for key in self.reservoirs if before is None or (key[1] + 1) * 60 <= before]
+        rows = []
+        for key in closed:
+            reservoir = self.reservoirs.pop(key)
+            weight = reservoir.seen / len(reservoir.rows)
+            for row in reservoir.rows:
+                row.weight = weight
+            rows.extend(reservoir.rows)
+        return rows
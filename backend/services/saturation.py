@@ -0,0 +1,191 @@
+"""
+从机饱和保护模块
+负载机自身 CPU/内存打满时测得的延迟包含客户端排队，不能反映被测系统的真实表现：
+
+- 执行期间根据从机心跳上报的 cpu_usage/memory_usage 判定饱和，记录饱和时间窗口
+  (从机ID、起止时间、峰值)；心跳是周期性的，窗口从饱和前的上一次心跳开始计，偏保守
+- 从机资源使用率同时以 source="slave:<从机ID>" 写入执行的时序指标，可与延迟曲线叠加
+- 报告中标记饱和窗口内该从机的采样，并给出剔除这些采样后的延迟统计，区分服务端变慢与客户端瓶颈
+- 开启 SLAVE_REBALANCE 时，饱和状态变化后按各从机 CPU 余量向从机下发新的负载比例
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from config import SLAVE_SATURATION_CPU, SLAVE_SATURATION_MEMORY, SLAVE_REBALANCE, SLAVE_STOP_TIMEOUT
+from models import TestExecution, SlaveConfig, MetricPoint
+from services import dispatcher
+from services.copy_insert import bulk_insert
+from services.db_writer import db_writer
+from services.result_store import ColumnarResult, weighted_percentiles
+
+logger = logging.getLogger(__name__)
+
+# 负载比例的最小 CPU 余量(%)，避免饱和从机的比例降为 0
+MIN_HEADROOM = 5.0
+CLEAN_PERCENTILES = (50, 90, 95, 99)
+
+
+def is_saturated(slave: SlaveConfig) -> bool:
+    """从机资源使用率是否达到饱和阈值(未上报的指标不参与判定)"""
+    return (
+        (slave.cpu_usage is not None and slave.cpu_usage >= SLAVE_SATURATION_CPU)
+        or (slave.memory_usage is not None and slave.memory_usage >= SLAVE_SATURATION_MEMORY)
+    )
+
+
+def rebalance_weights(usages: Dict[int, Optional[float]]) -> Dict[str, float]:
+    """按 CPU 余量分配负载比例(合计为 1)，未上报使用率的从机按阈值的一半估计"""
+    headroom = {
+        slave_id: max(SLAVE_SATURATION_CPU - (cpu if cpu is not None else SLAVE_SATURATION_CPU / 2), MIN_HEADROOM)
+        for slave_id, cpu in usages.items()
+    }
+    total = sum(headroom.values())
+    return {str(slave_id): round(value / total, 4) for slave_id, value in headroom.items()}
+
+
+class SaturationGuard:
+    """从机饱和监测"""
+
+    def __init__(self):
+        # 同一执行的窗口列表按读-改-写更新，多台从机心跳并发时串行化
+        self._lock = asyncio.Lock()
+
+    async def observe(self, slave: SlaveConfig, previous_heartbeat: Optional[datetime]) -> None:
+        """
+        处理一次从机心跳：记录资源指标，打开或关闭该从机在运行中执行上的饱和窗口
+
+        Args:
+            slave: 已更新使用率与心跳时间的从机
+            previous_heartbeat: 本次心跳之前的心跳时间
+        """
+        executions = [
+            execution for execution in await TestExecution.filter(status__in=("running", "stopping"))
+            if slave.id in (execution.slave_ids or [])
+        ]
+        if not executions:
+            return
+
+        now = slave.last_heartbeat
+        ts = int(now.timestamp())
+        points = [
+            MetricPoint(execution_id=execution.id, source=f"slave:{slave.id}", name=name, ts=ts, value=value)
+            for execution in executions
+            for name, value in (("cpu_usage", slave.cpu_usage), ("memory_usage", slave.memory_usage))
+            if value is not None
+        ]
+        if points:
+            await db_writer.submit(lambda: bulk_insert(points))
+
+        saturated = is_saturated(slave)
+        now_ms = int(now.timestamp() * 1000)
+        changed = []
+        async with self._lock:
+            for execution in executions:
+                await execution.refresh_from_db(fields=['saturation_windows'])
+                windows = list(execution.saturation_windows or [])
+                window = next((w for w in windows if w["slave_id"] == slave.id and w["end"] is None), None)
+                if saturated and window is None:
+                    since = previous_heartbeat if previous_heartbeat and previous_heartbeat < now else now
+                    start_ms = max(int(since.timestamp() * 1000), int(execution.started_at.timestamp() * 1000))
+                    windows.append({
+                        "slave_id": slave.id,
+                        "start": start_ms,
+                        "end": None,
+                        "max_cpu": slave.cpu_usage,
+                        "max_memory": slave.memory_usage
+                    })
+                    logger.warning("执行 %s 的从机 %s 资源饱和 (CPU %s%%, 内存 %s%%)",
+                                   execution.execution_id, slave.id, slave.cpu_usage, slave.memory_usage)
+                elif saturated:
+                    window["max_cpu"] = max(filter(None, (window["max_cpu"], slave.cpu_usage)), default=None)
+                    window["max_memory"] = max(filter(None, (window["max_memory"], slave.memory_usage)), default=None)
+                elif window is not None:
+                    window["end"] = now_ms
+                else:
+                    continue
+                execution.saturation_windows = windows
+                await execution.save(update_fields=['saturation_windows'])
+                if saturated != (window is not None):
+                    changed.append(execution)
+
+        if SLAVE_REBALANCE:
+            for execution in changed:
+                await self.rebalance(execution)
+
+    async def rebalance(self, execution: TestExecution) -> List[Dict[str, Any]]:
+        """
+        按各从机 CPU 余量向执行的全部从机下发负载比例
+
+        从机代理收到 {"weights": {从机ID: 比例}} 后按自身比例调整并发/发送速率；
+        只有一台从机或全部饱和时无可转移的余量，不下发。
+        """
+        slaves = await SlaveConfig.filter(id__in=execution.slave_ids or [])
+        if len(slaves) < 2 or all(is_saturated(slave) for slave in slaves):
+            return []
+        weights = rebalance_weights({slave.id: slave.cpu_usage for slave in slaves})
+        results = await dispatcher.broadcast(
+            slaves, execution.execution_id, "rebalance", {"weights": weights}, SLAVE_STOP_TIMEOUT
+        )
+        logger.info("执行 %s 按从机 CPU 余量重新分配负载: %s", execution.execution_id, weights)
+        return results
+
+
+def saturation_report(result: Optional[ColumnarResult], windows: List[Dict[str, Any]], end_ms: int) -> Dict[str, Any]:
+    """
+    饱和窗口内的采样统计
+
+    Args:
+        result: 执行的列式结果
+        windows: 执行的饱和窗口列表，未关闭的窗口按执行结束时间截止
+        end_ms: 执行结束时间(毫秒时间戳)
+
+    Returns:
+        Dict: {"windows": 各窗口及其采样数, "affected_samples", "affected_ratio",
+               "clean": 剔除饱和窗口采样后的样本数/错误数/延迟均值与分位数}
+    """
+    items = [{**window, "end": window["end"] if window["end"] is not None else end_ms} for window in windows]
+    report: Dict[str, Any] = {"windows": items, "affected_samples": 0, "affected_ratio": 0.0, "clean": None}
+    if result is None or not result.rows:
+        for item in items:
+            item["samples"] = 0
+        return report
+
+    # 抽样保留的行按权重还原样本数，与 ColumnarResult.summarize 一致
+    weights = np.asarray(result.column("weight"), dtype=np.float64)
+    slave_ids = np.asarray(result.column("slave_id"))
+    affected = np.zeros(len(weights), dtype=bool)
+    for item in items:
+        # 时间列已排序，先二分定位窗口再按从机过滤
+        lo, hi = result.row_range(item["start"], item["end"])
+        mask = slave_ids[lo:hi] == item["slave_id"]
+        item["samples"] = int(round(float(weights[lo:hi][mask].sum())))
+        affected[lo:hi] |= mask
+
+    total = float(weights.sum())
+    count = int(round(float(weights[affected].sum())))
+    report["affected_samples"] = count
+    report["affected_ratio"] = round(count / total, 4) if total else 0.0
+
+    clean = ~affected
+    latency = np.asarray(result.column("latency"), dtype=np.float64)[clean]
+    clean_weights = weights[clean]
+    clean_count = int(round(float(clean_weights.sum())))
+    clean_stats: Dict[str, Any] = {"count": clean_count}
+    if clean_count:
+        failed = ~np.asarray(result.column("success"))[clean]
+        clean_stats["errors"] = int(round(float(clean_weights[failed].sum())))
+        clean_stats["avg"] = round(float(np.average(latency, weights=clean_weights)), 2)
+        if result.retention == "full":
+            values = np.percentile(latency, CLEAN_PERCENTILES)
+        else:
+            values = weighted_percentiles(latency, clean_weights, CLEAN_PERCENTILES)
+        clean_stats.update({f"p{p:g}": round(float(v), 2) for p, v in zip(CLEAN_PERCENTILES, values)})
+    report["clean"] = clean_stats
+    return report
+
+
+saturation_guard = SaturationGuard()
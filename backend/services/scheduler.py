@@ -0,0 +1,177 @@
+"""
+测试计划调度模块
+按测试计划的 scheduled_start / scheduled_end / cron_expression 自动执行与停止：
+
+- 只设置计划开始时间：到时执行一次
+- 设置 cron 表达式：从计划开始时间(未设置则从现在)起按表达式周期执行，直到计划结束时间
+- 计划结束时间为硬性截止：到时立即终止计划所有运行中的执行，之后不再触发
+
+下次执行时间持久化在 TestPlan.next_run_at 上，调度器在内存中维护按触发时间排序的最小堆，
+只需等待堆顶到期；计划变更时递增版本号使旧的堆条目失效(惰性删除)。
+重启后通过索引查询重建堆，停机期间错过的触发在启动后补执行一次。
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from tortoise import timezone
+
+from config import CRON_TIMEZONE
+from models import TestPlan, TestExecution
+from services.cron import parse_cron
+from services.executions import registry, stop_execution
+from services.execution_queue import execution_queue
+
+logger = logging.getLogger(__name__)
+
+# 不再调度的计划状态
+INACTIVE_STATUSES = ("completed", "cancelled")
+# 堆为空时的最长等待时间(秒)，防止系统时间跳变导致长时间不检查
+MAX_SLEEP = 60
+
+
+def _aware(moment: datetime) -> datetime:
+    return timezone.make_aware(moment) if timezone.is_naive(moment) else moment
+
+
+def next_run_time(plan: TestPlan, after: datetime) -> Optional[datetime]:
+    """
+    计划在 after 之后的下次执行时间，不再执行时返回 None
+
+    cron 表达式按 CRON_TIMEZONE 时区解释；单次计划只在开始时间晚于 after 时执行。
+    """
+    if plan.is_deleted or not plan.is_active or plan.status in INACTIVE_STATUSES:
+        return None
+    start = _aware(plan.scheduled_start) if plan.scheduled_start else None
+    end = _aware(plan.scheduled_end) if plan.scheduled_end else None
+    cron = parse_cron(plan.cron_expression)
+    if cron is None:
+        return start if start and start > after else None
+
+    # 计划开始时间本身也可以是一次触发
+    base = max(after, start - timedelta(seconds=1)) if start else after
+    try:
+        moment = cron.next_after(base.astimezone(ZoneInfo(CRON_TIMEZONE)))
+    except ValueError:
+        return None
+    if end and moment >= end:
+        return None
+    return moment
+
+
+class PlanScheduler:
+    """测试计划调度器"""
+
+    def __init__(self):
+        # (触发时间戳, 序号, 计划ID, 版本号, 动作 start/stop)
+        self._heap: List[Tuple[float, int, int, int, str]] = []
+        self._versions: Dict[int, int] = {}
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _push(self, moment: datetime, plan_id: int, version: int, action: str) -> None:
+        heapq.heappush(self._heap, (moment.timestamp(), next(self._seq), plan_id, version, action))
+
+    def schedule(self, plan: TestPlan) -> None:
+        """按计划当前的 next_run_at 与结束时间登记触发，旧的登记失效"""
+        version = self._versions.get(plan.id, 0) + 1
+        self._versions[plan.id] = version
+        if plan.next_run_at:
+            self._push(_aware(plan.next_run_at), plan.id, version, "start")
+        if plan.scheduled_end and not plan.is_deleted:
+            self._push(_aware(plan.scheduled_end), plan.id, version, "stop")
+        self._wakeup.set()
+
+    async def reschedule(self, plan: TestPlan) -> None:
+        """计划创建/更新/删除后重新计算下次执行时间"""
+        next_run_at = next_run_time(plan, timezone.now())
+        if next_run_at != plan.next_run_at:
+            plan.next_run_at = next_run_at
+            await TestPlan.filter(id=plan.id).update(next_run_at=next_run_at)
+        self.schedule(plan)
+
+    async def load(self) -> None:
+        """
+        启动时从数据库重建调度堆
+
+        按 next_run_at 与 scheduled_end 索引分别查询：有下次执行时间的计划、结束时间未到的计划(不论状态)；
+        结束时间在停机期间已过、但仍有运行中执行的计划也登记停止，启动后立即触发。
+        """
+        running_plan_ids = list({live.test_plan_id for live in registry.all()})
+        queries = [
+            TestPlan.filter(next_run_at__isnull=False, is_deleted=False),
+            TestPlan.filter(scheduled_end__gt=timezone.now(), is_deleted=False),
+        ]
+        if running_plan_ids:
+            queries.append(TestPlan.filter(id__in=running_plan_ids, scheduled_end__isnull=False, is_deleted=False))
+        plans: Dict[int, TestPlan] = {}
+        for query in queries:
+            for plan in await query:
+                plans[plan.id] = plan
+        for plan in plans.values():
+            self.schedule(plan)
+
+    async def _fire_start(self, plan: TestPlan, fire_at: datetime) -> None:
+        if not plan.is_active or plan.status in INACTIVE_STATUSES:
+            return
+        # 上一次执行尚未结束(含排队中)时跳过本次触发
+        if await TestExecution.filter(test_plan_id=plan.id, status__in=("queued", "running", "stopping")).exists():
+            logger.warning("测试计划 %s 上次执行尚未结束，跳过 %s 的调度执行", plan.id, fire_at)
+            return
+        execution, _ = await execution_queue.submit(plan, None, trigger="schedule")
+        logger.info("测试计划 %s 已按调度提交执行 %s (%s)", plan.id, execution.execution_id, execution.status)
+
+    async def _fire_stop(self, plan: TestPlan) -> None:
+        executions = await TestExecution.filter(test_plan_id=plan.id, status__in=("queued", "running", "stopping"))
+        for execution in executions:
+            await stop_execution(execution, "hard", "已到计划结束时间")
+
+    async def _fire(self, plan_id: int, version: int, action: str, fire_ts: float) -> None:
+        plan = await TestPlan.get_or_none(id=plan_id, is_deleted=False)
+        if not plan:
+            self._versions.pop(plan_id, None)
+            return
+        if action == "stop":
+            await self._fire_stop(plan)
+            return
+        fire_at = datetime.fromtimestamp(fire_ts, tz=ZoneInfo(CRON_TIMEZONE))
+        try:
+            await self._fire_start(plan, fire_at)
+        finally:
+            # 执行期间计划被修改时已由 reschedule 重新登记
+            if self._versions.get(plan_id) == version:
+                # 无论本次是否执行成功都推进到下一次，停机期间错过的多次触发合并为一次
+                plan.next_run_at = next_run_time(plan, max(fire_at, timezone.now()))
+                await TestPlan.filter(id=plan_id).update(next_run_at=plan.next_run_at)
+                if plan.next_run_at:
+                    self._push(plan.next_run_at, plan_id, version, "start")
+
+    async def run(self) -> None:
+        """调度循环：处理全部到期条目后等待到下一个触发时间或被新登记唤醒"""
+        while True:
+            self._wakeup.clear()
+            now = time.time()
+            while self._heap and self._heap[0][0] <= now:
+                fire_ts, _, plan_id, version, action = heapq.heappop(self._heap)
+                if self._versions.get(plan_id) != version:
+                    continue
+                try:
+                    await self._fire(plan_id, version, action, fire_ts)
+                except Exception:
+                    logger.exception("测试计划 %s 调度 %s 失败", plan_id, action)
+            timeout = min(self._heap[0][0] - time.time(), MAX_SLEEP) if self._heap else MAX_SLEEP
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), max(timeout, 0))
+            except asyncio.TimeoutError:
+                pass
+
+
+scheduler = PlanScheduler()
@@ -0,0 +1,33 @@
+"""
+脚本文件模块
+脚本文件只允许位于脚本目录(SCRIPT_DIR)内：登记、更新与下载时都按解析后的真实路径校验，
+防止通过 ../ 或符号链接把任意服务器文件登记为脚本再经下载接口读出。
+"""
+import os
+from pathlib import Path
+from typing import Optional
+
+from config import SCRIPT_DIR
+
+
+def script_path(file_path: str) -> Optional[Path]:
+    """
+    解析脚本路径
+
+    Returns:
+        Optional[Path]: 位于脚本目录内时返回解析后的绝对路径，否则返回 None(不判断文件是否存在)
+    """
+    root = Path(SCRIPT_DIR).resolve()
+    path = Path(file_path).resolve()
+    if path == root or root not in path.parents:
+        return None
+    return path
+
+
+def remove_script_file(file_path: str) -> bool:
+    """删除脚本目录内的脚本文件，目录外的路径与不存在的文件忽略，返回是否删除"""
+    path = script_path(file_path)
+    if path is None or not path.is_file():
+        return False
+    os.remove(path)
+    return True
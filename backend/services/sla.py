@@ -0,0 +1,170 @@
+"""
+SLA 断言模块
+- 执行期间：采样写入后基于实时聚合(直方图)增量判定，同一执行至多每 SLA_EVAL_INTERVAL 秒判定一次，
+  硬性规则一旦违反即提前终止执行
+- 执行结束后：基于分析报告(精确分位数)做最终判定，结果计入测试计划的用例统计
+
+吞吐(rps)规则受压测爬坡阶段影响，执行期间不判定，只在结束时按全程平均吞吐判定。
+"""
+import operator
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from config import SLA_EVAL_INTERVAL
+from models import SlaRule
+from services.metrics import ExecutionStats
+
+SLA_METRICS = ("avg", "max", "p50", "p75", "p90", "p95", "p99", "p99.9", "error_rate", "rps")
+SLA_METRIC_PATTERN = "^(avg|max|p50|p75|p90|p95|p99|p99\\.9|error_rate|rps)$"
+SLA_OPERATOR_PATTERN = "^(lt|lte|gt|gte)$"
+
+OPERATORS: Dict[str, Callable[[float, float], bool]] = {
+    "lt": operator.lt,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "gte": operator.ge,
+}
+OPERATOR_SYMBOLS = {"lt": "<", "lte": "<=", "gt": ">", "gte": ">="}
+
+# 执行期间不判定的指标
+FINAL_ONLY_METRICS = ("rps",)
+
+
+def describe_rule(rule: SlaRule) -> str:
+    """规则的可读描述，如 login p95 < 300"""
+    return f"{rule.label or '全部请求'} {rule.metric} {OPERATOR_SYMBOLS[rule.operator]} {rule.threshold:g}"
+
+
+def sla_rule_data(rule: SlaRule) -> Dict[str, Any]:
+    """规则响应数据"""
+    return {
+        "id": rule.id,
+        "test_plan_id": rule.test_plan_id,
+        "label": rule.label,
+        "metric": rule.metric,
+        "operator": rule.operator,
+        "threshold": rule.threshold,
+        "is_hard": rule.is_hard,
+        "min_samples": rule.min_samples,
+        "is_active": rule.is_active,
+        "description": describe_rule(rule),
+        "created_at": rule.created_at
+    }
+
+
+def _live_metric(stats: ExecutionStats, label: Optional[str], metric: str) -> Optional[tuple]:
+    """从实时聚合取指标，返回(样本数, 指标值)"""
+    if label is None:
+        count, errors, histogram = stats.total, stats.errors, stats.histogram
+    else:
+        label_stats = stats.labels.get(label)
+        if label_stats is None:
+            return None
+        count, errors, histogram = label_stats.count, label_stats.errors, label_stats.histogram
+    if not count:
+        return None
+    if metric == "error_rate":
+        return count, errors / count
+    # 延迟指标以直方图为准(重启恢复的执行只有计数没有直方图)
+    if not histogram.total:
+        return None
+    if metric == "avg":
+        return histogram.total, histogram.mean
+    if metric == "max":
+        return histogram.total, histogram.max
+    return histogram.total, histogram.percentile(float(metric[1:]))
+
+
+def report_metric(report: Dict[str, Any], label: Optional[str], metric: str) -> Optional[float]:
+    """从分析报告取指标"""
+    if label is None:
+        item = report.get("overall")
+    else:
+        item = next((item for item in report.get("labels", []) if item["label"] == label), None)
+    if not item or not item.get("count"):
+        return None
+    return item.get(metric)
+
+
+class SlaTracker:
+    """单个执行的 SLA 实时判定状态"""
+
+    def __init__(self, rules: List[SlaRule], interval: float = SLA_EVAL_INTERVAL):
+        self.rules = rules
+        self.interval = interval
+        self._last_check = 0.0
+        self.states: Dict[int, Dict[str, Any]] = {
+            rule.id: {"status": "pending", "value": None, "violated": False, "violated_value": None}
+            for rule in rules
+        }
+
+    def check(self, stats: ExecutionStats, force: bool = False) -> Optional[SlaRule]:
+        """
+        判定全部规则
+
+        Returns:
+            Optional[SlaRule]: 首个被违反的硬性规则，没有则为 None
+        """
+        now = time.monotonic()
+        if not self.rules or (not force and now - self._last_check < self.interval):
+            return None
+        self._last_check = now
+
+        breached = None
+        for rule in self.rules:
+            if rule.metric in FINAL_ONLY_METRICS:
+                continue
+            state = self.states[rule.id]
+            observed = _live_metric(stats, rule.label, rule.metric)
+            if observed is None or observed[0] < rule.min_samples:
+                continue
+            value = observed[1]
+            state["value"] = value
+            if OPERATORS[rule.operator](value, rule.threshold):
+                state["status"] = "passing"
+            else:
+                state["status"] = "failing"
+                if not state["violated"]:
+                    state["violated"] = True
+                    state["violated_value"] = value
+                if rule.is_hard and breached is None:
+                    breached = rule
+        return breached
+
+    def status(self) -> List[Dict[str, Any]]:
+        """实时判定结果"""
+        return [
+            {
+                "rule_id": rule.id,
+                "description": describe_rule(rule),
+                "is_hard": rule.is_hard,
+                **self.states[rule.id]
+            }
+            for rule in self.rules
+        ]
+
+
+def evaluate_report(rules: List[SlaRule], report: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    基于分析报告做最终判定
+
+    无数据(标签不存在或无样本)的规则判定为不通过。
+    """
+    results = []
+    for rule in rules:
+        value = report_metric(report, rule.label, rule.metric)
+        passed = value is not None and OPERATORS[rule.operator](value, rule.threshold)
+        results.append({
+            "rule_id": rule.id,
+            "description": describe_rule(rule),
+            "is_hard": rule.is_hard,
+            "value": value,
+            "passed": passed
+        })
+    passed_count = sum(1 for item in results if item["passed"])
+    return {
+        "total": len(results),
+        "passed": passed_count,
+        "failed": len(results) - passed_count,
+        "results": results
+    }
@@ -0,0 +1,45 @@
+"""
+后台任务模块
+统一管理应用生命周期内的周期性任务
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Coroutine, List
+
+logger = logging.getLogger(__name__)
+
+_tasks: List[asyncio.Task] = []
+
+
+async def _run_periodic(name: str, interval: float, func: Callable[[], Awaitable[None]]) -> None:
+    while True:
+        try:
+            await func()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # 单次执行失败不影响后续周期
+            logger.exception("后台任务 %s 执行失败", name)
+        await asyncio.sleep(interval)
+
+
+def start_periodic(name: str, interval: float, func: Callable[[], Awaitable[None]]) -> asyncio.Task:
+    """启动周期任务，每次执行结束后间隔 interval 秒再次执行"""
+    task = asyncio.create_task(_run_periodic(name, interval, func), name=name)
+    _tasks.append(task)
+    return task
+
+
+def start_task(name: str, coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+    """启动自行管理节奏的常驻任务(如调度循环)，随应用退出一并取消"""
+    task = asyncio.create_task(coro, name=name)
+    _tasks.append(task)
+    return task
+
+
+async def stop_all() -> None:
+    """取消全部后台任务并等待其退出"""
+    for task in _tasks:
+        task.cancel()
+    await asyncio.gather(*_tasks, return_exceptions=True)
+    _tasks.clear()